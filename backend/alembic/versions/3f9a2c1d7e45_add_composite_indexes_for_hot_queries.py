@@ -0,0 +1,54 @@
+"""Add composite indexes for hot queries
+
+Revision ID: 3f9a2c1d7e45
+Revises: c66a0faade43
+Create Date: 2026-10-19 10:12:41.204518
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from typing import Optional
+
+
+# revision identifiers, used by Alembic.
+revision = '3f9a2c1d7e45'
+down_revision = 'c66a0faade43'
+branch_labels = None
+depends_on = None
+
+
+# (인덱스 이름, 테이블, 컬럼, 부분 인덱스 조건)
+INDEXES = [
+    ('ix_projects_user_id_deleted_at', 'projects', ['user_id', 'deleted_at'], None),
+    ('ix_projects_active_user_id_created_at', 'projects', ['user_id', 'created_at'], 'deleted_at IS NULL'),
+    ('ix_documents_project_id_deleted_at_created_at', 'documents', ['project_id', 'deleted_at', 'created_at'], None),
+    ('ix_documents_project_id_processing_status', 'documents', ['project_id', 'processing_status'], None),
+    ('ix_chat_histories_project_id_created_at', 'chat_histories', ['project_id', 'created_at'], None),
+]
+
+
+def _existing_indexes(table_name: str) -> Optional[set]:
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table_name):
+        return None
+    return {index['name'] for index in inspector.get_indexes(table_name)}
+
+
+def upgrade() -> None:
+    for name, table_name, columns, where in INDEXES:
+        existing = _existing_indexes(table_name)
+        # create_all로 만든 DB에는 테이블이나 인덱스가 이미 있을 수 있음
+        if existing is None or name in existing:
+            continue
+        kwargs = {}
+        if where:
+            kwargs['sqlite_where'] = sa.text(where)
+            kwargs['postgresql_where'] = sa.text(where)
+        op.create_index(name, table_name, columns, unique=False, **kwargs)
+
+
+def downgrade() -> None:
+    for name, table_name, _, _ in reversed(INDEXES):
+        existing = _existing_indexes(table_name)
+        if existing and name in existing:
+            op.drop_index(name, table_name=table_name)
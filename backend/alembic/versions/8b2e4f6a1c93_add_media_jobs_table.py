@@ -0,0 +1,54 @@
+"""Add media_jobs table
+
+Revision ID: 8b2e4f6a1c93
+Revises: 3f9a2c1d7e45
+Create Date: 2026-10-19 14:05:12.731904
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8b2e4f6a1c93'
+down_revision = '3f9a2c1d7e45'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # create_all로 만든 DB에는 테이블이 이미 있을 수 있음
+    if sa.inspect(op.get_bind()).has_table('media_jobs'):
+        return
+
+    op.create_table(
+        'media_jobs',
+        sa.Column('id', sa.String(length=36), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('job_type', sa.String(length=50), nullable=False),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('status', sa.Enum('QUEUED', 'RUNNING', 'COMPLETED', 'FAILED', 'CANCELLED',
+                                    name='mediajobstatus'), nullable=False),
+        sa.Column('progress', sa.Float(), nullable=False),
+        sa.Column('stage', sa.String(length=50), nullable=True),
+        sa.Column('cancel_requested', sa.Boolean(), nullable=False),
+        sa.Column('result', sa.JSON(), nullable=True),
+        sa.Column('error_message', sa.Text(), nullable=True),
+        sa.Column('worker_id', sa.String(length=100), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_media_jobs_user_id', 'media_jobs', ['user_id'], unique=False)
+    op.create_index('ix_media_jobs_status_created_at', 'media_jobs', ['status', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table('media_jobs'):
+        return
+    op.drop_index('ix_media_jobs_status_created_at', table_name='media_jobs')
+    op.drop_index('ix_media_jobs_user_id', table_name='media_jobs')
+    op.drop_table('media_jobs')
@@ -0,0 +1,45 @@
+"""Add media_job_segments table
+
+Revision ID: c4d7e9a2b610
+Revises: 8b2e4f6a1c93
+Create Date: 2026-10-19 16:42:08.215730
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4d7e9a2b610'
+down_revision = '8b2e4f6a1c93'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # create_all로 만든 DB에는 테이블이 이미 있을 수 있음
+    if sa.inspect(op.get_bind()).has_table('media_job_segments'):
+        return
+
+    op.create_table(
+        'media_job_segments',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('job_id', sa.String(length=36), nullable=False),
+        sa.Column('seq', sa.Integer(), nullable=False),
+        sa.Column('kind', sa.String(length=20), nullable=False),
+        sa.Column('start_seconds', sa.Float(), nullable=True),
+        sa.Column('end_seconds', sa.Float(), nullable=True),
+        sa.Column('text', sa.Text(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['job_id'], ['media_jobs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('job_id', 'seq', name='uq_media_job_segments_job_id_seq'),
+    )
+    op.create_index('ix_media_job_segments_id', 'media_job_segments', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table('media_job_segments'):
+        return
+    op.drop_index('ix_media_job_segments_id', table_name='media_job_segments')
+    op.drop_table('media_job_segments')
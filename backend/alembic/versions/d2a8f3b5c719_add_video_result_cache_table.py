@@ -0,0 +1,50 @@
+"""Add video_result_cache table
+
+Revision ID: d2a8f3b5c719
+Revises: c4d7e9a2b610
+Create Date: 2026-10-19 18:05:31.402118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd2a8f3b5c719'
+down_revision = 'c4d7e9a2b610'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # create_all로 만든 DB에는 테이블이 이미 있을 수 있음
+    if sa.inspect(op.get_bind()).has_table('video_result_cache'):
+        return
+
+    op.create_table(
+        'video_result_cache',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('sha256', sa.String(length=64), nullable=True),
+        sa.Column('md5', sa.String(length=32), nullable=True),
+        sa.Column('config_hash', sa.String(length=64), nullable=False),
+        sa.Column('config', sa.JSON(), nullable=False),
+        sa.Column('extraction', sa.JSON(), nullable=False),
+        sa.Column('summary', sa.JSON(), nullable=True),
+        sa.Column('source_filename', sa.String(length=255), nullable=True),
+        sa.Column('hit_count', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('last_hit_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_video_result_cache_id', 'video_result_cache', ['id'], unique=False)
+    op.create_index('ix_video_result_cache_sha256_config', 'video_result_cache', ['sha256', 'config_hash'], unique=False)
+    op.create_index('ix_video_result_cache_md5_config', 'video_result_cache', ['md5', 'config_hash'], unique=False)
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table('video_result_cache'):
+        return
+    op.drop_index('ix_video_result_cache_md5_config', table_name='video_result_cache')
+    op.drop_index('ix_video_result_cache_sha256_config', table_name='video_result_cache')
+    op.drop_index('ix_video_result_cache_id', table_name='video_result_cache')
+    op.drop_table('video_result_cache')
@@ -0,0 +1,70 @@
+"""Add project_document_stats table
+
+Revision ID: e5b1c7d9f246
+Revises: d2a8f3b5c719
+Create Date: 2026-10-19 21:40:12.518304
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e5b1c7d9f246'
+down_revision = 'd2a8f3b5c719'
+branch_labels = None
+depends_on = None
+
+# documents.processing_status는 SQLAlchemy Enum이라 enum 이름(대문자)으로 저장됨
+STATUSES = ('PENDING', 'UPLOADING', 'PROCESSING', 'COMPLETED', 'FAILED')
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    # create_all로 만든 DB에는 테이블이 이미 있을 수 있음
+    if not inspector.has_table('project_document_stats'):
+        op.create_table(
+            'project_document_stats',
+            sa.Column('project_id', sa.Integer(), nullable=False),
+            sa.Column('total_documents', sa.Integer(), nullable=False),
+            sa.Column('pending_documents', sa.Integer(), nullable=False),
+            sa.Column('uploading_documents', sa.Integer(), nullable=False),
+            sa.Column('processing_documents', sa.Integer(), nullable=False),
+            sa.Column('completed_documents', sa.Integer(), nullable=False),
+            sa.Column('failed_documents', sa.Integer(), nullable=False),
+            sa.Column('total_size_bytes', sa.BigInteger(), nullable=False),
+            sa.Column('updated_at', sa.DateTime(), nullable=False),
+            sa.ForeignKeyConstraint(['project_id'], ['projects.id']),
+            sa.PrimaryKeyConstraint('project_id'),
+        )
+
+    if not inspector.has_table('documents'):
+        return
+
+    # 기존 문서로 카운터 채우기 (이미 카운터 행이 있는 프로젝트는 건너뜀)
+    status_sums = ",\n            ".join(
+        f"SUM(CASE WHEN processing_status = '{status}' THEN 1 ELSE 0 END)" for status in STATUSES
+    )
+    op.execute(f"""
+        INSERT INTO project_document_stats (
+            project_id, total_documents,
+            pending_documents, uploading_documents, processing_documents, completed_documents, failed_documents,
+            total_size_bytes, updated_at
+        )
+        SELECT
+            project_id,
+            COUNT(*),
+            {status_sums},
+            COALESCE(SUM(file_size), 0),
+            CURRENT_TIMESTAMP
+        FROM documents
+        WHERE deleted_at IS NULL
+          AND project_id NOT IN (SELECT project_id FROM project_document_stats)
+        GROUP BY project_id
+    """)
+
+
+def downgrade() -> None:
+    if not sa.inspect(op.get_bind()).has_table('project_document_stats'):
+        return
+    op.drop_table('project_document_stats')
@@ -59,6 +59,8 @@ class Settings(BaseSettings):
 
     # 파일 업로드 설정
     MAX_FILE_SIZE: int = 10 * 1024 * 1024  # 10MB
+    MAX_VIDEO_UPLOAD_SIZE: int = 4 * 1024 * 1024 * 1024  # 4GB (비디오 업로드는 청크 단위로 디스크에 바로 씀)
+    UPLOAD_CHUNK_SIZE: int = 1024 * 1024  # 업로드 스트리밍 청크 크기 (업로드당 메모리 사용량)
 
     # 사용량 제한
     MAX_PROJECTS_PER_USER: int = 10
@@ -69,6 +71,71 @@ class Settings(BaseSettings):
     CHUNK_OVERLAP: int = 50
     SIMILARITY_THRESHOLD: float = 0.7
 
+    # 로그인 시도 제한 저장소 (memory, sqlite, redis, local_redis)
+    # 여러 uvicorn 워커를 띄우는 경우 sqlite 또는 redis를 사용해야 제한이 공유됨
+    RATE_LIMIT_BACKEND: str = "memory"
+    RATE_LIMIT_DB_PATH: str = "backend/data/rate_limits.db"
+    REDIS_URL: Optional[str] = None
+
+    # 프로젝트 통계 카운터 테이블 사용 여부 (False면 매번 집계 쿼리 실행)
+    PROJECT_STATS_COUNTERS_ENABLED: bool = True
+
+    # 비디오 텍스트 추출 모델 (워커 프로세스당 한 번 로드)
+    WHISPER_MODEL_SIZE: str = "base"
+    # 음성 인식 엔진 (whisper: openai-whisper FP32, faster-whisper: CTranslate2 CPU 양자화)
+    # 처리량과 정확도 비교는 benchmark_asr.py로 배포 환경에서 측정
+    ASR_BACKEND: str = "whisper"
+    ASR_COMPUTE_TYPE: str = "int8"
+    # 음성 인식 분할/병렬화 (VAD로 무음 제외 후 최대 CHUNK 초 창으로 나눠 WORKERS개 프로세스에서 인식, 0이면 자동)
+    WHISPER_VAD_ENABLED: bool = True
+    WHISPER_CHUNK_SECONDS: float = 120.0
+    WHISPER_CHUNK_OVERLAP_SECONDS: float = 2.0
+    WHISPER_WORKERS: int = 0
+    # 창 안의 무음도 잘라내고 음성만 이어 붙여 인식 (구간 사이 무음은 KEEP 초만 남김, VAD 사용 시에만 적용)
+    WHISPER_SILENCE_TRIM: bool = True
+    WHISPER_SILENCE_KEEP_SECONDS: float = 0.3
+    # /api/videos/summary 음성 인식 백엔드 (whisper: 로컬 오프라인, google: Google Web Speech API)
+    VIDEO_TRANSCRIPTION_BACKEND: str = "whisper"
+    GOOGLE_SPEECH_WINDOW_SECONDS: float = 50.0
+    GOOGLE_SPEECH_WORKERS: int = 4
+    # 미디어 워커 시작 시 Whisper/EasyOCR 모델을 미리 로드할지 여부
+    MODEL_WARMUP_ON_STARTUP: bool = False
+    MODEL_WARMUP_EASYOCR: bool = True
+    # 프레임 OCR 병렬화 (Tesseract 프로세스 수, 0이면 CPU 코어 수 / EasyOCR 배치 크기)
+    OCR_WORKERS: int = 0
+    OCR_BATCH_SIZE: int = 8
+    # OCR 전 텍스트 줄 영역 검출 (검출한 영역만 OCR, 영역이 화면의 이 비율을 넘으면 프레임 전체 OCR)
+    # EasyOCR은 영역 검출을 켜도 OCR_BATCH_SIZE개 프레임의 줄을 한 장으로 모아 배치 인식
+    OCR_TEXT_REGIONS: bool = True
+    OCR_TEXT_REGION_MAX_COVERAGE: float = 0.6
+    # OCR 전 프레임 중복 제거 (dHash 64비트 해밍 거리가 임계값 이하면 같은 화면으로 간주)
+    FRAME_DEDUP_ENABLED: bool = True
+    FRAME_DEDUP_THRESHOLD: int = 5
+    # 프레임 샘플링 방식: "scene"이면 화면 전환마다 한 장(최대 간격은 interval), "interval"이면 고정 간격
+    FRAME_SAMPLING_MODE: str = "scene"
+    FRAME_SCENE_THRESHOLD: float = 0.3  # ffmpeg scene 점수(0~1) 임계값
+    # 프레임 전달 방식: "pipe"면 ffmpeg rawvideo 파이프로 메모리에서 바로 OCR, "files"면 JPEG 파일 경유
+    FRAME_SOURCE: str = "pipe"
+    FRAME_PIPE_MAX_WIDTH: int = 1280  # 파이프 프레임 최대 너비 (링 버퍼 메모리 상한)
+    # Google Drive 다운로드 (범위 요청 병렬 다운로드, 실패 시 DRIVE_DOWNLOAD_DIR의 부분 파일에서 이어받기)
+    DRIVE_DOWNLOAD_CHUNK_MB: int = 16
+    DRIVE_DOWNLOAD_WORKERS: int = 4
+    DRIVE_DOWNLOAD_DIR: str = "backend/temp/drive_downloads"
+    # 같은 영상(SHA-256 또는 Drive md5Checksum)과 같은 처리 설정이면 저장된 결과 재사용
+    VIDEO_RESULT_CACHE_ENABLED: bool = True
+
+    # 미디어 워커 (python -m app.workers.media_worker)
+    MEDIA_JOB_DIR: str = "backend/temp/media_jobs"  # 업로드된 비디오를 워커에 넘기는 디렉토리
+    MEDIA_WORKER_PROCESSES: int = 2
+    MEDIA_WORKER_POLL_INTERVAL: float = 1.0
+    MEDIA_STREAM_POLL_INTERVAL: float = 1.0  # SSE 부분 결과 전송 주기 (초)
+    # 처리 중인 작업의 heartbeat 주기 (초), STALE 초 동안 갱신이 없으면 다시 대기열에 넣음
+    # (워커 풀 감독 스레드가 heartbeat 주기마다 확인하고, 종료된 워커 프로세스도 다시 띄움)
+    MEDIA_JOB_HEARTBEAT_SECONDS: float = 30.0
+    MEDIA_JOB_STALE_SECONDS: float = 300.0
+    # 개발 환경에서 API 서버가 워커 프로세스를 직접 띄울지 여부
+    MEDIA_WORKER_EMBEDDED: bool = False
+
     @property
     def get_absolute_upload_dir(self) -> str:
         """업로드 디렉토리의 절대 경로 반환"""
@@ -89,6 +156,21 @@ class Settings(BaseSettings):
         """임시 디렉토리의 절대 경로 반환"""
         return os.path.join(self.PROJECT_ROOT, self.TEMP_DIR)
 
+    @property
+    def get_absolute_drive_download_dir(self) -> str:
+        """Drive 다운로드 부분 파일 디렉토리의 절대 경로 반환"""
+        return os.path.join(self.PROJECT_ROOT, self.DRIVE_DOWNLOAD_DIR)
+
+    @property
+    def get_absolute_rate_limit_db_path(self) -> str:
+        """로그인 제한 SQLite 파일의 절대 경로 반환"""
+        return os.path.join(self.PROJECT_ROOT, self.RATE_LIMIT_DB_PATH)
+
+    @property
+    def get_absolute_media_job_dir(self) -> str:
+        """미디어 작업 디렉토리의 절대 경로 반환"""
+        return os.path.join(self.PROJECT_ROOT, self.MEDIA_JOB_DIR)
+
     def ensure_directories(self):
         """필요한 디렉토리들이 존재하는지 확인하고 생성"""
         directories = [
@@ -96,6 +178,7 @@ class Settings(BaseSettings):
             self.get_absolute_vector_store_dir,
             self.get_absolute_data_dir,
             self.get_absolute_temp_dir,
+            self.get_absolute_media_job_dir,
         ]
 
         for directory in directories:
@@ -64,6 +64,21 @@ class FileUploadException(ParseNoteLMException):
         )
 
 
+class FileTooLargeException(ParseNoteLMException):
+    """업로드 크기 제한 초과 예외"""
+    
+    def __init__(self, max_bytes: int, filename: Optional[str] = None):
+        details = {"max_bytes": max_bytes}
+        if filename:
+            details["filename"] = filename
+        super().__init__(
+            status_code=413,
+            message=f"파일 크기가 제한({max_bytes // (1024 * 1024)}MB)을 초과했습니다.",
+            error_code="FILE_TOO_LARGE",
+            details=details
+        )
+
+
 class DocumentProcessingException(ParseNoteLMException):
     """문서 처리 관련 예외"""
     
@@ -96,3 +111,15 @@ class AuthorizationException(ParseNoteLMException):
             message=message,
             error_code="AUTHORIZATION_ERROR"
         )
+
+
+class DocumentLimitExceededException(ParseNoteLMException):
+    """프로젝트 문서 수 제한 초과 예외"""
+    
+    def __init__(self, project_id: int, max_documents: int):
+        super().__init__(
+            status_code=400,
+            message=f"프로젝트당 최대 {max_documents}개의 문서만 추가할 수 있습니다.",
+            error_code="DOCUMENT_LIMIT_EXCEEDED",
+            details={"project_id": project_id, "max_documents": max_documents}
+        )
@@ -0,0 +1,81 @@
+"""
+커서(keyset) 기반 페이지네이션 유틸리티
+
+(created_at, id) 내림차순 정렬을 기준으로 마지막 항목의 키를 커서로 넘겨
+offset 없이 다음 페이지를 조회합니다. 페이지 깊이와 관계없이 인덱스 범위 탐색 한 번으로 끝납니다.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, func, or_
+
+
+def encode_cursor(created_at: datetime, item_id: int) -> str:
+    """(created_at, id)를 URL에 안전한 커서 문자열로 변환"""
+    payload = json.dumps([created_at.isoformat(), item_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """커서 문자열을 (created_at, id)로 변환"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, item_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(created_at), int(item_id)
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="유효하지 않은 페이지 커서입니다"
+        )
+
+
+def paginate_keyset(query, created_column, id_column, cursor: Optional[str],
+                    limit: int) -> Tuple[List[Any], Optional[str]]:
+    """
+    쿼리에 커서 조건과 (created_at, id) 내림차순 정렬을 적용해 한 페이지 조회
+
+    Args:
+        query: 필터가 적용된 SQLAlchemy 쿼리
+        created_column: 정렬 기준 생성 시각 컬럼
+        id_column: 동률 해소용 기본 키 컬럼
+        cursor: 이전 페이지의 next_cursor (첫 페이지는 None)
+        limit: 페이지 크기
+
+    Returns:
+        (페이지 항목 목록, 다음 페이지 커서 또는 None)
+    """
+    if cursor:
+        created_at, item_id = decode_cursor(cursor)
+        # created_at <= 조건을 함께 두어 인덱스 범위 탐색이 가능하도록 함
+        query = query.filter(
+            created_column <= created_at,
+            or_(
+                created_column < created_at,
+                and_(created_column == created_at, id_column < item_id),
+            ),
+        )
+
+    # 다음 페이지 존재 여부 확인을 위해 하나 더 조회
+    items = query.order_by(created_column.desc(), id_column.desc()).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        last = items[-1]
+        next_cursor = encode_cursor(
+            getattr(last, created_column.key), getattr(last, id_column.key)
+        )
+    return items, next_cursor
+
+
+def capped_count(query, cap: int) -> int:
+    """
+    쿼리 결과 수를 cap까지만 세기 (LIMIT cap 서브쿼리 위에서 COUNT)
+
+    한도 도달 여부만 필요할 때 전체 count 대신 사용합니다. cap 이상이면 cap을 반환합니다.
+    """
+    limited = query.order_by(None).limit(cap).subquery()
+    return query.session.query(func.count()).select_from(limited).scalar() or 0
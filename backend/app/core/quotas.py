@@ -0,0 +1,26 @@
+"""
+사용량 제한 검사
+
+업로드 API와 비디오 스트리밍 색인처럼 프로젝트에 문서를 만드는 모든 경로에서 같은 검사를 사용합니다.
+"""
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.exceptions import DocumentLimitExceededException
+from app.core.pagination import capped_count
+from app.models.document import Document
+
+
+def ensure_project_document_quota(db: Session, project_id: int) -> None:
+    """
+    프로젝트에 문서를 하나 더 추가할 수 있는지 확인 (한도까지만 셈)
+
+    Raises:
+        DocumentLimitExceededException: 활성 문서 수가 MAX_DOCUMENTS_PER_PROJECT 이상인 경우
+    """
+    query = db.query(Document.id).filter(
+        Document.project_id == project_id,
+        Document.deleted_at.is_(None)
+    )
+    if capped_count(query, settings.MAX_DOCUMENTS_PER_PROJECT) >= settings.MAX_DOCUMENTS_PER_PROJECT:
+        raise DocumentLimitExceededException(project_id, settings.MAX_DOCUMENTS_PER_PROJECT)
@@ -0,0 +1,338 @@
+"""
+로그인 시도 제한용 공유 상태 백엔드
+
+슬라이딩 윈도우 카운터(현재/이전 고정 윈도우 두 칸) 방식으로 키당 O(1) 메모리만 사용하며,
+일정 시간 사용되지 않은 키는 자동으로 만료됩니다.
+
+- memory: 프로세스 내부 딕셔너리 (단일 워커 개발용)
+- sqlite: 공유 SQLite 파일 (여러 uvicorn 워커 간 일관된 제한)
+- redis: Redis 호환 클라이언트 (운영용, 로컬에서는 LocalRedis 대체 구현 사용 가능)
+"""
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _window_position(now: float, window_seconds: int) -> Tuple[int, float]:
+    """현재 시각이 속한 고정 윈도우 번호와 윈도우 내 경과 비율 반환"""
+    bucket = int(now // window_seconds)
+    elapsed = (now - bucket * window_seconds) / window_seconds
+    return bucket, elapsed
+
+
+def _sliding_count(bucket: int, elapsed: float, stored_bucket: int,
+                   current: int, previous: int) -> float:
+    """저장된 두 윈도우 카운터로 슬라이딩 윈도우 내 시도 횟수 추정"""
+    if stored_bucket == bucket:
+        return current + previous * (1.0 - elapsed)
+    if stored_bucket == bucket - 1:
+        # 저장된 현재 윈도우가 이제 이전 윈도우가 됨
+        return current * (1.0 - elapsed)
+    return 0.0
+
+
+class RateLimitBackend:
+    """시도 횟수 저장소 인터페이스"""
+
+    def hit(self, key: str, window_seconds: int, now: Optional[float] = None) -> float:
+        """시도 1회를 기록하고 기록 후의 슬라이딩 윈도우 카운트 반환"""
+        raise NotImplementedError
+
+    def count(self, key: str, window_seconds: int, now: Optional[float] = None) -> float:
+        """슬라이딩 윈도우 내 시도 횟수 추정값 반환"""
+        raise NotImplementedError
+
+    def reset(self, key: str, window_seconds: int) -> None:
+        """키의 시도 기록 삭제"""
+        raise NotImplementedError
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """프로세스 내부 메모리 백엔드"""
+
+    def __init__(self, sweep_interval: int = 60):
+        # key -> [bucket, current, previous, window_seconds]
+        self._counters: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+        self._sweep_interval = sweep_interval
+        self._last_sweep = 0.0
+
+    def _sweep(self, now: float) -> None:
+        """두 윈도우 이상 사용되지 않은 키 제거"""
+        if now - self._last_sweep < self._sweep_interval:
+            return
+        self._last_sweep = now
+        expired = [
+            key for key, (bucket, _, _, window) in self._counters.items()
+            if int(now // window) - bucket > 1
+        ]
+        for key in expired:
+            del self._counters[key]
+
+    def hit(self, key: str, window_seconds: int, now: Optional[float] = None) -> float:
+        now = time.time() if now is None else now
+        bucket, elapsed = _window_position(now, window_seconds)
+        with self._lock:
+            self._sweep(now)
+            entry = self._counters.get(key)
+            if entry is None or bucket - entry[0] > 1:
+                entry = [bucket, 0, 0, window_seconds]
+            elif entry[0] == bucket - 1:
+                entry = [bucket, 0, entry[1], window_seconds]
+            entry[1] += 1
+            self._counters[key] = entry
+            return _sliding_count(bucket, elapsed, entry[0], entry[1], entry[2])
+
+    def count(self, key: str, window_seconds: int, now: Optional[float] = None) -> float:
+        now = time.time() if now is None else now
+        bucket, elapsed = _window_position(now, window_seconds)
+        with self._lock:
+            entry = self._counters.get(key)
+            if entry is None:
+                return 0.0
+            return _sliding_count(bucket, elapsed, entry[0], entry[1], entry[2])
+
+    def reset(self, key: str, window_seconds: int) -> None:
+        with self._lock:
+            self._counters.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._counters)
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """공유 SQLite 파일 백엔드 - 같은 호스트의 여러 워커가 하나의 카운터를 공유"""
+
+    def __init__(self, db_path: str, sweep_interval: int = 60):
+        self.db_path = db_path
+        self._sweep_interval = sweep_interval
+        self._last_sweep = 0.0
+        self._local = threading.local()
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS login_rate_limits ("
+                " key TEXT PRIMARY KEY,"
+                " bucket INTEGER NOT NULL,"
+                " current INTEGER NOT NULL,"
+                " previous INTEGER NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_login_rate_limits_expires_at"
+                " ON login_rate_limits (expires_at)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 연결 반환"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def _sweep(self, conn: sqlite3.Connection, now: float) -> None:
+        if now - self._last_sweep < self._sweep_interval:
+            return
+        self._last_sweep = now
+        conn.execute("DELETE FROM login_rate_limits WHERE expires_at < ?", (now,))
+
+    def hit(self, key: str, window_seconds: int, now: Optional[float] = None) -> float:
+        now = time.time() if now is None else now
+        bucket, elapsed = _window_position(now, window_seconds)
+        expires_at = (bucket + 2) * window_seconds
+        conn = self._connect()
+        # BEGIN IMMEDIATE로 쓰기 잠금을 먼저 잡아 워커 간 갱신 경합 방지
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._sweep(conn, now)
+            row = conn.execute(
+                "SELECT bucket, current, previous FROM login_rate_limits WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None or bucket - row[0] > 1:
+                current, previous = 1, 0
+            elif row[0] == bucket - 1:
+                current, previous = 1, row[1]
+            else:
+                current, previous = row[1] + 1, row[2]
+            conn.execute(
+                "INSERT OR REPLACE INTO login_rate_limits"
+                " (key, bucket, current, previous, expires_at) VALUES (?, ?, ?, ?, ?)",
+                (key, bucket, current, previous, expires_at),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return _sliding_count(bucket, elapsed, bucket, current, previous)
+
+    def count(self, key: str, window_seconds: int, now: Optional[float] = None) -> float:
+        now = time.time() if now is None else now
+        bucket, elapsed = _window_position(now, window_seconds)
+        row = self._connect().execute(
+            "SELECT bucket, current, previous FROM login_rate_limits WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return 0.0
+        return _sliding_count(bucket, elapsed, row[0], row[1], row[2])
+
+    def reset(self, key: str, window_seconds: int) -> None:
+        self._connect().execute("DELETE FROM login_rate_limits WHERE key = ?", (key,))
+
+
+class LocalRedis:
+    """
+    Redis 클라이언트의 일부 명령(INCR, EXPIRE, MGET, DELETE)만 흉내 내는 로컬 대체 구현
+
+    redis 서버 없이 RedisRateLimitBackend를 개발/테스트할 때 사용합니다.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, int] = {}
+        self._expiry: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _purge(self, key: str, now: float) -> None:
+        expires_at = self._expiry.get(key)
+        if expires_at is not None and expires_at <= now:
+            self._data.pop(key, None)
+            self._expiry.pop(key, None)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self._purge(key, time.time())
+            self._data[key] = self._data.get(key, 0) + 1
+            return self._data[key]
+
+    def expire(self, key: str, seconds: int) -> bool:
+        with self._lock:
+            if key not in self._data:
+                return False
+            self._expiry[key] = time.time() + seconds
+            return True
+
+    def mget(self, *keys: str) -> List[Optional[bytes]]:
+        now = time.time()
+        with self._lock:
+            values = []
+            for key in keys:
+                self._purge(key, now)
+                value = self._data.get(key)
+                values.append(str(value).encode() if value is not None else None)
+            return values
+
+    def delete(self, *keys: str) -> int:
+        with self._lock:
+            removed = 0
+            for key in keys:
+                if self._data.pop(key, None) is not None:
+                    removed += 1
+                self._expiry.pop(key, None)
+            return removed
+
+    def __len__(self) -> int:
+        now = time.time()
+        with self._lock:
+            for key in list(self._data):
+                self._purge(key, now)
+            return len(self._data)
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """Redis 백엔드 - 윈도우별 키에 INCR 후 TTL을 걸어 유휴 키가 자동 만료됨"""
+
+    def __init__(self, client, prefix: str = "login_rl"):
+        self.client = client
+        self.prefix = prefix
+
+    def _key(self, key: str, bucket: int) -> str:
+        return f"{self.prefix}:{key}:{bucket}"
+
+    def _estimate(self, key: str, window_seconds: int, now: float) -> float:
+        bucket, elapsed = _window_position(now, window_seconds)
+        current, previous = self.client.mget(
+            self._key(key, bucket), self._key(key, bucket - 1)
+        )
+        return int(current or 0) + int(previous or 0) * (1.0 - elapsed)
+
+    def hit(self, key: str, window_seconds: int, now: Optional[float] = None) -> float:
+        now = time.time() if now is None else now
+        bucket, _ = _window_position(now, window_seconds)
+        bucket_key = self._key(key, bucket)
+        self.client.incr(bucket_key)
+        self.client.expire(bucket_key, window_seconds * 2)
+        return self._estimate(key, window_seconds, now)
+
+    def count(self, key: str, window_seconds: int, now: Optional[float] = None) -> float:
+        now = time.time() if now is None else now
+        return self._estimate(key, window_seconds, now)
+
+    def reset(self, key: str, window_seconds: int) -> None:
+        # TTL이 남아 있을 수 있는 현재/이전 윈도우 키만 삭제
+        bucket, _ = _window_position(time.time(), window_seconds)
+        self.client.delete(self._key(key, bucket), self._key(key, bucket - 1))
+
+
+_backend: Optional[RateLimitBackend] = None
+_backend_lock = threading.Lock()
+
+
+def create_rate_limit_backend(backend_type: str = "memory", sqlite_path: Optional[str] = None,
+                              redis_url: Optional[str] = None) -> RateLimitBackend:
+    """
+    설정값에 따라 로그인 제한 백엔드 생성
+
+    Args:
+        backend_type: memory, sqlite, redis, local_redis 중 하나
+        sqlite_path: sqlite 백엔드 파일 경로
+        redis_url: redis 백엔드 연결 URL
+
+    Returns:
+        RateLimitBackend 인스턴스
+    """
+    backend_type = (backend_type or "memory").lower()
+    if backend_type == "sqlite":
+        if not sqlite_path:
+            raise ValueError("sqlite 백엔드에는 RATE_LIMIT_DB_PATH 설정이 필요합니다")
+        return SQLiteRateLimitBackend(sqlite_path)
+    if backend_type == "redis":
+        if not redis_url:
+            raise ValueError("redis 백엔드에는 REDIS_URL 설정이 필요합니다")
+        import redis  # 선택 의존성
+        return RedisRateLimitBackend(redis.Redis.from_url(redis_url))
+    if backend_type == "local_redis":
+        return RedisRateLimitBackend(LocalRedis())
+    if backend_type != "memory":
+        logger.warning(f"알 수 없는 RATE_LIMIT_BACKEND '{backend_type}', memory 백엔드를 사용합니다")
+    return InMemoryRateLimitBackend()
+
+
+def get_rate_limit_backend() -> RateLimitBackend:
+    """전역 로그인 제한 백엔드 반환 (최초 호출 시 설정에 따라 생성)"""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                from app.core.config import settings
+                _backend = create_rate_limit_backend(
+                    settings.RATE_LIMIT_BACKEND,
+                    sqlite_path=settings.get_absolute_rate_limit_db_path,
+                    redis_url=settings.REDIS_URL,
+                )
+                logger.info(f"로그인 제한 백엔드: {type(_backend).__name__}")
+    return _backend
+
+
+def set_rate_limit_backend(backend: Optional[RateLimitBackend]) -> None:
+    """전역 로그인 제한 백엔드 교체 (테스트용)"""
+    global _backend
+    _backend = backend
+
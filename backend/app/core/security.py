@@ -2,53 +2,33 @@
 보안 관련 유틸리티
 """
 from datetime import datetime, timedelta
-from typing import Optional, Dict
+from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
+from app.core.rate_limit import get_rate_limit_backend
 
 # 비밀번호 해싱 컨텍스트
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
-# 로그인 시도 추적을 위한 메모리 저장소
-login_attempts: Dict[str, list] = {}
-
 class LoginRateLimiter:
-    """로그인 시도 제한 클래스"""
+    """로그인 시도 제한 클래스 (저장소는 RATE_LIMIT_BACKEND 설정으로 선택)"""
     
     @staticmethod
     def is_blocked(email: str, max_attempts: int = 5, window_minutes: int = 15) -> bool:
         """사용자가 로그인 시도 제한에 걸렸는지 확인"""
-        if email not in login_attempts:
-            return False
-        
-        now = datetime.utcnow()
-        cutoff_time = now - timedelta(minutes=window_minutes)
-        
-        # 시간 윈도우 내의 시도만 필터링
-        recent_attempts = [
-            attempt for attempt in login_attempts[email]
-            if attempt > cutoff_time
-        ]
-        
-        # 정리된 시도 목록으로 업데이트
-        login_attempts[email] = recent_attempts
-        
-        return len(recent_attempts) >= max_attempts
+        attempts = get_rate_limit_backend().count(email, window_minutes * 60)
+        return attempts >= max_attempts
     
     @staticmethod
-    def record_failed_attempt(email: str):
+    def record_failed_attempt(email: str, window_minutes: int = 15):
         """실패한 로그인 시도 기록"""
-        now = datetime.utcnow()
-        if email not in login_attempts:
-            login_attempts[email] = []
-        login_attempts[email].append(now)
+        get_rate_limit_backend().hit(email, window_minutes * 60)
     
     @staticmethod
-    def clear_attempts(email: str):
+    def clear_attempts(email: str, window_minutes: int = 15):
         """성공한 로그인 후 시도 기록 초기화"""
-        if email in login_attempts:
-            del login_attempts[email]
+        get_rate_limit_backend().reset(email, window_minutes * 60)
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """비밀번호 검증"""
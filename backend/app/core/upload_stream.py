@@ -0,0 +1,70 @@
+"""
+업로드 스트리밍 저장
+
+`await file.read()`로 업로드 전체를 메모리에 올리지 않고, 청크 단위로 디스크에 쓰면서
+크기 제한을 확인하고 내용 해시를 함께 계산합니다.
+"""
+import hashlib
+import os
+from typing import NamedTuple, Optional
+
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.exceptions import FileTooLargeException
+
+
+class StoredUpload(NamedTuple):
+    """디스크에 저장한 업로드 파일 정보"""
+    path: str
+    size: int
+    sha256: str
+    md5: str
+
+
+async def stream_upload_to_file(file: UploadFile, dest_path: str, max_bytes: Optional[int] = None,
+                                chunk_size: Optional[int] = None) -> StoredUpload:
+    """
+    업로드 파일을 청크 단위로 디스크에 쓰면서 크기 제한 확인과 해시 계산
+
+    메모리에는 청크 하나만 올라가므로 파일 크기와 무관하게 업로드당 메모리 사용량이 일정합니다.
+    SHA-256/MD5는 쓰는 동안 함께 계산해 비디오 결과 캐시 키로 사용합니다.
+
+    Args:
+        file: 업로드 파일
+        dest_path: 저장 경로
+        max_bytes: 최대 크기 (넘으면 쓰던 파일을 지우고 FileTooLargeException)
+        chunk_size: 한 번에 읽을 크기 (None이면 설정값)
+
+    Returns:
+        StoredUpload(경로, 크기, SHA-256, MD5)
+    """
+    if max_bytes and file.size and file.size > max_bytes:
+        raise FileTooLargeException(max_bytes, file.filename)
+
+    chunk_size = chunk_size or settings.UPLOAD_CHUNK_SIZE
+    sha256, md5 = hashlib.sha256(), hashlib.md5()
+    size = 0
+
+    def write(out, chunk: bytes) -> None:
+        # 해시 계산과 디스크 쓰기는 이벤트 루프를 막지 않도록 스레드에서 처리
+        sha256.update(chunk)
+        md5.update(chunk)
+        out.write(chunk)
+
+    try:
+        with open(dest_path, "wb") as out:
+            while chunk := await file.read(chunk_size):
+                size += len(chunk)
+                if max_bytes and size > max_bytes:
+                    raise FileTooLargeException(max_bytes, file.filename)
+                await run_in_threadpool(write, out, chunk)
+    except BaseException:
+        try:
+            os.remove(dest_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+    return StoredUpload(dest_path, size, sha256.hexdigest(), md5.hexdigest())
@@ -7,8 +7,11 @@ from .user import User, UserRole
 from .project import Project
 from .project_member import ProjectMember, MemberRole
 from .document import Document, DocumentType, ProcessingStatus
+from .project_stats import ProjectDocumentStats
 from .embedding import Embedding
 from .chat_history import ChatHistory, MessageRole, MessageType
+from .media_job import MediaJob, MediaJobStatus, MediaJobSegment
+from .video_result import VideoResultCache
 
 # 모든 모델을 외부에서 사용할 수 있도록 export
 __all__ = [
@@ -25,6 +28,7 @@ __all__ = [
     "Document",
     "DocumentType", 
     "ProcessingStatus",
+    "ProjectDocumentStats",
     
     # Embedding 관련
     "Embedding",
@@ -33,4 +37,10 @@ __all__ = [
     "ChatHistory",
     "MessageRole",
     "MessageType",
+    
+    # MediaJob 관련
+    "MediaJob",
+    "MediaJobStatus",
+    "MediaJobSegment",
+    "VideoResultCache",
 ]
\ No newline at end of file
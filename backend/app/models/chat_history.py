@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional, Dict, Any, List
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean, Float, JSON, Enum
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean, Float, JSON, Enum, Index
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 import enum
@@ -72,6 +72,11 @@ class ChatHistory(Base):
     project = relationship("Project", back_populates="chat_histories")
     parent_message = relationship("ChatHistory", remote_side=[id], backref="child_messages")
 
+    # 프로젝트별 최신순 조회용 복합 인덱스 (alembic 3f9a2c1d7e45 참고)
+    __table_args__ = (
+        Index("ix_chat_histories_project_id_created_at", "project_id", "created_at"),
+    )
+
     def __repr__(self):
         return (f"<ChatHistory(id={self.id}, project_id={self.project_id}, "
                 f"role={self.role}, type={self.message_type})>")
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, BigInteger, Text, DateTime, Boolean, ForeignKey, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, BigInteger, Text, DateTime, Boolean, ForeignKey, Enum, Index
+from sqlalchemy.orm import relationship, deferred
 from app.core.database import Base
 import enum
 from datetime import datetime
@@ -46,7 +46,9 @@ class Document(Base):
     processing_error = Column(Text, nullable=True)  # 처리 실패 시 에러 메시지
     
     # 문서 내용 정보
-    content = Column(Text, nullable=True)  # 추출된 텍스트 내용
+    # 추출된 텍스트 내용 - 수 MB일 수 있어 목록/권한 확인 쿼리에서는 읽지 않도록 지연 로딩
+    # (필요한 곳에서는 접근 시 별도 SELECT로 로드되거나 undefer(Document.content)로 함께 조회)
+    content = deferred(Column(Text, nullable=True), group="content")
     content_length = Column(Integer, default=0, nullable=False)  # 문자 수
     chunk_count = Column(Integer, default=0, nullable=False)  # 분할된 청크 수
     
@@ -63,6 +65,12 @@ class Document(Base):
     project = relationship("Project", back_populates="documents")
     embeddings = relationship("Embedding", back_populates="document", cascade="all, delete-orphan")
 
+    # 자주 쓰이는 조회 패턴용 복합 인덱스 (alembic 3f9a2c1d7e45 참고)
+    __table_args__ = (
+        Index("ix_documents_project_id_deleted_at_created_at", "project_id", "deleted_at", "created_at"),
+        Index("ix_documents_project_id_processing_status", "project_id", "processing_status"),
+    )
+
     def __repr__(self):
         return f"<Document(id={self.id}, filename='{self.filename}', project_id={self.project_id})>"
 
@@ -1,5 +1,6 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean, Float, JSON
+from typing import Any, Dict, Iterable, List, Optional
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean, Float, JSON, insert
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 
@@ -101,6 +102,54 @@ class Embedding(Base):
             
         return embedding
 
+    @classmethod
+    def build_row(cls, document_id: int, chunk_index: int, chunk_text: str,
+                  embedding_vector: Optional[list] = None,
+                  embedding_model: str = "text-embedding-ada-002",
+                  metadata: Optional[dict] = None) -> Dict[str, Any]:
+        """bulk_insert용 행 딕셔너리 생성 (create_from_chunk와 같은 규칙으로 값 계산)"""
+        now = datetime.utcnow()
+        return {
+            "document_id": document_id,
+            "chunk_index": chunk_index,
+            "chunk_text": chunk_text,
+            "chunk_size": len(chunk_text),
+            "embedding_vector": embedding_vector or [],
+            "embedding_model": embedding_model,
+            "vector_dimension": len(embedding_vector) if embedding_vector else 1536,
+            "document_metadata": metadata or {},
+            "tokens": len(chunk_text.split()) if chunk_text else 0,
+            "created_at": now,
+            "updated_at": now,
+            "is_deleted": False,
+        }
+
+    @classmethod
+    def bulk_insert(cls, session, rows: Iterable[Dict[str, Any]], batch_size: int = 1000) -> int:
+        """
+        청크 임베딩 행을 ORM 단위 작업(identity map) 없이 executemany로 저장
+
+        rows는 제너레이터로 받을 수 있으며, 행 딕셔너리를 한꺼번에 메모리에 쌓지 않도록
+        batch_size행마다 executemany 한 번씩 실행합니다 (문서 하나가 batch_size행 이하면 한 번).
+        커밋은 호출한 쪽에서 수행합니다.
+
+        Returns:
+            저장한 행 수
+        """
+        statement = insert(cls.__table__)
+        total = 0
+        batch: List[Dict[str, Any]] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                session.execute(statement, batch)
+                total += len(batch)
+                batch = []
+        if batch:
+            session.execute(statement, batch)
+            total += len(batch)
+        return total
+
     @classmethod
     def get_by_document(cls, session, document_id: int, include_deleted: bool = False):
         """문서별 임베딩 조회"""
@@ -0,0 +1,102 @@
+"""
+미디어 처리 작업 모델
+
+비디오 처리(다운로드, 오디오/프레임 추출, 음성 인식, OCR, 요약)는 API 프로세스가 아니라
+별도 미디어 워커 프로세스에서 실행됩니다. API는 이 테이블에 작업을 넣고 바로 응답하며,
+워커는 대기 중인 작업을 하나씩 가져가 진행률을 갱신합니다.
+"""
+import enum
+import uuid
+from datetime import datetime
+
+from sqlalchemy import (
+    Column, Integer, String, Float, Text, DateTime, Boolean, ForeignKey, JSON, Enum, Index, UniqueConstraint
+)
+
+from app.core.database import Base
+
+
+class MediaJobStatus(str, enum.Enum):
+    """미디어 작업 상태"""
+    QUEUED = "queued"          # 대기 중
+    RUNNING = "running"        # 워커에서 처리 중
+    COMPLETED = "completed"    # 처리 완료
+    FAILED = "failed"          # 처리 실패
+    CANCELLED = "cancelled"    # 사용자 취소
+
+
+class MediaJob(Base):
+    """미디어 처리 작업 모델"""
+    __tablename__ = "media_jobs"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+
+    # 작업 종류와 입력 (예: google_drive_video, uploaded_video)
+    job_type = Column(String(50), nullable=False)
+    payload = Column(JSON, nullable=False, default=dict)
+
+    # 진행 상태
+    status = Column(Enum(MediaJobStatus), default=MediaJobStatus.QUEUED, nullable=False)
+    progress = Column(Float, default=0.0, nullable=False)  # 0.0 ~ 1.0
+    stage = Column(String(50), nullable=True)  # 현재 처리 단계
+    cancel_requested = Column(Boolean, default=False, nullable=False)
+
+    # 결과
+    result = Column(JSON, nullable=True)
+    error_message = Column(Text, nullable=True)
+
+    # 처리 중인 워커 식별자 (호스트:PID)
+    worker_id = Column(String(100), nullable=True)
+
+    # 타임스탬프
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+
+    # 워커가 가장 오래된 대기 작업을 가져가는 조회용 인덱스
+    __table_args__ = (
+        Index("ix_media_jobs_status_created_at", "status", "created_at"),
+    )
+
+    def __repr__(self):
+        return f"<MediaJob(id={self.id}, type='{self.job_type}', status='{self.status}')>"
+
+    @property
+    def is_finished(self) -> bool:
+        """더 이상 진행되지 않는 상태인지 확인"""
+        return self.status in (
+            MediaJobStatus.COMPLETED,
+            MediaJobStatus.FAILED,
+            MediaJobStatus.CANCELLED,
+        )
+
+
+class MediaJobSegment(Base):
+    """
+    처리 중인 미디어 작업이 내보낸 부분 결과 (음성 인식/화면 텍스트 구간)
+
+    워커는 시간 창 하나를 끝낼 때마다 세그먼트를 추가하고, 클라이언트는 seq 이후의
+    세그먼트를 폴링하거나 SSE로 받아 전체 처리가 끝나기 전에 내용을 볼 수 있습니다.
+    """
+    __tablename__ = "media_job_segments"
+
+    TRANSCRIPT = "transcript"
+    SCREEN_TEXT = "screen_text"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(String(36), ForeignKey("media_jobs.id", ondelete="CASCADE"), nullable=False)
+    seq = Column(Integer, nullable=False)  # 작업 내 순번 (1부터 시작)
+    kind = Column(String(20), nullable=False)
+    start_seconds = Column(Float, nullable=True)
+    end_seconds = Column(Float, nullable=True)
+    text = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("job_id", "seq", name="uq_media_job_segments_job_id_seq"),
+    )
+
+    def __repr__(self):
+        return f"<MediaJobSegment(job_id={self.job_id}, seq={self.seq}, kind='{self.kind}')>"
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean
+from sqlalchemy import Column, Integer, String, DateTime, Text, ForeignKey, Boolean, Index, text
 from sqlalchemy.orm import relationship, validates
 from app.core.database import Base
 
@@ -32,6 +32,16 @@ class Project(Base):
     chat_histories = relationship("ChatHistory", back_populates="project", cascade="all, delete-orphan")
     members = relationship("ProjectMember", back_populates="project", cascade="all, delete-orphan")
 
+    # 자주 쓰이는 조회 패턴용 복합/부분 인덱스 (alembic 3f9a2c1d7e45 참고)
+    __table_args__ = (
+        Index("ix_projects_user_id_deleted_at", "user_id", "deleted_at"),
+        Index(
+            "ix_projects_active_user_id_created_at", "user_id", "created_at",
+            sqlite_where=text("deleted_at IS NULL"),
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+    )
+
     def __repr__(self):
         return f"<Project(id={self.id}, title='{self.title}', user_id={self.user_id})>"
 
@@ -0,0 +1,214 @@
+"""
+프로젝트 문서 통계 카운터 모델
+
+문서가 생성되거나 상태가 바뀔 때(mark_processing, mark_completed, mark_failed, 소프트 삭제)
+같은 트랜잭션 안에서 카운터를 증감시켜 대시보드 통계를 O(1) 조회로 제공합니다.
+카운터 행이 없는 프로젝트는 documents 테이블 집계로 한 번 채워 넣습니다.
+"""
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import Column, Integer, BigInteger, DateTime, ForeignKey, case, event, func, select, update, insert
+from sqlalchemy.orm import attributes
+
+from app.core.database import Base
+from app.models.document import Document, ProcessingStatus
+
+
+STATUS_COLUMNS = {
+    status: f"{status.value}_documents" for status in ProcessingStatus
+}
+
+# 카운터에 영향을 주는 Document 속성
+TRACKED_ATTRIBUTES = ("processing_status", "file_size", "deleted_at", "project_id")
+
+
+class ProjectDocumentStats(Base):
+    """프로젝트별 문서 통계 카운터"""
+    __tablename__ = "project_document_stats"
+
+    project_id = Column(Integer, ForeignKey("projects.id"), primary_key=True)
+
+    # 활성(삭제되지 않은) 문서 수
+    total_documents = Column(Integer, default=0, nullable=False)
+    pending_documents = Column(Integer, default=0, nullable=False)
+    uploading_documents = Column(Integer, default=0, nullable=False)
+    processing_documents = Column(Integer, default=0, nullable=False)
+    completed_documents = Column(Integer, default=0, nullable=False)
+    failed_documents = Column(Integer, default=0, nullable=False)
+    total_size_bytes = Column(BigInteger, default=0, nullable=False)
+
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False)
+
+    def __repr__(self):
+        return f"<ProjectDocumentStats(project_id={self.project_id}, total={self.total_documents})>"
+
+    def to_dict(self) -> Dict[str, int]:
+        """통계 딕셔너리 반환"""
+        data = {"total_documents": self.total_documents, "total_size_bytes": self.total_size_bytes}
+        for column in STATUS_COLUMNS.values():
+            data[column] = getattr(self, column)
+        return data
+
+    @staticmethod
+    def aggregate_statement(project_id: int):
+        """documents 테이블에서 프로젝트 통계를 한 번의 집계 쿼리로 계산하는 SELECT 문"""
+        columns = [
+            func.count(Document.id).label("total_documents"),
+            func.coalesce(func.sum(Document.file_size), 0).label("total_size_bytes"),
+        ]
+        for status, column in STATUS_COLUMNS.items():
+            columns.append(
+                func.coalesce(
+                    func.sum(case((Document.processing_status == status, 1), else_=0)), 0
+                ).label(column)
+            )
+        return select(*columns).where(
+            Document.project_id == project_id,
+            Document.deleted_at.is_(None),
+        )
+
+    @classmethod
+    def aggregate(cls, session, project_id: int) -> Dict[str, int]:
+        """documents 테이블 집계로 통계 계산"""
+        row = session.execute(cls.aggregate_statement(project_id)).mappings().one()
+        return {key: int(value or 0) for key, value in row.items()}
+
+    @classmethod
+    def get_for_project(cls, session, project_id: int) -> Dict[str, int]:
+        """
+        프로젝트 통계 조회 - 카운터 행이 있으면 그대로 반환하고,
+        없으면 집계 결과로 카운터 행을 만든 뒤 반환
+        """
+        stats = session.get(cls, project_id)
+        if stats is not None:
+            return stats.to_dict()
+
+        data = cls.aggregate(session, project_id)
+        session.add(cls(project_id=project_id, **data))
+        try:
+            session.commit()
+        except Exception:
+            # 동시에 다른 요청이 먼저 만든 경우
+            session.rollback()
+        return data
+
+    @classmethod
+    def rebuild(cls, session, project_id: int) -> Dict[str, int]:
+        """집계 쿼리로 카운터 행을 다시 계산 (수동 보정용)"""
+        data = cls.aggregate(session, project_id)
+        stats = session.get(cls, project_id)
+        if stats is None:
+            session.add(cls(project_id=project_id, **data))
+        else:
+            for key, value in data.items():
+                setattr(stats, key, value)
+        session.commit()
+        return data
+
+
+def _apply_delta(connection, project_id: int, delta: Dict[str, int]) -> None:
+    """카운터 행에 증감 적용 (행이 없으면 집계 결과로 생성)"""
+    delta = {key: value for key, value in delta.items() if value}
+    if not delta:
+        return
+
+    table = ProjectDocumentStats.__table__
+    values = {key: table.c[key] + value for key, value in delta.items()}
+    values["updated_at"] = datetime.utcnow()
+    result = connection.execute(
+        update(table).where(table.c.project_id == project_id).values(**values)
+    )
+    if result.rowcount:
+        return
+
+    # 플러시 중이므로 집계 결과에 이번 변경이 이미 반영되어 있음
+    row = connection.execute(ProjectDocumentStats.aggregate_statement(project_id)).mappings().one()
+    connection.execute(
+        insert(table).values(
+            project_id=project_id,
+            updated_at=datetime.utcnow(),
+            **{key: int(value or 0) for key, value in row.items()},
+        )
+    )
+
+
+def _document_delta(status: Optional[ProcessingStatus], file_size: Optional[int], sign: int) -> Dict[str, int]:
+    delta = {"total_documents": sign, "total_size_bytes": sign * (file_size or 0)}
+    if status is not None:
+        delta[STATUS_COLUMNS[ProcessingStatus(status)]] = sign
+    return delta
+
+
+def _merge(*deltas: Dict[str, int]) -> Dict[str, int]:
+    merged: Dict[str, int] = {}
+    for delta in deltas:
+        for key, value in delta.items():
+            merged[key] = merged.get(key, 0) + value
+    return merged
+
+
+def _previous_value(target: Any, name: str) -> Any:
+    """플러시 직전 값 반환 (변경되지 않았으면 현재 값)"""
+    history = attributes.get_history(target, name)
+    if history.deleted:
+        return history.deleted[0]
+    return getattr(target, name)
+
+
+def _counters_enabled() -> bool:
+    from app.core.config import settings
+    return settings.PROJECT_STATS_COUNTERS_ENABLED
+
+
+def _load_previous_value(target, value, oldvalue, initiator):
+    return value
+
+
+# 커밋 후 만료된 속성에 값을 대입해도 이전 값이 히스토리에 남도록 active_history 설정
+for _name in TRACKED_ATTRIBUTES:
+    event.listen(getattr(Document, _name), "set", _load_previous_value,
+                 active_history=True, retval=True)
+
+
+@event.listens_for(Document, "after_insert")
+def _document_inserted(mapper, connection, target: Document) -> None:
+    if not _counters_enabled() or target.deleted_at is not None:
+        return
+    _apply_delta(connection, target.project_id,
+                 _document_delta(target.processing_status, target.file_size, 1))
+
+
+@event.listens_for(Document, "after_update")
+def _document_updated(mapper, connection, target: Document) -> None:
+    if not _counters_enabled():
+        return
+
+    if not any(attributes.get_history(target, name).has_changes() for name in TRACKED_ATTRIBUTES):
+        return
+
+    old_project_id = _previous_value(target, "project_id")
+    was_active = _previous_value(target, "deleted_at") is None
+    is_active = target.deleted_at is None
+
+    removed = _document_delta(
+        _previous_value(target, "processing_status"),
+        _previous_value(target, "file_size"),
+        -1,
+    ) if was_active else {}
+    added = _document_delta(target.processing_status, target.file_size, 1) if is_active else {}
+
+    if old_project_id == target.project_id:
+        _apply_delta(connection, target.project_id, _merge(removed, added))
+    else:
+        _apply_delta(connection, old_project_id, removed)
+        _apply_delta(connection, target.project_id, added)
+
+
+@event.listens_for(Document, "after_delete")
+def _document_deleted(mapper, connection, target: Document) -> None:
+    if not _counters_enabled() or _previous_value(target, "deleted_at") is not None:
+        return
+    _apply_delta(connection, target.project_id,
+                 _document_delta(_previous_value(target, "processing_status"),
+                                 _previous_value(target, "file_size"), -1))
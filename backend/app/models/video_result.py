@@ -0,0 +1,43 @@
+"""
+비디오 처리 결과 캐시 모델
+
+같은 영상을 다시 올리거나 같은 Google Drive 파일을 다시 처리하면 다운로드, ffmpeg, Whisper,
+OCR을 처음부터 반복하게 됩니다. 영상 내용 해시(SHA-256 또는 Drive md5Checksum)와
+파이프라인 설정 해시를 키로 음성 인식/화면 텍스트 결과와 요약 내용을 저장해 재사용합니다.
+"""
+from datetime import datetime
+
+from sqlalchemy import Column, Integer, String, DateTime, JSON, Index
+
+from app.core.database import Base
+
+
+class VideoResultCache(Base):
+    """비디오 처리 결과 캐시 항목"""
+    __tablename__ = "video_result_cache"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    # 영상 내용 해시 (업로드는 둘 다, Drive는 다운로드 전에는 md5만 알 수 있음)
+    sha256 = Column(String(64), nullable=True)
+    md5 = Column(String(32), nullable=True)
+    # 결과에 영향을 주는 파이프라인 설정(모델, OCR 엔진, 프레임 간격 등)의 해시
+    config_hash = Column(String(64), nullable=False)
+    config = Column(JSON, nullable=False, default=dict)
+
+    # 저장된 결과 (extract_all_text_from_video 결과와 요약 내용)
+    extraction = Column(JSON, nullable=False)
+    summary = Column(JSON, nullable=True)
+    source_filename = Column(String(255), nullable=True)
+
+    hit_count = Column(Integer, default=0, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    last_hit_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_video_result_cache_sha256_config", "sha256", "config_hash"),
+        Index("ix_video_result_cache_md5_config", "md5", "config_hash"),
+    )
+
+    def __repr__(self):
+        return f"<VideoResultCache(id={self.id}, sha256='{self.sha256}', md5='{self.md5}')>"
@@ -2,6 +2,7 @@
 관리자 전용 API 엔드포인트
 """
 from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy import case, func
 from sqlalchemy.orm import Session
 from typing import List
 from app.core.database import get_db
@@ -114,23 +115,23 @@ async def get_system_stats(
             detail="관리자 권한이 필요합니다"
         )
     
-    # 통계 데이터 수집
-    total_users = db.query(User).count()
-    active_users = db.query(User).filter(User.is_active == True).count()
-    verified_users = db.query(User).filter(User.is_verified == True).count()
-    
-    # 역할별 사용자 수
-    user_count = db.query(User).filter(User.role == UserRole.USER).count()
-    premium_count = db.query(User).filter(User.role == UserRole.PREMIUM).count()
-    admin_count = db.query(User).filter(User.role == UserRole.ADMIN).count()
+    # 통계 데이터 수집 (단일 집계 쿼리)
+    stats = db.query(
+        func.count(User.id).label("total_users"),
+        func.coalesce(func.sum(case((User.is_active == True, 1), else_=0)), 0).label("active_users"),
+        func.coalesce(func.sum(case((User.is_verified == True, 1), else_=0)), 0).label("verified_users"),
+        func.coalesce(func.sum(case((User.role == UserRole.USER, 1), else_=0)), 0).label("user_count"),
+        func.coalesce(func.sum(case((User.role == UserRole.PREMIUM, 1), else_=0)), 0).label("premium_count"),
+        func.coalesce(func.sum(case((User.role == UserRole.ADMIN, 1), else_=0)), 0).label("admin_count"),
+    ).one()
     
     return {
-        "total_users": total_users,
-        "active_users": active_users,
-        "verified_users": verified_users,
+        "total_users": stats.total_users,
+        "active_users": stats.active_users,
+        "verified_users": stats.verified_users,
         "role_distribution": {
-            "user": user_count,
-            "premium": premium_count,
-            "admin": admin_count
+            "user": stats.user_count,
+            "premium": stats.premium_count,
+            "admin": stats.admin_count
         }
     }
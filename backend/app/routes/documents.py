@@ -4,13 +4,14 @@
 
 from typing import List, Optional
 from datetime import datetime
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, status, Form
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Query, status, Form
 from sqlalchemy.orm import Session
 from app.db.session import get_db
 from app.core.auth import get_current_user
 from app.models.user import User
 from app.models.project import Project
 from app.models.document import Document, DocumentStatus
+from app.models.project_stats import ProjectDocumentStats
 from app.schemas.document import (
     DocumentCreate,
     DocumentResponse,
@@ -23,8 +24,10 @@ import os
 import pathlib
 from app.core.config import settings
 from app.core.file_validation_simple import SimpleFileValidator
+from app.core.pagination import capped_count, paginate_keyset
+from app.core.quotas import ensure_project_document_quota
 from app.services.document_service import get_document_service
-from app.services.rag_service import RAGService
+from app.services.rag_service import get_rag_service
 from uuid import UUID
 import logging
 from app.core.exceptions import (
@@ -71,12 +74,8 @@ async def upload_document(
     if not project:
         raise ProjectNotFoundException("프로젝트를 찾을 수 없거나 접근 권한이 없습니다.")
 
-    # 현재 프로젝트의 문서 수 확인
-    current_doc_count = (
-        db.query(Document)
-        .filter(Document.project_id == project_id, Document.deleted_at.is_(None))
-        .count()
-    )
+    # 프로젝트 문서 수 제한 확인
+    ensure_project_document_quota(db, project_id)
 
     # 파일 유효성 검사
     validate_uploaded_file(file, file.size)
@@ -149,7 +148,7 @@ async def upload_document(
         # RAG 시스템에 문서 추가 처리 (백그라운드에서)
         try:
             if document.content:  # 텍스트 내용이 있는 경우에만
-                rag_service = RAGService()
+                rag_service = await get_rag_service()
                 success = await rag_service.process_document_for_rag(document.id, db)
                 if success:
                     print(f"RAG 처리 성공: document_id={document.id}")
@@ -177,13 +176,14 @@ async def upload_document(
 def get_documents(
     project_id: Optional[int] = None,
     status: Optional[DocumentStatus] = None,
-    skip: int = 0,
-    limit: int = 100,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=100),
+    include_total: bool = True,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
     """
-    사용자의 문서 목록 조회
+    사용자의 문서 목록 조회 (커서 기반 페이지네이션)
     """
     query = (
         db.query(Document)
@@ -194,22 +194,41 @@ def get_documents(
     if project_id:
         query = query.filter(Document.project_id == project_id)
 
+    # 문서 추가 가능 여부는 상태 필터와 관계없이 활성 문서 수로 판단
+    quota_query = query
+
     if status:
         query = query.filter(Document.processing_status == status)
 
-    total = query.count()
-    documents = (
-        query.order_by(Document.created_at.desc()).offset(skip).limit(limit).all()
+    documents, next_cursor = paginate_keyset(
+        query, Document.created_at, Document.id, cursor, limit
     )
 
-    # 프로젝트의 문서 추가 가능 여부 확인
-    project_can_add_more = total < settings.MAX_DOCUMENTS_PER_PROJECT
+    total = None
+    if include_total:
+        if project_id and not status and settings.PROJECT_STATS_COUNTERS_ENABLED:
+            # 프로젝트 통계 카운터로 O(1) 조회 (권한은 위 쿼리 필터로 이미 제한됨)
+            owns_project = documents or db.query(Project.id).filter(
+                Project.id == project_id, Project.user_id == current_user.id
+            ).first()
+            total = (
+                ProjectDocumentStats.get_for_project(db, project_id)["total_documents"]
+                if owns_project else 0
+            )
+        else:
+            total = query.count()
+
+    # 프로젝트의 문서 추가 가능 여부 확인 (total이 없거나 상태로 걸러진 값이면 한도+1까지만 셈)
+    if total is not None and not status:
+        document_count = total
+    else:
+        document_count = capped_count(quota_query, settings.MAX_DOCUMENTS_PER_PROJECT + 1)
+    project_can_add_more = document_count < settings.MAX_DOCUMENTS_PER_PROJECT
 
     return DocumentListResponse(
         documents=[DocumentResponse.model_validate(doc) for doc in documents],
         total=total,
-        skip=skip,
-        limit=limit,
+        next_cursor=next_cursor,
         project_can_add_more=project_can_add_more,
     )
 
@@ -327,8 +346,15 @@ def get_document_processing_status(
     """
     문서 처리 상태 조회
     """
+    # 상태 폴링용이므로 필요한 컬럼만 조회
     document = (
-        db.query(Document)
+        db.query(
+            Document.id,
+            Document.processing_status,
+            Document.processing_error,
+            Document.chunk_count,
+            Document.updated_at,
+        )
         .join(Project)
         .filter(
             Document.id == document_id,
@@ -341,25 +367,7 @@ def get_document_processing_status(
     if not document:
         raise DocumentNotFoundException("문서를 찾을 수 없습니다.")
 
-    # 진행률 계산
-    progress = 0
-    if document.processing_status == DocumentStatus.UPLOADING:
-        progress = 25
-    elif document.processing_status == DocumentStatus.PROCESSING:
-        progress = 50
-    elif document.processing_status == DocumentStatus.COMPLETED:
-        progress = 100
-    elif document.processing_status == DocumentStatus.FAILED:
-        progress = 0
-
-    return DocumentProcessingStatus(
-        document_id=document.id,
-        status=document.processing_status,
-        progress=progress,
-        error_message=document.error_message,
-        created_at=document.created_at,
-        updated_at=document.updated_at,
-    )
+    return DocumentProcessingStatus.model_validate(document._asdict())
 
 
 @router.post("/{document_id}/reprocess")
@@ -1,5 +1,8 @@
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, Depends, Response
+from sqlalchemy.orm import Session
+from app.core.database import get_db
 from app.services.monitoring_service import performance_monitor, CONTENT_TYPE_LATEST
+from app.services.model_registry import get_model_registry
 
 router = APIRouter(prefix="/api/monitoring", tags=["monitoring"])
 
@@ -8,10 +11,18 @@ async def health_check():
     return {"status": "ok"}
 
 @router.get("/stats")
-async def get_stats():
+async def get_stats(db: Session = Depends(get_db)):
+    performance_monitor.sync_transcription_metrics(db)
     return performance_monitor.get_performance_stats()
 
 @router.get("/metrics")
-async def get_metrics():
+async def get_metrics(db: Session = Depends(get_db)):
+    # 음성 인식은 워커 프로세스에서 실행되므로 완료된 작업 결과로 지표를 갱신한 뒤 내보냄
+    performance_monitor.sync_transcription_metrics(db)
     metrics_data = performance_monitor.get_prometheus_metrics()
     return Response(metrics_data, media_type=CONTENT_TYPE_LATEST)
+
+@router.get("/models")
+async def get_model_stats():
+    """로드된 ML 모델별 로드 시간과 메모리 증가량"""
+    return get_model_registry().stats()
@@ -2,15 +2,16 @@
 프로젝트 관리 API 엔드포인트
 """
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from sqlalchemy import func
 from app.db.session import get_db
 from app.core.auth import get_current_user
 from app.core.exceptions import ProjectNotFoundException
+from app.core.pagination import capped_count, paginate_keyset
 from app.models.user import User
 from app.models.project import Project
 from app.models.document import Document
+from app.models.project_stats import ProjectDocumentStats
 from app.schemas.project import (
     ProjectCreate, ProjectResponse, ProjectUpdate, 
     ProjectListResponse, ProjectStatistics
@@ -90,30 +91,35 @@ def create_project(
 
 @router.get("/", response_model=ProjectListResponse)
 def get_projects(
-    skip: int = 0,
-    limit: int = 100,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=100),
+    include_total: bool = True,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user)
 ):
     """
-    사용자의 프로젝트 목록 조회
+    사용자의 프로젝트 목록 조회 (커서 기반 페이지네이션)
     """
     query = db.query(Project).filter(
         Project.user_id == current_user.id,
         Project.deleted_at.is_(None)
     )
     
-    total = query.count()
-    projects = query.order_by(Project.created_at.desc()).offset(skip).limit(limit).all()
+    projects, next_cursor = paginate_keyset(
+        query, Project.created_at, Project.id, cursor, limit
+    )
+    
+    # 사용자당 프로젝트 수는 MAX_PROJECTS_PER_USER로 제한되어 있어 count 비용이 작음
+    total = query.count() if include_total else None
     
-    # 사용자가 더 많은 프로젝트를 생성할 수 있는지 확인
-    can_create_more = total < settings.MAX_PROJECTS_PER_USER
+    # 사용자가 더 많은 프로젝트를 생성할 수 있는지 확인 (total을 건너뛰면 한도+1까지만 셈)
+    project_count = total if total is not None else capped_count(query, settings.MAX_PROJECTS_PER_USER + 1)
+    can_create_more = project_count < settings.MAX_PROJECTS_PER_USER
     
     return ProjectListResponse(
         projects=[ProjectResponse.model_validate(project) for project in projects],
         total=total,
-        skip=skip,
-        limit=limit,
+        next_cursor=next_cursor,
         can_create_more=can_create_more
     )
 
@@ -262,54 +268,25 @@ def get_project_statistics(
         raise ProjectNotFoundException
     
     try:
-        # 문서 통계
-        total_documents = db.query(Document).filter(
-            Document.project_id == project_id,
-            Document.deleted_at.is_(None)
-        ).count()
-        
-        completed_documents = db.query(Document).filter(
-            Document.project_id == project_id,
-            Document.status == "completed",
-            Document.deleted_at.is_(None)
-        ).count()
-        
-        processing_documents = db.query(Document).filter(
-            Document.project_id == project_id,
-            Document.status == "processing",
-            Document.deleted_at.is_(None)
-        ).count()
-        
-        failed_documents = db.query(Document).filter(
-            Document.project_id == project_id,
-            Document.status == "failed",
-            Document.deleted_at.is_(None)
-        ).count()
-        
-        # 저장소 통계 (간단하게 계산)
-        documents_in_project = total_documents
-        total_size_bytes = db.query(func.sum(Document.file_size)).filter(
-            Document.project_id == project_id,
-            Document.is_deleted == False
-        ).scalar() or 0
-        
-        # 임베딩 개수 (나중에 구현)
-        total_embeddings = 0
+        # 카운터 테이블(O(1) 조회) 또는 단일 집계 쿼리로 문서 통계 조회
+        if settings.PROJECT_STATS_COUNTERS_ENABLED:
+            stats = ProjectDocumentStats.get_for_project(db, project_id)
+        else:
+            stats = ProjectDocumentStats.aggregate(db, project_id)
         
         return ProjectStatistics(
-            id=project.id,
-            title=project.title,
-            description=project.description,
-            total_documents=documents_in_project,
-            total_storage_mb=round(total_size_bytes / (1024 * 1024), 2),
-            total_embeddings=total_embeddings,
+            project_id=project.id,
+            total_documents=stats["total_documents"],
+            completed_documents=stats["completed_documents"],
+            processing_documents=stats["processing_documents"],
+            failed_documents=stats["failed_documents"],
+            total_storage_mb=round(stats["total_size_bytes"] / (1024 * 1024), 2),
             created_at=project.created_at,
-            last_activity=project.updated_at,
-            can_upload_more=documents_in_project < 5
+            updated_at=project.updated_at
         )
         
     except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"통계 조회 실패: {str(e)}"
-        )
\ No newline at end of file
+        )
@@ -8,15 +8,16 @@ from uuid import UUID
 import logging
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 from sqlalchemy import select
 
 from app.core.database import get_db
 from app.core.auth import get_current_user
+from app.core.pagination import paginate_keyset
 from app.models.user import User
 from app.models.project import Project
 from app.models.document import Document
-from app.models.chat_history import ChatHistory
+from app.models.chat_history import ChatHistory, MessageRole
 from app.schemas.openai import ChatRequest, ChatResponse
 from app.services.rag_service import get_rag_service, RAGService
 from app.services.openai_service import get_openai_service, OpenAIService
@@ -380,8 +381,8 @@ async def reindex_document(
     문서를 RAG 시스템에 재인덱싱
     """
     try:
-        # 문서 권한 확인
-        document = db.query(Document).join(Project).filter(
+        # 문서 권한 확인 (ID만 조회)
+        document = db.query(Document.id).join(Project).filter(
             Document.id == document_id,
             Project.user_id == current_user.id,
             Document.is_deleted == False
@@ -404,6 +405,8 @@ async def reindex_document(
                 detail="문서 재인덱싱에 실패했습니다"
             )
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"문서 재인덱싱 실패: {e}")
         raise HTTPException(
@@ -415,12 +418,16 @@ async def reindex_document(
 @router.get("/projects/{project_id}/chat/history")
 async def get_chat_history(
     project_id: int,
-    limit: int = 20,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
-    프로젝트의 채팅 기록 조회
+    프로젝트의 채팅 기록 조회 (커서 기반 페이지네이션)
+    
+    AI 응답 메시지를 기준으로 최신순 페이지를 만들고, 대응하는 사용자 질문은
+    parent_message_id로 한 번에 조회합니다.
     """
     try:
         # 프로젝트 권한 확인
@@ -437,28 +444,44 @@ async def get_chat_history(
             )
         
         # 채팅 기록 조회
-        chat_history = db.query(ChatHistory).filter(
+        query = db.query(ChatHistory).filter(
             ChatHistory.project_id == project_id,
-            ChatHistory.user_id == current_user.id
-        ).order_by(ChatHistory.created_at.desc()).limit(limit).all()
+            ChatHistory.role == MessageRole.ASSISTANT,
+            ChatHistory.is_deleted == False
+        )
+        answers, next_cursor = paginate_keyset(
+            query, ChatHistory.created_at, ChatHistory.id, cursor, limit
+        )
+        
+        parent_ids = [chat.parent_message_id for chat in answers if chat.parent_message_id]
+        questions = {}
+        if parent_ids:
+            questions = dict(
+                db.query(ChatHistory.id, ChatHistory.content)
+                .filter(ChatHistory.id.in_(parent_ids))
+                .all()
+            )
         
         return {
             "project_id": str(project_id),
-            "total_chats": len(chat_history),
+            "total_chats": len(answers),
+            "next_cursor": next_cursor,
             "chats": [
                 {
                     "id": str(chat.id),
-                    "message": chat.message,
-                    "response": chat.response,
+                    "message": questions.get(chat.parent_message_id, ""),
+                    "response": chat.content,
                     "created_at": chat.created_at.isoformat(),
-                    "tokens_used": chat.tokens_used,
-                    "sources": chat.sources,
-                    "rating": chat.rating
+                    "tokens_used": chat.total_tokens,
+                    "sources": chat.context_documents or [],
+                    "rating": chat.user_feedback
                 }
-                for chat in chat_history
+                for chat in answers
             ]
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"채팅 기록 조회 실패: {e}")
         raise HTTPException(
@@ -521,7 +544,9 @@ async def generate_mindmap(
     try:
         # 문서 조회
         result = db.execute(
-            select(Document).where(Document.id == document_id)
+            select(Document)
+            .options(undefer(Document.content))
+            .where(Document.id == document_id)
         )
         document = result.scalar_one_or_none()
         
@@ -1,27 +1,34 @@
 """
 비디오 처리 통합 API 엔드포인트
+
+비디오 처리는 미디어 워커 프로세스(app/workers/media_worker.py)에서 실행됩니다.
+API는 작업을 대기열에 넣고 작업 ID를 바로 반환하며, 클라이언트는 진행률을 폴링합니다.
+처리 중 나온 음성 인식/화면 텍스트 세그먼트는 /media-jobs/{job_id}/segments(폴링) 또는
+/media-jobs/{job_id}/events(SSE)로 받을 수 있고, project_id를 주면 해당 프로젝트 문서로 바로 색인됩니다.
 """
 
 import os
+import json
+import shutil
+import asyncio
 import logging
-import tempfile
-from datetime import datetime
-from typing import Optional, Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form
+import uuid
+from typing import Optional, List
+from fastapi import APIRouter, Depends, HTTPException, status, UploadFile, File, Form, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel
 
 from app.core.database import get_db
 from app.core.auth import get_current_user
+from app.core.config import settings
+from app.core.upload_stream import stream_upload_to_file
 from app.models.user import User
-from app.services.google_drive import create_google_drive_service
-from app.services.video_processing import create_video_processing_service
-from app.services.text_extraction import create_video_text_extraction_service
-from app.services.summary import (
-    create_summary_service, 
-    create_markdown_generator, 
-    create_document_sharing_service
-)
+from app.models.project import Project
+from app.schemas.media_job import MediaJobResponse, MediaJobSegmentResponse, MediaJobSegmentsResponse
+from app.services.media_job_service import create_media_job_service
+from app.services.video_pipeline import GOOGLE_DRIVE_VIDEO, UPLOADED_VIDEO
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -31,280 +38,238 @@ class VideoProcessRequest(BaseModel):
     google_drive_url: Optional[str] = None
     project_name: str
     description: Optional[str] = None
+    project_id: Optional[int] = None  # 지정하면 처리 중인 내용을 이 프로젝트 문서로 바로 색인
 
-class VideoProcessResponse(BaseModel):
-    """비디오 처리 응답 모델"""
-    success: bool
-    message: str
-    summary_id: Optional[str] = None
-    share_link: Optional[str] = None
-    markdown_path: Optional[str] = None
+def _ensure_project_owner(db: Session, project_id: Optional[int], user: User) -> None:
+    """색인 대상 프로젝트가 사용자 소유인지 확인"""
+    if project_id is None:
+        return
+    project = db.query(Project.id).filter(
+        Project.id == project_id,
+        Project.user_id == user.id,
+        Project.is_deleted == False
+    ).first()
+    if not project:
+        raise HTTPException(status_code=404, detail="프로젝트를 찾을 수 없습니다.")
 
-@router.post("/process-video", response_model=VideoProcessResponse)
+@router.post("/process-video", response_model=MediaJobResponse, status_code=status.HTTP_202_ACCEPTED)
 async def process_video(
     request: VideoProcessRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
-    비디오 처리 및 요약 생성
-    
+    Google Drive 비디오 처리 작업 등록
+
     Args:
         request: 비디오 처리 요청
         current_user: 현재 사용자
         db: 데이터베이스 세션
-        
+
     Returns:
-        처리 결과
+        등록된 작업 (GET /media-jobs/{job_id}로 진행률 조회)
     """
-    try:
-        logger.info(f"비디오 처리 시작: 사용자 {current_user.id}")
-        
-        if not request.google_drive_url:
-            raise HTTPException(
-                status_code=400, 
-                detail="Google Drive URL이 필요합니다."
-            )
-        
-        # 임시 디렉토리 생성
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Google Drive 서비스 초기화
-            drive_service = create_google_drive_service()
-            if not drive_service:
-                raise HTTPException(
-                    status_code=500,
-                    detail="Google Drive 서비스 초기화 실패"
-                )
-            
-            # 파일 ID 추출
-            file_id = drive_service.extract_file_id_from_url(request.google_drive_url)
-            if not file_id:
-                raise HTTPException(
-                    status_code=400,
-                    detail="유효하지 않은 Google Drive URL입니다."
-                )
-            
-            # 파일 정보 조회
-            file_info = drive_service.get_file_info(file_id)
-            if not file_info:
-                raise HTTPException(
-                    status_code=404,
-                    detail="파일을 찾을 수 없습니다."
-                )
-            
-            # 비디오 파일인지 확인
-            if not drive_service.is_video_file(file_info):
-                raise HTTPException(
-                    status_code=400,
-                    detail="비디오 파일이 아닙니다."
-                )
-            
-            # 파일 다운로드
-            video_filename = file_info.get('name', f'video_{file_id}.mp4')
-            video_path = os.path.join(temp_dir, video_filename)
-            
-            if not drive_service.download_file(file_id, video_path):
-                raise HTTPException(
-                    status_code=500,
-                    detail="파일 다운로드에 실패했습니다."
-                )
-            
-            # 비디오 처리 서비스 초기화
-            video_service = create_video_processing_service()
-            
-            # 오디오 추출
-            audio_path = os.path.join(temp_dir, 'audio.mp3')
-            if not video_service.extract_audio_from_video(video_path, audio_path):
-                raise HTTPException(
-                    status_code=500,
-                    detail="오디오 추출에 실패했습니다."
-                )
-            
-            # 프레임 추출
-            frames_dir = os.path.join(temp_dir, 'frames')
-            frame_paths = video_service.extract_frames(video_path, frames_dir, interval=30)
-            
-            # 텍스트 추출 서비스 초기화
-            text_extraction_service = create_video_text_extraction_service()
-            
-            # 음성 및 화면 텍스트 추출
-            extraction_result = text_extraction_service.extract_all_text_from_video(
-                video_path, audio_path, frame_paths
-            )
-            
-            # 요약 생성
-            summary_service = create_summary_service()
-            project_info = {
-                "name": request.project_name,
-                "description": request.description,
-                "user_id": current_user.id,
-                "original_filename": video_filename
-            }
-            
-            summary_data = summary_service.create_video_summary(
-                extraction_result, project_info
-            )
-            
-            if not summary_data:
-                raise HTTPException(
-                    status_code=500,
-                    detail="요약 생성에 실패했습니다."
-                )
-            
-            # 마크다운 문서 생성
-            markdown_generator = create_markdown_generator()
-            markdown_path = markdown_generator.generate_video_summary_markdown(summary_data)
-            
-            if not markdown_path:
-                raise HTTPException(
-                    status_code=500,
-                    detail="마크다운 문서 생성에 실패했습니다."
-                )
-            
-            # 공유 링크 생성
-            sharing_service = create_document_sharing_service()
-            share_link = sharing_service.create_shareable_link(
-                markdown_path, summary_data["id"]
-            )
-            
-            # 메타데이터 저장
-            sharing_service.save_summary_metadata(summary_data, markdown_path)
-            
-            logger.info(f"비디오 처리 완료: {summary_data['id']}")
-            
-            return VideoProcessResponse(
-                success=True,
-                message="비디오 처리가 완료되었습니다.",
-                summary_id=summary_data["id"],
-                share_link=share_link,
-                markdown_path=markdown_path
-            )
-    
-    except HTTPException:
-        raise
-    except Exception as error:
-        logger.error(f"비디오 처리 중 오류: {error}")
+    if not request.google_drive_url:
         raise HTTPException(
-            status_code=500,
-            detail=f"비디오 처리 중 오류가 발생했습니다: {str(error)}"
+            status_code=400,
+            detail="Google Drive URL이 필요합니다."
         )
+    _ensure_project_owner(db, request.project_id, current_user)
+
+    job = create_media_job_service().enqueue(
+        db,
+        user_id=current_user.id,
+        job_type=GOOGLE_DRIVE_VIDEO,
+        payload={
+            "google_drive_url": request.google_drive_url,
+            "project_name": request.project_name,
+            "description": request.description,
+            "user_id": current_user.id,
+            "project_id": request.project_id,
+        },
+    )
+    logger.info(f"비디오 처리 작업 등록: {job.id} (사용자 {current_user.id})")
+    return MediaJobResponse.model_validate(job)
 
-@router.post("/upload-video", response_model=VideoProcessResponse)
+@router.post("/upload-video", response_model=MediaJobResponse, status_code=status.HTTP_202_ACCEPTED)
 async def upload_and_process_video(
     file: UploadFile = File(...),
     project_name: str = Form(...),
     description: Optional[str] = Form(None),
+    project_id: Optional[int] = Form(None),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
-    비디오 파일 업로드 및 처리
-    
+    비디오 파일 업로드 및 처리 작업 등록
+
     Args:
         file: 업로드된 비디오 파일
         project_name: 프로젝트 이름
         description: 프로젝트 설명
+        project_id: 처리 중인 내용을 바로 색인할 프로젝트 ID (선택)
         current_user: 현재 사용자
         db: 데이터베이스 세션
-        
+
     Returns:
-        처리 결과
+        등록된 작업 (GET /media-jobs/{job_id}로 진행률 조회)
     """
+    _ensure_project_owner(db, project_id, current_user)
+
+    # 파일 형식 확인
+    if not file.content_type or not file.content_type.startswith('video/'):
+        raise HTTPException(
+            status_code=400,
+            detail="비디오 파일만 업로드 가능합니다."
+        )
+
+    # 워커가 읽을 수 있도록 작업 전용 디렉토리에 저장 (작업 종료 시 워커가 삭제)
+    job_id = str(uuid.uuid4())
+    job_dir = os.path.join(settings.get_absolute_media_job_dir, job_id)
+    os.makedirs(job_dir, exist_ok=True)
+    filename = os.path.basename(file.filename or "video.mp4")
+    video_path = os.path.join(job_dir, filename)
+
     try:
-        logger.info(f"비디오 업로드 처리 시작: 사용자 {current_user.id}")
-        
-        # 파일 형식 확인
-        if not file.content_type.startswith('video/'):
-            raise HTTPException(
-                status_code=400,
-                detail="비디오 파일만 업로드 가능합니다."
-            )
-        
-        # 임시 디렉토리 생성
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # 업로드된 파일 저장
-            video_path = os.path.join(temp_dir, file.filename)
-            with open(video_path, 'wb') as f:
-                content = await file.read()
-                f.write(content)
-            
-            # 비디오 처리 서비스 초기화
-            video_service = create_video_processing_service()
-            
-            # 오디오 추출
-            audio_path = os.path.join(temp_dir, 'audio.mp3')
-            if not video_service.extract_audio_from_video(video_path, audio_path):
-                raise HTTPException(
-                    status_code=500,
-                    detail="오디오 추출에 실패했습니다."
-                )
-            
-            # 프레임 추출
-            frames_dir = os.path.join(temp_dir, 'frames')
-            frame_paths = video_service.extract_frames(video_path, frames_dir, interval=30)
-            
-            # 텍스트 추출 서비스 초기화
-            text_extraction_service = create_video_text_extraction_service()
-            
-            # 음성 및 화면 텍스트 추출
-            extraction_result = text_extraction_service.extract_all_text_from_video(
-                video_path, audio_path, frame_paths
-            )
-            
-            # 요약 생성
-            summary_service = create_summary_service()
-            project_info = {
-                "name": project_name,
+        # 청크 단위로 디스크에 쓰면서 크기 제한 확인, 결과 캐시 키(SHA-256/MD5) 계산
+        stored = await stream_upload_to_file(file, video_path, settings.MAX_VIDEO_UPLOAD_SIZE)
+
+        job = create_media_job_service().enqueue(
+            db,
+            user_id=current_user.id,
+            job_type=UPLOADED_VIDEO,
+            payload={
+                "video_path": video_path,
+                "job_dir": job_dir,
+                "original_filename": filename,
+                "file_size": stored.size,
+                "sha256": stored.sha256,
+                "md5": stored.md5,
+                "project_name": project_name,
                 "description": description,
                 "user_id": current_user.id,
-                "original_filename": file.filename
-            }
-            
-            summary_data = summary_service.create_video_summary(
-                extraction_result, project_info
-            )
-            
-            if not summary_data:
-                raise HTTPException(
-                    status_code=500,
-                    detail="요약 생성에 실패했습니다."
-                )
-            
-            # 마크다운 문서 생성
-            markdown_generator = create_markdown_generator()
-            markdown_path = markdown_generator.generate_video_summary_markdown(summary_data)
-            
-            if not markdown_path:
-                raise HTTPException(
-                    status_code=500,
-                    detail="마크다운 문서 생성에 실패했습니다."
-                )
-            
-            # 공유 링크 생성
-            sharing_service = create_document_sharing_service()
-            share_link = sharing_service.create_shareable_link(
-                markdown_path, summary_data["id"]
-            )
-            
-            # 메타데이터 저장
-            sharing_service.save_summary_metadata(summary_data, markdown_path)
-            
-            logger.info(f"비디오 업로드 처리 완료: {summary_data['id']}")
-            
-            return VideoProcessResponse(
-                success=True,
-                message="비디오 업로드 및 처리가 완료되었습니다.",
-                summary_id=summary_data["id"],
-                share_link=share_link,
-                markdown_path=markdown_path
-            )
-    
+                "project_id": project_id,
+            },
+            job_id=job_id,
+        )
     except HTTPException:
+        shutil.rmtree(job_dir, ignore_errors=True)
         raise
     except Exception as error:
-        logger.error(f"비디오 업로드 처리 중 오류: {error}")
+        shutil.rmtree(job_dir, ignore_errors=True)
+        logger.error(f"비디오 업로드 작업 등록 중 오류: {error}")
         raise HTTPException(
             status_code=500,
             detail=f"비디오 업로드 처리 중 오류가 발생했습니다: {str(error)}"
         )
 
+    logger.info(f"비디오 업로드 작업 등록: {job.id} (사용자 {current_user.id})")
+    return MediaJobResponse.model_validate(job)
+
+@router.get("/media-jobs", response_model=List[MediaJobResponse])
+async def list_media_jobs(
+    limit: int = 20,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """사용자의 최근 미디어 작업 목록"""
+    jobs = create_media_job_service().list_for_user(db, current_user.id, min(limit, 100))
+    return [MediaJobResponse.model_validate(job) for job in jobs]
+
+@router.get("/media-jobs/{job_id}", response_model=MediaJobResponse)
+async def get_media_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """미디어 작업 진행률/결과 조회"""
+    job = create_media_job_service().get_for_user(db, job_id, current_user.id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return MediaJobResponse.model_validate(job)
+
+@router.post("/media-jobs/{job_id}/cancel", response_model=MediaJobResponse)
+async def cancel_media_job(
+    job_id: str,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """미디어 작업 취소 요청"""
+    service = create_media_job_service()
+    job = service.get_for_user(db, job_id, current_user.id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    job = service.request_cancel(db, job)
+    return MediaJobResponse.model_validate(job)
+
+@router.get("/media-jobs/{job_id}/segments", response_model=MediaJobSegmentsResponse)
+async def get_media_job_segments(
+    job_id: str,
+    after: int = Query(0, ge=0, description="이 seq 이후의 세그먼트만 조회"),
+    limit: int = Query(500, ge=1, le=1000),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """처리 중인 작업의 부분 결과(음성 인식/화면 텍스트 세그먼트) 폴링"""
+    service = create_media_job_service()
+    job = service.get_for_user(db, job_id, current_user.id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    segments = service.list_segments(db, job_id, after, limit)
+    return MediaJobSegmentsResponse(
+        job_id=job.id,
+        status=job.status,
+        progress=job.progress,
+        stage=job.stage,
+        segments=[MediaJobSegmentResponse.model_validate(segment) for segment in segments],
+        next_after=segments[-1].seq if segments else after,
+    )
+
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+@router.get("/media-jobs/{job_id}/events")
+async def stream_media_job_events(
+    job_id: str,
+    request: Request,
+    after: int = Query(0, ge=0, description="이 seq 이후의 세그먼트부터 전송"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    작업 진행률과 부분 결과를 Server-Sent Events로 전송
+
+    이벤트: progress(진행률/단계), segment(세그먼트 하나), done(종료 상태)
+    """
+    service = create_media_job_service()
+    if not service.get_for_user(db, job_id, current_user.id):
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+
+    def poll(last_seq: int):
+        with service.session_factory() as session:
+            job = service.get_for_user(session, job_id, current_user.id)
+            segments = service.list_segments(session, job_id, last_seq)
+            return (
+                MediaJobResponse.model_validate(job).model_dump(mode="json"),
+                [MediaJobSegmentResponse.model_validate(s).model_dump(mode="json") for s in segments],
+            )
+
+    async def events():
+        last_seq = after
+        last_progress = None
+        while not await request.is_disconnected():
+            job, segments = await run_in_threadpool(poll, last_seq)
+            for segment in segments:
+                last_seq = segment["seq"]
+                yield _sse("segment", segment)
+            progress = (job["status"], job["progress"], job["stage"])
+            if progress != last_progress:
+                last_progress = progress
+                yield _sse("progress", {"status": job["status"], "progress": job["progress"], "stage": job["stage"]})
+            if job["finished_at"] and not segments:
+                yield _sse("done", job)
+                return
+            await asyncio.sleep(settings.MEDIA_STREAM_POLL_INTERVAL)
+
+    return StreamingResponse(events(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
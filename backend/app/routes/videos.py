@@ -1,5 +1,7 @@
 from fastapi import APIRouter, UploadFile, File, Depends, HTTPException
 from app.core.auth import get_current_user
+from app.core.config import settings
+from app.core.upload_stream import stream_upload_to_file
 from app.models.user import User
 from app.services.video_service import VideoService, get_video_service
 from app.schemas.video import VideoSummaryResponse
@@ -15,13 +17,17 @@ async def summarize_video(
     video_service: VideoService = Depends(get_video_service),
 ):
     """비디오 요약 및 스크립트 추출"""
+    fd, tmp_path = tempfile.mkstemp(suffix=os.path.splitext(file.filename or "")[1])
+    os.close(fd)
     try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as tmp:
-            content = await file.read()
-            tmp.write(content)
-            tmp_path = tmp.name
+        # 업로드 전체를 메모리에 올리지 않고 청크 단위로 임시 파일에 씀
+        await stream_upload_to_file(file, tmp_path, settings.MAX_VIDEO_UPLOAD_SIZE)
         transcript, summary = await video_service.process_video(tmp_path)
-        os.remove(tmp_path)
         return VideoSummaryResponse(transcript=transcript, summary=summary)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"비디오 처리 실패: {e}")
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
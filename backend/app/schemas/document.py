@@ -82,7 +82,10 @@ class DocumentListResponse(BaseModel):
     """문서 목록 응답 스키마"""
 
     documents: List[DocumentResponse]
-    total: int
+    total: Optional[int] = Field(
+        None, description="전체 문서 수 (근사값일 수 있으며 include_total=false면 생략)"
+    )
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 None)")
     project_can_add_more: bool = Field(
         description="프로젝트에 더 많은 문서를 추가할 수 있는지 여부"
     )
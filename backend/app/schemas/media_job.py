@@ -0,0 +1,47 @@
+"""
+미디어 작업 관련 스키마
+"""
+from datetime import datetime
+from typing import Optional, Dict, Any, List
+from pydantic import BaseModel, Field
+from app.models.media_job import MediaJobStatus
+
+
+class MediaJobResponse(BaseModel):
+    """미디어 작업 상태 응답 스키마"""
+    id: str
+    job_type: str
+    status: MediaJobStatus
+    progress: float = Field(..., description="진행률 (0.0 ~ 1.0)")
+    stage: Optional[str] = Field(None, description="현재 처리 단계")
+    cancel_requested: bool
+    result: Optional[Dict[str, Any]] = Field(None, description="완료 시 summary_id, share_link, markdown_path")
+    error_message: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+class MediaJobSegmentResponse(BaseModel):
+    """미디어 작업 부분 결과 세그먼트 스키마"""
+    seq: int
+    kind: str = Field(..., description="transcript(음성 인식) 또는 screen_text(화면 텍스트)")
+    start_seconds: Optional[float] = Field(None, description="영상 내 시작 시각(초)")
+    end_seconds: Optional[float] = None
+    text: str
+
+    class Config:
+        from_attributes = True
+
+
+class MediaJobSegmentsResponse(BaseModel):
+    """부분 결과 폴링 응답 스키마 (다음 요청은 after=next_after)"""
+    job_id: str
+    status: MediaJobStatus
+    progress: float
+    stage: Optional[str] = None
+    segments: List[MediaJobSegmentResponse]
+    next_after: int
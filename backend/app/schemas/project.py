@@ -39,7 +39,8 @@ class ProjectResponse(ProjectBase):
 class ProjectListResponse(BaseModel):
     """프로젝트 목록 응답 스키마"""
     projects: List[ProjectResponse]
-    total: int
+    total: Optional[int] = Field(None, description="전체 프로젝트 수 (include_total=false면 생략)")
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 None)")
     can_create_more: bool = Field(description="더 많은 프로젝트를 생성할 수 있는지 여부")
 
 
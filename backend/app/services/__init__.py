@@ -1,51 +1,58 @@
-from .openai_service import OpenAIService, get_openai_service
-from .rag_service import RAGService
-from .user_service import UserService
-from .video_service import VideoService, get_video_service
-from .google_drive_service import GoogleDriveService, create_google_drive_service
-from .video_processing_service import VideoProcessingService, create_video_processing_service
-from .text_extraction_service import (
-    SpeechToTextService,
-    OCRService,
-    VideoTextExtractionService,
-    create_speech_to_text_service,
-    create_ocr_service,
-    create_video_text_extraction_service,
-)
-from .summary_service import (
-    SummaryService,
-    MarkdownGenerator,
-    DocumentSharingService,
-    create_summary_service,
-    create_markdown_generator,
-    create_document_sharing_service,
-)
-from .monitoring_service import performance_monitor, monitor_request, monitor_video_processing
-
-__all__ = [
-    'OpenAIService',
-    'get_openai_service',
-    'RAGService',
-    'UserService',
-    'VideoService',
-    'get_video_service',
-    'GoogleDriveService',
-    'create_google_drive_service',
-    'VideoProcessingService',
-    'create_video_processing_service',
-    'SpeechToTextService',
-    'OCRService',
-    'VideoTextExtractionService',
-    'create_speech_to_text_service',
-    'create_ocr_service',
-    'create_video_text_extraction_service',
-    'SummaryService',
-    'MarkdownGenerator',
-    'DocumentSharingService',
-    'create_summary_service',
-    'create_markdown_generator',
-    'create_document_sharing_service',
-    'performance_monitor',
-    'monitor_request',
-    'monitor_video_processing',
-]
+"""
+서비스 패키지
+
+하위 모듈 하나만 import 해도 패키지 __init__이 모든 서비스(Whisper, EasyOCR, LangChain 등)를
+끌어오지 않도록, 공개 이름은 처음 접근할 때 해당 모듈에서 로드합니다.
+"""
+import importlib
+
+_EXPORTS = {
+    'OpenAIService': 'openai_service',
+    'get_openai_service': 'openai_service',
+    'RAGService': 'rag_service',
+    'UserService': 'user_service',
+    'VideoService': 'video_service',
+    'get_video_service': 'video_service',
+    'create_transcription_backend': 'video_service',
+    'GoogleDriveService': 'google_drive_service',
+    'create_google_drive_service': 'google_drive_service',
+    'VideoProcessingService': 'video_processing_service',
+    'create_video_processing_service': 'video_processing_service',
+    'SpeechToTextService': 'text_extraction_service',
+    'OCRService': 'text_extraction_service',
+    'VideoTextExtractionService': 'text_extraction_service',
+    'create_speech_to_text_service': 'text_extraction_service',
+    'create_ocr_service': 'text_extraction_service',
+    'create_video_text_extraction_service': 'text_extraction_service',
+    'ASRBackend': 'asr_backends',
+    'create_asr_backend': 'asr_backends',
+    'SummaryService': 'summary_service',
+    'MarkdownGenerator': 'summary_service',
+    'DocumentSharingService': 'summary_service',
+    'create_summary_service': 'summary_service',
+    'create_markdown_generator': 'summary_service',
+    'create_document_sharing_service': 'summary_service',
+    'VideoResultCacheService': 'video_result_cache',
+    'create_video_result_cache_service': 'video_result_cache',
+    'performance_monitor': 'monitoring_service',
+    'monitor_request': 'monitoring_service',
+    'monitor_video_processing': 'monitoring_service',
+    'ModelRegistry': 'model_registry',
+    'get_model_registry': 'model_registry',
+}
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_EXPORTS))
+
+
+__all__ = list(_EXPORTS)
@@ -0,0 +1,142 @@
+"""
+음성 인식(ASR) 엔진 백엔드 모듈
+
+SpeechToTextService의 창 분할/병렬 처리는 그대로 두고, 창 하나를 인식하는 엔진만 교체합니다.
+- whisper: openai-whisper (PyTorch, CPU에서는 FP32)
+- faster-whisper: CTranslate2 기반 Whisper (CPU int8 양자화, 정확도를 조금 내주고 처리량을 얻음)
+
+백엔드 객체는 이름/모델 크기 같은 값만 가지고 있어 spawn 프로세스 풀에 그대로 넘길 수 있고,
+실제 모델은 각 프로세스의 모델 레지스트리에서 한 번만 로드합니다.
+"""
+import logging
+from typing import Any, Dict, Hashable, List, Optional
+
+from app.services.model_registry import ModelRegistry, get_model_registry
+
+logger = logging.getLogger(__name__)
+
+
+class ASRBackend:
+    """창 단위 음성 인식 엔진 인터페이스"""
+
+    name = ""
+
+    def __init__(self, model_size: str = "base"):
+        self.model_size = model_size
+
+    @property
+    def key(self) -> Hashable:
+        """모델 레지스트리 키 (추론 락과 프로세스 풀 구분에도 사용)"""
+        raise NotImplementedError
+
+    def load(self, threads: int = 0) -> Any:
+        """모델 로드 (프로세스당 한 번, threads는 추론 스레드 수 / 0이면 엔진 기본값)"""
+        raise NotImplementedError
+
+    def transcribe(self, model: Any, samples, language: str) -> List[Dict[str, Any]]:
+        """16kHz float32 샘플 한 창을 인식해 창 기준 상대 시각의 세그먼트 반환"""
+        raise NotImplementedError
+
+    def describe(self) -> Dict[str, Any]:
+        """결과에 영향을 주는 엔진 설정 (결과 캐시 키, 벤치마크 출력용)"""
+        return {"backend": self.name, "model": self.model_size}
+
+
+class WhisperBackend(ASRBackend):
+    """openai-whisper 백엔드"""
+
+    name = "whisper"
+
+    @property
+    def key(self) -> Hashable:
+        return ModelRegistry.whisper_key(self.model_size)
+
+    def load(self, threads: int = 0) -> Any:
+        if threads:
+            # 프로세스마다 코어를 나눠 쓰도록 torch 스레드 수를 제한
+            import torch
+
+            torch.set_num_threads(threads)
+        return get_model_registry().get_whisper(self.model_size)
+
+    def transcribe(self, model: Any, samples, language: str) -> List[Dict[str, Any]]:
+        result = model.transcribe(samples, language=language, verbose=None)
+        return [
+            {"start": segment["start"], "end": segment["end"], "text": segment["text"]}
+            for segment in result["segments"]
+        ]
+
+
+class FasterWhisperBackend(ASRBackend):
+    """faster-whisper (CTranslate2) 백엔드, 기본 CPU int8 양자화"""
+
+    name = "faster-whisper"
+
+    def __init__(self, model_size: str = "base", compute_type: str = "int8", beam_size: int = 5):
+        super().__init__(model_size)
+        self.compute_type = compute_type
+        self.beam_size = beam_size
+
+    @property
+    def key(self) -> Hashable:
+        return ModelRegistry.faster_whisper_key(self.model_size, self.compute_type)
+
+    def load(self, threads: int = 0) -> Any:
+        return get_model_registry().get_faster_whisper(self.model_size, self.compute_type, threads)
+
+    def transcribe(self, model: Any, samples, language: str) -> List[Dict[str, Any]]:
+        # 창 분할/VAD는 SpeechToTextService가 하므로 엔진 쪽 VAD는 끔
+        segments, _ = model.transcribe(samples, language=language, beam_size=self.beam_size, vad_filter=False)
+        return [{"start": segment.start, "end": segment.end, "text": segment.text} for segment in segments]
+
+    def describe(self) -> Dict[str, Any]:
+        return {**super().describe(), "compute_type": self.compute_type}
+
+
+ASR_BACKENDS = {
+    WhisperBackend.name: WhisperBackend,
+    FasterWhisperBackend.name: FasterWhisperBackend,
+}
+
+
+def create_asr_backend(name: Optional[str] = None, model_size: str = "base") -> ASRBackend:
+    """이름(기본 ASR_BACKEND)으로 음성 인식 엔진 백엔드 생성"""
+    from app.core.config import settings
+
+    name = name or settings.ASR_BACKEND
+    if name == FasterWhisperBackend.name:
+        return FasterWhisperBackend(model_size, settings.ASR_COMPUTE_TYPE)
+    if name not in ASR_BACKENDS:
+        raise ValueError(f"지원하지 않는 음성 인식 엔진: {name} (가능: {', '.join(ASR_BACKENDS)})")
+    return ASR_BACKENDS[name](model_size)
+
+
+def _edit_distance(reference: List[str], hypothesis: List[str]) -> int:
+    previous = list(range(len(hypothesis) + 1))
+    for i, ref in enumerate(reference, 1):
+        current = [i] + [0] * len(hypothesis)
+        for j, hyp in enumerate(hypothesis, 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ref != hyp))
+        previous = current
+    return previous[-1]
+
+
+def _normalize(text: str) -> str:
+    return "".join(char for char in text.lower() if char.isalnum() or char.isspace())
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    """어절(공백) 단위 WER (문장 부호와 대소문자는 무시)"""
+    ref_words = _normalize(reference).split()
+    if not ref_words:
+        return 0.0 if not _normalize(hypothesis).split() else 1.0
+    return _edit_distance(ref_words, _normalize(hypothesis).split()) / len(ref_words)
+
+
+def character_error_rate(reference: str, hypothesis: str) -> float:
+    """글자 단위 CER (한국어는 띄어쓰기 차이가 WER을 크게 흔들어 함께 봄, 공백 무시)"""
+    ref_chars = list(_normalize(reference).replace(" ", ""))
+    hyp_chars = list(_normalize(hypothesis).replace(" ", ""))
+    if not ref_chars:
+        return 0.0 if not hyp_chars else 1.0
+    return _edit_distance(ref_chars, hyp_chars) / len(ref_chars)
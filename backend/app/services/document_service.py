@@ -199,20 +199,17 @@ class DocumentProcessingService:
                 logger.error(f"❌ 임베딩 수와 청크 수가 일치하지 않습니다: {len(embeddings)} vs {len(chunks)}")
                 return False
             
-            # 임베딩 저장
-            logger.info(f"💾 임베딩 객체 생성 및 DB 저장 시작: document_id={document.id}")
-            for i, (chunk, embedding) in enumerate(zip(chunks, embeddings)):
-                embedding_obj = Embedding(
+            # 임베딩 저장 (한 번의 executemany로 일괄 삽입)
+            logger.info(f"💾 임베딩 일괄 저장 시작: document_id={document.id}")
+            Embedding.bulk_insert(db, (
+                Embedding.build_row(
                     document_id=document.id,
-                    chunk_text=chunk,
                     chunk_index=i,
-                    chunk_size=len(chunk),  # chunk_size 설정
+                    chunk_text=chunk,
                     embedding_vector=embedding,
-                    tokens=len(chunk.split()) if chunk else 0  # 토큰 수 설정
                 )
-                db.add(embedding_obj)
-                if i % 10 == 0:  # 10개마다 로그
-                    logger.debug(f"📝 임베딩 객체 추가: {i+1}/{len(chunks)}")
+                for i, (chunk, embedding) in enumerate(zip(chunks, embeddings))
+            ))
             
             logger.info(f"💾 임베딩 커밋 시작: document_id={document.id}")
             db.commit()
@@ -0,0 +1,119 @@
+"""
+프레임 중복 제거 모듈
+
+강의 영상은 같은 슬라이드가 몇 분씩 이어지므로, OCR 전에 지각 해시(dHash)로
+직전에 남긴 프레임과 거의 같은 프레임을 걸러냅니다.
+"""
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+HASH_SIZE = 8
+
+
+def _area_resize(gray: np.ndarray, height: int, width: int) -> np.ndarray:
+    """영역 평균으로 축소 (cv2/PIL 없이 numpy만 사용)"""
+    gray = gray.astype(np.float32)
+    rows = np.linspace(0, gray.shape[0], height + 1).astype(int)[:-1]
+    cols = np.linspace(0, gray.shape[1], width + 1).astype(int)[:-1]
+    row_sums = np.add.reduceat(gray, rows, axis=0)
+    block_sums = np.add.reduceat(row_sums, cols, axis=1)
+    row_counts = np.diff(np.append(rows, gray.shape[0]))
+    col_counts = np.diff(np.append(cols, gray.shape[1]))
+    return block_sums / np.outer(row_counts, col_counts)
+
+
+def dhash(gray: np.ndarray, hash_size: int = HASH_SIZE) -> int:
+    """
+    그레이스케일 이미지의 dHash 계산
+
+    (hash_size+1) x hash_size로 축소한 뒤 가로로 인접한 픽셀의 밝기 차이를 비트로 만듭니다.
+    """
+    if gray.ndim == 3:
+        gray = gray.mean(axis=2)
+    small = _area_resize(gray, hash_size, hash_size + 1)
+    value = 0
+    for bit in (small[:, 1:] > small[:, :-1]).flatten():
+        value = (value << 1) | int(bit)
+    return value
+
+
+def dhash_file(image_path: str, hash_size: int = HASH_SIZE) -> int:
+    """이미지 파일의 dHash 계산"""
+    from PIL import Image
+
+    with Image.open(image_path) as image:
+        return dhash(np.asarray(image.convert("L")), hash_size)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+class FrameDeduplicator:
+    """직전에 남긴 프레임과 해시 거리가 threshold 이하인 프레임을 건너뜀"""
+
+    def __init__(self, threshold: int = 5):
+        self.threshold = threshold
+        self.last_hash: Optional[int] = None
+        self.total = 0
+        self.skipped = 0
+
+    def is_duplicate(self, frame_hash: int) -> bool:
+        self.total += 1
+        if self.last_hash is not None and hamming_distance(frame_hash, self.last_hash) <= self.threshold:
+            self.skipped += 1
+            return True
+        self.last_hash = frame_hash
+        return False
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        kept = self.total - self.skipped
+        return {
+            "total_frames": self.total,
+            "kept_frames": kept,
+            "skipped_frames": self.skipped,
+            "skip_ratio": round(self.skipped / self.total, 3) if self.total else 0.0,
+            "threshold": self.threshold,
+        }
+
+
+def deduplicate_frame_files(frame_paths: List[str], threshold: int = 5,
+                            remove_skipped: bool = True) -> Tuple[List[str], Dict[str, Any]]:
+    """
+    프레임 파일 목록에서 연속된 거의 같은 프레임 제거
+
+    Args:
+        frame_paths: 시간 순서로 정렬된 프레임 경로
+        threshold: 같은 프레임으로 볼 최대 해밍 거리 (64비트 기준)
+        remove_skipped: 건너뛴 프레임 파일 삭제 여부
+
+    Returns:
+        (남긴 프레임 경로 목록, 통계)
+    """
+    deduplicator = FrameDeduplicator(threshold)
+    kept = []
+    for path in frame_paths:
+        try:
+            duplicate = deduplicator.is_duplicate(dhash_file(path))
+        except Exception as error:
+            # 해시 계산에 실패한 프레임은 OCR 대상으로 남김
+            logger.warning(f"프레임 해시 계산 실패: {path} - {error}")
+            duplicate = False
+        if duplicate:
+            if remove_skipped:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+        else:
+            kept.append(path)
+
+    stats = deduplicator.stats
+    logger.info(f"프레임 중복 제거: {stats['total_frames']}개 중 {stats['skipped_frames']}개 건너뜀")
+    return kept, stats
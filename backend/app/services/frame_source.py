@@ -0,0 +1,166 @@
+"""
+ffmpeg rawvideo 파이프 프레임 소스
+
+프레임을 JPEG로 저장했다가 OCR에서 다시 읽는 대신, ffmpeg가 디코딩한 원시 픽셀을 표준 출력
+파이프로 받아 미리 할당한 NumPy 링 버퍼에 바로 읽어 들입니다. 인코딩/디코딩 왕복과 임시 파일
+I/O가 없고, 메모리는 링 버퍼 크기(ring_size x 높이 x 너비 x 채널)로 제한됩니다.
+"""
+import json
+import logging
+import subprocess
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.frame_dedup import FrameDeduplicator, dhash
+
+logger = logging.getLogger(__name__)
+
+_SHOWINFO_MARKER = "Parsed_showinfo"
+
+
+def probe_frame_size(video_path: str) -> Tuple[int, int]:
+    """첫 비디오 스트림의 (너비, 높이)"""
+    result = subprocess.run(
+        ['ffprobe', '-v', 'error', '-select_streams', 'v:0',
+         '-show_entries', 'stream=width,height', '-of', 'json', video_path],
+        capture_output=True, text=True, check=True
+    )
+    stream = json.loads(result.stdout)["streams"][0]
+    return int(stream["width"]), int(stream["height"])
+
+
+def scaled_size(width: int, height: int, max_width: Optional[int]) -> Tuple[int, int]:
+    """max_width에 맞춘 크기 (비율 유지, ffmpeg 호환을 위해 짝수로 맞춤)"""
+    if max_width and width > max_width:
+        height = round(height * max_width / width)
+        width = max_width
+    return width - width % 2, height - height % 2
+
+
+class RawFrameSource:
+    """
+    ffmpeg 프레임 파이프 반복자
+
+    `for timestamp, frame in source:` 로 (영상 내 시각, HxWxC uint8 배열)을 받습니다.
+    frame은 링 버퍼 슬롯의 뷰이므로 ring_size - 1장을 더 내보내기 전까지만 유효합니다
+    (중복으로 건너뛴 프레임은 세지 않음). 그보다 오래 보관하려면 복사해야 합니다.
+    """
+
+    def __init__(self, video_path: str, width: int, height: int, video_filter: str,
+                 pix_fmt: str = "rgb24", ring_size: int = 4,
+                 extra_outputs: Optional[List[str]] = None,
+                 dedupe_threshold: Optional[int] = None):
+        """
+        Args:
+            video_path: 비디오 파일 경로
+            width, height: 출력 프레임 크기 (video_filter 뒤에 scale로 맞춤)
+            video_filter: 샘플링 필터 (showinfo 포함 시 프레임 시각을 읽음)
+            pix_fmt: rgb24(3채널) 또는 gray(1채널)
+            ring_size: 링 버퍼 슬롯 수
+            extra_outputs: 같은 디코딩에서 함께 쓸 출력 인자 (예: 오디오 WAV)
+            dedupe_threshold: 지정하면 직전에 내보낸 프레임과 거의 같은 프레임은 건너뜀
+        """
+        self.channels = 1 if pix_fmt == "gray" else 3
+        self.width, self.height = width, height
+        self.frame_bytes = width * height * self.channels
+        self.ring = np.empty((ring_size, height, width, self.channels), dtype=np.uint8)
+        self.cmd = [
+            'ffmpeg', '-nostdin', '-y', '-i', video_path,
+            *(extra_outputs or []),
+            '-map', '0:v:0', '-an',
+            '-vf', f'{video_filter},scale={width}:{height}',
+            '-vsync', 'vfr',
+            '-f', 'rawvideo', '-pix_fmt', pix_fmt, 'pipe:1',
+        ]
+        self.deduplicator = FrameDeduplicator(dedupe_threshold) if dedupe_threshold is not None else None
+        self.returncode: Optional[int] = None
+        self.frames_read = 0
+        self.frames_yielded = 0
+        self._timestamps: List[float] = []
+        self._stderr_tail: List[str] = []
+        self._process: Optional[subprocess.Popen] = None
+        self._exhausted = False
+        self._stderr_thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "RawFrameSource":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _read_stderr(self) -> None:
+        # showinfo 로그에서 출력 프레임 시각을 모음 (파이프가 가득 차 ffmpeg가 멈추지 않도록 계속 읽음)
+        for raw in self._process.stderr:
+            line = raw.decode("utf-8", errors="replace")
+            if _SHOWINFO_MARKER in line and "pts_time:" in line:
+                try:
+                    self._timestamps.append(float(line.split("pts_time:")[1].split()[0]))
+                except ValueError:
+                    pass
+            else:
+                self._stderr_tail = (self._stderr_tail + [line])[-20:]
+
+    def _timestamp(self, index: int) -> Optional[float]:
+        # stderr는 별도 스레드에서 읽으므로 아직 도착하지 않았으면 잠시 기다림
+        for _ in range(100):
+            if index < len(self._timestamps) or not self._stderr_thread.is_alive():
+                break
+            self._stderr_thread.join(0.01)
+        return self._timestamps[index] if index < len(self._timestamps) else None
+
+    def __iter__(self) -> Iterator[Tuple[Optional[float], np.ndarray]]:
+        self._process = subprocess.Popen(self.cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        self._stderr_thread = threading.Thread(target=self._read_stderr, daemon=True)
+        self._stderr_thread.start()
+
+        try:
+            while True:
+                # 슬롯은 내보낸 프레임 수로 고름: 건너뛴 중복 프레임은 같은 슬롯에 다음 프레임을 덮어써
+                # 소비자가 아직 들고 있는 이전 ring_size - 1장의 뷰를 건드리지 않음
+                slot = self.ring[self.frames_yielded % len(self.ring)]
+                if not self._read_into(memoryview(slot.reshape(-1))):
+                    self._exhausted = True
+                    break
+                index = self.frames_read
+                self.frames_read += 1
+                if self.deduplicator and self.deduplicator.is_duplicate(dhash(slot)):
+                    continue
+                self.frames_yielded += 1
+                yield self._timestamp(index), slot
+        finally:
+            self.close()
+
+    def _read_into(self, buffer: memoryview) -> bool:
+        """프레임 한 장을 버퍼에 채움 (스트림 끝이면 False)"""
+        filled = 0
+        while filled < self.frame_bytes:
+            count = self._process.stdout.readinto(buffer[filled:])
+            if not count:
+                return False
+            filled += count
+        return True
+
+    def close(self) -> None:
+        """ffmpeg 종료 대기 (중간에 그만 읽은 경우 파이프를 닫아 프로세스 종료)"""
+        if self._process is None or self.returncode is not None:
+            return
+        if self._process.poll() is None:
+            self._process.stdout.close()
+        self.returncode = self._process.wait()
+        self._stderr_thread.join()
+        if self._exhausted and self.returncode != 0:
+            logger.error(f"ffmpeg 프레임 파이프 실패 ({self.returncode}): {''.join(self._stderr_tail)}")
+
+    @property
+    def error(self) -> str:
+        return "".join(self._stderr_tail)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """읽은/건너뛴 프레임 수와 버퍼 크기"""
+        stats = self.deduplicator.stats if self.deduplicator else {
+            "total_frames": self.frames_read, "kept_frames": self.frames_read, "skipped_frames": 0
+        }
+        return {**stats, "source": "pipe", "ring_buffer_bytes": int(self.ring.nbytes)}
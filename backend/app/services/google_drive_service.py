@@ -3,20 +3,21 @@ Google Drive API 연동 모듈
 """
 
 import os
-import io
 import logging
+import threading
 from typing import Optional, List, Dict, Any
-from googleapiclient.discovery import build
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.http import MediaIoBaseDownload
-from googleapiclient.errors import HttpError
+
+import httpx
+
+from app.services.ranged_download import DownloadError, DownloadProgress, RangedDownloader
+
+# googleapiclient/google-auth는 import 비용이 커서 실제로 Drive를 사용할 때 로드
 
 logger = logging.getLogger(__name__)
 
 # Google Drive API 스코프
 SCOPES = ['https://www.googleapis.com/auth/drive.readonly']
+DRIVE_MEDIA_URL = "https://www.googleapis.com/drive/v3/files/{file_id}?alt=media"
 
 class GoogleDriveService:
     """Google Drive API 서비스 클래스"""
@@ -32,10 +33,18 @@ class GoogleDriveService:
         self.credentials_path = credentials_path
         self.token_path = token_path
         self.service = None
+        self.credentials = None
+        self.last_download_stats: Optional[Dict[str, float]] = None
+        self._credentials_lock = threading.Lock()
         self._authenticate()
     
     def _authenticate(self):
         """Google Drive API 인증"""
+        from googleapiclient.discovery import build
+        from google.auth.transport.requests import Request
+        from google.oauth2.credentials import Credentials
+        from google_auth_oauthlib.flow import InstalledAppFlow
+        
         creds = None
         
         # 기존 토큰 파일이 있으면 로드
@@ -60,6 +69,7 @@ class GoogleDriveService:
                 token.write(creds.to_json())
         
         # Drive API 서비스 빌드
+        self.credentials = creds
         self.service = build('drive', 'v3', credentials=creds)
         logger.info("Google Drive API 인증 완료")
     
@@ -73,54 +83,71 @@ class GoogleDriveService:
         Returns:
             파일 정보 딕셔너리 또는 None
         """
+        from googleapiclient.errors import HttpError
+        
         try:
-            file_info = self.service.files().get(fileId=file_id).execute()
+            # md5Checksum은 기본 응답에 없으므로 명시적으로 요청 (결과 캐시 키)
+            file_info = self.service.files().get(
+                fileId=file_id, fields="id, name, mimeType, size, md5Checksum"
+            ).execute()
             logger.info(f"파일 정보 조회 성공: {file_info.get('name')}")
             return file_info
         except HttpError as error:
             logger.error(f"파일 정보 조회 실패: {error}")
             return None
     
-    def download_file(self, file_id: str, local_path: str) -> bool:
+    def _auth_headers(self) -> Dict[str, str]:
+        """다운로드 요청용 인증 헤더 (만료된 토큰은 갱신, 여러 다운로드 스레드에서 호출)"""
+        with self._credentials_lock:
+            if not self.credentials.valid:
+                from google.auth.transport.requests import Request
+                self.credentials.refresh(Request())
+            return {"Authorization": f"Bearer {self.credentials.token}"}
+    
+    def download_file(self, file_id: str, local_path: str,
+                      progress: Optional[DownloadProgress] = None,
+                      part_path: Optional[str] = None) -> bool:
         """
         파일 다운로드
         
+        바이트 범위를 나눠 동시에 받으며 디스크에 바로 씁니다. 실패하면 받은 범위가 부분 파일에 남아
+        같은 part_path로 다시 호출할 때 이어받습니다. 처리량은 last_download_stats에 기록됩니다.
+        
         Args:
             file_id: Google Drive 파일 ID
             local_path: 로컬 저장 경로
+            progress: 진행률 콜백 (받은 바이트, 전체 바이트, 초당 바이트)
+            part_path: 받는 중인 부분 파일 경로 (기본 local_path + ".part")
             
         Returns:
             다운로드 성공 여부
         """
+        from app.core.config import settings
+        
+        # 파일 정보 조회
+        file_info = self.get_file_info(file_id)
+        if not file_info:
+            return False
+        
+        downloader = RangedDownloader(
+            DRIVE_MEDIA_URL.format(file_id=file_id),
+            local_path,
+            chunk_size=settings.DRIVE_DOWNLOAD_CHUNK_MB * 1024 * 1024,
+            workers=settings.DRIVE_DOWNLOAD_WORKERS,
+            headers=self._auth_headers,
+            part_path=part_path,
+            validator=file_info.get('md5Checksum'),
+            progress=progress,
+        )
         try:
-            # 파일 정보 조회
-            file_info = self.get_file_info(file_id)
-            if not file_info:
-                return False
-            
-            # 파일 다운로드
-            request = self.service.files().get_media(fileId=file_id)
-            file_io = io.BytesIO()
-            downloader = MediaIoBaseDownload(file_io, request)
-            
-            done = False
-            while done is False:
-                status, done = downloader.next_chunk()
-                logger.debug(f"다운로드 진행률: {int(status.progress() * 100)}%")
-            
-            # 로컬 파일로 저장
-            with open(local_path, 'wb') as f:
-                f.write(file_io.getvalue())
-            
+            size = file_info.get('size')
+            self.last_download_stats = downloader.download(int(size) if size else None)
             logger.info(f"파일 다운로드 완료: {file_info.get('name')} -> {local_path}")
             return True
-            
-        except HttpError as error:
+        except (DownloadError, httpx.HTTPError, OSError) as error:
+            # 진행률 콜백의 취소 예외 등은 호출자에게 그대로 전달
             logger.error(f"파일 다운로드 실패: {error}")
             return False
-        except Exception as error:
-            logger.error(f"파일 다운로드 중 오류: {error}")
-            return False
     
     def extract_file_id_from_url(self, url: str) -> Optional[str]:
         """
@@ -174,6 +201,8 @@ class GoogleDriveService:
         Returns:
             공유 링크 또는 None
         """
+        from googleapiclient.errors import HttpError
+        
         try:
             # 파일을 공개적으로 읽기 가능하게 설정
             permission = {
@@ -0,0 +1,308 @@
+"""
+미디어 작업 큐 서비스
+
+media_jobs 테이블을 작업 큐로 사용합니다. API는 enqueue/조회/취소만 하고,
+미디어 워커(app/workers/media_worker.py)는 claim_next로 작업을 가져가 진행률을 보고합니다.
+여러 워커 프로세스가 동시에 가져가도 조건부 UPDATE로 한 워커만 작업을 차지합니다.
+작업을 가진 워커는 heartbeat로 updated_at을 주기적으로 갱신하고, 진행률/종료 기록은
+worker_id가 일치할 때만 반영되므로 다시 대기열에 들어간 작업을 이전 워커가 덮어쓰지 않습니다.
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import and_, func, insert, or_, update
+from sqlalchemy.orm import Session
+
+from app.models.media_job import MediaJob, MediaJobSegment, MediaJobStatus
+
+logger = logging.getLogger(__name__)
+
+
+class MediaJobCancelled(Exception):
+    """작업 취소 요청이 확인되었을 때 워커 내부에서 발생하는 예외"""
+
+
+class MediaJobLost(Exception):
+    """작업이 다른 워커에게 넘어가 더 이상 이 워커의 것이 아닐 때 발생하는 예외"""
+
+
+class MediaJobService:
+    """미디어 작업 큐 서비스"""
+
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None):
+        if session_factory is None:
+            from app.core.database import SessionLocal
+            session_factory = SessionLocal
+        self.session_factory = session_factory
+
+    # API 측
+
+    def enqueue(self, db: Session, user_id: int, job_type: str, payload: Dict[str, Any],
+                job_id: Optional[str] = None) -> MediaJob:
+        """작업 등록 (job_id를 주면 해당 ID로 등록)"""
+        job = MediaJob(user_id=user_id, job_type=job_type, payload=payload)
+        if job_id:
+            job.id = job_id
+        db.add(job)
+        db.commit()
+        db.refresh(job)
+        logger.info(f"미디어 작업 등록: {job.id} ({job_type})")
+        return job
+
+    def get_for_user(self, db: Session, job_id: str, user_id: int) -> Optional[MediaJob]:
+        """사용자의 작업 조회"""
+        return db.query(MediaJob).filter(
+            MediaJob.id == job_id,
+            MediaJob.user_id == user_id
+        ).first()
+
+    def list_for_user(self, db: Session, user_id: int, limit: int = 20) -> List[MediaJob]:
+        """사용자의 최근 작업 목록"""
+        return db.query(MediaJob).filter(
+            MediaJob.user_id == user_id
+        ).order_by(MediaJob.created_at.desc()).limit(limit).all()
+
+    def request_cancel(self, db: Session, job: MediaJob) -> MediaJob:
+        """
+        작업 취소 요청
+
+        대기 중인 작업은 바로 취소되고, 처리 중인 작업은 워커가 다음 진행률 보고 시점에 중단합니다.
+        """
+        if job.is_finished:
+            return job
+
+        if job.status == MediaJobStatus.QUEUED:
+            # 워커가 동시에 가져가는 경우를 피하기 위해 조건부 UPDATE
+            result = db.execute(
+                update(MediaJob)
+                .where(MediaJob.id == job.id, MediaJob.status == MediaJobStatus.QUEUED)
+                .values(status=MediaJobStatus.CANCELLED, cancel_requested=True,
+                        finished_at=datetime.utcnow(), updated_at=datetime.utcnow())
+            )
+            if result.rowcount:
+                db.commit()
+                db.refresh(job)
+                return job
+
+        db.execute(
+            update(MediaJob)
+            .where(MediaJob.id == job.id)
+            .values(cancel_requested=True, updated_at=datetime.utcnow())
+        )
+        db.commit()
+        db.refresh(job)
+        return job
+
+    def list_segments(self, db: Session, job_id: str, after_seq: int = 0,
+                      limit: int = 500) -> List[MediaJobSegment]:
+        """after_seq 이후에 추가된 부분 결과 세그먼트 (seq 순)"""
+        return db.query(MediaJobSegment).filter(
+            MediaJobSegment.job_id == job_id,
+            MediaJobSegment.seq > after_seq
+        ).order_by(MediaJobSegment.seq).limit(limit).all()
+
+    def list_finished_transcriptions(self, db: Session, after: Optional[Tuple[datetime, str]] = None,
+                                     limit: int = 500) -> List[Tuple[datetime, str, Optional[Dict[str, Any]]]]:
+        """
+        after (finished_at, id) 이후에 완료된 작업의 (finished_at, id, transcription_stats) 목록
+
+        음성 인식은 워커 프로세스에서 실행되므로 API 프로세스의 음성 인식 지표는 이 결과로 집계합니다.
+        캐시 결과를 재사용해 음성 인식을 하지 않은 작업은 transcription_stats가 None입니다.
+        """
+        query = db.query(MediaJob.finished_at, MediaJob.id, MediaJob.result).filter(
+            MediaJob.status == MediaJobStatus.COMPLETED,
+            MediaJob.finished_at.isnot(None)
+        )
+        if after:
+            finished_at, job_id = after
+            query = query.filter(or_(
+                MediaJob.finished_at > finished_at,
+                and_(MediaJob.finished_at == finished_at, MediaJob.id > job_id)
+            ))
+        rows = query.order_by(MediaJob.finished_at, MediaJob.id).limit(limit).all()
+        return [
+            (finished_at, job_id,
+             None if not result or result.get("cache_hit") else result.get("transcription_stats"))
+            for finished_at, job_id, result in rows
+        ]
+
+    # 워커 측
+
+    def claim_next(self, worker_id: str) -> Optional[MediaJob]:
+        """가장 오래된 대기 작업을 가져와 RUNNING으로 전환 (없으면 None)"""
+        with self.session_factory() as db:
+            while True:
+                job_id = db.query(MediaJob.id).filter(
+                    MediaJob.status == MediaJobStatus.QUEUED
+                ).order_by(MediaJob.created_at, MediaJob.id).limit(1).scalar()
+                if job_id is None:
+                    return None
+
+                now = datetime.utcnow()
+                result = db.execute(
+                    update(MediaJob)
+                    .where(MediaJob.id == job_id, MediaJob.status == MediaJobStatus.QUEUED)
+                    .values(status=MediaJobStatus.RUNNING, worker_id=worker_id,
+                            started_at=now, updated_at=now)
+                )
+                db.commit()
+                if result.rowcount:
+                    job = db.get(MediaJob, job_id)
+                    db.expunge(job)
+                    return job
+                # 다른 워커가 먼저 가져간 경우 다음 작업 시도
+
+    @staticmethod
+    def _owned_by(job_id: str, worker_id: Optional[str]) -> list:
+        """worker_id가 주어지면 그 워커가 처리 중인 작업만 고르는 조건"""
+        conditions = [MediaJob.id == job_id]
+        if worker_id is not None:
+            conditions += [MediaJob.worker_id == worker_id, MediaJob.status == MediaJobStatus.RUNNING]
+        return conditions
+
+    def heartbeat(self, job_id: str, worker_id: str) -> bool:
+        """
+        처리 중인 작업의 updated_at 갱신 (requeue_stale에 중단된 작업으로 잡히지 않도록 함)
+
+        Returns:
+            작업이 아직 이 워커의 것이면 True
+        """
+        with self.session_factory() as db:
+            result = db.execute(
+                update(MediaJob)
+                .where(*self._owned_by(job_id, worker_id))
+                .values(updated_at=datetime.utcnow())
+            )
+            db.commit()
+        return bool(result.rowcount)
+
+    def report_progress(self, job_id: str, progress: float, stage: str,
+                        worker_id: Optional[str] = None) -> None:
+        """
+        진행률 갱신 (worker_id를 주면 그 워커가 처리 중일 때만 반영)
+
+        Raises:
+            MediaJobCancelled: 취소 요청이 들어온 경우
+            MediaJobLost: 작업이 더 이상 이 워커의 것이 아닌 경우
+        """
+        with self.session_factory() as db:
+            result = db.execute(
+                update(MediaJob)
+                .where(*self._owned_by(job_id, worker_id))
+                .values(progress=max(0.0, min(progress, 1.0)), stage=stage,
+                        updated_at=datetime.utcnow())
+            )
+            db.commit()
+            if worker_id is not None and not result.rowcount:
+                raise MediaJobLost(job_id)
+            cancel_requested = db.query(MediaJob.cancel_requested).filter(
+                MediaJob.id == job_id
+            ).scalar()
+        if cancel_requested:
+            raise MediaJobCancelled(job_id)
+
+    def add_segments(self, job_id: str, kind: str, segments: List[Dict[str, Any]]) -> int:
+        """
+        부분 결과 세그먼트 추가 (한 작업은 한 워커만 처리하므로 seq는 마지막 값에 이어 붙임)
+
+        Args:
+            segments: start, end(초), text를 담은 딕셔너리 목록
+
+        Returns:
+            마지막 seq
+        """
+        with self.session_factory() as db:
+            last_seq = db.query(func.max(MediaJobSegment.seq)).filter(
+                MediaJobSegment.job_id == job_id
+            ).scalar() or 0
+            rows = [
+                {
+                    "job_id": job_id,
+                    "seq": last_seq + i,
+                    "kind": kind,
+                    "start_seconds": segment.get("start"),
+                    "end_seconds": segment.get("end"),
+                    "text": segment["text"],
+                    "created_at": datetime.utcnow(),
+                }
+                for i, segment in enumerate(segments, start=1)
+            ]
+            if rows:
+                db.execute(insert(MediaJobSegment.__table__), rows)
+                db.commit()
+        return last_seq + len(rows)
+
+    def finish(self, job_id: str, status: MediaJobStatus,
+               result: Optional[Dict[str, Any]] = None, error_message: Optional[str] = None,
+               worker_id: Optional[str] = None) -> bool:
+        """
+        작업 종료 상태 기록 (worker_id를 주면 그 워커가 처리 중일 때만 기록)
+
+        Returns:
+            기록되었으면 True
+        """
+        values = {
+            "status": status,
+            "result": result,
+            "error_message": error_message,
+            "finished_at": datetime.utcnow(),
+            "updated_at": datetime.utcnow(),
+        }
+        if status == MediaJobStatus.COMPLETED:
+            values["progress"] = 1.0
+            values["stage"] = "completed"
+        with self.session_factory() as db:
+            updated = db.execute(update(MediaJob).where(*self._owned_by(job_id, worker_id)).values(**values))
+            db.commit()
+        if not updated.rowcount:
+            logger.warning(f"미디어 작업 {job_id}이(가) 다른 워커로 넘어가 종료 상태를 기록하지 않았습니다")
+        return bool(updated.rowcount)
+
+    def requeue_stale(self, older_than: timedelta) -> int:
+        """
+        오래 갱신되지 않은 RUNNING 작업을 다시 대기열로 되돌림
+        (워커 프로세스가 비정상 종료된 경우 복구용, 살아 있는 워커는 heartbeat로 updated_at을 갱신)
+        """
+        cutoff = datetime.utcnow() - older_than
+        with self.session_factory() as db:
+            result = db.execute(
+                update(MediaJob)
+                .where(MediaJob.status == MediaJobStatus.RUNNING, MediaJob.updated_at < cutoff)
+                .values(status=MediaJobStatus.QUEUED, worker_id=None, updated_at=datetime.utcnow())
+            )
+            db.commit()
+        if result.rowcount:
+            logger.warning(f"중단된 미디어 작업 {result.rowcount}개를 다시 대기열에 넣었습니다")
+        return result.rowcount
+
+
+class MediaJobReporter:
+    """
+    작업 핸들러에 넘기는 보고 객체
+
+    report(progress, stage)로 진행률을 갱신하고(취소 시 MediaJobCancelled),
+    report.publish(kind, segments)로 처리가 끝난 구간의 부분 결과를 내보냅니다.
+    heartbeat가 작업을 잃은 것을 확인하면(lost 설정) 두 호출 모두 MediaJobLost를 발생시킵니다.
+    """
+
+    def __init__(self, job_service: MediaJobService, job_id: str, worker_id: Optional[str] = None):
+        self.job_service = job_service
+        self.job_id = job_id
+        self.worker_id = worker_id
+        self.lost = False
+
+    def __call__(self, progress: float, stage: str) -> None:
+        if self.lost:
+            raise MediaJobLost(self.job_id)
+        self.job_service.report_progress(self.job_id, progress, stage, self.worker_id)
+
+    def publish(self, kind: str, segments: List[Dict[str, Any]]) -> int:
+        if self.lost:
+            raise MediaJobLost(self.job_id)
+        return self.job_service.add_segments(self.job_id, kind, segments)
+
+
+def create_media_job_service(session_factory: Optional[Callable[[], Session]] = None) -> MediaJobService:
+    """미디어 작업 서비스 인스턴스 생성"""
+    return MediaJobService(session_factory)
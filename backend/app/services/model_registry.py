@@ -0,0 +1,173 @@
+"""
+ML 모델 레지스트리
+
+Whisper(openai-whisper/faster-whisper), EasyOCR 모델을 워커 프로세스당 한 번만 로드해 요청 간에 공유합니다.
+모델 객체는 스레드 안전하지 않으므로 추론 시에는 모델별 락(`lock_for`)을 잡고 사용합니다.
+"""
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def _rss_mb() -> float:
+    """현재 프로세스의 메모리 사용량(MB)"""
+    try:
+        import psutil
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except ImportError:
+        import resource
+        import sys
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS는 바이트, Linux는 KB 단위
+        return usage / (1024 * 1024) if sys.platform == "darwin" else usage / 1024
+
+
+class ModelRegistry:
+    """프로세스 단위 모델 싱글톤 저장소"""
+
+    def __init__(self):
+        self._models: Dict[Hashable, Any] = {}
+        self._load_locks: Dict[Hashable, threading.Lock] = {}
+        self._use_locks: Dict[Hashable, threading.Lock] = {}
+        self._stats: Dict[Hashable, Dict[str, float]] = {}
+        self._guard = threading.Lock()
+
+    def _lock(self, table: Dict[Hashable, threading.Lock], key: Hashable) -> threading.Lock:
+        with self._guard:
+            lock = table.get(key)
+            if lock is None:
+                lock = table[key] = threading.Lock()
+            return lock
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        키에 해당하는 모델 반환 (없으면 loader로 한 번만 로드)
+
+        같은 키를 동시에 요청해도 loader는 한 번만 실행됩니다.
+        """
+        model = self._models.get(key)
+        if model is not None:
+            return model
+
+        with self._lock(self._load_locks, key):
+            model = self._models.get(key)
+            if model is not None:
+                return model
+
+            logger.info(f"모델 로드 시작: {key}")
+            rss_before = _rss_mb()
+            started = time.perf_counter()
+            model = loader()
+            load_seconds = time.perf_counter() - started
+            rss_delta = max(_rss_mb() - rss_before, 0.0)
+
+            self._stats[key] = {
+                "load_seconds": round(load_seconds, 3),
+                "memory_mb": round(rss_delta, 1),
+                "loaded_at": time.time(),
+            }
+            self._models[key] = model
+            logger.info(f"모델 로드 완료: {key} ({load_seconds:.2f}초, +{rss_delta:.0f}MB)")
+            return model
+
+    @contextmanager
+    def lock_for(self, key: Hashable):
+        """공유 모델로 추론할 때 잡는 모델별 락"""
+        with self._lock(self._use_locks, key):
+            yield
+
+    def is_loaded(self, key: Hashable) -> bool:
+        return key in self._models
+
+    def unload(self, key: Hashable) -> None:
+        """모델 해제 (테스트/메모리 회수용)"""
+        with self._lock(self._load_locks, key):
+            self._models.pop(key, None)
+            self._stats.pop(key, None)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """로드된 모델별 로드 시간/메모리 증가량"""
+        return {self._format_key(key): dict(value) for key, value in self._stats.items()}
+
+    @staticmethod
+    def _format_key(key: Hashable) -> str:
+        if isinstance(key, tuple):
+            return ":".join(str(part) for part in key)
+        return str(key)
+
+    # 모델별 로더
+
+    @staticmethod
+    def whisper_key(model_size: str) -> Tuple[str, str]:
+        return ("whisper", model_size)
+
+    @staticmethod
+    def faster_whisper_key(model_size: str, compute_type: str) -> Tuple[str, str, str]:
+        return ("faster-whisper", model_size, compute_type)
+
+    @staticmethod
+    def easyocr_key(languages: Iterable[str]) -> Tuple[str, str]:
+        return ("easyocr", "+".join(languages))
+
+    @staticmethod
+    def tesseract_key(lang: str) -> Tuple[str, str]:
+        return ("tesseract", lang)
+
+    def get_whisper(self, model_size: str = "base") -> Any:
+        """Whisper 모델 반환"""
+        def load():
+            import whisper
+            return whisper.load_model(model_size)
+        return self.get(self.whisper_key(model_size), load)
+
+    def get_faster_whisper(self, model_size: str = "base", compute_type: str = "int8", cpu_threads: int = 0) -> Any:
+        """
+        faster-whisper(CTranslate2) 모델 반환 (CPU, compute_type으로 양자화 지정)
+
+        faster-whisper가 설치되어 있지 않으면 ImportError가 발생합니다.
+        """
+        def load():
+            from faster_whisper import WhisperModel
+            return WhisperModel(model_size, device="cpu", compute_type=compute_type, cpu_threads=cpu_threads)
+        return self.get(self.faster_whisper_key(model_size, compute_type), load)
+
+    def get_easyocr(self, languages: Iterable[str] = ("ko", "en")) -> Any:
+        """EasyOCR Reader 반환"""
+        languages = list(languages)
+
+        def load():
+            import easyocr
+            return easyocr.Reader(languages)
+        return self.get(self.easyocr_key(languages), load)
+
+    def get_tesseract(self, lang: str = "kor+eng", psm: int = 6) -> Any:
+        """
+        tesserocr 엔진 반환 (언어 모델을 한 번 로드해 프레임마다 재사용)
+
+        tesserocr가 설치되어 있지 않으면 ImportError가 발생합니다.
+        """
+        def load():
+            import tesserocr
+            return tesserocr.PyTessBaseAPI(lang=lang, psm=tesserocr.PSM(psm), oem=tesserocr.OEM.DEFAULT)
+        return self.get(self.tesseract_key(lang), load)
+
+    def warm_up(self, whisper_model: Optional[str] = "base", use_easyocr: bool = True) -> Dict[str, Dict[str, float]]:
+        """서버 시작 시 모델을 미리 로드"""
+        if whisper_model:
+            self.get_whisper(whisper_model)
+        if use_easyocr:
+            self.get_easyocr()
+        return self.stats()
+
+
+# 전역 모델 레지스트리 인스턴스
+_model_registry = ModelRegistry()
+
+
+def get_model_registry() -> ModelRegistry:
+    """모델 레지스트리 반환"""
+    return _model_registry
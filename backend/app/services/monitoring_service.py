@@ -21,6 +21,8 @@ SYSTEM_MEMORY_USAGE = Gauge('system_memory_usage_percent', 'System memory usage
 SYSTEM_DISK_USAGE = Gauge('system_disk_usage_percent', 'System disk usage percentage')
 VIDEO_PROCESSING_TIME = Histogram('video_processing_duration_seconds', 'Video processing duration')
 VIDEO_PROCESSING_COUNT = Counter('video_processing_total', 'Total video processing requests', ['status'])
+SOURCE_AUDIO_SECONDS = Counter('asr_source_audio_seconds_total', 'Decoded audio duration before silence trimming', ['backend'])
+ASR_AUDIO_SECONDS = Counter('asr_audio_seconds_total', 'Audio duration sent to the speech recognition engine', ['backend'])
 
 class PerformanceMonitor:
     """성능 모니터링 클래스"""
@@ -29,6 +31,8 @@ class PerformanceMonitor:
         self.start_time = datetime.now()
         self.request_stats = {}
         self.video_processing_stats = {}
+        # 지표에 반영한 마지막 완료 작업 (finished_at, id)
+        self._transcription_cursor = None
         
     def track_request(self, method: str, endpoint: str, status_code: int, duration: float):
         """HTTP 요청 추적"""
@@ -90,6 +94,50 @@ class PerformanceMonitor:
         if file_size:
             stats['total_file_size'] += file_size
     
+    def track_transcription(self, backend: str, audio_seconds: float, asr_seconds: float):
+        """음성 인식 오디오 길이 추적 (원본 길이와 무음을 잘라내고 엔진에 보낸 길이)"""
+        SOURCE_AUDIO_SECONDS.labels(backend=backend).inc(audio_seconds)
+        ASR_AUDIO_SECONDS.labels(backend=backend).inc(asr_seconds)
+        
+        stats = self.video_processing_stats.setdefault('transcription', {
+            'count': 0,
+            'audio_minutes': 0.0,
+            'asr_minutes': 0.0,
+            'trimmed_ratio': 0.0
+        })
+        stats['count'] += 1
+        stats['audio_minutes'] += audio_seconds / 60
+        stats['asr_minutes'] += asr_seconds / 60
+        if stats['audio_minutes'] > 0:
+            stats['trimmed_ratio'] = 1 - stats['asr_minutes'] / stats['audio_minutes']
+    
+    def sync_transcription_metrics(self, db) -> int:
+        """
+        미디어 워커에서 완료된 작업의 음성 인식 오디오 길이를 이 프로세스의 지표에 반영
+        
+        워커 프로세스의 지표는 API의 /metrics에 보이지 않으므로 작업 결과의 transcription_stats로 집계합니다.
+        
+        Returns:
+            새로 반영한 작업 수
+        """
+        from app.services.media_job_service import create_media_job_service
+        
+        job_service = create_media_job_service()
+        synced = 0
+        try:
+            while True:
+                rows = job_service.list_finished_transcriptions(db, self._transcription_cursor)
+                if not rows:
+                    break
+                for finished_at, job_id, stats in rows:
+                    if stats:
+                        self.track_transcription(stats.get("backend", ""), stats["audio_seconds"], stats["asr_seconds"])
+                    self._transcription_cursor = (finished_at, job_id)
+                synced += len(rows)
+        except Exception as e:
+            logger.error(f"음성 인식 지표 집계 실패: {e}")
+        return synced
+    
     def update_system_metrics(self):
         """시스템 메트릭 업데이트"""
         try:
@@ -3,17 +3,18 @@ RAG(검색 증강 생성) 시스템 구현
 문서 검색, 청킹, 벡터화, 유사도 검색을 담당합니다.
 """
 
+import fcntl
 import os
 import logging
-from typing import List, Dict, Any, Optional, Tuple
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Tuple, TYPE_CHECKING
 from uuid import UUID
 
-import numpy as np
-from sqlalchemy.orm import Session
-from langchain.text_splitter import RecursiveCharacterTextSplitter
-from langchain_openai import OpenAIEmbeddings
-from langchain_community.vectorstores import FAISS
-from langchain.schema import Document
+from sqlalchemy.orm import Session, undefer
+
+# LangChain/FAISS는 import 비용이 커서 RAG 서비스를 처음 사용할 때 로드
+if TYPE_CHECKING:
+    from langchain_community.vectorstores import FAISS
 
 from app.core.database import get_db
 from app.models.document import Document as DocumentModel
@@ -23,12 +24,30 @@ from app.config import settings
 logger = logging.getLogger(__name__)
 
 
+@contextmanager
+def project_store_lock(store_path: str):
+    """
+    프로젝트 벡터 스토어 파일 잠금 (프로세스 간 배타 잠금)
+
+    API 서버와 미디어 워커가 같은 스토어를 읽고-추가하고-저장할 때 서로의 추가분을 덮어쓰지 않도록
+    스토어 옆의 .lock 파일에 flock을 겁니다.
+    """
+    os.makedirs(os.path.dirname(store_path) or ".", exist_ok=True)
+    with open(f"{store_path}.lock", "a") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
 class DocumentChunker:
     """문서를 의미적 단위로 분할하는 클래스"""
     
     def __init__(self, chunk_size: int = 512, chunk_overlap: int = 50):
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
+        from langchain.text_splitter import RecursiveCharacterTextSplitter
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=chunk_size,
             chunk_overlap=chunk_overlap,
@@ -67,11 +86,14 @@ class VectorRetriever:
     """벡터 기반 문서 검색 클래스"""
     
     def __init__(self):
+        from langchain_openai import OpenAIEmbeddings
         self.embeddings = OpenAIEmbeddings(
             openai_api_key=settings.OPENAI_API_KEY,
             model="text-embedding-ada-002"
         )
-        self.vector_stores: Dict[str, FAISS] = {}  # 프로젝트별 벡터 스토어
+        self.vector_stores: Dict[str, "FAISS"] = {}  # 프로젝트별 벡터 스토어
+        # 프로젝트별로 마지막으로 읽거나 쓴 저장 파일의 수정 시각 (다른 프로세스가 갱신했는지 확인용)
+        self.store_mtimes: Dict[str, float] = {}
     
     async def create_embeddings(self, texts: List[str]) -> List[List[float]]:
         """텍스트 리스트를 임베딩으로 변환"""
@@ -93,6 +115,9 @@ class VectorRetriever:
             if not chunk_data:
                 return False
             
+            from langchain.schema import Document
+            from langchain_community.vectorstores import FAISS
+            
             # 텍스트 추출
             texts = [chunk["text"] for chunk in chunk_data]
             
@@ -175,12 +200,44 @@ class VectorRetriever:
             logger.error(f"문서 검색 실패: {e}")
             return []
     
+    def add_embeddings_to_store(
+        self,
+        project_id: str,
+        chunk_data: List[Dict[str, Any]],
+        vectors: List[List[float]]
+    ) -> None:
+        """이미 계산한 임베딩으로 청크를 벡터 스토어에 추가 (임베딩 API를 다시 호출하지 않음)"""
+        from langchain_community.vectorstores import FAISS
+        
+        text_embeddings = [(chunk["text"], vector) for chunk, vector in zip(chunk_data, vectors)]
+        metadatas = [
+            {"document_id": chunk["document_id"], "chunk_index": chunk["chunk_index"], **chunk["metadata"]}
+            for chunk in chunk_data
+        ]
+        if project_id in self.vector_stores:
+            self.vector_stores[project_id].add_embeddings(text_embeddings, metadatas=metadatas)
+        else:
+            self.vector_stores[project_id] = FAISS.from_embeddings(
+                text_embeddings, self.embeddings, metadatas=metadatas
+            )
+    
+    @staticmethod
+    def _store_mtime(path: str) -> Optional[float]:
+        index_path = os.path.join(path, "index.faiss")
+        return os.path.getmtime(index_path) if os.path.exists(index_path) else None
+    
+    def is_store_stale(self, project_id: str, path: str) -> bool:
+        """저장 파일이 마지막으로 읽은 뒤 다른 프로세스(미디어 워커 등)에서 갱신되었는지 확인"""
+        mtime = self._store_mtime(path)
+        return mtime is not None and mtime != self.store_mtimes.get(project_id)
+    
     def save_vector_store(self, project_id: str, path: str) -> bool:
         """벡터 스토어를 파일로 저장"""
         try:
             if project_id in self.vector_stores:
                 os.makedirs(os.path.dirname(path), exist_ok=True)
                 self.vector_stores[project_id].save_local(path)
+                self.store_mtimes[project_id] = self._store_mtime(path)
                 logger.info(f"벡터 스토어 저장 완료: {path}")
                 return True
             return False
@@ -192,6 +249,8 @@ class VectorRetriever:
         """파일에서 벡터 스토어 로드"""
         try:
             if os.path.exists(path):
+                from langchain_community.vectorstores import FAISS
+                
                 # FAISS 버전 호환성을 위한 다중 시도 방식
                 try:
                     # 최신 FAISS 버전에서 먼저 시도
@@ -208,6 +267,7 @@ class VectorRetriever:
                         self.embeddings
                     )
                 
+                self.store_mtimes[project_id] = self._store_mtime(path)
                 logger.info(f"벡터 스토어 로드 완료: {path}")
                 return True
             return False
@@ -227,6 +287,21 @@ class RAGService:
         from app.core.config import settings
         self.vector_store_base_path = settings.get_absolute_vector_store_dir
     
+    def _add_to_project_store(self, project_key: str, chunks: List[Dict[str, Any]],
+                              vectors: List[List[float]]) -> None:
+        """
+        프로젝트 벡터 스토어에 청크 추가 후 저장
+        
+        API 서버와 미디어 워커가 같은 스토어를 갱신하므로 프로젝트 스토어 잠금 안에서
+        다른 프로세스가 저장한 파일을 다시 읽은 뒤 추가하고 저장합니다.
+        """
+        store_path = os.path.join(self.vector_store_base_path, project_key)
+        with project_store_lock(store_path):
+            if self.retriever.is_store_stale(project_key, store_path):
+                self.retriever.load_vector_store(project_key, store_path)
+            self.retriever.add_embeddings_to_store(project_key, chunks, vectors)
+            self.retriever.save_vector_store(project_key, store_path)
+    
     async def process_document_for_rag(
         self, 
         document_id: int, 
@@ -235,7 +310,9 @@ class RAGService:
         """문서를 RAG 시스템에 추가 처리"""
         try:
             # 문서 조회
-            document = db.query(DocumentModel).filter(
+            document = db.query(DocumentModel).options(
+                undefer(DocumentModel.content)
+            ).filter(
                 DocumentModel.id == document_id
             ).first()
             
@@ -253,47 +330,23 @@ class RAGService:
                 logger.warning(f"문서 청킹 실패: {document_id}")
                 return False
             
-            # 벡터 스토어에 추가
-            success = await self.retriever.add_documents_to_store(
-                str(document.project_id), 
-                chunks
-            )
+            # 청크 벡터를 한 번만 생성해 벡터 스토어와 임베딩 테이블에 함께 사용
+            vectors = await self.retriever.create_embeddings([chunk["text"] for chunk in chunks])
             
-            if success:
-                # 벡터 스토어 저장
-                store_path = os.path.join(
-                    self.vector_store_base_path, 
-                    str(document.project_id)
-                )
-                self.retriever.save_vector_store(
-                    str(document.project_id), 
-                    store_path
-                )
+            if len(vectors) == len(chunks):
+                self._add_to_project_store(str(document.project_id), chunks, vectors)
                 
-                # 임베딩 메타데이터 DB에 저장
-                for chunk in chunks:
-                    # 청크에 대한 임베딩 벡터 생성
-                    chunk_embedding = await self.retriever.embeddings.aembed_query(chunk["text"])
-                    
-                    # 디버깅을 위한 로그 추가
-                    chunk_text = chunk["text"]
-                    chunk_size_val = len(chunk_text)
-                    logger.info(f"청크 처리 중: chunk_size={chunk_size_val}, text_length={len(chunk_text)}")
-                    
-                    embedding = Embedding(
+                # 임베딩 메타데이터 DB에 일괄 삽입
+                Embedding.bulk_insert(db, (
+                    Embedding.build_row(
                         document_id=document_id,
-                        chunk_text=chunk_text,
-                        chunk_size=chunk_size_val,  # 청크 크기 (문자 수) 추가
                         chunk_index=chunk["chunk_index"],
-                        embedding_vector=chunk_embedding,  # 임베딩 벡터 추가
-                        embedding_model="text-embedding-ada-002",
-                        vector_dimension=len(chunk_embedding) if chunk_embedding else 1536,
-                        tokens=len(chunk_text.split()),  # 대략적인 토큰 수
-                        document_metadata=chunk["metadata"]  # metadata_ → document_metadata로 수정
+                        chunk_text=chunk["text"],
+                        embedding_vector=vector,
+                        metadata=chunk["metadata"],
                     )
-                    db.add(embedding)
-                
-                db.commit()
+                    for chunk, vector in zip(chunks, vectors)
+                ))
                 
                 # 문서의 chunk_count 업데이트
                 document.chunk_count = len(chunks)
@@ -309,6 +362,50 @@ class RAGService:
             db.rollback()
             return False
     
+    async def append_document_chunks(
+        self,
+        db: Session,
+        document: DocumentModel,
+        chunks: List[Dict[str, Any]]
+    ) -> int:
+        """
+        처리 중인 문서에 청크를 이어서 색인 (스트리밍 비디오 처리용)
+        
+        청크 임베딩은 한 번만 계산해 FAISS와 embeddings 테이블에 함께 씁니다.
+        
+        Returns:
+            색인한 청크 수 (실패 시 0)
+        """
+        if not chunks:
+            return 0
+        
+        try:
+            # 임베딩은 스토어와 무관하므로 잠금 밖에서 계산
+            vectors = await self.retriever.create_embeddings([chunk["text"] for chunk in chunks])
+            if len(vectors) != len(chunks):
+                return 0
+            
+            self._add_to_project_store(str(document.project_id), chunks, vectors)
+            
+            Embedding.bulk_insert(db, (
+                Embedding.build_row(
+                    document_id=document.id,
+                    chunk_index=chunk["chunk_index"],
+                    chunk_text=chunk["text"],
+                    embedding_vector=vector,
+                    metadata=chunk["metadata"],
+                )
+                for chunk, vector in zip(chunks, vectors)
+            ))
+            document.chunk_count = (document.chunk_count or 0) + len(chunks)
+            db.commit()
+            return len(chunks)
+            
+        except Exception as e:
+            logger.error(f"RAG 청크 추가 실패 {document.id}: {e}")
+            db.rollback()
+            return 0
+    
     async def load_project_vector_store(self, project_id: str) -> bool:
         """프로젝트의 벡터 스토어 로드"""
         store_path = os.path.join(
@@ -325,8 +422,10 @@ class RAGService:
         score_threshold: float = 0.3  # 임계값을 낮춤
     ) -> List[Dict[str, Any]]:
         """프로젝트 내 문서 검색"""
-        # 벡터 스토어가 메모리에 없으면 로드
-        if str(project_id) not in self.retriever.vector_stores:
+        # 벡터 스토어가 메모리에 없거나 다른 프로세스에서 갱신되었으면 (다시) 로드
+        store_path = os.path.join(self.vector_store_base_path, str(project_id))
+        if (str(project_id) not in self.retriever.vector_stores
+                or self.retriever.is_store_stale(str(project_id), store_path)):
             await self.load_project_vector_store(str(project_id))
         
         # 쿼리 확장 - 한국어/영어 동의어 추가
@@ -367,10 +466,13 @@ class RAGService:
         return sorted_results[:max_results]
 
 
-# 전역 RAG 서비스 인스턴스
-rag_service = RAGService()
+# 전역 RAG 서비스 인스턴스 (첫 요청 시 생성)
+rag_service: Optional[RAGService] = None
 
 
 async def get_rag_service() -> RAGService:
     """RAG 서비스 의존성 주입"""
+    global rag_service
+    if rag_service is None:
+        rag_service = RAGService()
     return rag_service
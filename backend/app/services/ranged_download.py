@@ -0,0 +1,259 @@
+"""
+범위 요청 병렬 다운로드 모듈
+
+수 GB 강의 영상을 한 스트림으로 받으면 느리고, 중간에 실패하면 처음부터 다시 받아야 합니다.
+파일을 chunk_size 단위 바이트 범위(Range)로 나눠 여러 스레드에서 동시에 받아 미리 크기를 잡아 둔
+부분 파일(.part)의 제자리에 바로 쓰고, 끝난 범위는 상태 파일(.part.json)에 기록해
+다음 시도에서 이어받습니다.
+"""
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# (받은 바이트, 전체 바이트, 초당 바이트)
+DownloadProgress = Callable[[int, int, float], None]
+HeadersFactory = Callable[[], Dict[str, str]]
+
+
+class DownloadError(Exception):
+    """다운로드 실패 (받은 범위는 부분 파일에 남아 이어받을 수 있음)"""
+
+
+class RangedDownloader:
+    """
+    HTTP 범위 요청 병렬 다운로더
+
+    서버가 Range를 지원하지 않으면(206 대신 200 응답) 한 스트림으로 받습니다.
+    progress 콜백에서 발생한 예외(예: 작업 취소)는 남은 범위를 멈추고 그대로 전파됩니다.
+    """
+
+    def __init__(self, url: str, dest_path: str, chunk_size: int = 16 * 1024 * 1024,
+                 workers: int = 4, headers: Optional[HeadersFactory] = None,
+                 part_path: Optional[str] = None, validator: Optional[str] = None,
+                 progress: Optional[DownloadProgress] = None, progress_interval: float = 0.5,
+                 max_retries: int = 3, timeout: float = 60.0, client: Optional[httpx.Client] = None):
+        """
+        Args:
+            url: 다운로드 URL
+            dest_path: 완료된 파일을 둘 경로
+            chunk_size: 범위 요청 하나의 크기 (바이트)
+            workers: 동시에 받을 범위 수
+            headers: 요청마다 호출해 인증 헤더 등을 만드는 함수 (토큰 갱신 대응)
+            part_path: 받는 중인 부분 파일 경로 (기본 dest_path + ".part", 이어받기 위해 보존할 위치)
+            validator: 원본이 바뀌었는지 확인할 값 (예: md5Checksum, 상태 파일과 다르면 처음부터)
+            progress: 진행률 콜백 (progress_interval초마다, 완료 시 한 번 더 호출)
+            max_retries: 범위 하나를 다시 시도할 최대 횟수
+            timeout: 요청 타임아웃 (초)
+            client: 재사용할 httpx.Client (없으면 만들고 끝나면 닫음)
+        """
+        self.url = url
+        self.dest_path = dest_path
+        self.part_path = part_path or f"{dest_path}.part"
+        self.state_path = f"{self.part_path}.json"
+        self.chunk_size = max(1, chunk_size)
+        self.workers = max(1, workers)
+        self.headers = headers or (lambda: {})
+        self.validator = validator
+        self.progress = progress
+        self.progress_interval = progress_interval
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.client = client
+
+        self.total: Optional[int] = None
+        self.downloaded = 0
+        self.resumed_bytes = 0
+        self.elapsed = 0.0
+        self._done: Set[int] = set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._started = 0.0
+        self._last_report = 0.0
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """받은 바이트, 이어받은 바이트, 소요 시간, 처리량"""
+        fetched = self.downloaded - self.resumed_bytes
+        return {
+            "bytes": self.downloaded,
+            "resumed_bytes": self.resumed_bytes,
+            "seconds": round(self.elapsed, 3),
+            "mb_per_second": round(fetched / self.elapsed / (1024 * 1024), 2) if self.elapsed > 0 else 0.0,
+            "chunk_size": self.chunk_size,
+            "workers": self.workers,
+        }
+
+    def download(self, total: Optional[int] = None) -> Dict[str, float]:
+        """
+        파일 다운로드 (이미 받은 범위는 건너뜀)
+
+        Args:
+            total: 전체 크기를 알고 있으면 지정 (없으면 첫 바이트 범위 요청으로 확인)
+
+        Returns:
+            stats
+        """
+        owns_client = self.client is None
+        client = self.client or httpx.Client(timeout=self.timeout, follow_redirects=True)
+        self._started = time.perf_counter()
+        try:
+            self.total = total if total is not None else self._probe_size(client)
+            if self.total is None:
+                self._download_single(client)
+            else:
+                self._download_ranges(client)
+        finally:
+            self.elapsed = time.perf_counter() - self._started
+            if owns_client:
+                client.close()
+
+        # 부분 파일은 이어받기를 위해 다른 디스크에 둘 수 있으므로 rename 대신 move
+        shutil.move(self.part_path, self.dest_path)
+        self._remove_state()
+        logger.info(f"다운로드 완료: {self.dest_path} {self.stats}")
+        return self.stats
+
+    def _probe_size(self, client: httpx.Client) -> Optional[int]:
+        """bytes=0-0 요청으로 전체 크기 확인 (범위를 지원하지 않으면 None)"""
+        with client.stream("GET", self.url, headers={**self.headers(), "Range": "bytes=0-0"}) as response:
+            response.raise_for_status()
+            content_range = response.headers.get("Content-Range", "")
+            if response.status_code != 206 or "/" not in content_range:
+                return None
+            size = content_range.rsplit("/", 1)[1]
+            return int(size) if size.isdigit() else None
+
+    def _chunks(self) -> List[Tuple[int, int, int]]:
+        """(번호, 시작, 끝 포함) 범위 목록"""
+        return [
+            (index, start, min(start + self.chunk_size, self.total) - 1)
+            for index, start in enumerate(range(0, self.total, self.chunk_size))
+        ]
+
+    def _download_ranges(self, client: httpx.Client) -> None:
+        self._load_state()
+        chunks = self._chunks()
+        pending = [chunk for chunk in chunks if chunk[0] not in self._done]
+        self.resumed_bytes = sum(end - start + 1 for index, start, end in chunks if index in self._done)
+        self.downloaded = self.resumed_bytes
+        if self.resumed_bytes:
+            logger.info(f"이어받기: {self.resumed_bytes}/{self.total} 바이트 완료 상태에서 시작")
+
+        # 부분 파일을 전체 크기로 잡아 두고 범위마다 제자리에 씀
+        with open(self.part_path, "r+b" if os.path.exists(self.part_path) else "w+b") as f:
+            f.truncate(self.total)
+
+        errors = []
+        with ThreadPoolExecutor(max_workers=min(self.workers, max(1, len(pending)))) as executor:
+            futures = [executor.submit(self._fetch_chunk, client, chunk) for chunk in pending]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as error:
+                    # 하나가 실패하면 나머지 범위도 멈춤 (완료된 범위만 상태 파일에 남음)
+                    self._stop.set()
+                    errors.append(error)
+        if errors:
+            raise errors[0]
+        self._report(force=True)
+
+    def _fetch_chunk(self, client: httpx.Client, chunk: Tuple[int, int, int]) -> None:
+        index, start, end = chunk
+        for attempt in range(self.max_retries + 1):
+            if self._stop.is_set():
+                return
+            written = 0
+            try:
+                headers = {**self.headers(), "Range": f"bytes={start}-{end}"}
+                with client.stream("GET", self.url, headers=headers) as response, open(self.part_path, "r+b") as f:
+                    if response.status_code != 206:
+                        raise DownloadError(f"범위 요청 응답 코드 {response.status_code} (bytes={start}-{end})")
+                    f.seek(start)
+                    for data in response.iter_bytes():
+                        if self._stop.is_set():
+                            # 다른 범위가 실패했거나 취소됨 (이 범위는 완료로 기록하지 않음)
+                            return
+                        f.write(data)
+                        written += len(data)
+                        self._add_progress(len(data))
+                if written != end - start + 1:
+                    raise DownloadError(f"범위 크기 불일치: {written} != {end - start + 1}")
+                self._mark_done(index)
+                return
+            except (httpx.HTTPError, DownloadError) as error:
+                self._add_progress(-written)
+                if attempt == self.max_retries:
+                    raise DownloadError(f"범위 다운로드 실패 (bytes={start}-{end}): {error}") from error
+                logger.warning(f"범위 다운로드 재시도 {attempt + 1}/{self.max_retries} (bytes={start}-{end}): {error}")
+                time.sleep(min(2 ** attempt * 0.5, 8.0))
+
+    def _download_single(self, client: httpx.Client) -> None:
+        """Range를 지원하지 않는 서버: 한 스트림으로 받기 (이어받기 불가)"""
+        with client.stream("GET", self.url, headers=self.headers()) as response, open(self.part_path, "wb") as f:
+            response.raise_for_status()
+            self.total = int(response.headers.get("Content-Length", 0)) or None
+            for data in response.iter_bytes():
+                f.write(data)
+                self._add_progress(len(data))
+        self.total = self.downloaded
+        self._report(force=True)
+
+    def _add_progress(self, size: int) -> None:
+        with self._lock:
+            self.downloaded += size
+        self._report()
+
+    def _report(self, force: bool = False) -> None:
+        if not self.progress:
+            return
+        now = time.perf_counter()
+        if not force and now - self._last_report < self.progress_interval:
+            return
+        self._last_report = now
+        elapsed = now - self._started
+        rate = (self.downloaded - self.resumed_bytes) / elapsed if elapsed > 0 else 0.0
+        try:
+            self.progress(self.downloaded, self.total or 0, rate)
+        except Exception:
+            self._stop.set()
+            raise
+
+    def _load_state(self) -> None:
+        """이전 시도의 완료 범위 읽기 (크기/범위/원본 값이 다르면 처음부터)"""
+        self._done = set()
+        if not (os.path.exists(self.state_path) and os.path.exists(self.part_path)):
+            return
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (state.get("total"), state.get("chunk_size"), state.get("validator")) == (
+            self.total, self.chunk_size, self.validator
+        ):
+            self._done = set(state.get("done", []))
+
+    def _mark_done(self, index: int) -> None:
+        with self._lock:
+            self._done.add(index)
+            state = {"total": self.total, "chunk_size": self.chunk_size,
+                     "validator": self.validator, "done": sorted(self._done)}
+            temp_path = f"{self.state_path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(temp_path, self.state_path)
+
+    def _remove_state(self) -> None:
+        try:
+            os.remove(self.state_path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,211 @@
+"""
+음성 구간 분할 모듈
+
+긴 강의 오디오를 한 번에 Whisper에 넣으면 한 스레드에서 처음부터 끝까지 순차로 디코딩합니다.
+여기서는 에너지 기반 VAD로 무음을 걸러내고, 음성 구간을 겹치는 창(window)으로 나눈 뒤
+창별 인식 결과를 창의 시작 시각만큼 밀어 하나의 타임라인으로 합칩니다.
+창은 서로 독립적이라 여러 프로세스에서 동시에 인식할 수 있습니다.
+
+창 안의 긴 무음도 잘라내고 음성만 이어 붙여 인식하며(trim_window), 이어 붙인 오디오의 시각을
+원래 시각으로 되돌리는 오프셋 맵(OffsetMap)으로 세그먼트 타임스탬프를 보정합니다.
+"""
+import bisect
+import logging
+import wave
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+
+
+class SpeechWindow(NamedTuple):
+    """인식 단위 창 (초 단위). keep_start/keep_end는 겹치는 구간에서 이 창이 책임지는 범위 (None이면 제한 없음)"""
+    start: float
+    end: float
+    keep_start: Optional[float] = None
+    keep_end: Optional[float] = None
+
+
+def load_audio(audio_path: str) -> np.ndarray:
+    """
+    오디오를 16kHz 모노 float32 배열로 읽기
+
+    extract_audio_and_frames가 만든 16kHz 모노 PCM WAV는 그대로 읽고,
+    그 밖의 형식은 Whisper의 ffmpeg 디코더로 변환합니다.
+    """
+    try:
+        with wave.open(audio_path, "rb") as wav:
+            if (wav.getframerate(), wav.getnchannels(), wav.getsampwidth()) == (SAMPLE_RATE, 1, 2):
+                pcm = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+                return pcm.astype(np.float32) / 32768.0
+    except (wave.Error, EOFError):
+        pass
+
+    from whisper.audio import load_audio as whisper_load_audio
+    return whisper_load_audio(audio_path, sr=SAMPLE_RATE)
+
+
+def detect_speech(samples: np.ndarray, sample_rate: int = SAMPLE_RATE, frame_ms: int = 30,
+                  margin_db: float = 12.0, min_silence: float = 0.5,
+                  min_speech: float = 0.25, padding: float = 0.2) -> List[Tuple[float, float]]:
+    """
+    에너지 기반 음성 구간 검출
+
+    프레임별 에너지(dB)가 잡음 바닥(하위 10%)보다 margin_db 이상 크면 음성으로 봅니다.
+    min_silence보다 짧은 무음은 이어 붙이고, min_speech보다 짧은 구간은 버립니다.
+
+    Returns:
+        (시작, 끝) 초 단위 음성 구간 목록
+    """
+    frame = int(sample_rate * frame_ms / 1000)
+    count = len(samples) // frame
+    if count == 0:
+        return []
+
+    frames = samples[:count * frame].astype(np.float32).reshape(count, frame)
+    energy_db = 10 * np.log10(np.mean(frames ** 2, axis=1) + 1e-10)
+    noise_floor, loud = np.percentile(energy_db, [10, 90])
+    # 전체가 말소리라 잡음 바닥이 높게 잡힌 경우에도 대부분의 프레임이 음성으로 남도록 상한을 둠
+    threshold = max(-55.0, min(noise_floor + margin_db, loud - 15.0))
+    voiced = energy_db > threshold
+
+    frame_seconds = frame / sample_rate
+    regions: List[List[float]] = []
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], voiced.astype(np.int8), [0]))))
+    for first, last in zip(edges[::2], edges[1::2]):
+        start, end = first * frame_seconds, last * frame_seconds
+        if regions and start - regions[-1][1] < min_silence:
+            regions[-1][1] = end
+        else:
+            regions.append([start, end])
+
+    duration = len(samples) / sample_rate
+    return [
+        (max(0.0, start - padding), min(duration, end + padding))
+        for start, end in regions
+        if end - start >= min_speech
+    ]
+
+
+def plan_windows(regions: List[Tuple[float, float]], chunk_seconds: float,
+                 overlap_seconds: float) -> List[SpeechWindow]:
+    """
+    음성 구간을 최대 chunk_seconds 길이의 창으로 묶기
+
+    창 경계는 가능하면 무음 구간에 둡니다. 한 음성 구간이 chunk_seconds보다 길면
+    overlap_seconds만큼 겹치게 자르고, 겹친 부분은 가운데를 기준으로 앞뒤 창이 나눠 맡습니다.
+    """
+    spans: List[Tuple[float, float]] = []
+    step = max(chunk_seconds - overlap_seconds, 1.0)
+    for start, end in regions:
+        while end - start > chunk_seconds:
+            spans.append((start, start + chunk_seconds))
+            start += step
+        spans.append((start, end))
+
+    merged: List[List[float]] = []
+    for start, end in spans:
+        if merged and start >= merged[-1][1] and end - merged[-1][0] <= chunk_seconds:
+            merged[-1][1] = end
+        else:
+            merged.append([start, end])
+
+    windows = []
+    for i, (start, end) in enumerate(merged):
+        keep_start = keep_end = None
+        if i > 0 and start < merged[i - 1][1]:
+            keep_start = (start + merged[i - 1][1]) / 2
+        if i + 1 < len(merged) and merged[i + 1][0] < end:
+            keep_end = (merged[i + 1][0] + end) / 2
+        windows.append(SpeechWindow(start, end, keep_start, keep_end))
+    return windows
+
+
+def merge_window_segments(windows: List[SpeechWindow],
+                          window_segments: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    창별 세그먼트(창 기준 상대 시각)를 전체 타임라인으로 합치기
+
+    겹친 구간의 세그먼트는 중심 시각이 그 창의 keep 범위에 드는 쪽만 남겨 중복을 없앱니다.
+    """
+    merged = []
+    for window, segments in zip(windows, window_segments):
+        for segment in segments:
+            start = window.start + segment["start"]
+            end = min(window.start + segment["end"], window.end)
+            middle = (start + end) / 2
+            if window.keep_start is not None and middle < window.keep_start:
+                continue
+            if window.keep_end is not None and middle >= window.keep_end:
+                continue
+            text = segment["text"].strip()
+            if text:
+                merged.append({"start": round(start, 2), "end": round(end, 2), "text": text})
+    merged.sort(key=lambda segment: segment["start"])
+    return merged
+
+
+class OffsetMap(NamedTuple):
+    """
+    무음을 잘라 이어 붙인 오디오의 시각 → 창 기준 원래 시각 변환표
+
+    pieces는 (이어 붙인 오디오의 시작, 창 기준 원래 시작) 목록이며, 조각 안에서는 시각이 그대로 흐릅니다.
+    """
+    pieces: Tuple[Tuple[float, float], ...] = ((0.0, 0.0),)
+
+    def to_source(self, seconds: float, end: bool = False) -> float:
+        """이어 붙인 시각을 원래 시각으로 변환 (end=True면 조각 경계를 앞 조각의 끝으로 봄)"""
+        starts = [piece[0] for piece in self.pieces]
+        index = (bisect.bisect_left(starts, seconds) if end else bisect.bisect_right(starts, seconds)) - 1
+        compact_start, source_start = self.pieces[max(index, 0)]
+        return source_start + seconds - compact_start
+
+    def remap(self, segments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """창 인식 결과 세그먼트의 시각을 창 기준 원래 시각으로 변환"""
+        if len(self.pieces) == 1 and self.pieces[0] == (0.0, 0.0):
+            return segments
+        return [
+            {**segment, "start": self.to_source(segment["start"]), "end": self.to_source(segment["end"], end=True)}
+            for segment in segments
+        ]
+
+
+def trim_window(samples: np.ndarray, window: SpeechWindow, regions: List[Tuple[float, float]],
+                keep_silence: float = 0.3, sample_rate: int = SAMPLE_RATE) -> Tuple[np.ndarray, OffsetMap]:
+    """
+    창 안의 음성 구간만 이어 붙인 샘플과 오프셋 맵 반환
+
+    구간 사이 무음이 keep_silence보다 길면 다음 구간 앞의 keep_silence초만 남기고 잘라냅니다
+    (말 사이 끊김은 남겨 두어 문장 경계 인식이 흐트러지지 않게 함).
+    """
+    spans = [(max(start, window.start), min(end, window.end))
+             for start, end in regions if end > window.start and start < window.end]
+    if not spans:
+        return slice_window(samples, window, sample_rate), OffsetMap()
+
+    pieces: List[Tuple[float, float]] = []
+    parts: List[np.ndarray] = []
+    compact = 0
+    previous_end = None
+    for start, end in spans:
+        if previous_end is not None and start - previous_end <= keep_silence:
+            # 짧은 무음은 그대로 두고 앞 조각에 이어 붙임
+            start = previous_end
+        else:
+            if previous_end is not None:
+                start -= keep_silence
+            pieces.append((compact / sample_rate, start - window.start))
+        first, last = int(round(start * sample_rate)), int(round(end * sample_rate))
+        parts.append(samples[first:last])
+        compact += last - first
+        previous_end = end
+
+    return np.ascontiguousarray(np.concatenate(parts)), OffsetMap(tuple(pieces))
+
+
+def slice_window(samples: np.ndarray, window: SpeechWindow, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """창에 해당하는 샘플 구간 (Whisper 입력용으로 연속 배열 복사)"""
+    return np.ascontiguousarray(samples[int(window.start * sample_rate):int(window.end * sample_rate)])
@@ -359,5 +359,5 @@ def create_markdown_generator(output_dir: str = None) -> MarkdownGenerator:
 
 def create_document_sharing_service(base_url: str = None) -> DocumentSharingService:
     """문서 공유 서비스 인스턴스 생성"""
-    return DocumentSharingService(base_url)
+    return DocumentSharingService(base_url) if base_url else DocumentSharingService()
 
@@ -3,117 +3,258 @@
 """
 
 import os
+import atexit
 import logging
 import tempfile
-import whisper
-import cv2
-import easyocr
-import pytesseract
-from typing import Optional, Dict, Any, List, Tuple
+import threading
+import time
+import multiprocessing
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple, Callable
 from pathlib import Path
-import numpy as np
-from PIL import Image
+
+from app.services.model_registry import ModelRegistry, get_model_registry
+
+if TYPE_CHECKING:
+    from app.services.asr_backends import ASRBackend
+    from app.services.speech_chunking import OffsetMap, SpeechWindow
+
+# whisper, easyocr, cv2, pytesseract는 import만으로 수 초와 수백 MB가 들기 때문에
+# 모듈 최상단이 아니라 실제로 모델/엔진을 사용하는 시점에 import 합니다.
 
 logger = logging.getLogger(__name__)
 
+# (완료한 창 수, 전체 창 수)를 받는 음성 인식 진행률 콜백
+TranscriptionProgress = Callable[[int, int], None]
+# 앞에서부터 인식이 끝난 창의 세그먼트(전체 타임라인 기준)를 받는 콜백
+SegmentsCallback = Callable[[List[Dict[str, Any]]], None]
+
 class SpeechToTextService:
     """음성을 텍스트로 변환하는 서비스"""
     
-    def __init__(self, model_size: str = "base"):
+    def __init__(self, model_size: str = "base", backend: Optional[str] = None):
         """
         음성 인식 서비스 초기화
         
         Args:
             model_size: Whisper 모델 크기 (tiny, base, small, medium, large)
+            backend: 음성 인식 엔진 (whisper, faster-whisper / 기본 ASR_BACKEND)
         """
+        from app.services.asr_backends import create_asr_backend
+        
         self.model_size = model_size
-        self.model = None
-        self._load_model()
+        self.asr: "ASRBackend" = create_asr_backend(backend, model_size)
+        # 창을 프로세스 풀에서 인식하면 현재 프로세스에는 모델이 필요 없으므로 처음 쓸 때 로드
+        self._model = None
+    
+    @property
+    def model(self):
+        """음성 인식 모델 (순차 인식이나 프로세스 풀 실패 시 처음 접근할 때 로드)"""
+        if self._model is None:
+            self._load_model()
+        return self._model
     
     def _load_model(self):
-        """Whisper 모델 로드"""
+        """음성 인식 모델 로드 (프로세스당 한 번만 로드하고 공유)"""
         try:
-            logger.info(f"Whisper 모델 로드 중: {self.model_size}")
-            self.model = whisper.load_model(self.model_size)
-            logger.info("Whisper 모델 로드 완료")
+            self._model = self.asr.load()
         except Exception as error:
-            logger.error(f"Whisper 모델 로드 실패: {error}")
+            logger.error(f"음성 인식 모델 로드 실패 ({self.asr.name}): {error}")
             raise
     
-    def transcribe_audio(self, audio_path: str, language: str = "ko") -> Optional[Dict[str, Any]]:
+    def transcribe_audio(self, audio_path: str, language: str = "ko",
+                         progress: Optional[TranscriptionProgress] = None,
+                         on_segments: Optional[SegmentsCallback] = None) -> Optional[Dict[str, Any]]:
         """
         오디오 파일을 텍스트로 변환
         
+        오디오를 16kHz 모노 float32로 한 번만 디코딩하고, VAD로 무음을 제외한 음성 구간을 창 단위로 나눠
+        인식한 뒤 타임라인으로 합칩니다. 창 안의 긴 무음도 잘라낸 뒤 인식하고 오프셋 맵으로 시각을 되돌립니다.
+        창이 여러 개면 WHISPER_WORKERS개 프로세스에서 병렬로 인식합니다.
+        
         Args:
             audio_path: 오디오 파일 경로
             language: 언어 코드 (ko, en 등)
+            progress: 창 하나를 끝낼 때마다 (완료 수, 전체 수)로 호출되는 콜백.
+                콜백에서 발생한 예외(작업 취소 등)는 그대로 전파됩니다.
+            on_segments: 창의 인식 결과를 시간 순서대로 받는 콜백 (앞 창이 끝나야 뒤 창을 전달).
+                전체 인식이 끝나기 전에 앞부분부터 내보내거나 색인할 때 사용합니다.
             
         Returns:
             변환 결과 딕셔너리 또는 None
         """
+        from app.core.config import settings
+        from app.services.speech_chunking import (
+            SAMPLE_RATE, OffsetMap, detect_speech, load_audio, merge_window_segments, plan_windows,
+            slice_window, trim_window
+        )
+        
         try:
             if not os.path.exists(audio_path):
                 logger.error(f"오디오 파일이 존재하지 않습니다: {audio_path}")
                 return None
             
             logger.info(f"음성 인식 시작: {audio_path}")
-            
-            # Whisper로 음성 인식 수행
-            result = self.model.transcribe(
-                audio_path,
-                language=language,
-                verbose=True
-            )
-            
-            # 결과 정리
-            transcription_result = {
-                "text": result["text"].strip(),
-                "language": result["language"],
-                "segments": []
-            }
-            
-            # 세그먼트 정보 추가
-            for segment in result["segments"]:
-                transcription_result["segments"].append({
-                    "start": segment["start"],
-                    "end": segment["end"],
-                    "text": segment["text"].strip()
-                })
-            
-            logger.info(f"음성 인식 완료: {len(transcription_result['segments'])}개 세그먼트")
-            return transcription_result
-            
+            samples = load_audio(audio_path)
         except Exception as error:
             logger.error(f"음성 인식 실패: {error}")
             return None
+        
+        duration = len(samples) / SAMPLE_RATE
+        if settings.WHISPER_VAD_ENABLED:
+            regions = detect_speech(samples)
+        else:
+            regions = [(0.0, duration)] if duration > 0 else []
+        windows = plan_windows(regions, settings.WHISPER_CHUNK_SECONDS, settings.WHISPER_CHUNK_OVERLAP_SECONDS)
+        workers = self._worker_count(len(windows))
+        if settings.WHISPER_VAD_ENABLED and settings.WHISPER_SILENCE_TRIM:
+            prepared = [trim_window(samples, window, regions, settings.WHISPER_SILENCE_KEEP_SECONDS)
+                        for window in windows]
+        else:
+            prepared = [(slice_window(samples, window), OffsetMap()) for window in windows]
+        asr_seconds = sum(len(window_samples) for window_samples, _ in prepared) / SAMPLE_RATE
+        
+        started = time.perf_counter()
+        window_segments = self._transcribe_windows(prepared, windows, language, workers, progress, on_segments)
+        elapsed = time.perf_counter() - started
+        
+        segments = merge_window_segments(windows, window_segments)
+        speech_seconds = sum(window.end - window.start for window in windows)
+        transcription_stats = {
+            **self.asr.describe(),
+            "workers": workers,
+            "windows": len(windows),
+            "audio_seconds": round(duration, 2),
+            "speech_seconds": round(speech_seconds, 2),
+            # 실제로 인식 엔진에 보낸 오디오 길이 (창 안의 무음까지 잘라낸 뒤)
+            "asr_seconds": round(asr_seconds, 2),
+            "asr_minutes": round(asr_seconds / 60, 2),
+            "elapsed_seconds": round(elapsed, 3),
+            "realtime_factor": round(elapsed / duration, 3) if duration > 0 else 0.0,
+        }
+        logger.info(f"음성 인식 완료: {len(segments)}개 세그먼트, {transcription_stats}")
+        _record_transcription_metrics(transcription_stats)
+        
+        return {
+            "text": " ".join(segment["text"] for segment in segments),
+            "language": language,
+            "segments": segments,
+            "transcription_stats": transcription_stats,
+        }
+    
+    @staticmethod
+    def _worker_count(window_count: int) -> int:
+        from app.core.config import settings
+        
+        workers = settings.WHISPER_WORKERS or max(1, min(4, (os.cpu_count() or 1) // 2))
+        return max(1, min(workers, window_count))
+    
+    def _transcribe_windows(self, prepared: List[Tuple[Any, "OffsetMap"]], windows: List["SpeechWindow"],
+                            language: str, workers: int, progress: Optional[TranscriptionProgress],
+                            on_segments: Optional[SegmentsCallback] = None) -> List[List[Dict[str, Any]]]:
+        """
+        창별 세그먼트 목록 반환 (인식에 실패한 창은 빈 목록)
+        
+        prepared는 창마다 (인식할 샘플, 오프셋 맵)이며, 세그먼트 시각은 오프셋 맵으로 창 기준 원래 시각으로 되돌립니다.
+        """
+        from app.services.speech_chunking import merge_window_segments
+        
+        results: List[Optional[List[Dict[str, Any]]]] = [None] * len(windows)
+        done = 0
+        emitted = 0
+        
+        def window_done() -> None:
+            nonlocal done, emitted
+            done += 1
+            if progress:
+                progress(done, len(windows))
+            # 병렬 처리 시 창이 순서 없이 끝나므로 앞에서부터 연속으로 끝난 창만 전달
+            while emitted < len(windows) and results[emitted] is not None:
+                if on_segments:
+                    segments = merge_window_segments([windows[emitted]], [results[emitted]])
+                    if segments:
+                        on_segments(segments)
+                emitted += 1
+        
+        if workers > 1:
+            pool = _get_whisper_pool(self.asr, workers)
+            futures = {
+                pool.submit(_transcribe_window_in_process, self.asr, window_samples, language): i
+                for i, (window_samples, _) in enumerate(prepared)
+            }
+            try:
+                for future in as_completed(futures):
+                    index = futures[future]
+                    try:
+                        results[index] = prepared[index][1].remap(future.result())
+                    except BrokenProcessPool:
+                        # 워커 프로세스가 죽은 경우 풀을 버리고 남은 창은 현재 프로세스에서 처리
+                        logger.error("음성 인식 프로세스 풀이 중단되어 순차 처리로 전환합니다.")
+                        _discard_whisper_pool(self.asr, workers)
+                        break
+                    except Exception as error:
+                        logger.error(f"음성 인식 실패 ({windows[index].start:.1f}s~): {error}")
+                        results[index] = []
+                    window_done()
+            finally:
+                for future in futures:
+                    future.cancel()
+        
+        for i, window in enumerate(windows):
+            if results[i] is not None:
+                continue
+            try:
+                # 공유 모델이므로 락을 잡고 사용
+                with get_model_registry().lock_for(self.asr.key):
+                    window_samples, offset_map = prepared[i]
+                    results[i] = offset_map.remap(self.asr.transcribe(self.model, window_samples, language))
+            except Exception as error:
+                logger.error(f"음성 인식 실패 ({window.start:.1f}s~): {error}")
+                results[i] = []
+            window_done()
+        
+        return results
     
     def get_supported_languages(self) -> List[str]:
         """지원되는 언어 목록 반환"""
+        import whisper
+        
         return list(whisper.tokenizer.LANGUAGES.keys())
 
 
 class OCRService:
     """이미지에서 텍스트를 추출하는 OCR 서비스"""
     
-    def __init__(self, use_easyocr: bool = True):
+    EASYOCR_LANGUAGES = ('ko', 'en')
+    
+    def __init__(self, use_easyocr: bool = True, workers: Optional[int] = None,
+                 batch_size: Optional[int] = None, text_regions: Optional[bool] = None):
         """
         OCR 서비스 초기화
         
         Args:
             use_easyocr: EasyOCR 사용 여부 (False면 Tesseract 사용)
+            workers: Tesseract 병렬 처리 프로세스 수 (None이면 설정값, 0이면 CPU 코어 수)
+            batch_size: EasyOCR 배치 추론 크기 (None이면 설정값)
+            text_regions: 텍스트 줄 영역만 잘라 OCR할지 여부 (None이면 설정값)
         """
+        from app.core.config import settings
+        
         self.use_easyocr = use_easyocr
         self.easyocr_reader = None
+        self.workers = settings.OCR_WORKERS if workers is None else workers
+        self.batch_size = settings.OCR_BATCH_SIZE if batch_size is None else batch_size
+        self.text_regions = settings.OCR_TEXT_REGIONS if text_regions is None else text_regions
         
         if use_easyocr:
             self._init_easyocr()
     
     def _init_easyocr(self):
-        """EasyOCR 초기화"""
+        """EasyOCR 초기화 (프로세스당 한 번만 로드하고 공유)"""
         try:
-            logger.info("EasyOCR 초기화 중...")
-            self.easyocr_reader = easyocr.Reader(['ko', 'en'])
-            logger.info("EasyOCR 초기화 완료")
+            self.easyocr_reader = get_model_registry().get_easyocr(self.EASYOCR_LANGUAGES)
         except Exception as error:
             logger.error(f"EasyOCR 초기화 실패: {error}")
             raise
@@ -144,8 +285,90 @@ class OCRService:
     
     def _extract_with_easyocr(self, image_path: str) -> Dict[str, Any]:
         """EasyOCR을 사용한 텍스트 추출"""
-        results = self.easyocr_reader.readtext(image_path)
+        if self.text_regions:
+            import cv2
+            return self._extract_with_easyocr_regions(cv2.imread(image_path, cv2.IMREAD_GRAYSCALE))
+        with get_model_registry().lock_for(ModelRegistry.easyocr_key(self.EASYOCR_LANGUAGES)):
+            results = self.easyocr_reader.readtext(image_path)
+        return self._format_easyocr_results(results)
+    
+    def _extract_with_easyocr_regions(self, image) -> Dict[str, Any]:
+        """검출한 텍스트 줄만 EasyOCR로 인식 (프레임 한 장)"""
+        return self._extract_with_easyocr_regions_batch([image])[0]
+    
+    def _extract_with_easyocr_regions_batch(self, images) -> List[Dict[str, Any]]:
+        """
+        여러 프레임에서 검출한 텍스트 줄을 EasyOCR recognize 한 번으로 인식
         
+        프레임별 줄 모자이크를 세로로 이어 붙인 시트와 줄 영역을 horizontal_list로 넘겨 CRAFT 검출 단계를
+        건너뛰고, 모든 프레임의 줄을 batch_size개씩 묶어 인식합니다. 영역이 화면 대부분을 차지하는
+        프레임은 검출 이득이 없으므로 모아서 readtext_batched로 전체를 처리합니다.
+        """
+        from app.core.config import settings
+        from app.services.text_regions import build_sheet, detect_text_lines, region_coverage, sheet_box_to_frame, to_gray
+        
+        grays = [to_gray(image) for image in images]
+        boxes = [detect_text_lines(gray) for gray in grays]
+        full_frames = [
+            i for i, (gray, frame_boxes) in enumerate(zip(grays, boxes))
+            if frame_boxes and region_coverage(frame_boxes, gray.shape) > settings.OCR_TEXT_REGION_MAX_COVERAGE
+        ]
+        line_frames = [i for i, frame_boxes in enumerate(boxes) if frame_boxes and i not in full_frames]
+        
+        raw_results: List[list] = [[] for _ in images]
+        with get_model_registry().lock_for(ModelRegistry.easyocr_key(self.EASYOCR_LANGUAGES)):
+            if full_frames:
+                for i, results in zip(full_frames, self._readtext_batched([images[i] for i in full_frames])):
+                    raw_results[i] = results
+            if line_frames:
+                sheet, lines, frame_placements = build_sheet([(grays[i], boxes[i]) for i in line_frames])
+                recognized = self.easyocr_reader.recognize(
+                    sheet,
+                    horizontal_list=[[x0, x1, y0, y1] for x0, y0, x1, y1 in lines],
+                    free_list=[],
+                    batch_size=max(self.batch_size, 1),
+                )
+                for bbox, text, confidence in recognized:
+                    (x_min, y_min), (x_max, y_max) = bbox[0], bbox[2]
+                    index, (x0, y0, x1, y1) = sheet_box_to_frame([x_min, y_min, x_max, y_max], frame_placements)
+                    raw_results[line_frames[index]].append(
+                        ([[x0, y0], [x1, y0], [x1, y1], [x0, y1]], text, confidence)
+                    )
+        
+        formatted = []
+        for results, frame_boxes in zip(raw_results, boxes):
+            result = self._format_easyocr_results(results)
+            result["regions"] = len(frame_boxes)
+            formatted.append(result)
+        return formatted
+    
+    def _readtext_batched(self, images) -> list:
+        """같은 크기 프레임은 readtext_batched로 한 번에, 실패하면 프레임 단위 readtext (모델 락은 호출자가 잡음)"""
+        try:
+            return self.easyocr_reader.readtext_batched(images, batch_size=len(images))
+        except Exception as error:
+            logger.warning(f"EasyOCR 배치 추론 실패, 프레임 단위로 처리: {error}")
+            return [self.easyocr_reader.readtext(image) for image in images]
+    
+    def _extract_easyocr_region_frames(self, images) -> List[Optional[Dict[str, Any]]]:
+        """프레임 배치의 영역 인식 (배치 인식이 실패하면 프레임 단위로 다시 시도, 읽지 못한 프레임은 None)"""
+        try:
+            if all(image is not None for image in images):
+                return self._extract_with_easyocr_regions_batch(images)
+        except Exception as error:
+            logger.warning(f"EasyOCR 영역 배치 인식 실패, 프레임 단위로 처리: {error}")
+        results: List[Optional[Dict[str, Any]]] = []
+        for image in images:
+            try:
+                results.append(None if image is None else self._extract_with_easyocr_regions(image))
+            except Exception as error:
+                logger.error(f"텍스트 추출 실패: {error}")
+                results.append(None)
+        return results
+    
+    @staticmethod
+    def _format_easyocr_results(results) -> Dict[str, Any]:
+        """EasyOCR readtext 결과를 공통 형식으로 변환"""
         extracted_texts = []
         full_text = ""
         
@@ -166,75 +389,403 @@ class OCRService:
     
     def _extract_with_tesseract(self, image_path: str) -> Dict[str, Any]:
         """Tesseract를 사용한 텍스트 추출"""
+        import cv2
+        
         # 이미지 로드 및 전처리
         image = cv2.imread(image_path)
         gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+        return self._tesseract_frame(gray, self.text_regions)
+    
+    TESSERACT_LANG = "kor+eng"
+    TESSERACT_MIN_CONFIDENCE = 30
+
+    @staticmethod
+    def _tesseract_frame(gray, text_regions: bool = True) -> Dict[str, Any]:
+        """
+        프레임 하나를 Tesseract로 인식
         
-        # 텍스트 추출
-        config = '--oem 3 --psm 6 -l kor+eng'
-        text = pytesseract.image_to_string(gray, config=config)
+        text_regions가 켜져 있으면 검출한 텍스트 줄만 잘라 세로로 쌓은 모자이크 한 장을 인식하고,
+        단어 박스는 원본 프레임 좌표로 되돌립니다. 텍스트가 없으면 Tesseract를 실행하지 않습니다.
+        """
+        if not text_regions:
+            return OCRService._tesseract_gray(gray)
         
-        # 상세 정보 추출
-        data = pytesseract.image_to_data(gray, config=config, output_type=pytesseract.Output.DICT)
+        from app.core.config import settings
+        from app.services.text_regions import build_mosaic, detect_text_lines, mosaic_box_to_frame, region_coverage
         
+        boxes = detect_text_lines(gray)
+        if not boxes:
+            return {"full_text": "", "texts": [], "method": "tesseract", "regions": 0}
+        if region_coverage(boxes, gray.shape) > settings.OCR_TEXT_REGION_MAX_COVERAGE:
+            result = OCRService._tesseract_gray(gray)
+        else:
+            mosaic, placements = build_mosaic(gray, boxes)
+            result = OCRService._tesseract_gray(mosaic)
+            for text_item in result["texts"]:
+                text_item["bbox"] = mosaic_box_to_frame(text_item["bbox"], placements)
+        result["regions"] = len(boxes)
+        return result
+    
+    @staticmethod
+    def _tesseract_gray(gray) -> Dict[str, Any]:
+        """
+        그레이스케일 배열에 Tesseract 실행
+
+        한 번의 인식으로 전체 텍스트와 단어 박스를 함께 얻습니다. tesserocr가 설치되어 있으면
+        프로세스마다 한 번 로드한 엔진을 재사용하고, 없으면 pytesseract image_to_data 한 번으로 처리합니다.
+        """
+        try:
+            return OCRService._tesseract_with_engine(gray)
+        except (ImportError, RuntimeError):
+            # tesserocr 미설치 또는 언어 데이터 초기화 실패
+            return OCRService._tesseract_with_cli(gray)
+
+    @staticmethod
+    def _tesseract_with_engine(gray) -> Dict[str, Any]:
+        """프로세스 내 tesserocr 엔진으로 인식 (엔진은 스레드 안전하지 않아 잠금 후 사용)"""
+        import numpy as np
+        import tesserocr
+
+        registry = get_model_registry()
+        api = registry.get_tesseract(OCRService.TESSERACT_LANG)
+        height, width = gray.shape[:2]
+        with registry.lock_for(ModelRegistry.tesseract_key(OCRService.TESSERACT_LANG)):
+            api.SetImageBytes(np.ascontiguousarray(gray).tobytes(), width, height, 1, width)
+            api.Recognize()
+            full_text = api.GetUTF8Text()
+            extracted_texts = []
+            iterator = api.GetIterator()
+            level = tesserocr.RIL.WORD
+            if iterator is not None:
+                while True:
+                    text_item = (iterator.GetUTF8Text(level) or "").strip()
+                    confidence = iterator.Confidence(level)
+                    if text_item and confidence > OCRService.TESSERACT_MIN_CONFIDENCE:
+                        extracted_texts.append({
+                            "text": text_item,
+                            "confidence": confidence / 100.0,
+                            "bbox": list(iterator.BoundingBox(level)),
+                        })
+                    if not iterator.Next(level):
+                        break
+            api.Clear()
+
+        return {
+            "full_text": full_text.strip(),
+            "texts": extracted_texts,
+            "method": "tesseract"
+        }
+
+    @staticmethod
+    def _tesseract_with_cli(gray) -> Dict[str, Any]:
+        """pytesseract로 한 번 인식 (image_to_data 결과에서 전체 텍스트도 재구성)"""
+        import pytesseract
+
+        config = f'--oem 3 --psm 6 -l {OCRService.TESSERACT_LANG}'
+        data = pytesseract.image_to_data(gray, config=config, output_type=pytesseract.Output.DICT)
+        return OCRService._format_tesseract_data(data)
+
+    @staticmethod
+    def _format_tesseract_data(data: Dict[str, List[Any]]) -> Dict[str, Any]:
+        """image_to_data 결과를 단어 박스와 줄 단위 전체 텍스트로 변환"""
+        lines: Dict[Tuple[int, int, int], List[str]] = {}
         extracted_texts = []
         for i in range(len(data['text'])):
-            if int(data['conf'][i]) > 30:  # 신뢰도 임계값
-                text_item = data['text'][i].strip()
-                if text_item:
-                    extracted_texts.append({
-                        "text": text_item,
-                        "confidence": int(data['conf'][i]) / 100.0,
-                        "bbox": [
-                            data['left'][i],
-                            data['top'][i],
-                            data['left'][i] + data['width'][i],
-                            data['top'][i] + data['height'][i]
-                        ]
-                    })
-        
+            text_item = str(data['text'][i]).strip()
+            if not text_item:
+                continue
+            line_key = (data['block_num'][i], data['par_num'][i], data['line_num'][i])
+            lines.setdefault(line_key, []).append(text_item)
+            confidence = float(data['conf'][i])
+            if confidence > OCRService.TESSERACT_MIN_CONFIDENCE:  # 신뢰도 임계값
+                extracted_texts.append({
+                    "text": text_item,
+                    "confidence": confidence / 100.0,
+                    "bbox": [
+                        data['left'][i],
+                        data['top'][i],
+                        data['left'][i] + data['width'][i],
+                        data['top'][i] + data['height'][i]
+                    ]
+                })
+
         return {
-            "full_text": text.strip(),
+            "full_text": "\n".join(" ".join(words) for words in lines.values()),
             "texts": extracted_texts,
             "method": "tesseract"
         }
     
-    def extract_text_from_frames(self, frame_paths: List[str]) -> Dict[str, Any]:
+    def extract_text_from_frames(self, frame_paths: List[str],
+                                 timestamps: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
         """
         여러 프레임에서 텍스트 추출
         
         Args:
             frame_paths: 프레임 이미지 파일 경로 리스트
+            timestamps: 프레임 경로 -> 영상 내 시각(초). 있으면 프레임 결과에 timestamp로 포함
             
         Returns:
             모든 프레임의 텍스트 추출 결과
         """
-        all_texts = []
-        frame_results = []
+        started = time.perf_counter()
+        if self.use_easyocr:
+            results, workers = self._extract_frames_with_easyocr(frame_paths), 1
+        else:
+            results, workers = self._extract_frames_with_tesseract(frame_paths)
+        elapsed = time.perf_counter() - started
+        
+        frames = [(frame_path, (timestamps or {}).get(frame_path)) for frame_path in frame_paths]
+        return self._build_frames_result(frames, results, elapsed, workers)
+    
+    def extract_text_from_frame_source(self, frame_source) -> Dict[str, Any]:
+        """
+        프레임 소스(RawFrameSource)에서 메모리로 받은 프레임의 텍스트 추출
         
-        for i, frame_path in enumerate(frame_paths):
-            logger.info(f"프레임 {i+1}/{len(frame_paths)} 텍스트 추출 중...")
+        프레임 파일을 거치지 않고 링 버퍼의 배열을 그대로 OCR에 넘깁니다. 링 버퍼 슬롯이
+        덮어써지기 전에 처리하도록 배치 크기는 링 크기보다 작게 제한됩니다.
+        
+        Args:
+            frame_source: (시각, 프레임 배열)을 내보내는 반복 가능한 프레임 소스
             
-            result = self.extract_text_from_image(frame_path)
+        Returns:
+            extract_text_from_frames와 같은 형식의 결과 (frame_path는 None)
+        """
+        ring_size = len(getattr(frame_source, "ring", ())) or self.batch_size + 1
+        batch_limit = max(1, min(self.batch_size, ring_size - 1))
+        workers = 1
+        executor = None
+        if not self.use_easyocr:
+            workers = max(1, self.workers or os.cpu_count() or 1)
+            if workers > 1:
+                executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_ocr_process,
+                )
+        
+        started = time.perf_counter()
+        frames: List[Tuple[Optional[str], Optional[float]]] = []
+        results: List[Optional[Dict[str, Any]]] = []
+        batch = []
+        try:
+            for timestamp, frame in frame_source:
+                frames.append((None, timestamp))
+                batch.append(frame)
+                if len(batch) >= batch_limit:
+                    results.extend(self._extract_arrays(batch, executor))
+                    batch = []
+            if batch:
+                results.extend(self._extract_arrays(batch, executor))
+        finally:
+            if executor:
+                executor.shutdown()
+        elapsed = time.perf_counter() - started
+        
+        return self._build_frames_result(frames, results, elapsed, workers)
+    
+    def _extract_arrays(self, images, executor=None) -> List[Optional[Dict[str, Any]]]:
+        """메모리 프레임 배치 OCR (EasyOCR 배치 추론 또는 Tesseract 프로세스 풀)"""
+        if self.use_easyocr and self.text_regions:
+            return self._extract_easyocr_region_frames(images)
+        if self.use_easyocr:
+            key = ModelRegistry.easyocr_key(self.EASYOCR_LANGUAGES)
+            try:
+                with get_model_registry().lock_for(key):
+                    batch_results = self.easyocr_reader.readtext_batched(images, batch_size=len(images))
+                return [self._format_easyocr_results(r) for r in batch_results]
+            except Exception as error:
+                logger.warning(f"EasyOCR 배치 추론 실패, 프레임 단위로 처리: {error}")
+                results = []
+                for image in images:
+                    try:
+                        with get_model_registry().lock_for(key):
+                            results.append(self._format_easyocr_results(self.easyocr_reader.readtext(image)))
+                    except Exception as frame_error:
+                        logger.error(f"텍스트 추출 실패: {frame_error}")
+                        results.append(None)
+                return results
+        
+        ocr_array = partial(_tesseract_ocr_array, text_regions=self.text_regions)
+        if executor:
+            return list(executor.map(ocr_array, images))
+        return [ocr_array(image) for image in images]
+    
+    def _build_frames_result(self, frames: List[Tuple[Optional[str], Optional[float]]],
+                             results: List[Optional[Dict[str, Any]]],
+                             elapsed: float, workers: int) -> Dict[str, Any]:
+        """프레임별 OCR 결과를 모아 중복 없는 전체 텍스트와 처리 통계 생성"""
+        all_texts = []
+        frame_results = []
+        for i, ((frame_path, timestamp), result) in enumerate(zip(frames, results)):
             if result and result["full_text"]:
                 frame_results.append({
                     "frame_index": i,
                     "frame_path": frame_path,
+                    "timestamp": timestamp,
                     "result": result
                 })
                 all_texts.append(result["full_text"])
         
-        # 중복 제거 및 정리
-        unique_texts = list(set(all_texts))
+        # 중복 제거 및 정리 (프레임 순서 유지)
+        unique_texts = list(dict.fromkeys(all_texts))
         combined_text = " ".join(unique_texts)
         
+        frames_per_second = len(frames) / elapsed if elapsed > 0 else 0.0
+        ocr_stats = {
+            "method": "easyocr" if self.use_easyocr else "tesseract",
+            "text_regions": self.text_regions,
+            "workers": workers,
+            "elapsed_seconds": round(elapsed, 3),
+            "frames_per_second": round(frames_per_second, 2),
+            "frames_per_second_per_core": round(frames_per_second / workers, 2),
+        }
+        logger.info(f"프레임 OCR 완료: {len(frames)}개, {ocr_stats}")
+        
         return {
             "combined_text": combined_text,
             "unique_texts": unique_texts,
             "frame_results": frame_results,
-            "total_frames": len(frame_paths),
-            "frames_with_text": len(frame_results)
+            "total_frames": len(frames),
+            "frames_with_text": len(frame_results),
+            "ocr_stats": ocr_stats
         }
+    
+    def _extract_frames_with_easyocr(self, frame_paths: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        EasyOCR 배치 추론 (같은 비디오의 프레임은 크기가 같아 한 번에 묶을 수 있음)
+        
+        영역 인식을 켜면 batch_size개 프레임의 텍스트 줄을 한 번에 묶어 인식합니다.
+        """
+        results: List[Optional[Dict[str, Any]]] = []
+        key = ModelRegistry.easyocr_key(self.EASYOCR_LANGUAGES)
+        for start in range(0, len(frame_paths), max(self.batch_size, 1)):
+            batch = frame_paths[start:start + max(self.batch_size, 1)]
+            logger.info(f"프레임 {start + 1}-{start + len(batch)}/{len(frame_paths)} 텍스트 추출 중...")
+            if self.text_regions:
+                import cv2
+                results.extend(self._extract_easyocr_region_frames(
+                    [cv2.imread(path, cv2.IMREAD_GRAYSCALE) for path in batch]
+                ))
+                continue
+            try:
+                with get_model_registry().lock_for(key):
+                    batch_results = self.easyocr_reader.readtext_batched(batch, batch_size=len(batch))
+                results.extend(self._format_easyocr_results(r) for r in batch_results)
+            except Exception as error:
+                # 크기가 다른 프레임이 섞인 경우 등은 프레임 단위로 처리
+                logger.warning(f"EasyOCR 배치 추론 실패, 프레임 단위로 처리: {error}")
+                results.extend(self.extract_text_from_image(path) for path in batch)
+        return results
+    
+    def _extract_frames_with_tesseract(self, frame_paths: List[str]) -> Tuple[List[Optional[Dict[str, Any]]], int]:
+        """Tesseract OCR을 프로세스 풀로 병렬 실행 (결과는 프레임 순서 유지)"""
+        workers = self.workers or os.cpu_count() or 1
+        workers = max(1, min(workers, len(frame_paths)))
+        if workers == 1:
+            return [self.extract_text_from_image(path) for path in frame_paths], 1
+        
+        logger.info(f"프레임 {len(frame_paths)}개를 {workers}개 프로세스로 OCR 처리")
+        ocr_frame = partial(_tesseract_ocr_frame, text_regions=self.text_regions)
+        return map_in_processes(ocr_frame, frame_paths, workers), workers
+
+
+def _record_transcription_metrics(stats: Dict[str, Any]) -> None:
+    """원본/인식 엔진에 보낸 오디오 길이를 성능 모니터 지표로 기록 (모니터링 패키지가 없으면 건너뜀)"""
+    try:
+        from app.services.monitoring_service import performance_monitor
+    except ImportError:
+        return
+    performance_monitor.track_transcription(stats.get("backend", ""), stats["audio_seconds"], stats["asr_seconds"])
+
+
+def _init_whisper_process(asr: "ASRBackend", threads: int) -> None:
+    # 프로세스마다 코어를 나눠 쓰도록 추론 스레드 수를 제한하고 모델을 미리 로드
+    asr.load(threads)
+
+
+def _transcribe_window_in_process(asr: "ASRBackend", samples, language: str) -> List[Dict[str, Any]]:
+    """프로세스 풀에서 실행되는 창 단위 음성 인식"""
+    return asr.transcribe(asr.load(), samples, language)
+
+
+_whisper_pools: Dict[Tuple[Any, int], ProcessPoolExecutor] = {}
+_whisper_pools_lock = threading.Lock()
+
+
+def _get_whisper_pool(asr: "ASRBackend", workers: int) -> ProcessPoolExecutor:
+    """음성 인식 모델을 미리 로드한 프로세스 풀 (작업 간에 재사용해 모델 로드는 프로세스당 한 번)"""
+    with _whisper_pools_lock:
+        pool = _whisper_pools.get((asr.key, workers))
+        if pool is None:
+            threads = max(1, (os.cpu_count() or 1) // workers)
+            pool = _whisper_pools[(asr.key, workers)] = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_whisper_process,
+                initargs=(asr, threads),
+            )
+        return pool
+
+
+def _discard_whisper_pool(asr: "ASRBackend", workers: int) -> None:
+    with _whisper_pools_lock:
+        pool = _whisper_pools.pop((asr.key, workers), None)
+    if pool:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+@atexit.register
+def shutdown_whisper_pools() -> None:
+    """열려 있는 음성 인식 프로세스 풀 종료"""
+    with _whisper_pools_lock:
+        pools = list(_whisper_pools.values())
+        _whisper_pools.clear()
+    for pool in pools:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _init_ocr_process() -> None:
+    # 프로세스마다 Tesseract가 여러 스레드를 쓰면 코어를 과점유하므로 1개로 제한
+    os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+    # 워커마다 엔진 하나를 미리 로드해 두고 이후 프레임에서 재사용
+    try:
+        get_model_registry().get_tesseract(OCRService.TESSERACT_LANG)
+    except ImportError:
+        pass
+    except RuntimeError as error:
+        logger.warning(f"Tesseract 엔진 로드 실패, pytesseract로 처리: {error}")
+
+
+def _tesseract_ocr_frame(image_path: str, text_regions: bool = True) -> Optional[Dict[str, Any]]:
+    """프로세스 풀에서 실행되는 프레임 단위 Tesseract OCR"""
+    return OCRService(use_easyocr=False, workers=1, text_regions=text_regions).extract_text_from_image(image_path)
+
+
+def _tesseract_ocr_array(image, text_regions: bool = True) -> Optional[Dict[str, Any]]:
+    """메모리 프레임(HxW 또는 HxWxC uint8) 하나를 Tesseract로 OCR"""
+    try:
+        gray = image[..., 0] if image.ndim == 3 and image.shape[2] == 1 else image
+        if gray.ndim == 3:
+            gray = gray.mean(axis=2).astype("uint8")
+        return OCRService._tesseract_frame(gray, text_regions)
+    except Exception as error:
+        logger.error(f"텍스트 추출 실패: {error}")
+        return None
+
+
+def map_in_processes(func, items: List[Any], workers: int) -> List[Any]:
+    """
+    items를 프로세스 풀에 나눠 func를 실행하고 입력 순서대로 결과 반환
+
+    모델 라이브러리 상태를 물려받지 않도록 spawn 방식으로 프로세스를 띄웁니다.
+    """
+    chunksize = max(1, len(items) // (workers * 4))
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_ocr_process,
+    ) as executor:
+        return list(executor.map(func, items, chunksize=chunksize))
 
 
 class VideoTextExtractionService:
@@ -252,7 +803,11 @@ class VideoTextExtractionService:
         self.ocr_service = OCRService(use_easyocr)
     
     def extract_all_text_from_video(self, video_path: str, audio_path: str, 
-                                  frame_paths: List[str]) -> Dict[str, Any]:
+                                  frame_paths: List[str],
+                                  frame_timestamps: Optional[Dict[str, float]] = None,
+                                  progress: Optional[TranscriptionProgress] = None,
+                                  on_segments: Optional[SegmentsCallback] = None,
+                                  ocr_result: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         비디오에서 음성과 화면 텍스트를 모두 추출
         
@@ -260,6 +815,10 @@ class VideoTextExtractionService:
             video_path: 비디오 파일 경로
             audio_path: 추출된 오디오 파일 경로
             frame_paths: 추출된 프레임 이미지 경로 리스트
+            frame_timestamps: 프레임 경로 -> 영상 내 시각(초)
+            progress: 음성 인식 진행률 콜백 (완료한 창 수, 전체 창 수)
+            on_segments: 음성 인식 세그먼트를 시간 순서대로 받는 콜백
+            ocr_result: 프레임 소스에서 이미 추출한 화면 텍스트 결과 (있으면 frame_paths OCR 생략)
             
         Returns:
             통합 텍스트 추출 결과
@@ -267,10 +826,11 @@ class VideoTextExtractionService:
         logger.info("비디오 텍스트 추출 시작")
         
         # 음성 인식
-        speech_result = self.speech_service.transcribe_audio(audio_path)
+        speech_result = self.speech_service.transcribe_audio(audio_path, progress=progress, on_segments=on_segments)
         
         # 화면 텍스트 추출
-        ocr_result = self.ocr_service.extract_text_from_frames(frame_paths)
+        if ocr_result is None:
+            ocr_result = self.ocr_service.extract_text_from_frames(frame_paths, frame_timestamps)
         
         # 결과 통합
         result = {
@@ -298,9 +858,9 @@ class VideoTextExtractionService:
         return result
 
 
-def create_speech_to_text_service(model_size: str = "base") -> SpeechToTextService:
-    """음성 인식 서비스 인스턴스 생성"""
-    return SpeechToTextService(model_size)
+def create_speech_to_text_service(model_size: str = "base", backend: Optional[str] = None) -> SpeechToTextService:
+    """음성 인식 서비스 인스턴스 생성 (backend: whisper, faster-whisper / 기본 ASR_BACKEND)"""
+    return SpeechToTextService(model_size, backend)
 
 
 def create_ocr_service(use_easyocr: bool = True) -> OCRService:
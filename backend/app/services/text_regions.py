@@ -0,0 +1,193 @@
+"""
+텍스트 영역 검출 모듈
+
+강의 슬라이드와 자막은 화면의 일부만 차지하므로, 축소한 그레이스케일 프레임에서
+형태학적 기울기(morphological gradient)로 글자 획이 몰린 줄을 찾고 그 영역만 OCR에 넘깁니다.
+cv2 없이 numpy만 사용합니다.
+"""
+from typing import List, Tuple
+
+import numpy as np
+
+Box = Tuple[int, int, int, int]  # (x0, y0, x1, y1), 끝은 포함하지 않음
+
+DETECT_WIDTH = 640
+MOSAIC_GAP = 8  # 모자이크에서 영역 사이/가장자리 여백 (픽셀)
+
+
+def to_gray(image: np.ndarray) -> np.ndarray:
+    """HxW, HxWx1, HxWx3 배열을 HxW 그레이스케일로 변환"""
+    if image.ndim == 3:
+        return image[..., 0] if image.shape[2] == 1 else image.mean(axis=2).astype(np.uint8)
+    return image
+
+
+def _morph_gradient(image: np.ndarray) -> np.ndarray:
+    """3x3 팽창 - 침식 (글자 획 경계에서 크게 나옴)"""
+    padded = np.pad(image, 1, mode="edge")
+    # 3x3 창의 최대/최소를 가로, 세로로 나눠 계산
+    rows_max = np.maximum(np.maximum(padded[:, :-2], padded[:, 1:-1]), padded[:, 2:])
+    rows_min = np.minimum(np.minimum(padded[:, :-2], padded[:, 1:-1]), padded[:, 2:])
+    dilated = np.maximum(np.maximum(rows_max[:-2], rows_max[1:-1]), rows_max[2:])
+    eroded = np.minimum(np.minimum(rows_min[:-2], rows_min[1:-1]), rows_min[2:])
+    return dilated - eroded
+
+
+def _otsu_threshold(values: np.ndarray) -> float:
+    """0~255 값의 Otsu 임계값"""
+    histogram = np.bincount(np.clip(values, 0, 255).astype(np.uint8).ravel(), minlength=256).astype(np.float64)
+    weight = np.cumsum(histogram)
+    mean = np.cumsum(histogram * np.arange(256))
+    total, total_mean = weight[-1], mean[-1]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        between = (total_mean * weight - mean * total) ** 2 / (weight * (total - weight))
+    if np.all(np.isnan(between)):  # 값이 하나뿐인 균일한 이미지
+        return 0.0
+    return float(np.nanargmax(between))
+
+
+def _dilate_rows(mask: np.ndarray, size: int) -> np.ndarray:
+    """가로 방향으로 size 픽셀 팽창 (글자 사이 간격을 메워 한 줄로 연결)"""
+    counts = np.cumsum(np.pad(mask.astype(np.int32), ((0, 0), (size, size))), axis=1)
+    return (counts[:, 2 * size:] - np.pad(counts, ((0, 0), (1, 0)))[:, :-2 * size - 1]) > 0
+
+
+def _runs(flags: np.ndarray, max_gap: int = 0) -> List[Tuple[int, int]]:
+    """True가 이어진 구간 목록 (max_gap 이하의 틈은 이어 붙임)"""
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], flags.astype(np.int8), [0]))))
+    runs: List[List[int]] = []
+    for start, end in zip(edges[::2], edges[1::2]):
+        if runs and start - runs[-1][1] <= max_gap:
+            runs[-1][1] = end
+        else:
+            runs.append([start, end])
+    return [(int(start), int(end)) for start, end in runs]
+
+
+def detect_text_lines(image: np.ndarray, detect_width: int = DETECT_WIDTH,
+                      min_contrast: float = 24.0, min_height: int = 4,
+                      padding: int = 2) -> List[Box]:
+    """
+    텍스트 줄 영역 검출
+
+    detect_width 너비로 축소한 프레임의 형태학적 기울기를 이진화하고, 가로로 팽창해 글자를 잇습니다.
+    빈 행으로 나뉘는 가로 띠를 줄로 보고, 각 띠 안에서 넓은 빈 열로 나뉘는 구간을 영역으로 잘라냅니다.
+
+    Returns:
+        원본 프레임 좌표의 (x0, y0, x1, y1) 목록 (위에서 아래 순서)
+    """
+    gray = to_gray(image)
+    height, width = gray.shape
+    # 정수 배율로 블록 평균 축소 (reshape만으로 처리되어 빠름)
+    factor = max(1, int(np.ceil(width / detect_width)))
+    scale = 1.0 / factor
+    small = gray[:height // factor * factor, :width // factor * factor].reshape(
+        height // factor, factor, width // factor, factor
+    ).mean(axis=(1, 3), dtype=np.float32)
+
+    gradient = _morph_gradient(small)
+    edges = gradient > max(_otsu_threshold(gradient), min_contrast)
+    gap = max(3, small.shape[1] // 80)
+    joined = _dilate_rows(edges, gap)
+
+    boxes: List[Box] = []
+    for y0, y1 in _runs(joined.any(axis=1)):
+        if y1 - y0 < min_height:
+            continue
+        for x0, x1 in _runs(joined[y0:y1].any(axis=0), max_gap=gap):
+            # 팽창으로 늘어난 가장자리를 되돌리고 여백을 둠
+            x0, x1 = x0 + gap - padding, x1 - gap + padding
+            if x1 - x0 < 2 * min_height:
+                continue
+            boxes.append((
+                max(0, int(x0 / scale)),
+                max(0, int((y0 - padding) / scale)),
+                min(width, int(np.ceil(x1 / scale))),
+                min(height, int(np.ceil((y1 + padding) / scale))),
+            ))
+    return boxes
+
+
+def region_coverage(boxes: List[Box], shape: Tuple[int, ...]) -> float:
+    """영역들이 프레임에서 차지하는 비율 (영역은 겹치지 않는다고 가정)"""
+    area = sum((x1 - x0) * (y1 - y0) for x0, y0, x1, y1 in boxes)
+    return area / float(shape[0] * shape[1])
+
+
+def build_mosaic(image: np.ndarray, boxes: List[Box], gap: int = MOSAIC_GAP) -> Tuple[np.ndarray, List[Tuple[int, Box]]]:
+    """
+    영역을 세로로 쌓은 한 장의 이미지 생성 (Tesseract 한 번으로 모든 영역을 인식하기 위함)
+
+    어두운 배경의 영역은 반전해 모든 줄을 밝은 배경의 어두운 글자로 맞춥니다.
+
+    Returns:
+        (모자이크 이미지, [(모자이크 내 y 위치, 원본 영역)])
+    """
+    gray = to_gray(image)
+    crops = []
+    for x0, y0, x1, y1 in boxes:
+        crop = gray[y0:y1, x0:x1]
+        crops.append(255 - crop if np.median(crop) < 128 else crop)
+
+    mosaic = np.full((sum(c.shape[0] for c in crops) + gap * (len(crops) + 1),
+                      max(c.shape[1] for c in crops) + 2 * gap), 255, dtype=np.uint8)
+    placements = []
+    top = gap
+    for crop, box in zip(crops, boxes):
+        mosaic[top:top + crop.shape[0], gap:gap + crop.shape[1]] = crop
+        placements.append((top, box))
+        top += crop.shape[0] + gap
+    return mosaic, placements
+
+
+def mosaic_box_to_frame(bbox: List[int], placements: List[Tuple[int, Box]], gap: int = MOSAIC_GAP) -> List[int]:
+    """모자이크 좌표의 [x0, y0, x1, y1]을 원본 프레임 좌표로 변환"""
+    center = (bbox[1] + bbox[3]) / 2
+    top, (x0, y0, _, _) = placements[0]
+    for placement in placements:
+        if placement[0] <= center:
+            top, (x0, y0, _, _) = placement
+    dx, dy = x0 - gap, y0 - top
+    return [bbox[0] + dx, bbox[1] + dy, bbox[2] + dx, bbox[3] + dy]
+
+
+FramePlacement = Tuple[int, List[Tuple[int, Box]]]  # (시트 내 y 위치, 프레임 모자이크의 영역 배치)
+
+
+def build_sheet(frames: List[Tuple[np.ndarray, List[Box]]],
+                gap: int = MOSAIC_GAP) -> Tuple[np.ndarray, List[Box], List[FramePlacement]]:
+    """
+    여러 프레임의 모자이크를 세로로 이어 붙인 한 장의 시트 생성 (EasyOCR recognize 한 번으로 모든 줄을 인식하기 위함)
+
+    Args:
+        frames: (프레임, 영역 목록) 목록 (영역이 하나 이상인 프레임만)
+
+    Returns:
+        (시트 이미지, 시트 좌표의 줄 영역 (x0, y0, x1, y1) 목록, 프레임별 배치)
+    """
+    mosaics = [build_mosaic(image, boxes, gap) for image, boxes in frames]
+    sheet = np.full((sum(m.shape[0] for m, _ in mosaics), max(m.shape[1] for m, _ in mosaics)),
+                    255, dtype=np.uint8)
+    lines: List[Box] = []
+    frame_placements: List[FramePlacement] = []
+    top = 0
+    for mosaic, placements in mosaics:
+        sheet[top:top + mosaic.shape[0], :mosaic.shape[1]] = mosaic
+        for y, (x0, y0, x1, y1) in placements:
+            lines.append((gap, top + y, gap + x1 - x0, top + y + y1 - y0))
+        frame_placements.append((top, placements))
+        top += mosaic.shape[0]
+    return sheet, lines, frame_placements
+
+
+def sheet_box_to_frame(bbox: List[int], frame_placements: List[FramePlacement],
+                       gap: int = MOSAIC_GAP) -> Tuple[int, List[int]]:
+    """시트 좌표의 [x0, y0, x1, y1]을 (프레임 순번, 원본 프레임 좌표)로 변환"""
+    center = (bbox[1] + bbox[3]) / 2
+    index = 0
+    for i, (top, _) in enumerate(frame_placements):
+        if top <= center:
+            index = i
+    top, placements = frame_placements[index]
+    frame_bbox = mosaic_box_to_frame([bbox[0], bbox[1] - top, bbox[2], bbox[3] - top], placements, gap)
+    return index, frame_bbox
@@ -0,0 +1,352 @@
+"""
+비디오 처리 파이프라인
+
+Google Drive 다운로드 또는 업로드된 파일에서 오디오/프레임을 추출하고, 음성 인식과 OCR을 거쳐
+요약 마크다운과 공유 링크를 만듭니다. 미디어 워커 프로세스에서 실행되며,
+단계마다 report(progress, stage)를 호출해 진행률을 알리고 취소 여부를 확인하며,
+음성 인식/화면 텍스트 세그먼트는 끝나는 대로 report.publish로 내보냅니다.
+같은 영상과 같은 처리 설정의 결과가 캐시에 있으면 다운로드와 추출을 건너뛰고 재사용합니다.
+"""
+import logging
+import os
+import tempfile
+import uuid
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+from app.models.media_job import MediaJobSegment
+from app.services.google_drive_service import create_google_drive_service
+from app.services.video_processing_service import create_video_processing_service
+from app.services.text_extraction_service import create_video_text_extraction_service
+from app.services.video_streaming import format_segments
+from app.services.video_result_cache import config_fingerprint, create_video_result_cache_service, hash_file
+from app.services.summary_service import (
+    create_summary_service,
+    create_markdown_generator,
+    create_document_sharing_service
+)
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_DRIVE_VIDEO = "google_drive_video"
+UPLOADED_VIDEO = "uploaded_video"
+
+ProgressReporter = Callable[[float, str], None]
+
+FRAME_INTERVAL = 30  # 프레임 최대 간격 (초)
+USE_EASYOCR = True  # False면 Tesseract로 화면 텍스트 인식
+
+
+class MediaPipelineError(Exception):
+    """비디오 처리 단계 실패"""
+
+
+def pipeline_config() -> Dict[str, Any]:
+    """처리 결과에 영향을 주는 설정 (결과 캐시 키에 포함)"""
+    return {
+        "whisper_model": settings.WHISPER_MODEL_SIZE,
+        "asr_backend": settings.ASR_BACKEND,
+        "asr_compute_type": settings.ASR_COMPUTE_TYPE if settings.ASR_BACKEND == "faster-whisper" else None,
+        "asr_vad": settings.WHISPER_VAD_ENABLED,
+        "asr_silence_keep": settings.WHISPER_SILENCE_KEEP_SECONDS if settings.WHISPER_SILENCE_TRIM else None,
+        "ocr_engine": "easyocr" if USE_EASYOCR else "tesseract",
+        "ocr_text_regions": settings.OCR_TEXT_REGIONS,
+        "ocr_text_region_max_coverage": settings.OCR_TEXT_REGION_MAX_COVERAGE if settings.OCR_TEXT_REGIONS else None,
+        "frame_source": settings.FRAME_SOURCE,
+        "frame_pipe_max_width": settings.FRAME_PIPE_MAX_WIDTH if settings.FRAME_SOURCE == "pipe" else None,
+        "frame_interval": FRAME_INTERVAL,
+        "frame_sampling": settings.FRAME_SAMPLING_MODE,
+        "frame_scene_threshold": settings.FRAME_SCENE_THRESHOLD,
+        "frame_dedup_threshold": settings.FRAME_DEDUP_THRESHOLD if settings.FRAME_DEDUP_ENABLED else None,
+    }
+
+
+def _resolve_drive_file(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Google Drive 파일 정보 조회 (다운로드 전에 md5Checksum으로 캐시를 확인하기 위함)"""
+    drive_service = create_google_drive_service()
+    if not drive_service:
+        raise MediaPipelineError("Google Drive 서비스 초기화 실패")
+
+    file_id = drive_service.extract_file_id_from_url(payload["google_drive_url"])
+    if not file_id:
+        raise MediaPipelineError("유효하지 않은 Google Drive URL입니다.")
+
+    file_info = drive_service.get_file_info(file_id)
+    if not file_info:
+        raise MediaPipelineError("파일을 찾을 수 없습니다.")
+
+    if not drive_service.is_video_file(file_info):
+        raise MediaPipelineError("비디오 파일이 아닙니다.")
+
+    return {
+        "drive_service": drive_service,
+        "file_id": file_id,
+        "filename": file_info.get('name', f'video_{file_id}.mp4'),
+        "md5": file_info.get('md5Checksum'),
+    }
+
+
+def _download_drive_file(drive_file: Dict[str, Any], temp_dir: str, report: ProgressReporter) -> Dict[str, Any]:
+    """
+    Google Drive에서 비디오 다운로드 후 (경로, 파일명, 다운로드 통계) 반환
+
+    부분 파일은 작업 임시 디렉토리가 아니라 DRIVE_DOWNLOAD_DIR에 두어, 실패한 작업을
+    다시 등록하면 받은 범위부터 이어받습니다.
+    """
+    drive_service = drive_file["drive_service"]
+    part_dir = settings.get_absolute_drive_download_dir
+    os.makedirs(part_dir, exist_ok=True)
+    video_path = os.path.join(temp_dir, drive_file["filename"])
+
+    def progress(downloaded: int, total: int, bytes_per_second: float) -> None:
+        report(0.1 * downloaded / total if total else 0.0, "downloading")
+
+    if not drive_service.download_file(drive_file["file_id"], video_path, progress=progress,
+                                       part_path=os.path.join(part_dir, f"{drive_file['file_id']}.part")):
+        raise MediaPipelineError("파일 다운로드에 실패했습니다.")
+    return {"video_path": video_path, "filename": drive_file["filename"],
+            "download_stats": drive_service.last_download_stats}
+
+
+class _PartialResultSink:
+    """
+    처리 중간 결과를 내보내는 곳
+
+    세그먼트를 작업의 부분 결과(report.publish)로 내보내고, payload에 project_id가 있으면
+    프로젝트 문서로 누적해 바로 RAG 색인합니다.
+    """
+
+    def __init__(self, payload: Dict[str, Any], report: ProgressReporter, filename: str):
+        self.publish = getattr(report, "publish", None)
+        self.indexer = None
+        if payload.get("project_id"):
+            from app.services.video_streaming import StreamingDocumentIndexer
+            self.indexer = StreamingDocumentIndexer(
+                project_id=payload["project_id"],
+                filename=filename,
+                source=payload.get("google_drive_url") or filename,
+            )
+            self.indexer.start()
+
+    def add_transcript(self, segments: List[Dict[str, Any]]) -> None:
+        if self.publish:
+            self.publish(MediaJobSegment.TRANSCRIPT, segments)
+        if self.indexer:
+            self.indexer.add(format_segments(segments))
+
+    def add_screen_text(self, ocr_result: Optional[Dict[str, Any]]) -> None:
+        segments = [
+            {"start": frame.get("timestamp"), "end": None, "text": frame["result"]["full_text"]}
+            for frame in (ocr_result or {}).get("frame_results", [])
+        ]
+        if not segments:
+            return
+        if self.publish:
+            self.publish(MediaJobSegment.SCREEN_TEXT, segments)
+        if self.indexer:
+            self.indexer.add(format_segments(segments, label="[화면]"))
+
+    def finish(self) -> Optional[int]:
+        if self.indexer:
+            self.indexer.finish()
+            return self.indexer.document_id
+        return None
+
+    def fail(self, error: Exception) -> None:
+        if self.indexer and self.indexer.document_id:
+            self.indexer.fail(str(error) or error.__class__.__name__)
+
+
+def run_video_pipeline(job_type: str, payload: Dict[str, Any], report: ProgressReporter) -> Dict[str, Any]:
+    """
+    비디오 처리 작업 실행
+
+    음성 인식 세그먼트는 시간 창 하나가 끝날 때마다 부분 결과로 내보내고,
+    payload에 project_id가 있으면 해당 프로젝트 문서로 바로 색인해 처리 중에도 질의할 수 있게 합니다.
+    결과 캐시에 같은 영상이 있으면 저장된 세그먼트를 내보내고 요약 문서만 새로 만듭니다.
+
+    Args:
+        job_type: GOOGLE_DRIVE_VIDEO 또는 UPLOADED_VIDEO
+        payload: 작업 입력 (project_name, description, user_id, google_drive_url 또는 video_path,
+            선택적으로 project_id, 업로드 시 계산한 sha256/md5)
+        report: 진행률 보고 함수 (취소 요청 시 예외 발생, publish로 부분 결과 전달)
+
+    Returns:
+        summary_id, share_link, markdown_path(, document_id, cache_hit)를 담은 결과 딕셔너리
+    """
+    cache = create_video_result_cache_service() if settings.VIDEO_RESULT_CACHE_ENABLED else None
+    config = pipeline_config()
+    config_hash = config_fingerprint(config)
+    hashes = {"sha256": payload.get("sha256"), "md5": payload.get("md5")}
+    cached = None
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if job_type == GOOGLE_DRIVE_VIDEO:
+            report(0.0, "downloading")
+            drive_file = _resolve_drive_file(payload)
+            hashes["md5"] = drive_file["md5"]
+            source = {"video_path": None, "filename": drive_file["filename"]}
+            if cache:
+                cached = cache.lookup(config_hash, md5=hashes["md5"])
+            if not cached:
+                source = _download_drive_file(drive_file, temp_dir, report)
+        elif job_type == UPLOADED_VIDEO:
+            source = {"video_path": payload["video_path"], "filename": payload["original_filename"]}
+        else:
+            raise MediaPipelineError(f"지원하지 않는 작업 종류입니다: {job_type}")
+
+        if cache and not cached:
+            if not hashes["sha256"]:
+                hashes["sha256"], hashes["md5"] = hash_file(source["video_path"])
+            cached = cache.lookup(config_hash, **hashes)
+
+        sink = _PartialResultSink(payload, report, source["filename"])
+        try:
+            if cached:
+                result = _replay_cached_result(payload, report, source, cached, sink)
+            else:
+                extraction_result, result = _process_video(payload, report, source, temp_dir, sink)
+                summary_data = result.pop("summary_data")
+                if cache:
+                    _store_result(cache, config, extraction_result, summary_data, hashes, source["filename"])
+        except Exception as error:
+            sink.fail(error)
+            raise
+        document_id = sink.finish()
+        if document_id:
+            result["document_id"] = document_id
+        if source.get("download_stats"):
+            result["download_stats"] = source["download_stats"]
+        return result
+
+
+def _store_result(cache, config: Dict[str, Any], extraction_result: Dict[str, Any],
+                  summary_data: Dict[str, Any], hashes: Dict[str, Optional[str]], filename: str) -> None:
+    """처리 결과를 캐시에 저장 (저장 실패는 작업 실패로 보지 않음)"""
+    try:
+        cache.store(
+            config,
+            extraction_result,
+            {"content": summary_data["content"], "metadata": summary_data["metadata"]},
+            sha256=hashes["sha256"],
+            md5=hashes["md5"],
+            source_filename=filename,
+        )
+    except Exception as error:
+        logger.warning(f"비디오 결과 캐시 저장 실패: {error}")
+
+
+def _replay_cached_result(payload: Dict[str, Any], report: ProgressReporter, source: Dict[str, str],
+                          cached: Dict[str, Any], sink: _PartialResultSink) -> Dict[str, Any]:
+    """캐시된 추출 결과를 부분 결과/색인으로 내보내고 요약 문서만 새로 생성"""
+    extraction_result = cached["extraction"]
+    report(0.3, "cached")
+    segments = (extraction_result.get("speech_transcription") or {}).get("segments") or []
+    if segments:
+        sink.add_transcript(segments)
+    sink.add_screen_text(extraction_result.get("screen_text_extraction"))
+
+    result, _ = _publish_summary(payload, report, source["filename"], extraction_result, cached["summary"])
+    result["cache_hit"] = True
+    return result
+
+
+def _process_video(payload: Dict[str, Any], report: ProgressReporter, source: Dict[str, str],
+                   temp_dir: str, sink: _PartialResultSink) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """오디오/프레임 추출, 음성 인식, OCR, 요약 후 (추출 결과, 작업 결과) 반환"""
+    video_path = source["video_path"]
+    video_service = create_video_processing_service()
+    # 모델은 워커 프로세스의 레지스트리에서 공유
+    text_extraction_service = create_video_text_extraction_service(
+        whisper_model=settings.WHISPER_MODEL_SIZE,
+        use_easyocr=USE_EASYOCR
+    )
+    audio_path = os.path.join(temp_dir, 'audio.wav')
+    frame_paths: List[str] = []
+    frame_timestamps: Dict[str, float] = {}
+    ocr_result = None
+
+    report(0.1, "extracting_media")
+    if settings.FRAME_SOURCE == "pipe":
+        # 한 번의 디코딩으로 오디오(WAV)를 쓰면서 프레임은 파이프로 받아 바로 OCR
+        frame_source = video_service.open_frame_source(video_path, audio_path=audio_path, interval=FRAME_INTERVAL)
+        with frame_source:
+            ocr_result = text_extraction_service.ocr_service.extract_text_from_frame_source(frame_source)
+        if frame_source.returncode != 0:
+            raise MediaPipelineError("오디오/프레임 추출에 실패했습니다.")
+        frame_stats = frame_source.stats
+        sink.add_screen_text(ocr_result)
+    else:
+        # 오디오(16kHz 모노 WAV)와 프레임 파일을 한 번의 디코딩으로 추출
+        frames_dir = os.path.join(temp_dir, 'frames')
+        frame_paths = video_service.extract_audio_and_frames(video_path, audio_path, frames_dir, interval=FRAME_INTERVAL)
+        if frame_paths is None:
+            raise MediaPipelineError("오디오/프레임 추출에 실패했습니다.")
+        frame_stats = video_service.last_frame_stats
+        frame_timestamps = video_service.last_frame_timestamps
+
+    # 음성 및 화면 텍스트 추출
+    report(0.3, "extracting_text")
+    extraction_result = text_extraction_service.extract_all_text_from_video(
+        video_path, audio_path, frame_paths, frame_timestamps,
+        progress=lambda done, total: report(0.3 + 0.4 * done / total, "transcribing"),
+        on_segments=sink.add_transcript,
+        ocr_result=ocr_result
+    )
+    if ocr_result is None:
+        sink.add_screen_text(extraction_result.get("screen_text_extraction"))
+
+    result, summary_data = _publish_summary(payload, report, source["filename"], extraction_result)
+    result.update({
+        "frame_stats": frame_stats,
+        "ocr_stats": (extraction_result.get("screen_text_extraction") or {}).get("ocr_stats"),
+        "transcription_stats": (extraction_result.get("speech_transcription") or {}).get("transcription_stats"),
+        "summary_data": summary_data,
+    })
+    return extraction_result, result
+
+
+def _publish_summary(payload: Dict[str, Any], report: ProgressReporter, filename: str,
+                     extraction_result: Dict[str, Any],
+                     cached_summary: Optional[Dict[str, Any]] = None) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """요약 생성(또는 캐시된 요약 내용 사용) 후 마크다운 문서와 공유 링크 생성"""
+    report(0.8, "summarizing")
+    project_info = {
+        "name": payload["project_name"],
+        "description": payload.get("description"),
+        "user_id": payload["user_id"],
+        "original_filename": filename
+    }
+    if cached_summary:
+        # 요약 내용은 영상에서만 나오므로 재사용하고, 요청마다 다른 프로젝트 정보와 ID만 새로 채움
+        summary_data = {
+            **cached_summary,
+            "id": str(uuid.uuid4()),
+            "created_at": datetime.now().isoformat(),
+            "video_path": extraction_result.get("video_path", ""),
+            "project_info": project_info,
+        }
+    else:
+        summary_data = create_summary_service().create_video_summary(extraction_result, project_info)
+        if not summary_data:
+            raise MediaPipelineError("요약 생성에 실패했습니다.")
+
+    # 마크다운 문서 생성
+    report(0.9, "generating_markdown")
+    markdown_generator = create_markdown_generator()
+    markdown_path = markdown_generator.generate_video_summary_markdown(summary_data)
+    if not markdown_path:
+        raise MediaPipelineError("마크다운 문서 생성에 실패했습니다.")
+
+    # 공유 링크 생성 및 메타데이터 저장
+    sharing_service = create_document_sharing_service()
+    share_link = sharing_service.create_shareable_link(markdown_path, summary_data["id"])
+    sharing_service.save_summary_metadata(summary_data, markdown_path)
+
+    logger.info(f"비디오 처리 완료: {summary_data['id']}")
+    return {
+        "summary_id": summary_data["id"],
+        "share_link": share_link,
+        "markdown_path": markdown_path,
+    }, summary_data
@@ -3,15 +3,43 @@
 """
 
 import os
+import re
 import logging
 import subprocess
-from typing import Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, List, Tuple
 from pathlib import Path
 import tempfile
 import json
 
+if TYPE_CHECKING:
+    from app.services.frame_source import RawFrameSource
+
 logger = logging.getLogger(__name__)
 
+FRAME_SAMPLING_MODES = ("interval", "scene")
+_SHOWINFO_PTS_TIME = re.compile(r"Parsed_showinfo.*?\bpts_time:\s*(-?[\d.]+)")
+
+
+def build_scene_select_filter(threshold: float, max_gap: float, min_gap: float = 1.0) -> str:
+    """
+    화면 전환 프레임만 고르는 ffmpeg select 필터 생성
+
+    첫 프레임, scene 점수가 threshold를 넘는 프레임(직전 선택 후 min_gap초 이상 지난 경우),
+    그리고 max_gap초 동안 전환이 없을 때의 프레임을 고릅니다.
+    """
+    return (
+        "select='eq(n,0)"
+        f"+gt(scene,{threshold})*gte(t-prev_selected_t,{min_gap})"
+        f"+gte(t-prev_selected_t,{max_gap})',"
+        "showinfo"
+    )
+
+
+def parse_showinfo_timestamps(stderr: str) -> List[float]:
+    """ffmpeg showinfo 로그에서 출력 프레임의 시각(초) 목록 추출"""
+    return [float(match) for match in _SHOWINFO_PTS_TIME.findall(stderr)]
+
+
 class VideoProcessingService:
     """영상 처리 서비스 클래스"""
     
@@ -23,6 +51,10 @@ class VideoProcessingService:
             temp_dir: 임시 파일 저장 디렉토리
         """
         self.temp_dir = temp_dir or tempfile.gettempdir()
+        # 마지막 extract_frames 호출의 프레임 통계 (중복 제거로 건너뛴 프레임 수 등)
+        self.last_frame_stats: Dict[str, Any] = {}
+        # 마지막 extract_frames 호출에서 남은 프레임 경로 -> 영상 내 시각(초)
+        self.last_frame_timestamps: Dict[str, float] = {}
         self.ensure_dependencies()
     
     def ensure_dependencies(self):
@@ -48,20 +80,17 @@ class VideoProcessingService:
         """
         비디오에서 오디오 추출
         
+        음성 인식 입력 형식(16kHz 모노 PCM WAV)으로 바로 변환해 인식 쪽에서 다시 디코딩/리샘플링하지 않습니다.
+        
         Args:
             video_path: 비디오 파일 경로
-            audio_path: 오디오 저장 경로
+            audio_path: 오디오 저장 경로 (.wav)
             
         Returns:
             추출 성공 여부
         """
         try:
-            cmd = [
-                'ffmpeg', '-i', video_path,
-                '-vn', '-acodec', 'libmp3lame',
-                '-ab', '192k', '-ar', '44100',
-                '-y', audio_path
-            ]
+            cmd = ['ffmpeg', '-y', '-i', video_path, *self._audio_output_args(audio_path)]
             
             result = subprocess.run(cmd, capture_output=True, text=True)
             
@@ -109,38 +138,40 @@ class VideoProcessingService:
             return None
     
     def extract_frames(self, video_path: str, output_dir: str, 
-                      interval: int = 30) -> List[str]:
+                      interval: int = 30, dedupe: Optional[bool] = None,
+                      mode: Optional[str] = None, scene_threshold: Optional[float] = None) -> List[str]:
         """
         비디오에서 프레임 추출
         
         Args:
             video_path: 비디오 파일 경로
             output_dir: 프레임 저장 디렉토리
-            interval: 프레임 추출 간격 (초)
+            interval: 프레임 추출 간격 (초). scene 방식에서는 전환이 없을 때의 최대 간격
+            dedupe: 직전 프레임과 거의 같은 프레임 제거 여부 (None이면 설정값)
+            mode: "interval"(고정 간격) 또는 "scene"(화면 전환 감지). None이면 설정값
+            scene_threshold: 화면 전환으로 볼 scene 점수 (None이면 설정값)
             
         Returns:
             추출된 프레임 파일 경로 리스트
+            (시각은 last_frame_timestamps, 통계는 last_frame_stats 참고)
         """
+        mode, video_filter = self._frame_filter(mode, interval, scene_threshold)
+        self.last_frame_timestamps = {}
+        
         try:
             os.makedirs(output_dir, exist_ok=True)
             
             cmd = [
                 'ffmpeg', '-i', video_path,
-                '-vf', f'fps=1/{interval}',
+                '-vf', video_filter,
+                '-vsync', 'vfr',
                 '-y', f'{output_dir}/frame_%04d.jpg'
             ]
             
             result = subprocess.run(cmd, capture_output=True, text=True)
             
             if result.returncode == 0:
-                # 생성된 프레임 파일 목록 반환
-                frame_files = sorted([
-                    os.path.join(output_dir, f) 
-                    for f in os.listdir(output_dir) 
-                    if f.startswith('frame_') and f.endswith('.jpg')
-                ])
-                logger.info(f"프레임 추출 완료: {len(frame_files)}개 프레임")
-                return frame_files
+                return self._collect_frames(output_dir, result.stderr, interval, dedupe, mode)
             else:
                 logger.error(f"프레임 추출 실패: {result.stderr}")
                 return []
@@ -149,6 +180,145 @@ class VideoProcessingService:
             logger.error(f"프레임 추출 중 오류: {error}")
             return []
     
+    def extract_audio_and_frames(self, video_path: str, audio_path: str, output_dir: str,
+                                 interval: int = 30, dedupe: Optional[bool] = None,
+                                 mode: Optional[str] = None,
+                                 scene_threshold: Optional[float] = None) -> Optional[List[str]]:
+        """
+        한 번의 디코딩으로 오디오와 프레임을 함께 추출
+        
+        ffmpeg 한 번 실행에 출력 두 개를 지정해 음성 인식용 16kHz 모노 PCM(WAV)과
+        샘플링한 프레임을 동시에 씁니다. extract_audio_from_video + extract_frames와 달리
+        영상을 두 번 디코딩하지 않고 MP3 인코딩도 하지 않습니다.
+        
+        Args:
+            video_path: 비디오 파일 경로
+            audio_path: 오디오(WAV) 저장 경로
+            output_dir: 프레임 저장 디렉토리
+            interval, dedupe, mode, scene_threshold: extract_frames와 동일
+            
+        Returns:
+            추출된 프레임 파일 경로 리스트 또는 None (추출 실패)
+        """
+        mode, video_filter = self._frame_filter(mode, interval, scene_threshold)
+        self.last_frame_timestamps = {}
+        
+        try:
+            os.makedirs(output_dir, exist_ok=True)
+            
+            cmd = [
+                'ffmpeg', '-y', '-i', video_path,
+                # 출력 1: Whisper 입력 형식 그대로의 오디오
+                *self._audio_output_args(audio_path),
+                # 출력 2: 샘플링한 프레임
+                '-map', '0:v:0', '-an',
+                '-vf', video_filter,
+                '-vsync', 'vfr',
+                f'{output_dir}/frame_%04d.jpg'
+            ]
+            
+            result = subprocess.run(cmd, capture_output=True, text=True)
+            
+            if result.returncode == 0:
+                logger.info(f"오디오 추출 완료: {audio_path}")
+                return self._collect_frames(output_dir, result.stderr, interval, dedupe, mode)
+            else:
+                logger.error(f"오디오/프레임 추출 실패: {result.stderr}")
+                return None
+                
+        except Exception as error:
+            logger.error(f"오디오/프레임 추출 중 오류: {error}")
+            return None
+    
+    def open_frame_source(self, video_path: str, audio_path: Optional[str] = None,
+                          interval: int = 30, dedupe: Optional[bool] = None,
+                          mode: Optional[str] = None, scene_threshold: Optional[float] = None,
+                          ring_size: Optional[int] = None, max_width: Optional[int] = None) -> "RawFrameSource":
+        """
+        샘플링한 프레임을 파일 대신 메모리로 받는 프레임 소스 생성
+        
+        ffmpeg rawvideo 출력을 파이프로 받아 링 버퍼에 채우므로 JPEG 저장/재디코딩이 없습니다.
+        audio_path를 주면 같은 디코딩에서 16kHz 모노 WAV도 함께 씁니다
+        (오디오 파일은 프레임을 끝까지 읽은 뒤 완성됩니다).
+        
+        Args:
+            video_path: 비디오 파일 경로
+            audio_path: 함께 추출할 오디오(WAV) 경로 (선택)
+            interval, dedupe, mode, scene_threshold: extract_frames와 동일
+            ring_size: 링 버퍼 슬롯 수 (None이면 OCR 배치 크기 + 2)
+            max_width: 프레임 최대 너비 (None이면 설정값)
+            
+        Returns:
+            RawFrameSource (반복하면 (시각, 프레임 배열) 반환)
+        """
+        from app.core.config import settings
+        from app.services.frame_source import RawFrameSource, probe_frame_size, scaled_size
+        
+        mode, video_filter = self._frame_filter(mode, interval, scene_threshold)
+        if dedupe is None:
+            dedupe = settings.FRAME_DEDUP_ENABLED
+        width, height = scaled_size(*probe_frame_size(video_path),
+                                    max_width if max_width is not None else settings.FRAME_PIPE_MAX_WIDTH)
+        return RawFrameSource(
+            video_path, width, height, video_filter,
+            ring_size=ring_size or settings.OCR_BATCH_SIZE + 2,
+            extra_outputs=self._audio_output_args(audio_path) if audio_path else None,
+            dedupe_threshold=settings.FRAME_DEDUP_THRESHOLD if dedupe else None,
+        )
+    
+    @staticmethod
+    def _audio_output_args(audio_path: str) -> List[str]:
+        """음성 인식용 16kHz 모노 PCM(WAV) 출력 인자"""
+        return ['-map', '0:a:0', '-vn', '-ac', '1', '-ar', '16000', '-c:a', 'pcm_s16le', audio_path]
+    
+    @staticmethod
+    def _frame_filter(mode: Optional[str], interval: int,
+                      scene_threshold: Optional[float]) -> Tuple[str, str]:
+        """샘플링 방식에 맞는 ffmpeg 비디오 필터 반환 (mode, filter)"""
+        from app.core.config import settings
+        
+        mode = mode or settings.FRAME_SAMPLING_MODE
+        if mode not in FRAME_SAMPLING_MODES:
+            raise ValueError(f"지원하지 않는 프레임 샘플링 방식입니다: {mode}")
+        
+        if mode == "scene":
+            threshold = settings.FRAME_SCENE_THRESHOLD if scene_threshold is None else scene_threshold
+            return mode, build_scene_select_filter(threshold, max_gap=interval)
+        return mode, f'fps=1/{interval},showinfo'
+    
+    def _collect_frames(self, output_dir: str, ffmpeg_log: str, interval: int,
+                        dedupe: Optional[bool], mode: str) -> List[str]:
+        """ffmpeg가 쓴 프레임 파일 목록과 시각을 모은 뒤 중복 제거"""
+        frame_files = sorted([
+            os.path.join(output_dir, f) 
+            for f in os.listdir(output_dir) 
+            if f.startswith('frame_') and f.endswith('.jpg')
+        ])
+        timestamps = parse_showinfo_timestamps(ffmpeg_log)
+        if len(timestamps) != len(frame_files):
+            # showinfo 로그를 못 읽은 경우 고정 간격 기준으로 추정
+            timestamps = [float(i * interval) for i in range(len(frame_files))]
+        self.last_frame_timestamps = dict(zip(frame_files, timestamps))
+        logger.info(f"프레임 추출 완료 ({mode}): {len(frame_files)}개 프레임")
+        return self._dedupe_frames(frame_files, dedupe, mode)
+    
+    def _dedupe_frames(self, frame_files: List[str], dedupe: Optional[bool], mode: str) -> List[str]:
+        """OCR 전에 연속된 거의 같은 프레임(같은 슬라이드)을 제거"""
+        from app.core.config import settings
+        from app.services.frame_dedup import deduplicate_frame_files
+        
+        if dedupe is None:
+            dedupe = settings.FRAME_DEDUP_ENABLED
+        if dedupe:
+            kept, stats = deduplicate_frame_files(frame_files, threshold=settings.FRAME_DEDUP_THRESHOLD)
+        else:
+            kept = frame_files
+            stats = {"total_frames": len(frame_files), "kept_frames": len(frame_files), "skipped_frames": 0}
+        
+        self.last_frame_stats = {**stats, "mode": mode}
+        self.last_frame_timestamps = {path: self.last_frame_timestamps[path] for path in kept}
+        return kept
+    
     def get_video_duration(self, video_path: str) -> Optional[float]:
         """
         비디오 길이 조회
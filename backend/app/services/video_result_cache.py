@@ -0,0 +1,126 @@
+"""
+비디오 처리 결과 캐시 서비스
+
+영상 내용 해시와 파이프라인 설정 해시가 같으면 저장된 음성 인식/화면 텍스트 결과와 요약 내용을
+그대로 돌려줍니다. Google Drive 파일은 md5Checksum으로 다운로드 전에 조회할 수 있고,
+업로드 파일은 SHA-256과 MD5를 한 번에 계산해 두 키 중 하나라도 맞으면 재사용합니다.
+"""
+import hashlib
+import json
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from app.models.video_result import VideoResultCache
+
+logger = logging.getLogger(__name__)
+
+# 결과 형식이 바뀌면 올려서 이전 항목을 무효화
+CACHE_VERSION = 1
+
+
+def config_fingerprint(config: Dict[str, Any]) -> str:
+    """파이프라인 설정 딕셔너리의 해시 (키 순서와 무관)"""
+    encoded = json.dumps({**config, "cache_version": CACHE_VERSION}, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def hash_file(path: str, chunk_size: int = 1024 * 1024) -> Tuple[str, str]:
+    """파일을 한 번 읽어 (SHA-256, MD5) 16진 문자열 반환"""
+    sha256, md5 = hashlib.sha256(), hashlib.md5()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            sha256.update(chunk)
+            md5.update(chunk)
+    return sha256.hexdigest(), md5.hexdigest()
+
+
+def _to_builtin(value: Any) -> Any:
+    # numpy 스칼라/배열 (EasyOCR 박스 좌표 등)을 JSON으로 저장할 수 있게 변환
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"JSON으로 변환할 수 없는 값: {type(value).__name__}")
+
+
+def to_json_safe(data: Any) -> Any:
+    """JSON 컬럼에 저장할 수 있는 기본 타입으로 변환"""
+    return json.loads(json.dumps(data, default=_to_builtin, ensure_ascii=False))
+
+
+class VideoResultCacheService:
+    """비디오 처리 결과 캐시 조회/저장"""
+
+    def __init__(self, session_factory: Optional[Callable[[], Session]] = None):
+        if session_factory is None:
+            from app.core.database import SessionLocal
+            session_factory = SessionLocal
+        self.session_factory = session_factory
+
+    def lookup(self, config_hash: str, sha256: Optional[str] = None,
+               md5: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        캐시 조회
+
+        Returns:
+            {"extraction", "summary", "source_filename"} 또는 None
+        """
+        keys = []
+        if sha256:
+            keys.append(VideoResultCache.sha256 == sha256)
+        if md5:
+            keys.append(VideoResultCache.md5 == md5)
+        if not keys:
+            return None
+
+        with self.session_factory() as db:
+            entry = db.query(VideoResultCache).filter(
+                VideoResultCache.config_hash == config_hash,
+                or_(*keys)
+            ).order_by(VideoResultCache.id.desc()).first()
+            if entry is None:
+                return None
+
+            entry.hit_count += 1
+            entry.last_hit_at = datetime.utcnow()
+            # Drive로 먼저 저장된 항목에 업로드로 알게 된 SHA-256을 채워 둠
+            if sha256 and not entry.sha256:
+                entry.sha256 = sha256
+            if md5 and not entry.md5:
+                entry.md5 = md5
+            db.commit()
+            logger.info(f"비디오 결과 캐시 적중: {entry.id} ({entry.source_filename})")
+            return {
+                "extraction": entry.extraction,
+                "summary": entry.summary,
+                "source_filename": entry.source_filename,
+            }
+
+    def store(self, config: Dict[str, Any], extraction: Dict[str, Any],
+              summary: Optional[Dict[str, Any]] = None, sha256: Optional[str] = None,
+              md5: Optional[str] = None, source_filename: Optional[str] = None) -> Optional[int]:
+        """처리 결과 저장 (내용 해시가 없으면 저장하지 않음)"""
+        if not sha256 and not md5:
+            return None
+
+        with self.session_factory() as db:
+            entry = VideoResultCache(
+                sha256=sha256,
+                md5=md5,
+                config_hash=config_fingerprint(config),
+                config=config,
+                extraction=to_json_safe(extraction),
+                summary=to_json_safe(summary) if summary is not None else None,
+                source_filename=source_filename,
+            )
+            db.add(entry)
+            db.commit()
+            logger.info(f"비디오 결과 캐시 저장: {entry.id} ({source_filename})")
+            return entry.id
+
+
+def create_video_result_cache_service() -> VideoResultCacheService:
+    """비디오 결과 캐시 서비스 인스턴스 생성"""
+    return VideoResultCacheService()
@@ -1,38 +1,162 @@
+"""
+비디오 요약 서비스 모듈 (/api/videos/summary)
+
+음성 인식은 교체 가능한 백엔드로 처리합니다. 기본값은 로컬 Whisper로, 오디오를 창 단위로 나눠
+프로세스 풀에서 인식하고 창의 시작 시각만큼 밀어 타임스탬프를 합치므로 외부 서비스 없이 긴 영상도 처리합니다.
+"""
 import asyncio
+import logging
+import os
 import subprocess
-from pathlib import Path
-import speech_recognition as sr
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TranscriptionBackend:
+    """음성 인식 백엔드 인터페이스"""
+
+    name = ""
+
+    def transcribe(self, audio_path: str) -> Dict[str, Any]:
+        """
+        16kHz 모노 WAV를 인식
+
+        Returns:
+            {"text": 전체 텍스트, "segments": [{"start", "end", "text"}, ...]} (전체 타임라인 기준 초)
+        """
+        raise NotImplementedError
+
+
+class WhisperTranscriptionBackend(TranscriptionBackend):
+    """로컬 Whisper 백엔드 (오프라인, 창 단위 병렬 인식은 SpeechToTextService가 담당)"""
+
+    name = "whisper"
+
+    def __init__(self, model_size: Optional[str] = None, language: str = "ko"):
+        from app.core.config import settings
+
+        self.model_size = model_size or settings.WHISPER_MODEL_SIZE
+        self.language = language
+
+    def transcribe(self, audio_path: str) -> Dict[str, Any]:
+        from app.services.text_extraction_service import create_speech_to_text_service
+
+        # 모델은 레지스트리에서 프로세스당 한 번만 로드되므로 요청마다 서비스를 만들어도 됨
+        result = create_speech_to_text_service(self.model_size).transcribe_audio(audio_path, self.language)
+        if result is None:
+            raise RuntimeError(f"음성 인식 실패: {audio_path}")
+        return result
+
+
+class GoogleTranscriptionBackend(TranscriptionBackend):
+    """
+    Google Web Speech API 백엔드 (네트워크 필요)
+
+    한 번에 보낼 수 있는 길이 제한이 있어 고정 길이 창으로 나눠 스레드에서 동시에 요청합니다.
+    """
+
+    name = "google"
+
+    def __init__(self, window_seconds: Optional[float] = None, workers: Optional[int] = None,
+                 language: str = "ko-KR"):
+        from app.core.config import settings
+
+        self.window_seconds = window_seconds or settings.GOOGLE_SPEECH_WINDOW_SECONDS
+        self.workers = max(1, workers or settings.GOOGLE_SPEECH_WORKERS)
+        self.language = language
+
+    def transcribe(self, audio_path: str) -> Dict[str, Any]:
+        from app.services.speech_chunking import (
+            SAMPLE_RATE, load_audio, merge_window_segments, plan_windows, slice_window
+        )
+
+        samples = load_audio(audio_path)
+        duration = len(samples) / SAMPLE_RATE
+        windows = plan_windows([(0.0, duration)] if duration > 0 else [], self.window_seconds, 0.0)
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, max(1, len(windows)))) as executor:
+            texts = list(executor.map(self._recognize_window, (slice_window(samples, window) for window in windows)))
+
+        segments = merge_window_segments(windows, [
+            [{"start": 0.0, "end": window.end - window.start, "text": text}] for window, text in zip(windows, texts)
+        ])
+        return {"text": " ".join(segment["text"] for segment in segments), "segments": segments}
+
+    def _recognize_window(self, samples) -> str:
+        """창 하나 인식 (실패한 창은 빈 문자열)"""
+        import numpy as np
+        import speech_recognition as sr
+
+        from app.services.speech_chunking import SAMPLE_RATE
+
+        pcm = (np.clip(samples, -1.0, 1.0) * 32767).astype(np.int16).tobytes()
+        try:
+            return sr.Recognizer().recognize_google(sr.AudioData(pcm, SAMPLE_RATE, 2), language=self.language)
+        except Exception as error:
+            logger.warning(f"Google 음성 인식 실패: {error}")
+            return ""
+
+
+_TRANSCRIPTION_BACKENDS = {
+    WhisperTranscriptionBackend.name: WhisperTranscriptionBackend,
+    GoogleTranscriptionBackend.name: GoogleTranscriptionBackend,
+}
+
+
+def create_transcription_backend(name: Optional[str] = None) -> TranscriptionBackend:
+    """이름(기본 VIDEO_TRANSCRIPTION_BACKEND)으로 음성 인식 백엔드 생성"""
+    from app.core.config import settings
+
+    name = name or settings.VIDEO_TRANSCRIPTION_BACKEND
+    try:
+        return _TRANSCRIPTION_BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"지원하지 않는 음성 인식 백엔드: {name} (가능: {', '.join(_TRANSCRIPTION_BACKENDS)})")
+
 
 class VideoService:
+    def __init__(self, backend: Optional[TranscriptionBackend] = None):
+        self.backend = backend or create_transcription_backend()
+        self.last_segments: List[Dict[str, Any]] = []
+
     async def process_video(self, path: str):
         audio_path = await self._extract_audio(path)
-        transcript = await self._transcribe_audio(audio_path)
+        try:
+            transcript = await self._transcribe_audio(audio_path)
+        finally:
+            Path(audio_path).unlink(missing_ok=True)
         summary = self._summarize_text(transcript)
-        Path(audio_path).unlink(missing_ok=True)
         return transcript, summary
 
     async def _extract_audio(self, path: str) -> str:
         out_fd, out_path = tempfile.mkstemp(suffix='.wav')
+        os.close(out_fd)
+        # 16kHz 모노 PCM이면 음성 인식 쪽에서 디코더 없이 바로 읽음
         cmd = [
             'ffmpeg', '-y', '-i', path,
-            '-vn', '-acodec', 'pcm_s16le', '-ar', '16000', out_path
+            '-vn', '-acodec', 'pcm_s16le', '-ar', '16000', '-ac', '1', out_path
         ]
         proc = await asyncio.create_subprocess_exec(*cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         await proc.communicate()
         if proc.returncode != 0:
+            Path(out_path).unlink(missing_ok=True)
             raise RuntimeError('ffmpeg 변환 실패')
         return out_path
 
     async def _transcribe_audio(self, path: str) -> str:
-        r = sr.Recognizer()
-        with sr.AudioFile(path) as source:
-            audio_data = r.record(source)
+        # 인식은 CPU를 오래 쓰므로 이벤트 루프를 막지 않도록 스레드에서 실행
         try:
-            text = r.recognize_google(audio_data, language='ko-KR')
-        except Exception:
-            text = ""
-        return text
+            result = await asyncio.to_thread(self.backend.transcribe, path)
+        except Exception as error:
+            logger.error(f"음성 인식 실패 ({self.backend.name}): {error}")
+            self.last_segments = []
+            return ""
+        self.last_segments = result.get("segments", [])
+        return result.get("text", "")
 
     def _summarize_text(self, text: str) -> str:
         sentences = text.split('.')
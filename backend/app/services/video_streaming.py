@@ -0,0 +1,142 @@
+"""
+비디오 스트리밍 색인 모듈
+
+비디오 처리가 끝나기 전에도 앞부분을 질의할 수 있도록, 음성 인식/화면 텍스트 세그먼트가
+나오는 대로 프로젝트 문서에 이어 붙이고 청크 단위로 RAG 색인에 추가합니다.
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.orm import Session, undefer
+
+from app.core.quotas import ensure_project_document_quota
+from app.models.document import Document, DocumentType, ProcessingStatus
+
+logger = logging.getLogger(__name__)
+
+
+def format_timestamp(seconds: Optional[float]) -> str:
+    """초를 [H:]MM:SS 형식으로 변환"""
+    if seconds is None:
+        return "--:--"
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes:02d}:{secs:02d}"
+
+
+def format_segments(segments: List[Dict[str, Any]], label: str = "") -> str:
+    """세그먼트를 '[MM:SS] 텍스트' 줄로 변환 (색인 청크에서도 영상 위치를 알 수 있도록)"""
+    prefix = f"{label} " if label else ""
+    return "".join(f"[{format_timestamp(s.get('start'))}] {prefix}{s['text']}\n" for s in segments)
+
+
+class StreamingDocumentIndexer:
+    """
+    비디오 처리 중 나온 텍스트를 프로젝트 문서 하나로 누적하며 바로 색인
+
+    텍스트는 flush_chars 이상 쌓일 때마다 청크로 나눠 색인하고 문서 내용에 이어 붙입니다.
+    문서는 처리 중(PROCESSING) 상태로 만들어지고 finish/fail에서 최종 상태가 기록됩니다.
+    """
+
+    def __init__(self, project_id: int, filename: str, source: str,
+                 session_factory: Optional[Callable[[], Session]] = None,
+                 rag_service=None, flush_chars: int = 1000):
+        if session_factory is None:
+            from app.core.database import SessionLocal
+            session_factory = SessionLocal
+        if rag_service is None:
+            from app.services.rag_service import RAGService
+            rag_service = RAGService()
+        self.project_id = project_id
+        self.filename = filename
+        self.source = source
+        self.session_factory = session_factory
+        self.rag_service = rag_service
+        self.flush_chars = flush_chars
+        self.document_id: Optional[int] = None
+        self.chunk_count = 0
+        self._buffer = ""
+        # 임베딩 클라이언트가 이벤트 루프에 묶이므로 작업 동안 하나의 루프를 재사용
+        self._loop = asyncio.new_event_loop()
+
+    def start(self) -> int:
+        """
+        처리 중 상태의 문서 생성
+
+        Raises:
+            DocumentLimitExceededException: 프로젝트 문서 수 제한에 도달한 경우 (업로드 API와 같은 검사)
+        """
+        with self.session_factory() as db:
+            ensure_project_document_quota(db, self.project_id)
+            document = Document(
+                filename=f"{self.filename}.txt",
+                original_filename=self.filename,
+                file_path=self.source,
+                file_size=0,
+                file_type=DocumentType.TXT,
+                mime_type="text/plain",
+                project_id=self.project_id,
+                processing_status=ProcessingStatus.PROCESSING,
+                content="",
+            )
+            db.add(document)
+            db.commit()
+            self.document_id = document.id
+        logger.info(f"스트리밍 색인 문서 생성: {self.document_id} (프로젝트 {self.project_id})")
+        return self.document_id
+
+    def add(self, text: str) -> None:
+        """텍스트 추가 (flush_chars 이상 쌓이면 색인)"""
+        self._buffer += text
+        if len(self._buffer) >= self.flush_chars:
+            self.flush()
+
+    def flush(self) -> int:
+        """쌓인 텍스트를 문서에 이어 붙이고 청크로 색인 (색인한 청크 수 반환)"""
+        text, self._buffer = self._buffer, ""
+        if not text.strip():
+            return 0
+
+        chunks = self.rag_service.chunker.chunk_document(text, str(self.document_id))
+        for offset, chunk in enumerate(chunks):
+            chunk["chunk_index"] = self.chunk_count + offset
+
+        with self.session_factory() as db:
+            document = db.query(Document).options(undefer(Document.content)).filter(
+                Document.id == self.document_id
+            ).first()
+            document.content = (document.content or "") + text
+            document.content_length = len(document.content)
+            document.file_size = len(document.content.encode("utf-8"))
+            db.commit()
+            indexed = self._loop.run_until_complete(
+                self.rag_service.append_document_chunks(db, document, chunks)
+            )
+        self.chunk_count += indexed
+        return indexed
+
+    def finish(self) -> None:
+        """남은 텍스트를 색인하고 문서를 완료 상태로 전환"""
+        try:
+            self.flush()
+            self._set_status(ProcessingStatus.COMPLETED)
+        finally:
+            self._loop.close()
+
+    def fail(self, error: str) -> None:
+        """문서를 실패 상태로 전환 (이미 색인한 앞부분은 그대로 둠)"""
+        try:
+            self._set_status(ProcessingStatus.FAILED, error)
+        finally:
+            self._loop.close()
+
+    def _set_status(self, status: ProcessingStatus, error: Optional[str] = None) -> None:
+        with self.session_factory() as db:
+            document = db.get(Document, self.document_id)
+            document.processing_status = status
+            document.processing_error = error
+            if status == ProcessingStatus.COMPLETED:
+                document.processed_at = datetime.utcnow()
+            db.commit()
@@ -1,18 +1,17 @@
 import asyncio
+import logging
 from typing import Optional
 from urllib.parse import urlparse, parse_qs
 from youtube_transcript_api import YouTubeTranscriptApi
 
+logger = logging.getLogger(__name__)
+
 class YouTubeService:
     """간단한 YouTube 트랜스크립트 서비스"""
 
     @staticmethod
     async def get_transcript(video_url: str) -> Optional[str]:
         """영상 URL에서 트랜스크립트를 가져온다"""
-import logging
-
-logger = logging.getLogger(__name__)
-
         def _fetch(video_id: str):
             try:
                 transcript = YouTubeTranscriptApi.get_transcript(video_id, languages=["ko", "en"])
@@ -0,0 +1,3 @@
+"""
+백그라운드 워커 패키지
+"""
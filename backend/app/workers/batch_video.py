@@ -0,0 +1,257 @@
+"""
+비디오 일괄 처리 CLI
+
+여러 비디오 파일이나 Google Drive 링크를 N개 워커 프로세스에 나눠 video_pipeline으로 처리합니다.
+워커 프로세스마다 음성 인식/OCR 모델을 한 번만 로드해 모든 항목에서 재사용하고,
+항목별 결과와 단계별 소요 시간을 JSON Lines 매니페스트에 한 줄씩 남깁니다.
+중간에 중단되어도 같은 매니페스트로 다시 실행하면 완료된 항목은 건너뜁니다.
+
+실행:
+    python -m app.workers.batch_video lecture1.mp4 lecture2.mp4 --user-id 1 --manifest batch.jsonl
+    python -m app.workers.batch_video --input sources.txt --user-id 1 --processes 2 --manifest batch.jsonl
+"""
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.services.asr_backends import create_asr_backend
+from app.services.model_registry import get_model_registry
+
+logger = logging.getLogger(__name__)
+
+COMPLETED = "completed"
+FAILED = "failed"
+
+# (job_type, payload, report) -> 결과 (media_worker의 JobHandler와 같은 형태)
+BatchHandler = Callable[[str, Dict[str, Any], Callable[[float, str], None]], Dict[str, Any]]
+
+
+class StageTimer:
+    """
+    파이프라인 진행률 보고(report(progress, stage))를 받아 단계별 소요 시간을 재는 reporter
+
+    단계 이름이 바뀔 때 앞 단계를 끝난 것으로 봅니다 (같은 단계의 반복 보고는 하나로 합침).
+    """
+
+    def __init__(self):
+        self.timings: Dict[str, float] = {}
+        self._stage: Optional[str] = None
+        self._started = time.perf_counter()
+
+    def __call__(self, progress: float, stage: str) -> None:
+        if stage != self._stage:
+            self._close()
+            self._stage = stage
+
+    def finish(self) -> Dict[str, float]:
+        self._close()
+        self._stage = None
+        return {stage: round(seconds, 3) for stage, seconds in self.timings.items()}
+
+    def _close(self) -> None:
+        now = time.perf_counter()
+        if self._stage is not None:
+            self.timings[self._stage] = self.timings.get(self._stage, 0.0) + now - self._started
+        self._started = now
+
+
+class BatchManifest:
+    """항목별 처리 기록 (JSON Lines, 항목이 끝날 때마다 한 줄 추가)"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def records(self) -> List[Dict[str, Any]]:
+        if not os.path.exists(self.path):
+            return []
+        records = []
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except ValueError:
+                    # 기록 도중 중단되어 잘린 마지막 줄은 무시
+                    continue
+        return records
+
+    def completed_sources(self) -> set:
+        return {record["source"] for record in self.records() if record.get("status") == COMPLETED}
+
+    def append(self, record: Dict[str, Any]) -> None:
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+
+def is_drive_url(source: str) -> bool:
+    return "drive.google.com" in source
+
+
+def normalize_source(source: str) -> str:
+    """매니페스트에서 같은 항목을 알아볼 수 있도록 로컬 파일은 절대 경로로 통일"""
+    source = source.strip()
+    return source if is_drive_url(source) else os.path.abspath(os.path.expanduser(source))
+
+
+def build_job(source: str, defaults: Dict[str, Any]) -> Tuple[str, Dict[str, Any]]:
+    """항목 하나를 video_pipeline 작업 (job_type, payload)로 변환"""
+    from app.services.video_pipeline import GOOGLE_DRIVE_VIDEO, UPLOADED_VIDEO
+
+    payload = dict(defaults)
+    if is_drive_url(source):
+        payload["google_drive_url"] = source
+        payload.setdefault("project_name", source)
+        return GOOGLE_DRIVE_VIDEO, payload
+    filename = os.path.basename(source)
+    payload.update({"video_path": source, "original_filename": filename})
+    payload.setdefault("project_name", os.path.splitext(filename)[0])
+    return UPLOADED_VIDEO, payload
+
+
+def process_item(source: str, defaults: Dict[str, Any], handler: Optional[BatchHandler] = None) -> Dict[str, Any]:
+    """항목 하나 처리 후 매니페스트 기록 반환 (실패해도 예외 대신 failed 기록)"""
+    from app.services.video_result_cache import to_json_safe
+
+    if handler is None:
+        from app.services.video_pipeline import run_video_pipeline
+        handler = run_video_pipeline
+
+    timer = StageTimer()
+    started_at = datetime.now().isoformat()
+    started = time.perf_counter()
+    record: Dict[str, Any] = {"source": source, "started_at": started_at, "worker_pid": os.getpid()}
+    try:
+        job_type, payload = build_job(source, defaults)
+        result = handler(job_type, payload, timer)
+        record.update({"status": COMPLETED, "result": to_json_safe(result or {})})
+    except Exception as error:
+        logger.error(f"일괄 처리 실패: {source} - {error}", exc_info=True)
+        record.update({"status": FAILED, "error": str(error) or error.__class__.__name__})
+    record.update({
+        "finished_at": datetime.now().isoformat(),
+        "elapsed_seconds": round(time.perf_counter() - started, 3),
+        "stages": timer.finish(),
+    })
+    return record
+
+
+def _init_batch_process(warm_up: bool) -> None:
+    """
+    워커 프로세스 초기화: 모델을 한 번 로드해 두고 항목 간에 재사용
+
+    항목 단위로 이미 여러 프로세스가 돌고 있으므로 항목 안의 음성 인식/OCR 프로세스 풀은 쓰지 않습니다.
+    """
+    from app.core.config import settings
+
+    logging.basicConfig(level=logging.INFO)
+    settings.WHISPER_WORKERS = 1
+    settings.OCR_WORKERS = 1
+    if not warm_up:
+        return
+    try:
+        create_asr_backend(settings.ASR_BACKEND, settings.WHISPER_MODEL_SIZE).load()
+        if settings.MODEL_WARMUP_EASYOCR:
+            get_model_registry().get_easyocr()
+    except Exception as error:
+        # 로드 실패는 첫 항목에서 다시 드러나므로 워커는 계속 띄움
+        logger.error(f"모델 워밍업 실패: {error}")
+
+
+class BatchVideoRunner:
+    """매니페스트를 기준으로 남은 항목만 워커 프로세스에 나눠 처리"""
+
+    def __init__(self, manifest_path: str, processes: int = 1, defaults: Optional[Dict[str, Any]] = None,
+                 handler: Optional[BatchHandler] = None, warm_up: bool = True):
+        self.manifest = BatchManifest(manifest_path)
+        self.processes = max(1, processes)
+        self.defaults = defaults or {}
+        self.handler = handler
+        self.warm_up = warm_up
+
+    def pending(self, sources: Iterable[str]) -> List[str]:
+        """완료 기록이 없는 항목 (중복 제거, 입력 순서 유지)"""
+        done = self.manifest.completed_sources()
+        sources = dict.fromkeys(normalize_source(source) for source in sources if source.strip())
+        return [source for source in sources if source not in done]
+
+    def run(self, sources: Iterable[str]) -> Dict[str, int]:
+        sources = list(dict.fromkeys(normalize_source(source) for source in sources if source.strip()))
+        pending = self.pending(sources)
+        summary = {"total": len(sources), "skipped": len(sources) - len(pending), COMPLETED: 0, FAILED: 0}
+        logger.info(f"일괄 처리 시작: {len(pending)}개 처리, {summary['skipped']}개 완료 기록으로 건너뜀")
+
+        for record in self._records(pending):
+            self.manifest.append(record)
+            summary[record["status"]] += 1
+            logger.info(f"[{summary[COMPLETED] + summary[FAILED]}/{len(pending)}] {record['status']}: "
+                        f"{record['source']} ({record['elapsed_seconds']}초, {record['stages']})")
+        return summary
+
+    def _records(self, pending: List[str]) -> Iterable[Dict[str, Any]]:
+        if self.processes == 1 or len(pending) <= 1:
+            # 현재 프로세스에서 처리 (모델은 이 프로세스의 레지스트리에 한 번만 로드)
+            for source in pending:
+                yield process_item(source, self.defaults, self.handler)
+            return
+
+        with ProcessPoolExecutor(
+            max_workers=min(self.processes, len(pending)),
+            # 모델 라이브러리 상태를 물려받지 않도록 spawn 사용
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_batch_process,
+            initargs=(self.warm_up,),
+        ) as executor:
+            futures = [executor.submit(process_item, source, self.defaults, self.handler) for source in pending]
+            try:
+                for future in as_completed(futures):
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+
+def read_sources(paths: List[str], input_file: Optional[str]) -> List[str]:
+    """명령행 항목과 입력 파일(한 줄에 하나, #으로 시작하면 주석)을 합친 목록"""
+    sources = list(paths)
+    if input_file:
+        with open(input_file, encoding="utf-8") as f:
+            sources.extend(line.strip() for line in f if line.strip() and not line.lstrip().startswith("#"))
+    return sources
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="ParseNoteLM 비디오 일괄 처리")
+    parser.add_argument("sources", nargs="*", help="비디오 파일 경로 또는 Google Drive 공유 링크")
+    parser.add_argument("--input", help="처리할 항목 목록 파일 (한 줄에 하나)")
+    parser.add_argument("--manifest", required=True, help="결과/단계별 시간을 기록할 JSON Lines 파일 (재실행 시 완료 항목 건너뜀)")
+    parser.add_argument("--processes", type=int, default=1, help="워커 프로세스 수")
+    parser.add_argument("--user-id", type=int, required=True, help="요약 문서를 만들 사용자 ID")
+    parser.add_argument("--project-id", type=int, help="인식 결과를 색인할 프로젝트 ID")
+    parser.add_argument("--description", help="요약 문서 설명")
+    parser.add_argument("--no-warmup", action="store_true", help="워커 시작 시 모델을 미리 로드하지 않음 (첫 항목에서 로드)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    sources = read_sources(args.sources, args.input)
+    if not sources:
+        parser.error("처리할 비디오 파일이나 Drive 링크를 지정하세요.")
+
+    defaults = {"user_id": args.user_id, "description": args.description}
+    if args.project_id:
+        defaults["project_id"] = args.project_id
+    runner = BatchVideoRunner(args.manifest, args.processes, defaults, warm_up=not args.no_warmup)
+    summary = runner.run(sources)
+    logger.info(f"일괄 처리 완료: {summary}")
+
+
+if __name__ == "__main__":
+    main()
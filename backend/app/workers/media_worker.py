@@ -0,0 +1,287 @@
+"""
+미디어 워커
+
+API 프로세스와 분리된 프로세스에서 media_jobs 대기열의 비디오 처리 작업을 실행합니다.
+프로세스마다 Whisper/EasyOCR 모델을 한 번만 로드하므로 프로세스 수만큼 처리량이 늘어납니다.
+
+실행:
+    python -m app.workers.media_worker --processes 2
+"""
+import argparse
+import logging
+import multiprocessing
+import os
+import shutil
+import signal
+import socket
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from app.models.media_job import MediaJob, MediaJobStatus
+from app.services.asr_backends import create_asr_backend
+from app.services.media_job_service import (
+    MediaJobCancelled, MediaJobLost, MediaJobReporter, MediaJobService, create_media_job_service
+)
+from app.services.model_registry import get_model_registry
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[str, Dict[str, Any], Callable[[float, str], None]], Dict[str, Any]]
+
+
+def _default_handlers() -> Dict[str, JobHandler]:
+    from app.services.video_pipeline import GOOGLE_DRIVE_VIDEO, UPLOADED_VIDEO, run_video_pipeline
+    return {
+        GOOGLE_DRIVE_VIDEO: run_video_pipeline,
+        UPLOADED_VIDEO: run_video_pipeline,
+    }
+
+
+class _JobHeartbeat:
+    """
+    작업을 처리하는 동안 별도 스레드에서 주기적으로 heartbeat 전송
+
+    긴 단계(음성 인식 등) 동안 진행률 보고가 없어도 작업이 중단된 것으로 보이지 않게 합니다.
+    작업이 다른 워커로 넘어간 것을 확인하면 reporter.lost를 설정하고 멈춥니다.
+    """
+
+    def __init__(self, job_service: MediaJobService, report: MediaJobReporter, interval: float):
+        self.job_service = job_service
+        self.report = report
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"heartbeat-{report.job_id}", daemon=True)
+
+    def __enter__(self) -> "_JobHeartbeat":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                if not self.job_service.heartbeat(self.report.job_id, self.report.worker_id):
+                    self.report.lost = True
+                    logger.warning(f"미디어 작업 {self.report.job_id}이(가) 다른 워커로 넘어갔습니다")
+                    return
+            except Exception as error:
+                # DB 일시 오류는 다음 주기에 다시 시도
+                logger.error(f"미디어 작업 heartbeat 실패: {self.report.job_id} - {error}")
+
+
+class MediaWorker:
+    """대기열에서 작업을 하나씩 가져와 실행하는 워커"""
+
+    def __init__(self, job_service: Optional[MediaJobService] = None,
+                 handlers: Optional[Dict[str, JobHandler]] = None,
+                 worker_id: Optional[str] = None, poll_interval: float = 1.0,
+                 heartbeat_interval: float = 30.0):
+        self.job_service = job_service or create_media_job_service()
+        self.handlers = handlers if handlers is not None else _default_handlers()
+        self.worker_id = worker_id or f"{socket.gethostname()}:{os.getpid()}"
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+
+    def run_once(self) -> bool:
+        """작업 하나를 처리 (대기 작업이 없으면 False)"""
+        job = self.job_service.claim_next(self.worker_id)
+        if job is None:
+            return False
+        self._execute(job)
+        return True
+
+    def run_forever(self, stop_event=None) -> None:
+        """중지 요청이 올 때까지 대기열 처리"""
+        logger.info(f"미디어 워커 시작: {self.worker_id}")
+        while stop_event is None or not stop_event.is_set():
+            try:
+                if not self.run_once():
+                    time.sleep(self.poll_interval)
+            except Exception as error:
+                # DB 일시 오류 등으로 워커가 죽지 않도록 함
+                logger.error(f"미디어 워커 루프 오류: {error}")
+                time.sleep(self.poll_interval)
+        logger.info(f"미디어 워커 종료: {self.worker_id}")
+
+    def _execute(self, job: MediaJob) -> None:
+        handler = self.handlers.get(job.job_type)
+
+        report = MediaJobReporter(self.job_service, job.id, self.worker_id)
+
+        owned = True
+        started = time.perf_counter()
+        with _JobHeartbeat(self.job_service, report, self.heartbeat_interval):
+            try:
+                if handler is None:
+                    raise ValueError(f"지원하지 않는 작업 종류입니다: {job.job_type}")
+                report(0.0, "started")
+                result = handler(job.job_type, job.payload or {}, report)
+                result = dict(result or {})
+                result.setdefault("elapsed_seconds", round(time.perf_counter() - started, 3))
+                # 이 워커 프로세스의 모델 로드 시간/메모리 (모델은 워커에만 올라가므로 결과에 함께 기록)
+                model_stats = get_model_registry().stats()
+                if model_stats:
+                    result.setdefault("model_stats", model_stats)
+                owned = self.job_service.finish(job.id, MediaJobStatus.COMPLETED, result=result,
+                                                worker_id=self.worker_id)
+                logger.info(f"미디어 작업 완료: {job.id} ({result['elapsed_seconds']}초)")
+            except MediaJobLost:
+                owned = False
+                logger.warning(f"미디어 작업 중단 (다른 워커가 처리 중): {job.id}")
+            except MediaJobCancelled:
+                owned = self.job_service.finish(job.id, MediaJobStatus.CANCELLED, worker_id=self.worker_id)
+                logger.info(f"미디어 작업 취소: {job.id}")
+            except Exception as error:
+                logger.error(f"미디어 작업 실패: {job.id} - {error}", exc_info=True)
+                owned = self.job_service.finish(job.id, MediaJobStatus.FAILED, error_message=str(error),
+                                                worker_id=self.worker_id)
+            finally:
+                # 업로드 파일 등 작업 전용 디렉토리 정리 (작업을 넘겨받은 워커가 쓰는 중이면 남겨 둠)
+                job_dir = (job.payload or {}).get("job_dir")
+                if job_dir and owned:
+                    shutil.rmtree(job_dir, ignore_errors=True)
+
+
+def _warm_up_models() -> None:
+    """설정에 따라 첫 작업 전에 모델을 미리 로드"""
+    from app.core.config import settings
+
+    if not settings.MODEL_WARMUP_ON_STARTUP:
+        return
+    try:
+        create_asr_backend(settings.ASR_BACKEND, settings.WHISPER_MODEL_SIZE).load()
+        stats = get_model_registry().warm_up(None, settings.MODEL_WARMUP_EASYOCR)
+        logger.info(f"모델 워밍업 완료: {stats}")
+    except Exception as error:
+        logger.error(f"모델 워밍업 실패: {error}")
+
+
+def _worker_main(stop_event, poll_interval: float) -> None:
+    from app.core.config import settings
+
+    # 종료는 부모 프로세스가 stop_event로 알림
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    logging.basicConfig(level=logging.INFO)
+    _warm_up_models()
+    MediaWorker(poll_interval=poll_interval,
+                heartbeat_interval=settings.MEDIA_JOB_HEARTBEAT_SECONDS).run_forever(stop_event)
+
+
+class MediaWorkerPool:
+    """
+    미디어 워커 프로세스 풀
+
+    감독 스레드가 주기적으로 종료된 워커 프로세스(OOM 등)를 다시 띄우고, heartbeat가 끊긴
+    작업을 다시 대기열에 넣어 풀을 재시작하지 않아도 남은 워커가 이어서 처리합니다.
+    """
+
+    def __init__(self, processes: int = 2, poll_interval: float = 1.0,
+                 job_service: Optional[MediaJobService] = None):
+        from app.core.config import settings
+
+        self.processes = max(1, processes)
+        self.poll_interval = poll_interval
+        self.job_service = job_service
+        self.stale_after = timedelta(seconds=settings.MEDIA_JOB_STALE_SECONDS)
+        self.supervise_interval = settings.MEDIA_JOB_HEARTBEAT_SECONDS
+        # 모델 라이브러리와 이벤트 루프 상태를 물려받지 않도록 spawn 사용
+        self._context = multiprocessing.get_context("spawn")
+        self._stop_event = self._context.Event()
+        self._workers: List[multiprocessing.Process] = []
+        self._supervisor: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self.job_service = self.job_service or create_media_job_service()
+        # 이전 실행에서 비정상 종료된 작업 복구 (살아 있는 워커의 작업은 heartbeat로 계속 갱신됨)
+        self.job_service.requeue_stale(self.stale_after)
+        self._workers = [self._spawn(index) for index in range(self.processes)]
+        self._supervisor = threading.Thread(target=self._supervise, name="media-worker-supervisor", daemon=True)
+        self._supervisor.start()
+        logger.info(f"미디어 워커 {self.processes}개 시작")
+
+    def _spawn(self, index: int) -> multiprocessing.Process:
+        process = self._context.Process(
+            target=_worker_main,
+            args=(self._stop_event, self.poll_interval),
+            name=f"media-worker-{index}",
+            # 프레임 OCR 프로세스 풀을 띄울 수 있도록 daemon이 아닌 프로세스로 실행
+            daemon=False,
+        )
+        process.start()
+        return process
+
+    def _supervise(self) -> None:
+        while not self._stop_event.wait(self.supervise_interval):
+            try:
+                self.supervise_once()
+            except Exception as error:
+                # DB 일시 오류 등은 다음 주기에 다시 시도
+                logger.error(f"미디어 워커 감독 오류: {error}")
+
+    def supervise_once(self) -> int:
+        """
+        종료된 워커를 다시 띄우고 heartbeat가 끊긴 작업을 다시 대기열에 넣음
+
+        Returns:
+            다시 띄운 워커 수
+        """
+        respawned = 0
+        for index, process in enumerate(self._workers):
+            if self._stop_event.is_set():
+                break
+            if not process.is_alive():
+                logger.warning(f"{process.name} 종료 감지 (exitcode {process.exitcode}), 다시 시작합니다")
+                self._workers[index] = self._spawn(index)
+                respawned += 1
+        self.job_service.requeue_stale(self.stale_after)
+        return respawned
+
+    def stop(self, timeout: float = 10.0) -> None:
+        self._stop_event.set()
+        if self._supervisor:
+            self._supervisor.join()
+        for process in self._workers:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        self._workers = []
+
+    def join(self) -> None:
+        # 감독 스레드는 stop까지 워커를 교체하므로 감독 스레드가 끝난 뒤 남은 워커를 기다림
+        if self._supervisor:
+            self._supervisor.join()
+        for process in self._workers:
+            process.join()
+
+
+def main() -> None:
+    from app.core.config import settings
+
+    parser = argparse.ArgumentParser(description="ParseNoteLM 미디어 워커")
+    parser.add_argument("--processes", type=int, default=settings.MEDIA_WORKER_PROCESSES,
+                        help="워커 프로세스 수")
+    parser.add_argument("--poll-interval", type=float, default=settings.MEDIA_WORKER_POLL_INTERVAL,
+                        help="대기열 확인 주기(초)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    pool = MediaWorkerPool(args.processes, args.poll_interval)
+    pool.start()
+
+    def _shutdown(signum, frame):
+        pool.stop()
+
+    signal.signal(signal.SIGTERM, _shutdown)
+    try:
+        pool.join()
+    except KeyboardInterrupt:
+        pool.stop()
+
+
+if __name__ == "__main__":
+    main()
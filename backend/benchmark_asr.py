@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+음성 인식 엔진 벤치마크 스크립트
+
+같은 한국어 오디오 클립과 정답 스크립트로 엔진별 실시간 배율(RTF)과 WER/CER을 비교해
+배포 환경에서 처리량과 정확도 중 무엇을 택할지(ASR_BACKEND, ASR_COMPUTE_TYPE) 정할 때 사용합니다.
+
+사용법:
+    python benchmark_asr.py --audio lecture_ko.wav --reference lecture_ko.txt
+    python benchmark_asr.py --audio lecture_ko.wav --reference lecture_ko.txt \\
+        --backends whisper faster-whisper:int8 faster-whisper:float32 --model small --workers 1 --json result.json
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import argparse
+import json
+import time
+
+from app.core.config import settings
+from app.services.asr_backends import character_error_rate, word_error_rate
+from app.services.text_extraction_service import SpeechToTextService, shutdown_whisper_pools
+
+
+def run_backend(spec: str, model_size: str, audio_path: str, reference: str) -> dict:
+    """엔진 하나로 클립을 인식해 로드 시간, RTF, WER/CER 반환 (spec: 이름 또는 이름:compute_type)"""
+    name, _, compute_type = spec.partition(":")
+    if compute_type:
+        settings.ASR_COMPUTE_TYPE = compute_type
+
+    service = SpeechToTextService(model_size, name)
+    started = time.perf_counter()
+    service.asr.load()  # 서비스는 모델을 처음 쓸 때 로드하므로 로드 시간을 따로 잼
+    load_seconds = time.perf_counter() - started
+
+    result = service.transcribe_audio(audio_path)
+    if result is None:
+        raise RuntimeError(f"{spec} 인식 실패")
+    stats = result["transcription_stats"]
+    return {
+        **service.asr.describe(),
+        "load_seconds": round(load_seconds, 2),
+        "audio_seconds": stats["audio_seconds"],
+        "elapsed_seconds": stats["elapsed_seconds"],
+        "realtime_factor": stats["realtime_factor"],
+        "wer": round(word_error_rate(reference, result["text"]), 4),
+        "cer": round(character_error_rate(reference, result["text"]), 4),
+        "text": result["text"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="음성 인식 엔진별 RTF/WER 비교")
+    parser.add_argument("--audio", required=True, help="고정 한국어 오디오 클립 (16kHz 모노 WAV 권장)")
+    parser.add_argument("--reference", required=True, help="클립의 정답 스크립트 텍스트 파일")
+    parser.add_argument("--backends", nargs="+", default=["whisper", "faster-whisper:int8"],
+                        help="비교할 엔진 (faster-whisper는 이름:compute_type 형식 가능)")
+    parser.add_argument("--model", default=settings.WHISPER_MODEL_SIZE, help="Whisper 모델 크기")
+    parser.add_argument("--workers", type=int, default=1, help="창 병렬 프로세스 수 (엔진 자체 비교는 1)")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일 경로")
+    args = parser.parse_args()
+
+    with open(args.reference, encoding="utf-8") as f:
+        reference = f.read()
+    settings.WHISPER_WORKERS = args.workers
+
+    results = []
+    try:
+        for spec in args.backends:
+            print(f"▶ {spec} ({args.model}) 인식 중...")
+            results.append(run_backend(spec, args.model, args.audio, reference))
+    finally:
+        shutdown_whisper_pools()
+
+    print(f"\n{'엔진':<28}{'로드(s)':>9}{'RTF':>8}{'WER':>8}{'CER':>8}")
+    for result in results:
+        label = ":".join(str(value) for key, value in result.items() if key in ("backend", "model", "compute_type"))
+        print(f"{label:<28}{result['load_seconds']:>9.2f}{result['realtime_factor']:>8.3f}"
+              f"{result['wer']:>8.3f}{result['cer']:>8.3f}")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
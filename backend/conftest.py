@@ -0,0 +1,88 @@
+"""
+테스트 공통 fixture
+
+테이블을 만든 SQLite 엔진과 세션, 사용자/프로젝트/문서 행 생성 도우미를 제공합니다.
+테스트 모듈은 필요한 행만 insert_rows로 추가합니다.
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(__file__))
+
+from datetime import datetime
+from typing import Any, Dict, Iterable, Optional
+
+import pytest
+from sqlalchemy import create_engine, insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.models import User
+
+
+def create_test_engine(path: Optional[str] = None) -> Engine:
+    """
+    모든 테이블을 만든 SQLite 엔진
+
+    Args:
+        path: 파일 경로 (None이면 메모리 DB, 파일 DB는 여러 스레드의 세션에서 함께 사용 가능)
+    """
+    if path is None:
+        engine = create_engine("sqlite://")
+    else:
+        engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def insert_rows(engine: Engine, model, rows: Iterable[Dict[str, Any]]) -> None:
+    """모델 테이블에 행을 한 번에 삽입"""
+    with engine.begin() as conn:
+        conn.execute(insert(model.__table__), list(rows))
+
+
+def user_row(user_id: int = 1, **values) -> Dict[str, Any]:
+    return {"id": user_id, "email": f"user{user_id}@example.com", "username": f"user{user_id}",
+            "hashed_password": "x", "role": "USER", **values}
+
+
+def project_row(project_id: int, user_id: int = 1, **values) -> Dict[str, Any]:
+    now = datetime.utcnow()
+    return {"id": project_id, "title": f"project{project_id}", "user_id": user_id,
+            "created_at": now, "updated_at": now, "is_deleted": False, "document_count": 0, **values}
+
+
+def document_row(document_id: int, project_id: int = 1, **values) -> Dict[str, Any]:
+    now = datetime.utcnow()
+    return {"id": document_id, "filename": f"doc{document_id}.txt", "original_filename": f"doc{document_id}.txt",
+            "file_path": "", "file_size": 0, "file_type": "TXT", "project_id": project_id,
+            "processing_status": "COMPLETED", "content_length": 0, "chunk_count": 0,
+            "created_at": now, "updated_at": now, "is_deleted": False, **values}
+
+
+@pytest.fixture()
+def engine():
+    """사용자 1이 등록된 메모리 DB 엔진"""
+    engine = create_test_engine()
+    insert_rows(engine, User, [user_row(1)])
+    return engine
+
+
+@pytest.fixture()
+def session(engine):
+    db = sessionmaker(bind=engine)()
+    yield db
+    db.close()
+
+
+@pytest.fixture()
+def file_engine(tmp_path):
+    """사용자 1이 등록된 파일 DB 엔진 (워커 스레드의 세션에서 함께 사용)"""
+    engine = create_test_engine(str(tmp_path / "test.db"))
+    insert_rows(engine, User, [user_row(1)])
+    return engine
+
+
+@pytest.fixture()
+def session_factory(file_engine):
+    return sessionmaker(bind=file_engine)
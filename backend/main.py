@@ -83,11 +83,24 @@ async def startup_event():
     logger.info("ParseNoteLM API 서버가 시작되었습니다.")
     logger.info(f"프로젝트 루트: {settings.PROJECT_ROOT}")
     logger.info(f"데이터베이스 URL: {settings.DATABASE_URL}")
+    
+    if settings.MEDIA_WORKER_EMBEDDED:
+        # 개발 환경용: 별도 명령 없이 미디어 워커 프로세스를 함께 실행
+        from app.workers.media_worker import MediaWorkerPool
+        
+        app.state.media_worker_pool = MediaWorkerPool(
+            settings.MEDIA_WORKER_PROCESSES, settings.MEDIA_WORKER_POLL_INTERVAL
+        )
+        app.state.media_worker_pool.start()
 
 @app.on_event("shutdown") 
 async def shutdown_event():
     """애플리케이션 종료 시 실행"""
     logger.info("ParseNoteLM API 서버가 종료됩니다.")
+    
+    pool = getattr(app.state, "media_worker_pool", None)
+    if pool is not None:
+        pool.stop()
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,82 @@
+"""
+음성 인식 엔진 백엔드 테스트
+엔진 선택, faster-whisper 세그먼트 변환과 창 타임라인 합치기, WER/CER 계산을 확인
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(__file__))
+
+import wave
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from app.core.config import settings
+from app.services.asr_backends import (
+    FasterWhisperBackend, WhisperBackend, character_error_rate, create_asr_backend, word_error_rate
+)
+from app.services.model_registry import ModelRegistry, get_model_registry
+from app.services.speech_chunking import SAMPLE_RATE
+from app.services.text_extraction_service import create_speech_to_text_service
+
+
+class _FakeFasterWhisper:
+    """faster-whisper WhisperModel 대역 (세그먼트 제너레이터와 정보 튜플 반환)"""
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, samples, language, beam_size, vad_filter):
+        self.calls.append((len(samples) / SAMPLE_RATE, language, vad_filter))
+        seconds = len(samples) / SAMPLE_RATE
+        segments = (SimpleNamespace(start=start, end=min(start + 1.0, seconds), text=f" {start:.0f}초")
+                    for start in np.arange(0.0, seconds, 2.0))
+        return segments, SimpleNamespace(language=language)
+
+
+def test_backend_selection(monkeypatch):
+    monkeypatch.setattr(settings, "ASR_COMPUTE_TYPE", "int8_float32")
+
+    assert isinstance(create_asr_backend("whisper", "small"), WhisperBackend)
+    backend = create_asr_backend("faster-whisper", "small")
+    assert isinstance(backend, FasterWhisperBackend)
+    assert backend.key == ("faster-whisper", "small", "int8_float32")
+    assert backend.describe() == {"backend": "faster-whisper", "model": "small", "compute_type": "int8_float32"}
+    with pytest.raises(ValueError):
+        create_asr_backend("unknown")
+
+
+def test_faster_whisper_windows_are_merged(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "WHISPER_WORKERS", 1)
+    monkeypatch.setattr(settings, "WHISPER_VAD_ENABLED", False)
+    monkeypatch.setattr(settings, "WHISPER_CHUNK_SECONDS", 4.0)
+    monkeypatch.setattr(settings, "WHISPER_CHUNK_OVERLAP_SECONDS", 0.0)
+    monkeypatch.setattr(settings, "ASR_COMPUTE_TYPE", "int8")
+    key = ModelRegistry.faster_whisper_key("fake", "int8")
+    model = get_model_registry().get(key, _FakeFasterWhisper)
+    audio_path = tmp_path / "audio.wav"
+    with wave.open(str(audio_path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(np.zeros(6 * SAMPLE_RATE, dtype=np.int16).tobytes())
+
+    try:
+        result = create_speech_to_text_service("fake", "faster-whisper").transcribe_audio(str(audio_path))
+    finally:
+        get_model_registry().unload(key)
+
+    assert model.calls == [(4.0, "ko", False), (2.0, "ko", False)]
+    assert [(s["start"], s["text"]) for s in result["segments"]] == [(0.0, "0초"), (2.0, "2초"), (4.0, "0초")]
+    assert result["transcription_stats"]["backend"] == "faster-whisper"
+    assert result["transcription_stats"]["compute_type"] == "int8"
+
+
+def test_error_rates():
+    reference = "오늘은 음성 인식을 배웁니다."
+    assert word_error_rate(reference, "오늘은 음성 인식을 배웁니다") == 0.0
+    assert word_error_rate(reference, "오늘은 음성인식을 배웁니다") == 0.5
+    assert character_error_rate(reference, "오늘은 음성인식을 배웁니다") == 0.0
+    assert character_error_rate(reference, "오늘 음성 인식을 배웁니다") == pytest.approx(1 / 12)
+    assert word_error_rate("", "") == 0.0
@@ -0,0 +1,94 @@
+"""
+비디오 일괄 처리 CLI 테스트
+매니페스트 기록(단계별 시간 포함), 재실행 시 완료 항목 건너뛰기, 워커 프로세스 분산을 확인
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(__file__))
+
+import json
+import time
+
+import pytest
+
+pytest.importorskip("markdown")
+
+from app.services.video_pipeline import GOOGLE_DRIVE_VIDEO, UPLOADED_VIDEO
+from app.workers.batch_video import COMPLETED, FAILED, BatchVideoRunner, build_job
+
+CALLS_FILE = "calls.log"
+
+
+def fake_pipeline(job_type, payload, report):
+    """단계를 보고하고 파일 이름을 돌려주는 파이프라인 대역 (이름에 broken이 있으면 실패)"""
+    with open(os.path.join(os.path.dirname(payload["video_path"]), CALLS_FILE), "a") as f:
+        f.write(payload["original_filename"] + "\n")
+    for stage in ("extracting_media", "transcribing", "transcribing", "summarizing"):
+        report(0.5, stage)
+        time.sleep(0.01)
+    if "broken" in payload["original_filename"]:
+        raise RuntimeError("디코딩 실패")
+    return {"summary_id": payload["original_filename"], "pid": os.getpid()}
+
+
+def _videos(tmp_path, *names):
+    paths = []
+    for name in names:
+        path = tmp_path / name
+        path.write_bytes(b"video")
+        paths.append(str(path))
+    return paths
+
+
+def _calls(tmp_path):
+    return (tmp_path / CALLS_FILE).read_text().split()
+
+
+def test_manifest_records_stages_and_resume_skips_completed(tmp_path):
+    sources = _videos(tmp_path, "a.mp4", "broken.mp4", "b.mp4")
+    manifest = tmp_path / "batch.jsonl"
+
+    summary = BatchVideoRunner(str(manifest), handler=fake_pipeline).run(sources + [sources[0]])
+
+    assert summary == {"total": 3, "skipped": 0, COMPLETED: 2, FAILED: 1}
+    records = [json.loads(line) for line in manifest.read_text().splitlines()]
+    assert [(r["source"], r["status"]) for r in records] == [
+        (sources[0], COMPLETED), (sources[1], FAILED), (sources[2], COMPLETED)
+    ]
+    assert set(records[0]["stages"]) == {"extracting_media", "transcribing", "summarizing"}
+    assert records[0]["stages"]["transcribing"] >= 0.02
+    assert records[1]["error"] == "디코딩 실패"
+
+    # 중단된 실행이 남긴 잘린 줄은 무시하고, 완료된 항목은 건너뛰고 실패한 항목만 다시 처리
+    with open(manifest, "a", encoding="utf-8") as f:
+        f.write('{"source": "')
+    (tmp_path / CALLS_FILE).unlink()
+    summary = BatchVideoRunner(str(manifest), handler=fake_pipeline).run(sources)
+
+    assert summary == {"total": 3, "skipped": 2, COMPLETED: 0, FAILED: 1}
+    assert _calls(tmp_path) == ["broken.mp4"]
+
+
+def test_items_are_spread_over_worker_processes(tmp_path):
+    sources = _videos(tmp_path, "a.mp4", "b.mp4", "c.mp4", "d.mp4")
+    manifest = tmp_path / "batch.jsonl"
+
+    summary = BatchVideoRunner(str(manifest), processes=2, handler=fake_pipeline, warm_up=False).run(sources)
+
+    assert summary[COMPLETED] == 4
+    records = [json.loads(line) for line in manifest.read_text().splitlines()]
+    assert sorted(r["source"] for r in records) == sources
+    assert all(r["worker_pid"] != os.getpid() for r in records)
+    assert sorted(_calls(tmp_path)) == ["a.mp4", "b.mp4", "c.mp4", "d.mp4"]
+
+
+def test_build_job_from_path_or_drive_link():
+    job_type, payload = build_job("/videos/lecture 1.mp4", {"user_id": 1})
+    assert job_type == UPLOADED_VIDEO
+    assert payload == {"user_id": 1, "video_path": "/videos/lecture 1.mp4",
+                       "original_filename": "lecture 1.mp4", "project_name": "lecture 1"}
+
+    url = "https://drive.google.com/file/d/abc/view"
+    assert build_job(url, {"user_id": 1}) == (
+        GOOGLE_DRIVE_VIDEO, {"user_id": 1, "google_drive_url": url, "project_name": url}
+    )
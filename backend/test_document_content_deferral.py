@@ -0,0 +1,57 @@
+"""
+Document.content 지연 로딩 테스트
+목록 조회 SELECT에는 content 컬럼이 포함되지 않고, 접근할 때만 로드되는지 확인
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(__file__))
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker, undefer
+
+from app.models import Project, Document
+from conftest import document_row, insert_rows, project_row
+
+
+@pytest.fixture(autouse=True)
+def documents(engine):
+    insert_rows(engine, Project, [project_row(1)])
+    insert_rows(engine, Document, [
+        document_row(i, file_size=1024, content="x" * 100_000, content_length=100_000)
+        for i in range(1, 11)
+    ])
+
+
+def _capture(engine):
+    statements = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: statements.append(statement))
+    return statements
+
+
+def test_list_query_skips_content(engine):
+    db = sessionmaker(bind=engine)()
+    statements = _capture(engine)
+
+    documents = db.query(Document).filter(Document.project_id == 1).all()
+
+    assert len(documents) == 10
+    assert len(statements) == 1
+    assert "documents.content," not in statements[0]
+    assert "documents.content_length" in statements[0]
+
+
+def test_content_loaded_on_access_or_undefer(engine):
+    db = sessionmaker(bind=engine)()
+    statements = _capture(engine)
+
+    document = db.query(Document).filter(Document.id == 1).one()
+    assert len(document.content) == 100_000
+    assert len(statements) == 2
+
+    db.expunge_all()
+    statements.clear()
+    document = db.query(Document).options(undefer(Document.content)).filter(Document.id == 2).one()
+    assert len(document.content) == 100_000
+    assert len(statements) == 1
@@ -0,0 +1,66 @@
+"""
+Embedding 일괄 삽입 벤치마크
+1만 개 청크를 ORM 루프(db.add)와 Embedding.bulk_insert로 저장해 초당 행 수를 비교
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(__file__))
+
+import time
+
+import pytest
+from sqlalchemy import func
+
+from app.models import Project, Document, Embedding
+from conftest import document_row, insert_rows, project_row
+
+CHUNK_COUNT = 10_000
+VECTOR_DIMENSION = 64
+
+
+@pytest.fixture(autouse=True)
+def documents(engine):
+    insert_rows(engine, Project, [project_row(1)])
+    insert_rows(engine, Document, [document_row(i, processing_status="PROCESSING") for i in (1, 2)])
+
+
+def _chunks():
+    vector = [0.001 * i for i in range(VECTOR_DIMENSION)]
+    return [(f"청크 {i} 본문 텍스트 " * 20, vector) for i in range(CHUNK_COUNT)]
+
+
+def test_bulk_insert_matches_orm_rows_and_is_faster(session):
+    chunks = _chunks()
+
+    start = time.perf_counter()
+    for i, (text, vector) in enumerate(chunks):
+        session.add(Embedding(
+            document_id=1, chunk_index=i, chunk_text=text, chunk_size=len(text),
+            embedding_vector=vector, vector_dimension=len(vector), tokens=len(text.split()),
+        ))
+    session.commit()
+    orm_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    inserted = Embedding.bulk_insert(session, (
+        Embedding.build_row(document_id=2, chunk_index=i, chunk_text=text, embedding_vector=vector)
+        for i, (text, vector) in enumerate(chunks)
+    ))
+    session.commit()
+    bulk_elapsed = time.perf_counter() - start
+
+    print(f"\nORM 루프: {CHUNK_COUNT / orm_elapsed:,.0f} rows/s, "
+          f"bulk_insert: {CHUNK_COUNT / bulk_elapsed:,.0f} rows/s")
+
+    assert inserted == CHUNK_COUNT
+    counts = dict(session.query(Embedding.document_id, func.count(Embedding.id))
+                  .group_by(Embedding.document_id).all())
+    assert counts == {1: CHUNK_COUNT, 2: CHUNK_COUNT}
+
+    orm_row = session.query(Embedding).filter_by(document_id=1, chunk_index=5).one()
+    bulk_row = session.query(Embedding).filter_by(document_id=2, chunk_index=5).one()
+    for column in ("chunk_text", "chunk_size", "tokens", "embedding_vector",
+                   "embedding_model", "vector_dimension"):
+        assert getattr(orm_row, column) == getattr(bulk_row, column)
+
+    assert bulk_elapsed < orm_elapsed
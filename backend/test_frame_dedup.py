@@ -0,0 +1,63 @@
+"""
+프레임 중복 제거 테스트
+같은 슬라이드(잡음만 다른 프레임)는 건너뛰고 슬라이드가 바뀐 프레임은 남기는지 확인
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(__file__))
+
+import numpy as np
+import pytest
+
+from app.services.frame_dedup import FrameDeduplicator, deduplicate_frame_files, dhash, hamming_distance
+
+
+def _slide(seed: int, size=(180, 320)) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    blocks = rng.integers(0, 256, size=(9, 16))
+    return np.kron(blocks, np.ones((size[0] // 9, size[1] // 16))).astype(np.uint8)
+
+
+def _noisy(image: np.ndarray, seed: int) -> np.ndarray:
+    noise = np.random.default_rng(seed).integers(-3, 4, size=image.shape)
+    return np.clip(image.astype(int) + noise, 0, 255).astype(np.uint8)
+
+
+def test_dhash_distance_between_slides():
+    first, second = _slide(1), _slide(2)
+    assert hamming_distance(dhash(first), dhash(_noisy(first, 0))) <= 5
+    assert hamming_distance(dhash(first), dhash(second)) > 5
+    assert dhash(np.stack([first] * 3, axis=2)) == dhash(first)
+
+
+def test_deduplicator_skips_repeated_slides():
+    first, second = _slide(1), _slide(2)
+    frames = [first, _noisy(first, 1), _noisy(first, 2), second, _noisy(second, 3), first]
+
+    deduplicator = FrameDeduplicator(threshold=5)
+    kept = [i for i, frame in enumerate(frames) if not deduplicator.is_duplicate(dhash(frame))]
+
+    assert kept == [0, 3, 5]
+    assert deduplicator.stats == {
+        "total_frames": 6,
+        "kept_frames": 3,
+        "skipped_frames": 3,
+        "skip_ratio": 0.5,
+        "threshold": 5,
+    }
+
+
+def test_deduplicate_frame_files_removes_skipped(tmp_path):
+    Image = pytest.importorskip("PIL.Image")
+    first, second = _slide(1), _slide(2)
+    paths = []
+    for i, frame in enumerate([first, _noisy(first, 1), second]):
+        path = tmp_path / f"frame_{i:04d}.png"
+        Image.fromarray(frame).save(path)
+        paths.append(str(path))
+
+    kept, stats = deduplicate_frame_files(paths, threshold=5)
+
+    assert kept == [paths[0], paths[2]]
+    assert stats["skipped_frames"] == 1
+    assert not os.path.exists(paths[1])
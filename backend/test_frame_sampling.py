@@ -0,0 +1,90 @@
+"""
+화면 전환 기반 프레임 샘플링 테스트
+scene 필터 구성, showinfo 로그의 시각 파싱, 중복 제거 후에도 프레임 시각이 유지되는지 확인
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(__file__))
+
+import subprocess
+
+import pytest
+
+from app.services import video_processing_service as vps
+
+SHOWINFO_LOG = """
+Input #0, mov,mp4,m4a,3gp,3g2,mj2, from 'lecture.mp4':
+[Parsed_showinfo_1 @ 0x55d0c8] config in time_base: 1/12800, frame_rate:30/1
+[Parsed_showinfo_1 @ 0x55d0c8] n:   0 pts:      0 pts_time:0       duration:    512 fmt:yuv420p
+[Parsed_showinfo_1 @ 0x55d0c8] n:   1 pts: 531200 pts_time:41.5    duration:    512 fmt:yuv420p
+[Parsed_showinfo_1 @ 0x55d0c8] n:   2 pts: 915200 pts_time:71.5    duration:    512 fmt:yuv420p
+frame=    3 fps=0.0 q=2.0 Lsize=N/A time=00:01:11.54 bitrate=N/A speed= 140x
+"""
+
+
+def test_scene_select_filter():
+    video_filter = vps.build_scene_select_filter(0.3, max_gap=30)
+    assert video_filter == (
+        "select='eq(n,0)+gt(scene,0.3)*gte(t-prev_selected_t,1.0)+gte(t-prev_selected_t,30)',showinfo"
+    )
+
+
+def test_parse_showinfo_timestamps():
+    assert vps.parse_showinfo_timestamps(SHOWINFO_LOG) == [0.0, 41.5, 71.5]
+
+
+@pytest.fixture()
+def fake_ffmpeg(monkeypatch):
+    calls = []
+
+    def run(cmd, capture_output=True, text=True, check=False):
+        calls.append(cmd)
+        if cmd[0] == 'ffmpeg' and '-vf' in cmd:
+            pattern = cmd[-1]
+            for i in range(3):
+                with open(pattern % (i + 1), 'w') as f:
+                    f.write("frame")
+        return subprocess.CompletedProcess(cmd, 0, stdout="", stderr=SHOWINFO_LOG)
+
+    monkeypatch.setattr(vps.subprocess, "run", run)
+    return calls
+
+
+def test_scene_mode_keeps_timestamps_of_kept_frames(fake_ffmpeg, tmp_path, monkeypatch):
+    service = vps.VideoProcessingService()
+    monkeypatch.setattr(
+        "app.services.frame_dedup.deduplicate_frame_files",
+        lambda paths, threshold: ([paths[0], paths[2]], {"total_frames": 3, "kept_frames": 2, "skipped_frames": 1}),
+    )
+
+    frames = service.extract_frames("lecture.mp4", str(tmp_path), interval=30, mode="scene", scene_threshold=0.4)
+
+    ffmpeg_cmd = fake_ffmpeg[-1]
+    assert ffmpeg_cmd[ffmpeg_cmd.index('-vf') + 1].startswith("select='eq(n,0)+gt(scene,0.4)")
+    assert [os.path.basename(path) for path in frames] == ["frame_0001.jpg", "frame_0003.jpg"]
+    assert list(service.last_frame_timestamps.values()) == [0.0, 71.5]
+    assert service.last_frame_stats["mode"] == "scene"
+    assert service.last_frame_stats["skipped_frames"] == 1
+
+
+def test_unknown_sampling_mode_is_rejected(fake_ffmpeg, tmp_path):
+    with pytest.raises(ValueError):
+        vps.VideoProcessingService().extract_frames("lecture.mp4", str(tmp_path), mode="random")
+
+
+def test_audio_and_frames_come_from_one_decode(fake_ffmpeg, tmp_path):
+    service = vps.VideoProcessingService()
+    fake_ffmpeg.clear()
+    audio_path = str(tmp_path / "audio.wav")
+
+    frames = service.extract_audio_and_frames("lecture.mp4", audio_path, str(tmp_path / "frames"),
+                                              interval=30, dedupe=False, mode="interval")
+
+    assert len(fake_ffmpeg) == 1
+    cmd = fake_ffmpeg[0]
+    assert cmd.count('-i') == 1
+    audio_options = cmd[:cmd.index(audio_path)]
+    assert audio_options[-6:] == ['-ac', '1', '-ar', '16000', '-c:a', 'pcm_s16le']
+    assert cmd[cmd.index('-vf') + 1] == 'fps=1/30,showinfo'
+    assert len(frames) == 3
+    assert service.last_frame_stats["mode"] == "interval"
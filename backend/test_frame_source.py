@@ -0,0 +1,98 @@
+"""
+rawvideo 파이프 프레임 소스 테스트
+ffmpeg 대신 원시 프레임을 표준 출력으로 쓰는 프로세스를 띄워 링 버퍼 읽기, 프레임 시각,
+중복 프레임 건너뛰기, 메모리 프레임 OCR 배치 처리를 확인
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(__file__))
+
+from app.services.frame_source import RawFrameSource, scaled_size
+from app.services.text_extraction_service import OCRService
+
+WIDTH, HEIGHT = 64, 36
+
+# 슬라이드 값마다 다른 블록 무늬를 그리고, 왼쪽 위 픽셀에 슬라이드 값을 기록
+FAKE_FFMPEG = """
+import sys
+import numpy as np
+slides = [int(v) for v in sys.argv[1].split(",")]
+for i, value in enumerate(slides):
+    blocks = np.random.default_rng(value).integers(0, 256, size=(4, 8))
+    frame = np.kron(blocks, np.ones(({height} // 4, {width} // 8))).astype(np.uint8)
+    frame[0, 0] = value
+    sys.stderr.write(f"[Parsed_showinfo_1 @ 0x1] n:{{i}} pts:{{i * 30}} pts_time:{{i * 30.0}} fmt:gray\\n")
+    sys.stderr.flush()
+    sys.stdout.buffer.write(frame.tobytes())
+sys.stdout.flush()
+""".format(width=WIDTH, height=HEIGHT)
+
+
+def _source(slides, **kwargs) -> RawFrameSource:
+    source = RawFrameSource("lecture.mp4", WIDTH, HEIGHT, "fps=1/30,showinfo", pix_fmt="gray", **kwargs)
+    source.cmd = [sys.executable, "-c", FAKE_FFMPEG, ",".join(map(str, slides))]
+    return source
+
+
+def test_frames_are_read_into_ring_buffer_with_timestamps():
+    source = _source([0, 1, 2, 3, 4], ring_size=2)
+
+    seen = [(timestamp, int(frame[0, 0, 0]), frame.base is source.ring) for timestamp, frame in source]
+
+    assert [(t, v) for t, v, _ in seen] == [(0.0, 0), (30.0, 1), (60.0, 2), (90.0, 3), (120.0, 4)]
+    assert all(is_view for _, _, is_view in seen)
+    assert source.returncode == 0
+    assert source.stats["ring_buffer_bytes"] == 2 * WIDTH * HEIGHT
+
+
+def test_duplicate_frames_are_skipped():
+    source = _source([0, 0, 0, 1, 1], dedupe_threshold=5)
+
+    kept = [timestamp for timestamp, _ in source]
+
+    assert kept == [0.0, 90.0]
+    assert source.stats["skipped_frames"] == 3
+
+
+def test_held_frames_survive_skipped_duplicates():
+    # 링 3칸이면 직전 2장의 뷰를 들고 있어도 중복 프레임을 읽는 동안 덮어써지지 않아야 함
+    source = _source([0, 0, 0, 1, 1, 1, 2, 2, 3], ring_size=3, dedupe_threshold=5)
+
+    held = []
+    for _, frame in source:
+        held = (held + [frame])[-2:]
+        assert len({int(view[0, 0, 0]) for view in held}) == len(held)
+        if len(held) == 2:
+            assert int(held[1][0, 0, 0]) == int(held[0][0, 0, 0]) + 1
+
+    assert source.stats["kept_frames"] == 4
+    assert source.frames_yielded == 4
+
+
+def test_scaled_size_keeps_aspect_ratio():
+    assert scaled_size(1920, 1080, 1280) == (1280, 720)
+    assert scaled_size(641, 361, None) == (640, 360)
+
+
+class _ArrayReader:
+    """readtext_batched에 넘어온 배열을 기록하는 EasyOCR Reader 대역"""
+
+    def __init__(self):
+        self.batches = []
+
+    def readtext_batched(self, images, batch_size=1):
+        self.batches.append([int(image[0, 0, 0]) for image in images])
+        return [[([[0, 0]], f"slide {int(image[0, 0, 0])}", 0.9)] for image in images]
+
+
+def test_frame_source_ocr_batches_within_ring():
+    service = OCRService(use_easyocr=False, batch_size=8, text_regions=False)
+    service.use_easyocr = True
+    service.easyocr_reader = _ArrayReader()
+
+    result = service.extract_text_from_frame_source(_source([0, 1, 2, 3, 4], ring_size=3))
+
+    assert service.easyocr_reader.batches == [[0, 1], [2, 3], [4]]
+    assert result["unique_texts"] == [f"slide {i}" for i in range(5)]
+    assert [r["timestamp"] for r in result["frame_results"]] == [0.0, 30.0, 60.0, 90.0, 120.0]
+    assert result["frame_results"][0]["frame_path"] is None
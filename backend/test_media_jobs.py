@@ -0,0 +1,241 @@
+"""
+미디어 작업 큐/워커 테스트
+작업 등록, 워커 처리, 진행률 보고, 취소, 여러 워커의 중복 없는 작업 점유를 확인
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(__file__))
+
+import multiprocessing
+import threading
+import time
+from datetime import timedelta
+
+import pytest
+
+from app.models import MediaJob, MediaJobStatus
+from app.services.media_job_service import MediaJobService
+from app.workers import media_worker
+from app.workers.media_worker import MediaWorker, MediaWorkerPool
+
+
+@pytest.fixture()
+def service(session_factory):
+    return MediaJobService(session_factory)
+
+
+def _enqueue(service, session_factory, count=1, job_type="test"):
+    with session_factory() as db:
+        return [service.enqueue(db, 1, job_type, {"index": i}).id for i in range(count)]
+
+
+def _job(session_factory, job_id) -> MediaJob:
+    with session_factory() as db:
+        return db.get(MediaJob, job_id)
+
+
+def test_worker_completes_job_with_progress(service, session_factory):
+    job_id, = _enqueue(service, session_factory)
+    stages = []
+
+    def handler(job_type, payload, report):
+        for progress, stage in ((0.3, "ocr"), (0.8, "summary")):
+            report(progress, stage)
+            stages.append(_job(session_factory, job_id).stage)
+        return {"summary_id": f"s-{payload['index']}"}
+
+    worker = MediaWorker(service, {"test": handler}, worker_id="w1")
+    assert worker.run_once()
+    assert not worker.run_once()
+
+    job = _job(session_factory, job_id)
+    assert stages == ["ocr", "summary"]
+    assert job.status == MediaJobStatus.COMPLETED
+    assert job.progress == 1.0
+    assert job.result["summary_id"] == "s-0"
+    assert job.worker_id == "w1"
+
+
+def test_cancel_queued_and_running_jobs(service, session_factory):
+    queued_id, running_id = _enqueue(service, session_factory, 2)
+
+    with session_factory() as db:
+        service.request_cancel(db, db.get(MediaJob, queued_id))
+    assert _job(session_factory, queued_id).status == MediaJobStatus.CANCELLED
+
+    def handler(job_type, payload, report):
+        with session_factory() as db:
+            service.request_cancel(db, db.get(MediaJob, running_id))
+        report(0.5, "transcribing")
+        raise AssertionError("취소 후에는 실행되지 않아야 함")
+
+    worker = MediaWorker(service, {"test": handler}, worker_id="w1")
+    assert worker.run_once()
+    assert not worker.run_once()
+    assert _job(session_factory, running_id).status == MediaJobStatus.CANCELLED
+
+
+def test_failed_job_records_error_and_cleans_job_dir(service, session_factory, tmp_path):
+    job_dir = tmp_path / "job"
+    job_dir.mkdir()
+    with session_factory() as db:
+        job_id = service.enqueue(db, 1, "test", {"job_dir": str(job_dir)}).id
+
+    def handler(job_type, payload, report):
+        raise RuntimeError("오디오 추출에 실패했습니다.")
+
+    MediaWorker(service, {"test": handler}, worker_id="w1").run_once()
+
+    job = _job(session_factory, job_id)
+    assert job.status == MediaJobStatus.FAILED
+    assert job.error_message == "오디오 추출에 실패했습니다."
+    assert not job_dir.exists()
+
+
+def test_workers_claim_each_job_once(service, session_factory):
+    job_ids = _enqueue(service, session_factory, 12)
+    processed = []
+    lock = threading.Lock()
+
+    def handler(job_type, payload, report):
+        time.sleep(0.01)
+        with lock:
+            processed.append(payload["index"])
+        return {}
+
+    def run(worker_id):
+        worker = MediaWorker(service, {"test": handler}, worker_id=worker_id)
+        while worker.run_once():
+            pass
+
+    threads = [threading.Thread(target=run, args=(f"w{i}",)) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(processed) == list(range(12))
+    assert all(_job(session_factory, job_id).status == MediaJobStatus.COMPLETED for job_id in job_ids)
+
+
+def test_heartbeat_refreshes_running_job_between_reports(service, session_factory):
+    job_id, = _enqueue(service, session_factory)
+    seen = []
+
+    def handler(job_type, payload, report):
+        # 진행률 보고 없이 긴 단계를 처리하는 동안에도 updated_at이 갱신되어야 함
+        before = _job(session_factory, job_id).updated_at
+        time.sleep(0.3)
+        seen.append(_job(session_factory, job_id).updated_at > before)
+        return {}
+
+    MediaWorker(service, {"test": handler}, worker_id="w1", heartbeat_interval=0.05).run_once()
+
+    assert seen == [True]
+    assert _job(session_factory, job_id).status == MediaJobStatus.COMPLETED
+
+
+def test_requeued_job_is_not_overwritten_by_previous_worker(service, session_factory, tmp_path):
+    job_dir = tmp_path / "job"
+    job_dir.mkdir()
+    with session_factory() as db:
+        job_id = service.enqueue(db, 1, "test", {"job_dir": str(job_dir)}).id
+    calls = []
+
+    def handler(job_type, payload, report):
+        calls.append(job_type)
+        if len(calls) == 1:
+            # 첫 워커가 처리하는 도중 작업이 중단된 것으로 판단되어 다른 워커가 가져감
+            assert service.requeue_stale(timedelta(seconds=-1)) == 1
+            assert MediaWorker(service, {"test": handler}, worker_id="w2").run_once()
+            report(0.5, "transcribing")
+            raise AssertionError("작업을 잃은 뒤에는 실행되지 않아야 함")
+        return {"winner": "w2"}
+
+    MediaWorker(service, {"test": handler}, worker_id="w1").run_once()
+
+    job = _job(session_factory, job_id)
+    assert job.status == MediaJobStatus.COMPLETED
+    assert job.worker_id == "w2"
+    assert job.result["winner"] == "w2"
+    assert not service.finish(job_id, MediaJobStatus.FAILED, error_message="늦은 기록", worker_id="w1")
+    assert _job(session_factory, job_id).status == MediaJobStatus.COMPLETED
+
+
+def _exit_immediately(stop_event, poll_interval):
+    pass
+
+
+def _wait_for_stop(stop_event, poll_interval):
+    stop_event.wait()
+
+
+def test_pool_respawns_dead_workers_and_requeues_stale_jobs(service, session_factory, monkeypatch):
+    job_id, = _enqueue(service, session_factory)
+    assert service.claim_next("dead-worker").id == job_id
+    pool = MediaWorkerPool(processes=2, job_service=service)
+    pool.stale_after = timedelta(seconds=-1)
+    # 모델 없이 빠르게 띄우도록 fork 컨텍스트와 가벼운 워커 함수로 교체
+    pool._context = multiprocessing.get_context("fork")
+    pool._stop_event = pool._context.Event()
+    monkeypatch.setattr(media_worker, "_worker_main", _exit_immediately)
+    pool._workers = [pool._spawn(index) for index in range(2)]
+    for process in pool._workers:
+        process.join(5)
+
+    monkeypatch.setattr(media_worker, "_worker_main", _wait_for_stop)
+    try:
+        assert pool.supervise_once() == 2
+        assert all(process.is_alive() for process in pool._workers)
+        assert pool.supervise_once() == 0
+    finally:
+        pool.stop(timeout=5)
+
+    assert _job(session_factory, job_id).status == MediaJobStatus.QUEUED
+
+
+def _complete(service, session_factory, *results):
+    job_ids = _enqueue(service, session_factory, count=len(results))
+    for job_id, result in zip(job_ids, results):
+        service.finish(job_id, MediaJobStatus.COMPLETED, result=result)
+    return job_ids
+
+
+def _transcribed(asr_seconds):
+    return {"transcription_stats": {"backend": "faster-whisper", "audio_seconds": asr_seconds * 2,
+                                    "asr_seconds": asr_seconds}}
+
+
+def test_finished_transcriptions_resume_after_cursor_and_skip_cache_hits(service, session_factory):
+    _complete(service, session_factory, _transcribed(60.0), {**_transcribed(30.0), "cache_hit": True}, None)
+
+    with session_factory() as db:
+        rows = service.list_finished_transcriptions(db)
+        assert [row[2] for row in rows] == [_transcribed(60.0)["transcription_stats"], None, None]
+        assert service.list_finished_transcriptions(db, rows[-1][:2]) == []
+
+        later, = _complete(service, session_factory, _transcribed(90.0))
+        assert [row[1] for row in service.list_finished_transcriptions(db, rows[-1][:2])] == [later]
+
+
+def test_api_metrics_count_asr_seconds_from_worker_jobs(service, session_factory):
+    pytest.importorskip("psutil")
+    prometheus_client = pytest.importorskip("prometheus_client")
+    from app.services.monitoring_service import PerformanceMonitor
+
+    def asr_seconds():
+        return prometheus_client.REGISTRY.get_sample_value(
+            "asr_audio_seconds_total", {"backend": "faster-whisper"}) or 0.0
+
+    # 워커 프로세스에서 끝난 작업처럼 이 프로세스의 지표를 거치지 않고 결과만 기록
+    _complete(service, session_factory, _transcribed(60.0), _transcribed(30.0))
+    monitor = PerformanceMonitor()
+    before = asr_seconds()
+
+    with session_factory() as db:
+        assert monitor.sync_transcription_metrics(db) == 2
+        assert monitor.sync_transcription_metrics(db) == 0
+
+    assert asr_seconds() - before == 90.0
+    assert b"asr_audio_seconds_total" in prometheus_client.generate_latest()
+    assert monitor.get_performance_stats()["video_processing_stats"]["transcription"]["asr_minutes"] == 1.5
@@ -0,0 +1,53 @@
+"""
+모델 레지스트리 테스트
+동시에 요청해도 모델은 한 번만 로드되고, 로드 시간/메모리 통계가 기록되는지 확인
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(__file__))
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.services.model_registry import ModelRegistry
+
+
+def test_concurrent_get_loads_once():
+    registry = ModelRegistry()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        models = list(pool.map(lambda _: registry.get(("whisper", "base"), loader), range(16)))
+
+    assert len(calls) == 1
+    assert all(model is models[0] for model in models)
+
+    stats = registry.stats()["whisper:base"]
+    assert stats["load_seconds"] >= 0.05
+    assert stats["memory_mb"] >= 0
+
+
+def test_lock_for_serializes_inference():
+    registry = ModelRegistry()
+    active, peak = [0], [0]
+    guard = threading.Lock()
+
+    def infer(_):
+        with registry.lock_for(("easyocr", "ko+en")):
+            with guard:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            with guard:
+                active[0] -= 1
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(infer, range(8)))
+
+    assert peak[0] == 1
@@ -0,0 +1,85 @@
+"""
+커서 기반 페이지네이션 테스트
+created_at이 같은 행이 섞여 있어도 누락/중복 없이 전체를 순회하는지 확인
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(__file__))
+
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.pagination import capped_count, decode_cursor, encode_cursor, paginate_keyset
+from app.models import Document, Project, User
+from app.models.document import DocumentStatus
+from conftest import document_row, insert_rows, project_row
+
+
+@pytest.fixture(autouse=True)
+def projects(engine):
+    now = datetime.utcnow()
+    # 3개씩 같은 created_at을 갖도록 구성
+    insert_rows(engine, Project, [
+        project_row(i, created_at=now - timedelta(seconds=i // 3)) for i in range(1, 51)
+    ])
+
+
+def test_cursor_roundtrip():
+    created_at = datetime(2024, 1, 2, 3, 4, 5, 678901)
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+
+
+def test_invalid_cursor_rejected():
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor("not-a-cursor")
+    assert exc_info.value.status_code == 400
+
+
+def test_keyset_walks_all_rows_once(session):
+    query = session.query(Project).filter(Project.user_id == 1)
+    seen, cursor, pages = [], None, 0
+    while True:
+        items, cursor = paginate_keyset(query, Project.created_at, Project.id, cursor, 7)
+        seen.extend(item.id for item in items)
+        pages += 1
+        if cursor is None:
+            break
+
+    expected = [p.id for p in query.order_by(Project.created_at.desc(), Project.id.desc())]
+    assert seen == expected
+    assert pages == 8
+
+
+def test_capped_count_stops_at_cap(session):
+    query = session.query(Project).filter(Project.user_id == 1)
+    assert capped_count(query, 11) == 11
+    assert capped_count(query.filter(Project.id <= 3), 11) == 3
+
+
+@pytest.mark.parametrize("quota, can_create_more", [(50, False), (51, True)])
+def test_project_list_quota_flag_without_total(session, monkeypatch, quota, can_create_more):
+    from app.routes import projects
+
+    monkeypatch.setattr(projects.settings, "MAX_PROJECTS_PER_USER", quota)
+    response = projects.get_projects(limit=10, include_total=False, db=session, current_user=session.get(User, 1))
+
+    assert response.total is None
+    assert response.can_create_more is can_create_more
+
+
+@pytest.mark.parametrize("quota, can_add_more", [(5, False), (6, True)])
+def test_document_list_quota_flag_without_total(engine, session, monkeypatch, quota, can_add_more):
+    from app.routes import documents
+
+    # 상태로 걸러도 한도는 프로젝트의 전체 활성 문서 수로 판단
+    insert_rows(engine, Document, [document_row(i, processing_status="COMPLETED" if i < 3 else "FAILED")
+                                   for i in range(1, 6)])
+    monkeypatch.setattr(documents.settings, "MAX_DOCUMENTS_PER_PROJECT", quota)
+
+    for status in (None, DocumentStatus.COMPLETED):
+        response = documents.get_documents(project_id=1, status=status, limit=10, include_total=False,
+                                           db=session, current_user=session.get(User, 1))
+        assert response.total is None
+        assert response.project_can_add_more is can_add_more
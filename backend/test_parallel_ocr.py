@@ -0,0 +1,145 @@
+"""
+프레임 OCR 병렬화 테스트
+프로세스 풀 결과가 프레임 순서를 유지하는지, EasyOCR 프레임이 배치 단위로 추론되는지 확인하고
+프레임 처리량(frames/sec/core)을 출력. Tesseract는 프레임마다 한 번만 인식하는지 확인
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(__file__))
+
+import time
+import types
+
+import numpy as np
+
+from app.services.model_registry import ModelRegistry, get_model_registry
+from app.services.text_extraction_service import OCRService, map_in_processes
+
+
+def _fake_ocr(frame_path: str) -> dict:
+    # 프레임 하나를 OCR하는 정도의 CPU 작업
+    total = 0
+    for i in range(200_000):
+        total += i * i
+    return {"full_text": f"text-{frame_path}", "texts": [], "method": "tesseract"}
+
+
+def test_map_in_processes_keeps_frame_order():
+    frames = [f"frame_{i:04d}.jpg" for i in range(40)]
+    workers = max(2, min(os.cpu_count() or 1, 4))
+
+    started = time.perf_counter()
+    sequential = [_fake_ocr(frame) for frame in frames]
+    sequential_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    parallel = map_in_processes(_fake_ocr, frames, workers)
+    parallel_elapsed = time.perf_counter() - started
+
+    print(f"\n순차: {len(frames) / sequential_elapsed:.1f} frames/s, "
+          f"{workers}개 프로세스: {len(frames) / parallel_elapsed:.1f} frames/s "
+          f"({len(frames) / parallel_elapsed / workers:.1f} frames/s/core)")
+    assert parallel == sequential
+
+
+class _BatchReader:
+    """readtext_batched 호출을 기록하는 EasyOCR Reader 대역"""
+
+    def __init__(self):
+        self.batches = []
+
+    def readtext_batched(self, images, batch_size=1):
+        self.batches.append(list(images))
+        return [[([[0, 0]], f"text {image}", 0.9)] for image in images]
+
+
+def test_easyocr_frames_are_batched_in_order():
+    service = OCRService(use_easyocr=False, batch_size=4, text_regions=False)
+    service.use_easyocr = True
+    service.easyocr_reader = _BatchReader()
+
+    frames = [f"frame_{i}.jpg" for i in range(10)]
+    result = service.extract_text_from_frames(frames)
+
+    assert [len(batch) for batch in service.easyocr_reader.batches] == [4, 4, 2]
+    assert [r["frame_index"] for r in result["frame_results"]] == list(range(10))
+    assert result["unique_texts"] == [f"text frame_{i}.jpg" for i in range(10)]
+    assert result["ocr_stats"]["method"] == "easyocr"
+    assert result["ocr_stats"]["frames_per_second"] > 0
+
+
+def test_tesseract_data_builds_text_and_boxes_from_one_pass():
+    data = {
+        "text": ["", "강의", "제목", "", "Slide", "2"],
+        "conf": ["-1", "91", "88", "-1", "20", "95"],
+        "block_num": [1, 1, 1, 1, 1, 1],
+        "par_num": [1, 1, 1, 1, 1, 1],
+        "line_num": [0, 1, 1, 0, 2, 2],
+        "left": [0, 10, 50, 0, 10, 60],
+        "top": [0, 5, 5, 0, 30, 30],
+        "width": [0, 30, 30, 0, 40, 10],
+        "height": [0, 20, 20, 0, 20, 20],
+    }
+
+    result = OCRService._format_tesseract_data(data)
+
+    assert result["full_text"] == "강의 제목\nSlide 2"
+    assert [t["text"] for t in result["texts"]] == ["강의", "제목", "2"]
+    assert result["texts"][0]["bbox"] == [10, 5, 40, 25]
+
+
+class _FakeIterator:
+    def __init__(self, words):
+        self.words = words
+        self.index = 0
+
+    def GetUTF8Text(self, level):
+        return self.words[self.index][0]
+
+    def Confidence(self, level):
+        return self.words[self.index][1]
+
+    def BoundingBox(self, level):
+        return (self.index, 0, self.index + 1, 1)
+
+    def Next(self, level):
+        self.index += 1
+        return self.index < len(self.words)
+
+
+class _FakeTessAPI:
+    """tesserocr.PyTessBaseAPI 대역 (Recognize 호출 횟수 기록)"""
+
+    def __init__(self):
+        self.recognized = 0
+
+    def SetImageBytes(self, data, width, height, bpp, bpl):
+        assert len(data) == width * height
+
+    def Recognize(self):
+        self.recognized += 1
+
+    def GetUTF8Text(self):
+        return "강의 제목\n"
+
+    def GetIterator(self):
+        return _FakeIterator([("강의", 90.0), ("제목", 10.0)])
+
+    def Clear(self):
+        pass
+
+
+def test_tesseract_engine_is_reused_across_frames(monkeypatch):
+    monkeypatch.setitem(sys.modules, "tesserocr", types.SimpleNamespace(RIL=types.SimpleNamespace(WORD=3)))
+    registry = get_model_registry()
+    key = ModelRegistry.tesseract_key(OCRService.TESSERACT_LANG)
+    api = registry.get(key, _FakeTessAPI)
+    try:
+        frames = [np.zeros((8, 16), dtype=np.uint8) for _ in range(3)]
+        results = [OCRService._tesseract_gray(frame) for frame in frames]
+    finally:
+        registry.unload(key)
+
+    assert api.recognized == 3
+    assert results[0]["full_text"] == "강의 제목"
+    assert results[0]["texts"] == [{"text": "강의", "confidence": 0.9, "bbox": [0, 0, 1, 1]}]
@@ -0,0 +1,70 @@
+"""프로젝트 통계 카운터 테스트"""
+import os
+import sys
+sys.path.append(os.path.dirname(__file__))
+
+from datetime import datetime
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.models import User, Project, Document, DocumentType, ProcessingStatus, ProjectDocumentStats
+
+
+def _session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    return sessionmaker(bind=engine)()
+
+
+def _add_document(db, project_id, name, size=100):
+    doc = Document(
+        filename=name, original_filename=name, file_path="", file_size=size,
+        file_type=DocumentType.TXT, project_id=project_id,
+        processing_status=ProcessingStatus.UPLOADING,
+    )
+    db.add(doc)
+    db.commit()
+    return doc
+
+
+def test_counters_follow_status_transitions():
+    db = _session()
+    user = User(email="a@example.com", username="a", hashed_password="x")
+    db.add(user)
+    db.commit()
+    project = Project(title="p", user_id=user.id)
+    db.add(project)
+    db.commit()
+
+    docs = [_add_document(db, project.id, f"doc{i}.txt", size=1024) for i in range(4)]
+    docs[0].mark_processing()
+    docs[1].mark_completed("본문", 3)
+    docs[2].mark_processing()
+    db.commit()
+    docs[2].mark_failed("오류")
+    docs[3].deleted_at = datetime.utcnow()
+    db.commit()
+
+    counters = db.get(ProjectDocumentStats, project.id).to_dict()
+    assert counters == ProjectDocumentStats.aggregate(db, project.id)
+    assert counters["total_documents"] == 3
+    assert counters["processing_documents"] == 1
+    assert counters["completed_documents"] == 1
+    assert counters["failed_documents"] == 1
+    assert counters["uploading_documents"] == 0
+    assert counters["total_size_bytes"] == 3 * 1024
+
+
+def test_missing_counter_row_is_seeded_from_aggregate():
+    db = _session()
+    db.add(User(id=1, email="b@example.com", username="b", hashed_password="x"))
+    db.add(Project(id=1, title="p", user_id=1))
+    db.commit()
+    _add_document(db, 1, "doc.txt")
+    db.query(ProjectDocumentStats).delete()
+    db.commit()
+
+    stats = ProjectDocumentStats.get_for_project(db, 1)
+    assert stats["total_documents"] == 1
+    assert db.get(ProjectDocumentStats, 1) is not None
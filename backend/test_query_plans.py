@@ -0,0 +1,101 @@
+"""
+쿼리 플랜 회귀 테스트
+10만 건의 문서를 넣은 SQLite DB에서 주요 조회 쿼리가 복합 인덱스를 사용하는지 EXPLAIN으로 확인
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(__file__))
+
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from app.models import User, Project, Document, ChatHistory
+from conftest import create_test_engine, document_row, insert_rows, project_row, user_row
+
+DOCUMENT_COUNT = 100_000
+PROJECT_COUNT = 1_000
+
+
+@pytest.fixture(scope="module")
+def engine():
+    engine = create_test_engine()
+    now = datetime.utcnow()
+    insert_rows(engine, User, [user_row(i) for i in range(1, 101)])
+    insert_rows(engine, Project, [
+        project_row(i, user_id=i % 100 + 1, deleted_at=now if i % 10 == 0 else None)
+        for i in range(1, PROJECT_COUNT + 1)
+    ])
+    statuses = ["PENDING", "PROCESSING", "COMPLETED", "FAILED"]
+    insert_rows(engine, Document, [
+        document_row(i + 1, project_id=i % PROJECT_COUNT + 1, file_size=1024,
+                     processing_status=statuses[i % 4], created_at=now - timedelta(seconds=i),
+                     is_deleted=i % 20 == 0, deleted_at=now if i % 20 == 0 else None)
+        for i in range(DOCUMENT_COUNT)
+    ])
+    insert_rows(engine, ChatHistory, [
+        {"project_id": i % PROJECT_COUNT + 1, "role": "USER", "message_type": "QUERY",
+         "content": "질문", "input_tokens": 0, "output_tokens": 0, "total_tokens": 0,
+         "context_used": False, "created_at": now - timedelta(seconds=i), "updated_at": now,
+         "is_deleted": False}
+        for i in range(10_000)
+    ])
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE"))
+    return engine
+
+
+def _plan(engine, sql: str, **params) -> str:
+    with engine.connect() as conn:
+        rows = conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"), params).fetchall()
+    return "\n".join(row[-1] for row in rows)
+
+
+def test_project_listing_uses_user_index(engine):
+    plan = _plan(
+        engine,
+        "SELECT * FROM projects WHERE user_id = :uid AND deleted_at IS NULL ORDER BY created_at DESC",
+        uid=1,
+    )
+    assert "ix_projects_active_user_id_created_at" in plan
+    assert "USE TEMP B-TREE" not in plan
+
+
+def test_project_count_uses_user_index(engine):
+    plan = _plan(
+        engine,
+        "SELECT count(*) FROM projects WHERE user_id = :uid AND deleted_at IS NULL",
+        uid=1,
+    )
+    assert "ix_projects_active_user_id_created_at" in plan or "ix_projects_user_id_deleted_at" in plan
+
+
+def test_document_listing_uses_composite_index(engine):
+    plan = _plan(
+        engine,
+        "SELECT * FROM documents WHERE project_id = :pid AND deleted_at IS NULL "
+        "ORDER BY created_at DESC LIMIT 20",
+        pid=1,
+    )
+    assert "ix_documents_project_id_deleted_at_created_at" in plan
+    assert "USE TEMP B-TREE" not in plan
+
+
+def test_document_status_filter_uses_composite_index(engine):
+    plan = _plan(
+        engine,
+        "SELECT count(*) FROM documents WHERE project_id = :pid AND processing_status = :status",
+        pid=1, status="COMPLETED",
+    )
+    assert "ix_documents_project_id_processing_status" in plan
+
+
+def test_chat_history_uses_composite_index(engine):
+    plan = _plan(
+        engine,
+        "SELECT * FROM chat_histories WHERE project_id = :pid ORDER BY created_at DESC LIMIT 20",
+        pid=1,
+    )
+    assert "ix_chat_histories_project_id_created_at" in plan
+    assert "USE TEMP B-TREE" not in plan
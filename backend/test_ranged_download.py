@@ -0,0 +1,157 @@
+"""
+범위 요청 병렬 다운로드 테스트
+로컬 HTTP 서버를 Drive 대역으로 띄워 병렬 범위 다운로드, 실패 후 이어받기, 재시도,
+Range 미지원 서버 처리, 진행률/처리량 보고를 확인
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(__file__))
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.services.ranged_download import DownloadError, RangedDownloader
+
+CHUNK = 64 * 1024
+DATA = os.urandom(10 * CHUNK + 123)
+
+
+class _DriveStandIn(BaseHTTPRequestHandler):
+    """Range 요청을 처리하고 요청 기록/실패 주입을 지원하는 HTTP 서버 핸들러"""
+
+    def do_GET(self):
+        server = self.server
+        match = re.match(r"bytes=(\d+)-(\d+)", self.headers.get("Range", ""))
+        with server.lock:
+            server.requests.append(match.group(0) if match else None)
+            fail = match is not None and server.failures.get(int(match.group(1)), 0) > 0
+            if fail:
+                server.failures[int(match.group(1))] -= 1
+        if fail:
+            self.send_error(503)
+            return
+        if match is None or not server.ranges:
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(DATA)))
+            self.end_headers()
+            self.wfile.write(DATA)
+            return
+        start, end = int(match.group(1)), min(int(match.group(2)), len(DATA) - 1)
+        self.send_response(206)
+        self.send_header("Content-Range", f"bytes {start}-{end}/{len(DATA)}")
+        self.send_header("Content-Length", str(end - start + 1))
+        self.end_headers()
+        self.wfile.write(DATA[start:end + 1])
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _DriveStandIn)
+    httpd.lock = threading.Lock()
+    httpd.requests = []
+    httpd.failures = {}
+    httpd.ranges = True
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def _url(server) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}/video.mp4"
+
+
+def test_parallel_ranges_stream_to_disk(server, tmp_path):
+    dest = tmp_path / "video.mp4"
+    progress = []
+
+    downloader = RangedDownloader(_url(server), str(dest), chunk_size=CHUNK, workers=4,
+                                  progress=lambda done, total, rate: progress.append((done, total, rate)))
+    stats = downloader.download()
+
+    assert dest.read_bytes() == DATA
+    assert not os.path.exists(f"{dest}.part") and not os.path.exists(f"{dest}.part.json")
+    # 크기 확인 1회 + 범위 11개
+    assert server.requests[0] == "bytes=0-0" and len(server.requests) == 12
+    assert progress[-1][:2] == (len(DATA), len(DATA))
+    print(f"\n다운로드 {stats['bytes']} 바이트, {stats['mb_per_second']} MB/s")
+    assert stats["bytes"] == len(DATA) and stats["resumed_bytes"] == 0
+
+
+def test_failed_download_resumes_from_partial_file(server, tmp_path):
+    dest = tmp_path / "video.mp4"
+    part = tmp_path / "partial" / "abc.part"
+    part.parent.mkdir()
+    server.failures = {5 * CHUNK: 10}
+
+    with pytest.raises(DownloadError):
+        RangedDownloader(_url(server), str(dest), chunk_size=CHUNK, workers=1, part_path=str(part),
+                         validator="md5-1", max_retries=1).download(total=len(DATA))
+    done = json.loads((tmp_path / "partial" / "abc.part.json").read_text())["done"]
+    assert done == [0, 1, 2, 3, 4]
+
+    server.failures = {}
+    server.requests.clear()
+    stats = RangedDownloader(_url(server), str(dest), chunk_size=CHUNK, workers=2, part_path=str(part),
+                             validator="md5-1").download(total=len(DATA))
+
+    assert dest.read_bytes() == DATA
+    assert stats["resumed_bytes"] == 5 * CHUNK
+    assert sorted(server.requests) == sorted(f"bytes={i * CHUNK}-{min((i + 1) * CHUNK, len(DATA)) - 1}"
+                                             for i in range(5, 11))
+
+
+def test_changed_source_restarts_download(server, tmp_path):
+    dest = tmp_path / "video.mp4"
+    part = tmp_path / "video.mp4.part"
+    part.write_bytes(b"\0" * len(DATA))
+    (tmp_path / "video.mp4.part.json").write_text(json.dumps(
+        {"total": len(DATA), "chunk_size": CHUNK, "validator": "old", "done": list(range(11))}
+    ))
+
+    stats = RangedDownloader(_url(server), str(dest), chunk_size=CHUNK, validator="new").download(total=len(DATA))
+
+    assert dest.read_bytes() == DATA and stats["resumed_bytes"] == 0
+
+
+def test_transient_errors_are_retried(server, tmp_path, monkeypatch):
+    monkeypatch.setattr("app.services.ranged_download.time.sleep", lambda seconds: None)
+    dest = tmp_path / "video.mp4"
+    server.failures = {2 * CHUNK: 2}
+
+    RangedDownloader(_url(server), str(dest), chunk_size=CHUNK, workers=3).download()
+
+    assert dest.read_bytes() == DATA
+    assert server.requests.count(f"bytes={2 * CHUNK}-{3 * CHUNK - 1}") == 3
+
+
+def test_server_without_ranges_falls_back_to_single_stream(server, tmp_path):
+    server.ranges = False
+    dest = tmp_path / "video.mp4"
+
+    stats = RangedDownloader(_url(server), str(dest), chunk_size=CHUNK).download()
+
+    assert dest.read_bytes() == DATA and stats["bytes"] == len(DATA)
+
+
+def test_progress_exception_cancels_download(server, tmp_path):
+    class Cancelled(Exception):
+        pass
+
+    def cancel(done, total, rate):
+        if done > 3 * CHUNK:
+            raise Cancelled()
+
+    with pytest.raises(Cancelled):
+        RangedDownloader(_url(server), str(tmp_path / "video.mp4"), chunk_size=CHUNK, workers=2,
+                         progress=cancel, progress_interval=0).download()
+    assert not (tmp_path / "video.mp4").exists()
+    assert len(server.requests) < 12
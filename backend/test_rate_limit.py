@@ -0,0 +1,78 @@
+"""로그인 시도 제한 백엔드 테스트"""
+import multiprocessing
+import os
+import sys
+sys.path.append(os.path.dirname(__file__))
+
+from app.core.rate_limit import (
+    InMemoryRateLimitBackend,
+    SQLiteRateLimitBackend,
+    RedisRateLimitBackend,
+    LocalRedis,
+)
+
+WINDOW = 900
+
+
+def _check_sliding_window(backend):
+    start = 10 * WINDOW  # 윈도우 경계에서 시작
+    for i in range(5):
+        backend.hit("a@example.com", WINDOW, now=start + i)
+    assert backend.count("a@example.com", WINDOW, now=start + 10) == 5
+    assert backend.count("b@example.com", WINDOW, now=start + 10) == 0
+
+    # 다음 윈도우 중간: 이전 윈도우 카운트가 절반만 반영됨
+    assert backend.count("a@example.com", WINDOW, now=start + WINDOW * 1.5) == 2.5
+    # 두 윈도우가 지나면 모두 만료
+    assert backend.count("a@example.com", WINDOW, now=start + WINDOW * 2.5) == 0
+
+    backend.reset("a@example.com", WINDOW)
+    assert backend.count("a@example.com", WINDOW, now=start + 10) == 0
+
+
+def test_in_memory_backend():
+    _check_sliding_window(InMemoryRateLimitBackend())
+
+
+def test_in_memory_backend_expires_idle_keys():
+    backend = InMemoryRateLimitBackend(sweep_interval=0)
+    for i in range(1000):
+        backend.hit(f"user{i}@example.com", WINDOW, now=0)
+    backend.hit("late@example.com", WINDOW, now=WINDOW * 3)
+    assert len(backend) == 1
+
+
+def test_sqlite_backend(tmp_path):
+    _check_sliding_window(SQLiteRateLimitBackend(str(tmp_path / "rl.db")))
+
+
+def test_local_redis_backend():
+    import time
+    backend = RedisRateLimitBackend(LocalRedis())
+    now = time.time()
+    for _ in range(3):
+        backend.hit("a@example.com", WINDOW, now=now)
+    assert backend.count("a@example.com", WINDOW, now=now) >= 3
+    backend.reset("a@example.com", WINDOW)
+    assert backend.count("a@example.com", WINDOW, now=now) == 0
+
+
+def _record_attempts(db_path, count):
+    backend = SQLiteRateLimitBackend(db_path)
+    for _ in range(count):
+        backend.hit("shared@example.com", WINDOW)
+
+
+def test_sqlite_backend_is_shared_across_processes(tmp_path):
+    db_path = str(tmp_path / "rl.db")
+    SQLiteRateLimitBackend(db_path)
+    workers = [
+        multiprocessing.Process(target=_record_attempts, args=(db_path, 10))
+        for _ in range(4)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    # 윈도우 경계를 넘지 않는 한 네 워커의 시도가 모두 합산됨
+    assert SQLiteRateLimitBackend(db_path).count("shared@example.com", WINDOW) >= 40 * 0.9
@@ -0,0 +1,210 @@
+"""
+음성 구간 분할/병합 테스트
+VAD 구간 검출, 겹치는 창 구성, 겹친 구간의 세그먼트 중복 제거, 진행률 콜백을 확인
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(__file__))
+
+import wave
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pytest
+
+from app.core.config import settings
+from app.services.model_registry import ModelRegistry, get_model_registry
+from app.services.speech_chunking import (
+    SAMPLE_RATE, OffsetMap, SpeechWindow, detect_speech, load_audio, merge_window_segments, plan_windows,
+    trim_window
+)
+from app.services import text_extraction_service
+from app.services.asr_backends import WhisperBackend
+from app.services.text_extraction_service import SpeechToTextService
+
+
+def _tone(seconds: float) -> np.ndarray:
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def _silence(seconds: float) -> np.ndarray:
+    return np.random.default_rng(0).normal(0, 1e-4, int(seconds * SAMPLE_RATE)).astype(np.float32)
+
+
+def _write_wav(path, samples: np.ndarray) -> None:
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes((samples * 32767).astype(np.int16).tobytes())
+
+
+def test_detect_speech_skips_silence():
+    samples = np.concatenate([_silence(2), _tone(3), _silence(2), _tone(2), _silence(1)])
+    regions = detect_speech(samples)
+
+    assert len(regions) == 2
+    (s1, e1), (s2, e2) = regions
+    assert abs(s1 - 1.8) < 0.1 and abs(e1 - 5.2) < 0.1
+    assert abs(s2 - 6.8) < 0.1 and abs(e2 - 9.2) < 0.1
+
+
+def test_plan_windows_packs_short_regions_and_overlaps_long_ones():
+    assert plan_windows([(0, 10), (20, 30), (200, 210)], 120, 2) == [
+        SpeechWindow(0, 30), SpeechWindow(200, 210)
+    ]
+    assert plan_windows([(0, 300)], 120, 2) == [
+        SpeechWindow(0, 120, None, 119.0),
+        SpeechWindow(118, 238, 119.0, 237.0),
+        SpeechWindow(236, 300, 237.0, None),
+    ]
+
+
+def test_merge_drops_duplicates_from_overlap():
+    windows = plan_windows([(0, 240)], 120, 4)
+    merged = merge_window_segments(windows, [
+        [{"start": 0.0, "end": 115.0, "text": "앞부분"}, {"start": 115.0, "end": 119.0, "text": "겹침"}],
+        [{"start": 0.0, "end": 3.0, "text": "겹침"}, {"start": 3.0, "end": 124.0, "text": "뒷부분"}],
+    ])
+
+    assert [(s["start"], s["text"]) for s in merged] == [(0.0, "앞부분"), (115.0, "겹침"), (119.0, "뒷부분")]
+
+
+def test_trim_window_drops_inner_silence_and_maps_times_back():
+    samples = np.concatenate([_tone(2), _silence(4), _tone(2)])
+    trimmed, offsets = trim_window(samples, SpeechWindow(0, 8), [(0, 2), (6, 8)], keep_silence=0.3)
+
+    assert len(trimmed) == int(4.3 * SAMPLE_RATE)
+    assert offsets.pieces == ((0.0, 0.0), (2.0, 5.7))
+    assert offsets.remap([{"start": 0.5, "end": 2.0, "text": "앞"}, {"start": 2.3, "end": 4.3, "text": "뒤"}]) == [
+        {"start": 0.5, "end": 2.0, "text": "앞"}, {"start": 6.0, "end": 8.0, "text": "뒤"}
+    ]
+    # 짧은 무음은 잘라내지 않음
+    assert len(trim_window(samples, SpeechWindow(0, 8), [(0, 2), (2.2, 8)])[0]) == 8 * SAMPLE_RATE
+    assert OffsetMap().remap([{"start": 1.0, "end": 2.0}]) == [{"start": 1.0, "end": 2.0}]
+
+
+class _FakeWhisper:
+    """창 길이를 텍스트로 돌려주는 Whisper 모델 대역"""
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, samples, language, verbose):
+        self.calls.append(len(samples) / SAMPLE_RATE)
+        return {"segments": [{"start": 0.0, "end": len(samples) / SAMPLE_RATE,
+                              "text": f" {len(self.calls)}번째 창 "}]}
+
+
+@pytest.fixture()
+def chunked_service(monkeypatch):
+    monkeypatch.setattr(settings, "WHISPER_WORKERS", 1)
+    monkeypatch.setattr(settings, "WHISPER_CHUNK_SECONDS", 4.0)
+    monkeypatch.setattr(settings, "WHISPER_CHUNK_OVERLAP_SECONDS", 1.0)
+    registry = get_model_registry()
+    key = ModelRegistry.whisper_key("fake")
+    model = registry.get(key, _FakeWhisper)
+    model.calls.clear()
+    yield SpeechToTextService("fake")
+    registry.unload(key)
+
+
+def test_transcribe_audio_reports_progress_per_window(chunked_service, tmp_path):
+    audio_path = tmp_path / "audio.wav"
+    _write_wav(audio_path, np.concatenate([_silence(3), _tone(6), _silence(3)]))
+    progress = []
+
+    result = chunked_service.transcribe_audio(str(audio_path), progress=lambda done, total: progress.append((done, total)))
+
+    assert len(load_audio(str(audio_path))) == 12 * SAMPLE_RATE
+    assert progress == [(1, 2), (2, 2)]
+    assert result["text"] == "1번째 창 2번째 창"
+    assert result["transcription_stats"]["windows"] == 2
+    assert result["transcription_stats"]["speech_seconds"] < 7.5
+
+
+def test_progress_callback_errors_propagate(chunked_service, tmp_path):
+    audio_path = tmp_path / "audio.wav"
+    _write_wav(audio_path, _tone(6))
+
+    def cancel(done, total):
+        raise RuntimeError("cancelled")
+
+    with pytest.raises(RuntimeError):
+        chunked_service.transcribe_audio(str(audio_path), progress=cancel)
+
+
+def test_segments_are_emitted_per_window(chunked_service, tmp_path):
+    audio_path = tmp_path / "audio.wav"
+    _write_wav(audio_path, _tone(6))
+    emitted = []
+
+    result = chunked_service.transcribe_audio(str(audio_path), on_segments=emitted.append)
+
+    assert [[s["text"] for s in batch] for batch in emitted] == [["1번째 창"], ["2번째 창"]]
+    assert sum(emitted, []) == result["segments"]
+
+
+def test_silence_inside_window_is_not_sent_to_asr(chunked_service, monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "WHISPER_CHUNK_SECONDS", 30.0)
+    audio_path = tmp_path / "audio.wav"
+    _write_wav(audio_path, np.concatenate([_silence(3), _tone(2), _silence(6), _tone(2), _silence(3)]))
+
+    result = chunked_service.transcribe_audio(str(audio_path))
+    stats = result["transcription_stats"]
+
+    assert stats["windows"] == 1
+    assert stats["speech_seconds"] > 10 and stats["asr_seconds"] < 5.5
+    assert stats["asr_minutes"] == round(stats["asr_seconds"] / 60, 2)
+    # 이어 붙인 오디오 전체를 덮는 세그먼트가 원래 타임라인의 첫 음성 시작~마지막 음성 끝으로 복원됨
+    segment = result["segments"][0]
+    assert abs(segment["start"] - 2.8) < 0.1 and abs(segment["end"] - 13.2) < 0.1
+
+
+class _FakePool:
+    """창을 현재 프로세스에서 바로 처리하는 프로세스 풀 대역 (broken이면 BrokenProcessPool)"""
+
+    def __init__(self, broken=False):
+        self.broken = broken
+
+    def submit(self, fn, asr, samples, language):
+        future = Future()
+        if self.broken:
+            future.set_exception(BrokenProcessPool("worker died"))
+        else:
+            future.set_result([{"start": 0.0, "end": len(samples) / SAMPLE_RATE, "text": " 풀 "}])
+        return future
+
+
+@pytest.mark.parametrize("broken", [False, True])
+def test_model_is_loaded_only_when_windows_run_in_this_process(monkeypatch, tmp_path, broken):
+    monkeypatch.setattr(settings, "WHISPER_WORKERS", 2)
+    monkeypatch.setattr(settings, "WHISPER_CHUNK_SECONDS", 4.0)
+    monkeypatch.setattr(settings, "WHISPER_CHUNK_OVERLAP_SECONDS", 1.0)
+    monkeypatch.setattr(text_extraction_service, "_get_whisper_pool", lambda asr, workers: _FakePool(broken))
+    monkeypatch.setattr(text_extraction_service, "_discard_whisper_pool", lambda asr, workers: None)
+    registry = get_model_registry()
+    key = ModelRegistry.whisper_key("lazy")
+    loads = []
+
+    def load_fake():
+        loads.append(key)
+        return _FakeWhisper()
+
+    monkeypatch.setattr(WhisperBackend, "load", lambda self: registry.get(key, load_fake))
+    audio_path = tmp_path / "audio.wav"
+    _write_wav(audio_path, _tone(6))
+
+    try:
+        service = SpeechToTextService("lazy")
+        assert loads == []
+        result = service.transcribe_audio(str(audio_path))
+    finally:
+        registry.unload(key)
+
+    # 풀이 모든 창을 처리하면 현재 프로세스에는 모델을 로드하지 않고, 풀이 죽으면 그때 로드해 이어서 처리
+    assert loads == ([key] if broken else [])
+    assert result["transcription_stats"]["windows"] == 2
+    assert result["text"] == ("1번째 창 2번째 창" if broken else "풀 풀")
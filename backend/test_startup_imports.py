@@ -0,0 +1,61 @@
+"""
+API 시작 시간/메모리 벤치마크
+새 인터프리터에서 서비스 모듈을 import 했을 때 걸리는 시간과 할당 메모리를 측정하고,
+무거운 ML 라이브러리(Whisper, EasyOCR, OpenCV, Tesseract, LangChain, FAISS, Google API)가
+첫 사용 전까지 로드되지 않는지 확인
+"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.abspath(__file__))
+
+HEAVY_MODULES = [
+    "whisper", "torch", "easyocr", "cv2", "pytesseract",
+    "langchain", "langchain_openai", "langchain_community", "faiss",
+    "googleapiclient", "google_auth_oauthlib", "speech_recognition",
+]
+
+PROBE = """
+import importlib, json, sys, time, tracemalloc
+tracemalloc.start()
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+elapsed = time.perf_counter() - start
+_, peak = tracemalloc.get_traced_memory()
+print(json.dumps({
+    "elapsed_ms": elapsed * 1000,
+    "peak_mb": peak / (1024 * 1024),
+    "loaded": [name for name in sys.argv[2:] if name in sys.modules],
+}))
+"""
+
+
+def _probe(module_name: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE, module_name, *HEAVY_MODULES],
+        cwd=BACKEND_DIR, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        # 이 환경에 없는 일반 의존성(markdown 등) 때문에 실패한 경우는 측정 불가
+        last_line = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else ""
+        pytest.skip(f"{module_name} import 불가: {last_line}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("module_name", [
+    "app.services",
+    "app.services.text_extraction_service",
+    "app.services.google_drive_service",
+    "app.services.rag_service",
+    "app.services.video_service",
+    "app.routes.video",
+    "main",
+])
+def test_import_does_not_load_heavy_libraries(module_name):
+    stats = _probe(module_name)
+    print(f"\n{module_name}: {stats['elapsed_ms']:.0f} ms, peak {stats['peak_mb']:.1f} MB")
+    assert stats["loaded"] == []
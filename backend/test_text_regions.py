@@ -0,0 +1,141 @@
+"""
+텍스트 영역 검출 테스트
+강의 슬라이드 모양의 합성 프레임에서 줄 영역 검출, 빈 화면 OCR 생략, 모자이크 좌표 복원,
+EasyOCR 영역 인식(여러 프레임 줄 묶음 포함)을 확인하고 프레임당 OCR 시간(전체 프레임 vs 영역)을 출력
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(__file__))
+
+import shutil
+import time
+
+import numpy as np
+import pytest
+
+from app.services.text_extraction_service import OCRService
+from app.services.text_regions import build_mosaic, detect_text_lines, mosaic_box_to_frame, region_coverage
+
+# 제목 한 줄과 글머리 다섯 줄 (y, 글자 높이, 시작 x, 끝 x)
+SLIDE_LINES = [(60, 48, 100, 900)] + [(180 + i * 70, 28, 140, 700 - i * 60) for i in range(5)]
+
+
+def _slide(seed: int = 0, dark: bool = False) -> np.ndarray:
+    """밝은 배경에 글자 모양 블록 줄을 그린 1280x720 프레임"""
+    rng = np.random.default_rng(seed)
+    background, ink = (30, 230) if dark else (240, 30)
+    frame = np.full((720, 1280), background, dtype=np.uint8)
+    for y, height, x, end in SLIDE_LINES:
+        while x < end:
+            width = int(rng.integers(10, 22))
+            glyph = frame[y:y + height, x:x + width]
+            glyph[rng.random(glyph.shape) < 0.35] = ink
+            x += width + 4
+    return frame
+
+
+def test_detects_each_text_line():
+    frame = _slide()
+
+    started = time.perf_counter()
+    boxes = detect_text_lines(frame)
+    elapsed = time.perf_counter() - started
+
+    print(f"\n영역 검출: {elapsed * 1000:.1f} ms, OCR 입력 픽셀 {region_coverage(boxes, frame.shape):.0%}")
+    assert len(boxes) == len(SLIDE_LINES)
+    for (x0, y0, x1, y1), (y, height, x, end) in zip(boxes, SLIDE_LINES):
+        assert x0 <= x and y0 <= y and y + height <= y1 and end - 30 <= x1
+    assert detect_text_lines(np.stack([frame] * 3, axis=2)) == boxes
+    assert detect_text_lines(np.full((720, 1280), 200, dtype=np.uint8)) == []
+
+
+def test_blank_frame_skips_tesseract(monkeypatch):
+    calls = []
+    monkeypatch.setattr(OCRService, "_tesseract_gray", staticmethod(lambda gray: calls.append(gray)))
+
+    result = OCRService._tesseract_frame(np.full((720, 1280), 255, dtype=np.uint8))
+
+    assert calls == []
+    assert result["full_text"] == "" and result["regions"] == 0
+
+
+def test_mosaic_words_map_back_to_frame(monkeypatch):
+    frame = _slide(dark=True)
+    boxes = detect_text_lines(frame)
+    mosaic, placements = build_mosaic(frame, boxes)
+    top, line = placements[2]
+    seen = []
+
+    def fake_tesseract(gray):
+        seen.append(gray.shape)
+        return {"full_text": "둘째 줄", "texts": [{"text": "둘째", "confidence": 0.9,
+                                                   "bbox": [20, top + 4, 60, top + 20]}], "method": "tesseract"}
+
+    monkeypatch.setattr(OCRService, "_tesseract_gray", staticmethod(fake_tesseract))
+    result = OCRService._tesseract_frame(frame)
+
+    # 어두운 배경도 밝은 배경의 어두운 글자로 맞춤
+    assert np.median(mosaic) > 128
+    assert seen == [mosaic.shape]
+    assert result["texts"][0]["bbox"] == mosaic_box_to_frame([20, top + 4, 60, top + 20], placements)
+    assert line[0] <= result["texts"][0]["bbox"][0] and line[1] <= result["texts"][0]["bbox"][1] < line[3]
+
+
+class _LineReader:
+    """recognize에 넘어온 줄 영역을 기록하는 EasyOCR Reader 대역"""
+
+    def __init__(self):
+        self.horizontal_lists = []
+
+    def recognize(self, image, horizontal_list, free_list, batch_size=1):
+        self.horizontal_lists.append(horizontal_list)
+        return [([[x0, y0], [x1, y0], [x1, y1], [x0, y1]], f"line {i}", 0.9)
+                for i, (x0, x1, y0, y1) in enumerate(horizontal_list)]
+
+    def readtext(self, image):
+        raise AssertionError("텍스트 영역이 작으면 전체 프레임 검출을 하지 않아야 함")
+
+
+def test_easyocr_recognizes_only_detected_lines():
+    service = OCRService(use_easyocr=False, text_regions=True)
+    service.use_easyocr = True
+    service.easyocr_reader = _LineReader()
+
+    results = service._extract_arrays([_slide(0), np.zeros((720, 1280), dtype=np.uint8)])
+
+    assert [len(h) for h in service.easyocr_reader.horizontal_lists] == [len(SLIDE_LINES)]
+    assert results[0]["full_text"] == " ".join(f"line {i}" for i in range(len(SLIDE_LINES)))
+    assert results[1]["full_text"] == "" and results[1]["regions"] == 0
+
+
+def test_easyocr_batches_lines_across_frames():
+    service = OCRService(use_easyocr=False, batch_size=4, text_regions=True)
+    service.use_easyocr = True
+    service.easyocr_reader = _LineReader()
+    frames = [_slide(0), np.zeros((720, 1280), dtype=np.uint8), _slide(1, dark=True)]
+
+    results = service._extract_arrays(frames)
+
+    # 두 슬라이드의 줄을 recognize 한 번으로 인식하고, 결과는 각 프레임 좌표로 되돌림
+    lines = len(SLIDE_LINES)
+    assert [len(h) for h in service.easyocr_reader.horizontal_lists] == [2 * lines]
+    assert results[0]["full_text"] == " ".join(f"line {i}" for i in range(lines))
+    assert results[1]["full_text"] == "" and results[1]["regions"] == 0
+    assert results[2]["full_text"] == " ".join(f"line {i}" for i in range(lines, 2 * lines))
+    for frame, result in ((frames[0], results[0]), (frames[2], results[2])):
+        assert [text["bbox"][0] for text in result["texts"]] == [[x0, y0] for x0, y0, _, _ in detect_text_lines(frame)]
+
+
+@pytest.mark.skipif(shutil.which("tesseract") is None, reason="tesseract 실행 파일 필요")
+def test_text_region_ocr_benchmark():
+    pytest.importorskip("pytesseract")
+    frames = [_slide(seed) for seed in range(5)]
+
+    timings = {}
+    for text_regions in (False, True):
+        started = time.perf_counter()
+        for frame in frames:
+            OCRService._tesseract_frame(frame, text_regions)
+        timings[text_regions] = (time.perf_counter() - started) / len(frames)
+
+    print(f"\n프레임당 OCR: 전체 {timings[False] * 1000:.0f} ms, 영역 {timings[True] * 1000:.0f} ms")
@@ -0,0 +1,83 @@
+"""
+업로드 스트리밍 저장 테스트
+청크 단위로 쓰면서 해시를 계산하는지, 크기 제한을 넘으면 파일을 지우고 413을 내는지,
+업로드 크기와 무관하게 메모리 사용량이 청크 크기 수준으로 유지되는지 확인
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(__file__))
+
+import asyncio
+import hashlib
+import io
+import tracemalloc
+
+import pytest
+from fastapi import UploadFile
+
+from app.core.exceptions import FileTooLargeException
+from app.core.upload_stream import stream_upload_to_file
+
+MB = 1024 * 1024
+
+
+class _GeneratedVideo(io.RawIOBase):
+    """요청한 만큼만 바이트를 만들어 내는 업로드 본문 대역 (전체 내용을 메모리에 두지 않음)"""
+
+    def __init__(self, size: int):
+        self.remaining = size
+        self.sha256 = hashlib.sha256()
+        self.counter = 0
+
+    def read(self, size: int = -1) -> bytes:
+        size = self.remaining if size < 0 else min(size, self.remaining)
+        self.counter += 1
+        data = bytes([self.counter % 256]) * size
+        self.remaining -= size
+        self.sha256.update(data)
+        return data
+
+
+def _save(upload: UploadFile, path, max_bytes=None):
+    return asyncio.run(stream_upload_to_file(upload, str(path), max_bytes, chunk_size=MB))
+
+
+def test_upload_is_hashed_while_written(tmp_path):
+    data = os.urandom(3 * MB + 5)
+    path = tmp_path / "video.mp4"
+
+    stored = _save(UploadFile(io.BytesIO(data), filename="video.mp4"), path)
+
+    assert path.read_bytes() == data
+    assert stored.size == len(data)
+    assert stored.sha256 == hashlib.sha256(data).hexdigest()
+    assert stored.md5 == hashlib.md5(data).hexdigest()
+
+
+def test_size_cap_removes_partial_file(tmp_path):
+    path = tmp_path / "video.mp4"
+
+    with pytest.raises(FileTooLargeException) as error:
+        _save(UploadFile(_GeneratedVideo(5 * MB), filename="video.mp4"), path, max_bytes=2 * MB)
+
+    assert error.value.status_code == 413
+    assert not path.exists()
+
+    # 크기를 미리 알면 읽기 전에 거절
+    with pytest.raises(FileTooLargeException):
+        _save(UploadFile(_GeneratedVideo(5 * MB), size=5 * MB, filename="video.mp4"), path, max_bytes=2 * MB)
+
+
+def test_peak_memory_does_not_grow_with_upload_size(tmp_path):
+    peaks = {}
+    for size in (8 * MB, 64 * MB):
+        source = _GeneratedVideo(size)
+        tracemalloc.start()
+        stored = _save(UploadFile(source, filename="video.mp4"), tmp_path / f"{size}.mp4")
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert stored.sha256 == source.sha256.hexdigest()
+        peaks[size] = peak
+
+    print(f"\n업로드 최대 메모리: 8MB {peaks[8 * MB] / MB:.1f}MB, 64MB {peaks[64 * MB] / MB:.1f}MB")
+    assert peaks[64 * MB] < 4 * MB
@@ -0,0 +1,123 @@
+"""
+비디오 결과 캐시 테스트
+내용 해시(SHA-256/MD5)와 설정 해시로 조회되는지, 캐시 적중 시 Drive 다운로드와 추출을 건너뛰는지 확인
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(__file__))
+
+import hashlib
+
+import numpy as np
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.models import VideoResultCache
+from app.services.video_result_cache import VideoResultCacheService, config_fingerprint, hash_file
+
+CONFIG = {"whisper_model": "base", "ocr_engine": "easyocr", "frame_interval": 30}
+
+EXTRACTION = {
+    "video_path": "/tmp/lecture.mp4",
+    "speech_transcription": {"text": "안녕하세요", "segments": [{"start": 0.0, "end": 2.0, "text": "안녕하세요"}]},
+    "screen_text_extraction": {
+        "combined_text": "1장 소개",
+        "frame_results": [{"frame_index": 0, "frame_path": None, "timestamp": 0.0,
+                           "result": {"full_text": "1장 소개", "texts": [{"bbox": np.array([[1, 2]])}]}}],
+    },
+    "combined_content": {"total_content": "[음성 내용]\n안녕하세요"},
+}
+
+
+@pytest.fixture()
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'cache.db'}")
+    Base.metadata.create_all(engine, tables=[VideoResultCache.__table__])
+    return sessionmaker(bind=engine)
+
+
+def test_hash_file_matches_hashlib(tmp_path):
+    path = tmp_path / "video.mp4"
+    data = os.urandom(3 * 1024 * 1024 + 17)
+    path.write_bytes(data)
+
+    assert hash_file(str(path), chunk_size=1024 * 1024) == (
+        hashlib.sha256(data).hexdigest(), hashlib.md5(data).hexdigest()
+    )
+
+
+def test_lookup_by_either_hash_and_config(session_factory):
+    cache = VideoResultCacheService(session_factory)
+    cache.store(CONFIG, EXTRACTION, {"content": {"summary": "요약"}}, md5="m" * 32, source_filename="lecture.mp4")
+    config_hash = config_fingerprint(CONFIG)
+
+    # Drive로 저장된 결과를 같은 내용의 업로드(SHA-256 + MD5)로 찾음
+    hit = cache.lookup(config_hash, sha256="s" * 64, md5="m" * 32)
+    assert hit["summary"] == {"content": {"summary": "요약"}}
+    assert hit["extraction"]["screen_text_extraction"]["frame_results"][0]["result"]["texts"][0]["bbox"] == [[1, 2]]
+    assert cache.lookup(config_hash, sha256="s" * 64) is not None
+
+    assert cache.lookup(config_fingerprint({**CONFIG, "whisper_model": "small"}), md5="m" * 32) is None
+    assert cache.lookup(config_hash) is None
+    with session_factory() as db:
+        assert db.query(VideoResultCache.hit_count).scalar() == 2
+
+
+def test_config_fingerprint_ignores_key_order():
+    assert config_fingerprint({"a": 1, "b": 2}) == config_fingerprint({"b": 2, "a": 1})
+    assert config_fingerprint({"a": 1}) != config_fingerprint({"a": 2})
+
+
+def test_pipeline_config_tracks_frame_and_ocr_settings(monkeypatch):
+    pytest.importorskip("markdown")
+    from app.services import video_pipeline
+
+    settings = video_pipeline.settings
+    monkeypatch.setattr(settings, "FRAME_SOURCE", "pipe")
+    monkeypatch.setattr(settings, "OCR_TEXT_REGIONS", True)
+    base = config_fingerprint(video_pipeline.pipeline_config())
+
+    for name, value in (("FRAME_PIPE_MAX_WIDTH", settings.FRAME_PIPE_MAX_WIDTH // 2),
+                        ("OCR_TEXT_REGION_MAX_COVERAGE", settings.OCR_TEXT_REGION_MAX_COVERAGE / 2),
+                        ("FRAME_SOURCE", "files")):
+        with monkeypatch.context() as patch:
+            patch.setattr(settings, name, value)
+            assert config_fingerprint(video_pipeline.pipeline_config()) != base, name
+
+    assert video_pipeline.pipeline_config()["ocr_engine"] == "easyocr"
+    monkeypatch.setattr(video_pipeline, "USE_EASYOCR", False)
+    assert video_pipeline.pipeline_config()["ocr_engine"] == "tesseract"
+
+
+def test_drive_cache_hit_skips_download(session_factory, tmp_path, monkeypatch):
+    pytest.importorskip("markdown")
+    from app.services import summary_service
+    from app.services import video_pipeline
+
+    cache = VideoResultCacheService(session_factory)
+    cache.store(video_pipeline.pipeline_config(), EXTRACTION, {"content": {"summary": "요약"}, "metadata": {}},
+                md5="m" * 32, source_filename="lecture.mp4")
+
+    def no_download(*args):
+        raise AssertionError("캐시 적중 시 다운로드하지 않아야 함")
+
+    monkeypatch.setattr(video_pipeline, "create_video_result_cache_service", lambda: cache)
+    monkeypatch.setattr(video_pipeline, "_resolve_drive_file",
+                        lambda payload: {"filename": "lecture.mp4", "md5": "m" * 32})
+    monkeypatch.setattr(video_pipeline, "_download_drive_file", no_download)
+    monkeypatch.setattr(video_pipeline, "_process_video", no_download)
+    monkeypatch.setattr(video_pipeline, "create_markdown_generator",
+                        lambda: summary_service.create_markdown_generator(str(tmp_path)))
+    stages = []
+
+    result = video_pipeline.run_video_pipeline(
+        video_pipeline.GOOGLE_DRIVE_VIDEO,
+        {"google_drive_url": "https://drive.google.com/file/d/abc/view", "project_name": "강의", "user_id": 1},
+        lambda progress, stage: stages.append(stage),
+    )
+
+    assert result["cache_hit"] is True
+    assert os.path.exists(result["markdown_path"])
+    assert "downloading" in stages and "extracting_media" not in stages
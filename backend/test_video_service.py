@@ -0,0 +1,98 @@
+"""
+/api/videos/summary 비디오 서비스 테스트
+음성 인식 백엔드 교체, 로컬 Whisper 백엔드의 창 단위 인식, Google 백엔드의 고정 길이 창 분할과 타임스탬프 합치기를 확인
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(__file__))
+
+import asyncio
+import shutil
+import subprocess
+import wave
+
+import numpy as np
+import pytest
+
+from app.core.config import settings
+from app.services.model_registry import ModelRegistry, get_model_registry
+from app.services.speech_chunking import SAMPLE_RATE
+from app.services.video_service import (
+    GoogleTranscriptionBackend, TranscriptionBackend, VideoService, WhisperTranscriptionBackend,
+    create_transcription_backend,
+)
+
+
+def _write_wav(path, seconds: float) -> None:
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes((0.3 * np.sin(2 * np.pi * 220 * t) * 32767).astype(np.int16).tobytes())
+
+
+class _FakeWhisper:
+    def transcribe(self, samples, language, verbose):
+        return {"segments": [{"start": 0.0, "end": len(samples) / SAMPLE_RATE, "text": f" {len(samples) // SAMPLE_RATE}초"}]}
+
+
+def test_backend_is_selected_by_name(monkeypatch):
+    assert isinstance(create_transcription_backend("google"), GoogleTranscriptionBackend)
+    monkeypatch.setattr(settings, "VIDEO_TRANSCRIPTION_BACKEND", "whisper")
+    assert isinstance(create_transcription_backend(), WhisperTranscriptionBackend)
+    with pytest.raises(ValueError):
+        create_transcription_backend("unknown")
+
+
+def test_whisper_backend_transcribes_in_windows(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "WHISPER_WORKERS", 1)
+    monkeypatch.setattr(settings, "WHISPER_VAD_ENABLED", False)
+    monkeypatch.setattr(settings, "WHISPER_CHUNK_SECONDS", 4.0)
+    monkeypatch.setattr(settings, "WHISPER_CHUNK_OVERLAP_SECONDS", 0.0)
+    key = ModelRegistry.whisper_key("fake")
+    get_model_registry().get(key, _FakeWhisper)
+    audio_path = tmp_path / "audio.wav"
+    _write_wav(audio_path, 10)
+
+    try:
+        result = WhisperTranscriptionBackend("fake").transcribe(str(audio_path))
+    finally:
+        get_model_registry().unload(key)
+
+    assert [(s["start"], s["text"]) for s in result["segments"]] == [(0.0, "4초"), (4.0, "4초"), (8.0, "2초")]
+
+
+def test_google_backend_splits_fixed_windows(monkeypatch, tmp_path):
+    monkeypatch.setattr(GoogleTranscriptionBackend, "_recognize_window",
+                        lambda self, samples: f"{len(samples) / SAMPLE_RATE:.0f}초")
+    audio_path = tmp_path / "audio.wav"
+    _write_wav(audio_path, 125)
+
+    result = GoogleTranscriptionBackend(window_seconds=50, workers=3).transcribe(str(audio_path))
+
+    assert [(s["start"], s["end"], s["text"]) for s in result["segments"]] == [
+        (0.0, 50.0, "50초"), (50.0, 100.0, "50초"), (100.0, 125.0, "25초")
+    ]
+    assert result["text"] == "50초 50초 25초"
+
+
+class _StaticBackend(TranscriptionBackend):
+    name = "static"
+
+    def transcribe(self, audio_path):
+        assert os.path.exists(audio_path)
+        return {"text": "첫 문장. 둘째 문장. 셋째 문장. 넷째 문장.", "segments": [{"start": 0.0, "end": 1.0, "text": "첫 문장."}]}
+
+
+@pytest.mark.skipif(shutil.which("ffmpeg") is None, reason="ffmpeg 없음")
+def test_process_video_uses_injected_backend(tmp_path):
+    video_path = tmp_path / "video.mp4"
+    subprocess.run(["ffmpeg", "-y", "-f", "lavfi", "-i", "sine=frequency=440:duration=1", str(video_path)],
+                   check=True, capture_output=True)
+    service = VideoService(_StaticBackend())
+
+    transcript, summary = asyncio.run(service.process_video(str(video_path)))
+
+    assert summary == "첫 문장. 둘째 문장. 셋째 문장"
+    assert service.last_segments[0]["text"] == "첫 문장."
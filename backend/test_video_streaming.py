@@ -0,0 +1,184 @@
+"""
+스트리밍 비디오 처리 테스트
+부분 결과 세그먼트가 seq 순서로 쌓이는지, 세그먼트가 나오는 대로 프로젝트 문서에 색인되는지 확인
+"""
+import os
+import sys
+sys.path.append(os.path.dirname(__file__))
+
+import asyncio
+import json
+import subprocess
+
+import pytest
+from sqlalchemy.orm import undefer
+
+from app.core.config import settings
+from app.core.exceptions import DocumentLimitExceededException
+from app.models import Project, Document, ProcessingStatus, MediaJobSegment
+from app.services.media_job_service import MediaJobService
+from app.services.rag_service import RAGService, VectorRetriever, project_store_lock
+from app.services.video_streaming import StreamingDocumentIndexer, format_segments
+from app.workers.media_worker import MediaWorker
+from conftest import document_row, insert_rows, project_row
+
+
+@pytest.fixture(autouse=True)
+def project(file_engine):
+    insert_rows(file_engine, Project, [project_row(7, title="강의")])
+
+
+def test_published_segments_are_polled_in_order(session_factory):
+    service = MediaJobService(session_factory)
+    with session_factory() as db:
+        job_id = service.enqueue(db, 1, "test", {}).id
+    seen_while_running = []
+
+    def handler(job_type, payload, report):
+        report.publish(MediaJobSegment.TRANSCRIPT, [
+            {"start": 0.0, "end": 4.2, "text": "첫 번째 문장"},
+            {"start": 4.2, "end": 9.0, "text": "두 번째 문장"},
+        ])
+        with session_factory() as db:
+            seen_while_running.extend(s.text for s in service.list_segments(db, job_id))
+        report.publish(MediaJobSegment.SCREEN_TEXT, [{"start": 30.0, "end": None, "text": "슬라이드 제목"}])
+        return {}
+
+    MediaWorker(service, {"test": handler}, worker_id="w1").run_once()
+
+    assert seen_while_running == ["첫 번째 문장", "두 번째 문장"]
+    with session_factory() as db:
+        later = service.list_segments(db, job_id, after_seq=2)
+        assert [(s.seq, s.kind, s.text) for s in later] == [(3, "screen_text", "슬라이드 제목")]
+
+
+class _FakeChunker:
+    def chunk_document(self, content, document_id):
+        return [
+            {"text": line, "document_id": document_id, "chunk_index": i, "metadata": {}}
+            for i, line in enumerate(content.splitlines())
+        ]
+
+
+class _FakeRAGService:
+    """청크를 받은 순서대로 기록하는 RAG 서비스 대역"""
+
+    def __init__(self):
+        self.chunker = _FakeChunker()
+        self.indexed = []
+
+    async def append_document_chunks(self, db, document, chunks):
+        self.indexed.append([(chunk["chunk_index"], chunk["text"]) for chunk in chunks])
+        document.chunk_count += len(chunks)
+        db.commit()
+        return len(chunks)
+
+
+def test_indexer_indexes_segments_as_they_arrive(session_factory):
+    rag = _FakeRAGService()
+    indexer = StreamingDocumentIndexer(7, "lecture.mp4", "lecture.mp4", session_factory=session_factory,
+                                       rag_service=rag, flush_chars=20)
+    document_id = indexer.start()
+
+    indexer.add(format_segments([{"start": 0.0, "text": "강의 소개와 목차입니다"}]))
+    with session_factory() as db:
+        document = db.get(Document, document_id)
+        assert document.processing_status == ProcessingStatus.PROCESSING
+        assert document.chunk_count == 1
+
+    indexer.add(format_segments([{"start": 65.0, "text": "정렬"}], label="[화면]"))
+    indexer.finish()
+
+    assert rag.indexed == [[(0, "[00:00] 강의 소개와 목차입니다")], [(1, "[01:05] [화면] 정렬")]]
+    with session_factory() as db:
+        document = db.query(Document).options(undefer(Document.content)).get(document_id)
+        assert document.processing_status == ProcessingStatus.COMPLETED
+        assert document.chunk_count == 2
+        assert document.content == "[00:00] 강의 소개와 목차입니다\n[01:05] [화면] 정렬\n"
+
+
+def test_indexer_respects_project_document_limit(session_factory, monkeypatch):
+    monkeypatch.setattr(settings, "MAX_DOCUMENTS_PER_PROJECT", 1)
+    first = StreamingDocumentIndexer(7, "a.mp4", "a.mp4", session_factory=session_factory,
+                                     rag_service=_FakeRAGService())
+    first.start()
+
+    second = StreamingDocumentIndexer(7, "b.mp4", "b.mp4", session_factory=session_factory,
+                                      rag_service=_FakeRAGService())
+    with pytest.raises(DocumentLimitExceededException):
+        second.start()
+    with session_factory() as db:
+        assert db.query(Document).filter(Document.project_id == 7).count() == 1
+
+
+def test_project_store_lock_is_exclusive_across_processes(tmp_path):
+    store_path = str(tmp_path / "stores" / "7")
+    probe = (
+        "import fcntl, sys\n"
+        "f = open(sys.argv[1], 'a')\n"
+        "try:\n"
+        "    fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)\n"
+        "except BlockingIOError:\n"
+        "    sys.exit(1)\n"
+    )
+
+    def lock_is_free():
+        return subprocess.run([sys.executable, "-c", probe, f"{store_path}.lock"]).returncode == 0
+
+    with project_store_lock(store_path):
+        assert not lock_is_free()
+    assert lock_is_free()
+
+
+class _FileRetriever(VectorRetriever):
+    """저장 파일을 JSON 목록으로 쓰는 벡터 스토어 대역 (스토어 갱신 시각 확인은 실제 구현 사용)"""
+
+    def __init__(self):
+        self.vector_stores = {}
+        self.store_mtimes = {}
+
+    async def create_embeddings(self, texts):
+        return [[float(len(text))] for text in texts]
+
+    def add_embeddings_to_store(self, project_id, chunk_data, vectors):
+        self.vector_stores.setdefault(project_id, []).extend(chunk["text"] for chunk in chunk_data)
+
+    def save_vector_store(self, project_id, path):
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, "index.faiss"), "w") as f:
+            json.dump(self.vector_stores[project_id], f)
+        self.store_mtimes[project_id] = self._store_mtime(path)
+        return True
+
+    def load_vector_store(self, project_id, path):
+        with open(os.path.join(path, "index.faiss")) as f:
+            self.vector_stores[project_id] = json.load(f)
+        self.store_mtimes[project_id] = self._store_mtime(path)
+        return True
+
+
+def _rag_service(store_dir) -> RAGService:
+    service = RAGService.__new__(RAGService)
+    service.chunker = _FakeChunker()
+    service.retriever = _FileRetriever()
+    service.vector_store_base_path = str(store_dir)
+    return service
+
+
+def test_upload_and_streamed_append_keep_each_others_chunks(file_engine, session_factory, tmp_path):
+    # API 프로세스(업로드)와 미디어 워커(스트리밍)가 각자 메모리에 스토어를 들고 같은 파일을 번갈아 갱신
+    api, worker = _rag_service(tmp_path / "stores"), _rag_service(tmp_path / "stores")
+    insert_rows(file_engine, Document, [
+        document_row(1, project_id=7, content="업로드 1\n업로드 2"),
+        document_row(2, project_id=7, processing_status="PROCESSING", content=""),
+    ])
+    streamed = lambda text, index: {"text": text, "document_id": "2", "chunk_index": index, "metadata": {}}
+
+    with session_factory() as db:
+        stream_doc = db.get(Document, 2)
+        assert asyncio.run(worker.append_document_chunks(db, stream_doc, [streamed("영상 1", 0)])) == 1
+        assert asyncio.run(api.process_document_for_rag(1, db))
+        assert asyncio.run(worker.append_document_chunks(db, stream_doc, [streamed("영상 2", 1)])) == 1
+
+    with open(tmp_path / "stores" / "7" / "index.faiss") as f:
+        assert sorted(json.load(f)) == ["업로드 1", "업로드 2", "영상 1", "영상 2"]
@@ -15,8 +15,8 @@
 """
 
 import argparse
-import os
 import subprocess
+import sys
 import tempfile
 import time
 from pathlib import Path
@@ -24,7 +24,10 @@ from pathlib import Path
 import gdown
 from whisper import load_model
 import pytesseract
-from PIL import Image
+
+# 프레임 파이프는 백엔드 구현을 그대로 사용
+sys.path.append(str(Path(__file__).resolve().parent.parent / "backend"))
+from app.services.frame_source import RawFrameSource, probe_frame_size, scaled_size  # noqa: E402
 
 # 성능 측정을 위한 간단한 데코레이터
 
@@ -73,44 +76,31 @@ def transcribe_audio(audio_path: str) -> str:
     return result.get("text", "")
 
 @timing
-def extract_frame_text(video_path: str, interval: int = 5) -> str:
-    """프레임을 주기적으로 추출해 화면 텍스트 OCR"""
-    import shutil
+def extract_frame_text(video_path: str, interval: int = 5, max_width: int = 1280, ring_size: int = 2) -> str:
+    """프레임을 주기적으로 추출해 화면 텍스트 OCR
 
-    temp_dir = tempfile.mkdtemp()
+    백엔드의 RawFrameSource로 ffmpeg rawvideo(gray) 출력을 링 버퍼에 바로 읽어 들입니다.
+    PNG 저장/재디코딩과 임시 디렉터리가 없고, 메모리는 ring_size 프레임 크기로 제한됩니다.
+    """
     try:
-        frame_pattern = os.path.join(temp_dir, "frame_%04d.png")
-        # 매 interval 초마다 프레임 저장
-        cmd = [
-            "ffmpeg",
-            "-y",  # Overwrite output files without asking
-            "-i",
-            video_path,
-            "-vf",
-            f"fps=1/{interval}",
-            frame_pattern,
-        ]
+        width, height = scaled_size(*probe_frame_size(video_path), max_width)
+    except FileNotFoundError:
+        raise RuntimeError("ffmpeg not found. Please install ffmpeg.")
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"Frame extraction failed: {e.stderr}")
+
+    source = RawFrameSource(video_path, width, height, f"fps=1/{interval}", pix_fmt="gray", ring_size=ring_size)
+    texts = []
+    for index, (_, frame) in enumerate(source, start=1):
         try:
-            subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        except subprocess.CalledProcessError as e:
-            raise RuntimeError(f"Frame extraction failed: {e.stderr}")
-        except FileNotFoundError:
-            raise RuntimeError("ffmpeg not found. Please install ffmpeg.")
-
-        texts = []
-        for frame_file in sorted(Path(temp_dir).glob("frame_*.png")):
-            try:
-                with Image.open(frame_file) as img:
-                    text = pytesseract.image_to_string(img, lang="kor+eng")
-                    if text.strip():
-                        texts.append(text.strip())
-            except Exception as e:
-                print(f"Warning: Failed to process frame {frame_file}: {e}")
-                continue
-        return "\n".join(texts)
-    finally:
-        # Clean up temporary directory
-        shutil.rmtree(temp_dir, ignore_errors=True)
+            text = pytesseract.image_to_string(frame[:, :, 0], lang="kor+eng")
+            if text.strip():
+                texts.append(text.strip())
+        except Exception as e:
+            print(f"Warning: Failed to process frame {index}: {e}")
+    if source.returncode != 0:
+        raise RuntimeError(f"Frame extraction failed (ffmpeg exit code {source.returncode}): {source.error}")
+    return "\n".join(texts)
 
 @timing
 def summarize_with_lilys(text: str) -> str:
@@ -170,5 +160,4 @@ def main():
     print(f"✅ 결과 저장: {args.output}")
 
 if __name__ == "__main__":
-    import sys
     sys.exit(main())
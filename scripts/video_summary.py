@@ -40,18 +40,65 @@ def transcribe_audio(audio_path: str, model_name: str = "base") -> str:
     return result.get("text", "")
 
 
-def extract_text_from_video(video_path: str, interval: int = 1) -> List[str]:
+def frame_hash(img) -> int:
+    """
+    프레임의 dHash(64비트 지각 해시)를 계산합니다.
+    
+    Args:
+        img: OpenCV로 읽은 BGR 프레임.
+    
+    Returns:
+        해시 값 정수.
+    """
+    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+    value = 0
+    for bit in (small[:, 1:] > small[:, :-1]).flatten():
+        value = (value << 1) | int(bit)
+    return value
+
+
+class SlideGate:
+    """직전에 통과시킨 프레임과 해시 거리가 threshold 이하인 프레임(같은 슬라이드)을 걸러냅니다."""
+
+    def __init__(self, threshold: int = 5):
+        self.threshold = threshold
+        self.last_hash: Optional[int] = None
+        self.total = 0
+        self.skipped = 0
+
+    def accept(self, img) -> bool:
+        """새 화면이면 True, 직전 프레임과 거의 같으면 False를 반환합니다."""
+        self.total += 1
+        if self.threshold < 0:
+            return True
+        current = frame_hash(img)
+        if self.last_hash is not None and bin(current ^ self.last_hash).count("1") <= self.threshold:
+            self.skipped += 1
+            return False
+        self.last_hash = current
+        return True
+
+    def report(self, label: str) -> None:
+        print(f"[{label}] 샘플 프레임 {self.total}개 중 {self.skipped}개를 중복으로 건너뜀")
+
+
+def extract_text_from_video(video_path: str, interval: int = 1, dedupe_threshold: int = 5) -> List[str]:
     """
     비디오에서 일정 간격마다 화면의 텍스트를 OCR로 추출합니다.
     
+    직전에 OCR한 프레임과 거의 같은 프레임(같은 슬라이드)은 OCR하지 않습니다.
+    
     Args:
         video_path: 처리할 비디오 파일 경로.
         interval: 텍스트 추출 간격(초)입니다.
+        dedupe_threshold: 같은 화면으로 볼 최대 해시 거리. 음수면 중복 제거를 하지 않습니다.
     
     Returns:
         추출된 화면 텍스트 문자열의 리스트를 반환합니다.
     """
     texts = []
+    gate = SlideGate(dedupe_threshold)
     cap = cv2.VideoCapture(video_path)
     fps = cap.get(cv2.CAP_PROP_FPS) or 30
     frame = 0
@@ -59,12 +106,13 @@ def extract_text_from_video(video_path: str, interval: int = 1) -> List[str]:
         ret, img = cap.read()
         if not ret:
             break
-        if int(frame % (fps * interval)) == 0:
+        if int(frame % (fps * interval)) == 0 and gate.accept(img):
             text = pytesseract.image_to_string(img).strip()
             if text:
                 texts.append(text)
         frame += 1
     cap.release()
+    gate.report("OCR")
     return texts
 
 
@@ -173,20 +221,25 @@ def read_script(script_path: str) -> str:
         return f.read()
 
 
-def capture_frames(video_path: str, output_dir: str = "downloads/frames", interval: int = 10) -> List[str]:
+def capture_frames(video_path: str, output_dir: str = "downloads/frames", interval: int = 10,
+                   dedupe_threshold: int = 5) -> List[str]:
     """
     비디오 파일에서 지정된 간격(초)마다 프레임을 캡처하여 이미지 파일로 저장하고, 저장된 이미지 경로 목록을 반환합니다.
     
+    직전에 저장한 프레임과 거의 같은 프레임(같은 슬라이드)은 저장하지 않습니다.
+    
     Args:
         video_path: 프레임을 추출할 비디오 파일 경로.
         output_dir: 캡처된 프레임 이미지를 저장할 디렉터리 경로. 기본값은 "downloads/frames"입니다.
         interval: 프레임을 캡처할 시간 간격(초). 기본값은 10초입니다.
+        dedupe_threshold: 같은 화면으로 볼 최대 해시 거리. 음수면 중복 제거를 하지 않습니다.
     
     Returns:
         저장된 프레임 이미지 파일의 경로 리스트.
     """
     os.makedirs(output_dir, exist_ok=True)
     frames = []
+    gate = SlideGate(dedupe_threshold)
     cap = cv2.VideoCapture(video_path)
     fps = cap.get(cv2.CAP_PROP_FPS) or 30
     frame = 0
@@ -195,13 +248,14 @@ def capture_frames(video_path: str, output_dir: str = "downloads/frames", interv
         ret, img = cap.read()
         if not ret:
             break
-        if int(frame % (fps * interval)) == 0:
+        if int(frame % (fps * interval)) == 0 and gate.accept(img):
             img_path = os.path.join(output_dir, f"frame_{idx:03d}.png")
             cv2.imwrite(img_path, img)
             frames.append(img_path)
             idx += 1
         frame += 1
     cap.release()
+    gate.report("캡처")
     return frames
 
 